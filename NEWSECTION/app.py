@@ -1,13 +1,22 @@
 import streamlit as st
+import functools
+import hashlib
 import json
 import math
 from datetime import datetime
 import os
-from bs4 import Tag
-from github import Github, Auth, GithubException
 import re
-
-from scraper import run_scraper
+import threading
+
+# bs4, PyGithub, lo scraper e pyarrow (storico) vengono importati solo quando
+# servono: l'avvio del CMS non paga dipendenze che la sezione attiva non usa.
+from storage import load_json, save_json, pos_key, open_stock_store
+import storico
+from publish import write_playlist, publish_feed, feed_files
+from settings_store import SettingsStore, ORDINI
+from search import StockIndex, FACETS
+import profiling
+from log_sink import LogSink, LEVELS, format_entry
 
 # =========================
 # CONFIG
@@ -19,17 +28,29 @@ STOCK_FILE = os.path.join(DATA_DIR, "stock.json")
 SETTINGS_FILE = "settings.json"
 SECRETS_FILE = "secrets.json"
 PROMO_DIR = os.path.join("static", "promos")
+STORICO_DIR = os.path.join(DATA_DIR, "storico")
+PLAYLIST_FILE = os.path.join(DATA_DIR, "playlist.json")
+FEED_DIR = os.path.join(DATA_DIR, "feed")
+LOCAL_PUBLISH_DIR = os.path.join(DATA_DIR, "pubblicazione")
+IMAGE_CACHE_FILE = os.path.join(DATA_DIR, "immagini_cache.json")
+IMAGE_KO_MSG = "🚫 Nessuna immagine raggiungibile all'ultima verifica: esclusa dallo slideshow."
+DETAIL_CACHE_FILE = os.path.join(DATA_DIR, "dettagli_cache.json")
+SCRAPE_LOG_FILE = os.path.join(DATA_DIR, "log", "scraping.log")
+# Righe di log mostrate nella sezione Scraping (il buffer ne tiene di più)
+LOG_VISIBLE = 300
+
+
+@st.cache_resource
+def get_stock_store():
+    """Backend stock: "json" (default) o "sqlite", via CMS_STOCK_BACKEND. Uno per processo."""
+    return open_stock_store(DATA_DIR)
 
-os.makedirs(DATA_DIR, exist_ok=True)
-os.makedirs(PROMO_DIR, exist_ok=True)
+
+stock_store = get_stock_store()
 
 # Inizializza la session state per il log
 if 'log' not in st.session_state:
     st.session_state.log = []
-if 'scraping_log' not in st.session_state:
-    st.session_state.scraping_log = ""
-if 'scraping_in_progress' not in st.session_state:
-    st.session_state.scraping_in_progress = False
 if 'editor_changed' not in st.session_state:
     st.session_state.editor_changed = False
 
@@ -37,38 +58,62 @@ if 'editor_changed' not in st.session_state:
 # =========================
 # UTILS
 # =========================
-def load_json(path, default):
-    """Carica JSON in modo robusto. Se mancante/corrotto, ritorna default."""
-    if os.path.exists(path):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, ValueError):
-            return default
-    return default
-
-
-def save_json(path, data):
-    """Salva l'intero JSON (indentato, utf-8)."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
-def pos_key(item):
-    """Chiave di ordinamento: posizione numerica (se valida), tie-breaker = link."""
-    raw = item.get("posizione", None)
-    try:
-        p = int(raw)
-    except (TypeError, ValueError):
-        p = 10_000_000
-    return (p, item.get("link", ""))
-
-
+@profiling.profiled("sorted_annunci")
 def sorted_annunci(annunci):
     """Ritorna una copia della lista di annunci ordinata."""
     return sorted(annunci, key=pos_key)
 
 
+@st.cache_resource(max_entries=2)
+def get_search_index(version: str) -> StockIndex:
+    """
+    Indice di ricerca sugli annunci ordinati, ricostruito solo quando cambia
+    la versione dello stock. Condiviso tra i rerun: gli annunci vanno letti,
+    non modificati.
+    """
+    return StockIndex(sorted_annunci(stock_store.load()))
+
+
+def search_filters(idx: StockIndex, key: str) -> list[dict]:
+    """Casella di ricerca + faccette; ritorna gli annunci filtrati, in ordine di posizione."""
+    testo = st.text_input("🔎 Cerca", key=f"cerca_{key}", placeholder="marca, modello, versione…")
+    scelte = {}
+    anno = prezzo = None
+    with st.expander("Filtri"):
+        counts = idx.facet_counts()
+        cols = st.columns(len(FACETS))
+        for col, facet in zip(cols, FACETS):
+            with col:
+                values = counts[facet]
+                scelte[facet] = st.multiselect(
+                    facet.capitalize(), list(values), key=f"{facet}_{key}",
+                    format_func=lambda v, values=values: f"{v} ({values[v]})",
+                )
+        cols = st.columns(2)
+        # Slider solo se c'è un intervallo; a fondo scala = nessun filtro
+        # (così restano anche gli annunci senza anno o prezzo)
+        bounds = idx.anno.bounds
+        if bounds and bounds[0] < bounds[1]:
+            with cols[0]:
+                sel = st.slider("Anno", bounds[0], bounds[1], bounds, key=f"anno_{key}")
+                anno = None if sel == bounds else sel
+        bounds = idx.prezzo.bounds
+        if bounds and bounds[0] < bounds[1]:
+            with cols[1]:
+                sel = st.slider("Prezzo (€)", bounds[0], bounds[1], bounds, step=500, key=f"prezzo_{key}")
+                prezzo = None if sel == bounds else sel
+    with profiling.span("search.query"):
+        return idx.query(testo, anno=anno, prezzo=prezzo, **scelte)
+
+
+def page_input(label: str, n_items: int, per_page: int, key: str) -> int:
+    """Selettore di pagina; riporta in range la pagina se i filtri hanno ridotto i risultati."""
+    num_pages = max(1, math.ceil(n_items / per_page))
+    if st.session_state.get(key, 1) > num_pages:
+        st.session_state[key] = num_pages
+    return st.number_input(label, min_value=1, max_value=num_pages, value=1, key=key)
+
+
 def check_for_conflicts(annunci_list):
     """Controlla se ci sono posizioni duplicate nella lista degli annunci."""
     positions = [item.get("posizione") for item in annunci_list if "posizione" in item]
@@ -79,10 +124,8 @@ def check_for_conflicts(annunci_list):
 
 def resolve_conflicts_and_save():
     """Risolve i conflitti di posizione riassegnando numeri sequenziali."""
-    full_list = load_json(STOCK_FILE, [])
-    if not isinstance(full_list, list):
-        full_list = []
-    
+    full_list = stock_store.load()
+
     st.session_state.log = []
     st.session_state.log.append("⚠️ **Conflitto rilevato.** Risoluzione automatica avviata.")
     
@@ -92,8 +135,8 @@ def resolve_conflicts_and_save():
         nuova_pos = i + 1
         st.session_state.log.append(f"→ Riassegnata posizione a '{item.get('titolo', 'N/D')}': da {item.get('posizione')} a {nuova_pos}")
         item["posizione"] = nuova_pos
-    
-    save_json(STOCK_FILE, full_list)
+
+    stock_store.save(full_list)
     st.success("✅ Conflitti risolti. Lista salvata e riordinata.")
     st.rerun()
 
@@ -107,30 +150,29 @@ def save_changes_and_reorganize():
     """Salva le modifiche e riorganizza la lista degli annunci."""
     st.session_state.log = []
 
-    full_list = load_json(STOCK_FILE, [])
-    if not isinstance(full_list, list):
-        full_list = []
-    
-    # Aggiorna i valori
-    for item in full_list:
+    # Raccoglie solo i campi effettivamente cambiati, annuncio per annuncio
+    edits = {}
+    for item in stock_store.load():
         unique_key = item.get("link")
-        if unique_key:
-            try:
-                item["titolo"] = st.session_state[f"titolo_{unique_key}"]
-                item["prezzo"] = st.session_state[f"prezzo_{unique_key}"]
-                item["anno"] = st.session_state[f"anno_{unique_key}"]
-                item["km"] = st.session_state[f"km_{unique_key}"]
-                item["posizione"] = st.session_state[f"pos_{unique_key}"]
-            except KeyError:
-                continue
-
-    # Ordina e riassegna posizioni pulite
-    full_list.sort(key=pos_key)
-    for i, item in enumerate(full_list):
-        item["posizione"] = i + 1
-
-    save_json(STOCK_FILE, full_list)
-    st.session_state.log.append("✅ Modifiche salvate e lista riorganizzata.")
+        if not unique_key:
+            continue
+        try:
+            nuovi = {
+                "titolo": st.session_state[f"titolo_{unique_key}"],
+                "prezzo": st.session_state[f"prezzo_{unique_key}"],
+                "anno": st.session_state[f"anno_{unique_key}"],
+                "km": st.session_state[f"km_{unique_key}"],
+                "posizione": st.session_state[f"pos_{unique_key}"],
+            }
+        except KeyError:
+            continue
+        changed = {k: v for k, v in nuovi.items() if item.get(k) != v}
+        if changed:
+            edits[unique_key] = changed
+
+    # Salva e riassegna posizioni pulite
+    n = stock_store.apply_edits(edits, reorder=True)
+    st.session_state.log.append(f"✅ Modifiche salvate ({n} annunci) e lista riorganizzata.")
     st.session_state.editor_changed = False
     st.rerun()
 
@@ -149,13 +191,22 @@ def extract_url_from_srcset(srcset_value: str) -> str:
     return first.split()[0].strip()
 
 
+def _is_img_tag(candidate) -> bool:
+    """isinstance(candidate, bs4.Tag) senza importare bs4 per le stringhe (il caso comune)."""
+    if candidate is None or isinstance(candidate, str):
+        return False
+    from bs4 import Tag
+    return isinstance(candidate, Tag)
+
+
+@profiling.profiled("normalize_img_candidate")
 def normalize_img_candidate(candidate) -> str:
     """
     Accetta stringa o Tag <img>.
     Restituisce URL completo e valido (startswith http) o "".
     """
     url = ""
-    if isinstance(candidate, Tag):
+    if _is_img_tag(candidate):
         for attr in ("src", "data-src", "data-lazy", "data-original", "data-srcset", "srcset"):
             val = candidate.get(attr)
             if not val:
@@ -183,11 +234,18 @@ def normalize_img_candidate(candidate) -> str:
 # =========================
 # GITHUB UPLOAD
 # =========================
+def git_blob_sha(content: bytes) -> str:
+    """SHA del blob git: lo stesso che l'API GitHub ritorna per un file."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
 def push_to_github(username, repo_name, token, file_entries):
     """
     file_entries: lista di tuple (local_path, github_path).
     Supporta file binari (immagini) e testuali.
     """
+    from github import Github, Auth, GithubException
+
     try:
         g = Github(auth=Auth.Token(token))
         user = g.get_user(username)
@@ -199,6 +257,8 @@ def push_to_github(username, repo_name, token, file_entries):
             label = os.path.basename(github_path)
             try:
                 existing = repo.get_contents(github_path)
+                if existing.sha == git_blob_sha(content):
+                    continue  # invariato (es. delta del feed già caricati)
                 repo.update_file(github_path, f"Aggiornamento {label}", content, existing.sha)
             except GithubException as e:
                 if e.status == 404:
@@ -219,28 +279,137 @@ def push_to_github(username, repo_name, token, file_entries):
 
 
 # =========================
-# LOAD INIZIALE
+# PUBBLICAZIONE
+# =========================
+def verify_images():
+    """Controlla le immagini dello stock e salva riparazioni/segnalazioni."""
+    from image_check import ImageCache, validate_images
+
+    with st.spinner("Verifica immagini..."):
+        edits, stats = validate_images(stock_store.load(), ImageCache(IMAGE_CACHE_FILE))
+    stock_store.apply_edits(edits, reorder=False)
+    st.session_state.log.append(
+        f"🖼️ Immagini: {stats['ok']} ok, {stats['riparate']} riparate dalla galleria, "
+        f"{stats['ko']} non raggiungibili ({stats['dalla_cache']} dalla cache, {stats['secondi']} s)"
+    )
+    return stats
+
+
+def promo_entries(settings):
+    """Voci (local_path, public_path) delle promo in uso presenti in PROMO_DIR."""
+    return [
+        (os.path.join(PROMO_DIR, os.path.basename(p)), p)
+        for p in settings.get("promo", [])
+        if os.path.exists(os.path.join(PROMO_DIR, os.path.basename(p)))
+    ]
+
+
+def build_publish_entries(promo_files, check_images=False):
+    """
+    Prepara gli artefatti per il kiosk (stock, feed, playlist) e ritorna le
+    voci (local_path, public_path) da pubblicare, su GitHub o in locale.
+    """
+    get_settings_store().flush()
+    if check_images:
+        verify_images()
+    stock_store.export_json(STOCK_FILE)
+    manifest, written = publish_feed(stock_store.load(), FEED_DIR)
+    st.session_state.log.append(f"🧾 Feed v{manifest['versione']}: {len(written)} file nuovi")
+    playlist = write_playlist(STOCK_FILE, SETTINGS_FILE, PLAYLIST_FILE, feed_versione=manifest["versione"])
+    st.session_state.log.append(f"🎞️ Playlist generata: {len(playlist['slides'])} slide")
+    return [
+        (STOCK_FILE, "stock.json"),
+        (SETTINGS_FILE, "settings.json"),
+        (PLAYLIST_FILE, "playlist.json"),
+    ] + [
+        (os.path.join(FEED_DIR, name), f"feed/{name}") for name in feed_files(FEED_DIR)
+    ] + promo_files
+
+
+# =========================
+# LOAD
 # =========================
-annunci = load_json(STOCK_FILE, [])
-settings = load_json(SETTINGS_FILE, {
-    "durata_slide": 8,
-    "max_annunci": 20,
-    "ordine": "Casuale",
-    "promo": []
-})
-secrets = load_json(SECRETS_FILE, {})
+# Ogni sezione carica solo i dati che le servono, quando è attiva.
+def on_settings_changed(settings):
+    """
+    Subscriber dello store: se la pubblicazione locale è in uso, aggiorna
+    subito settings, playlist e promo per il kiosk sulla LAN. La playlist si
+    ricostruisce dallo stock e dal feed già pubblicati lì, non da data/stock.json:
+    scraping e modifiche non ancora pubblicati restano fuori finché non si preme
+    Pubblica. Gira nel thread della scrittura differita: niente chiamate `st.*` qui.
+    """
+    from publish_local import PUBLISH_LOCK, publish_local, published_file
+
+    # Lock per tutto il giro: una pubblicazione concorrente non deve rimuovere
+    # lo stock pubblicato mentre la playlist viene ricostruita
+    with PUBLISH_LOCK:
+        stock = published_file(LOCAL_PUBLISH_DIR, "stock.json")
+        if stock is None:
+            return
+        manifest_path = published_file(LOCAL_PUBLISH_DIR, "feed/manifest.json")
+        manifest = load_json(manifest_path, {}) if manifest_path else {}
+        write_playlist(stock, SETTINGS_FILE, PLAYLIST_FILE, feed_versione=manifest.get("versione"))
+        publish_local([
+            (SETTINGS_FILE, "settings.json"),
+            (PLAYLIST_FILE, "playlist.json"),
+        ] + promo_entries(settings), LOCAL_PUBLISH_DIR, partial=True)
+
+
+@st.cache_resource
+def get_settings_store():
+    """Uno store per processo: sopravvive ai rerun e conserva le modifiche pendenti."""
+    store = SettingsStore(SETTINGS_FILE, debounce=1.0)
+    store.subscribe(on_settings_changed)
+    return store
+
+
+def load_settings():
+    return get_settings_store().load()
+
 
 now_it = datetime.now().strftime("%d/%m/%Y - %H:%M:%S")
 st.title("🚗 CMS Annunci Auto")
 
-tabs = st.tabs(["📊 Dashboard", "🕵️ Scraping", "✏️ Editor annunci", "🎛️ Settings slideshow", "⬆️ GitHub"])
+# Navigazione a sezioni: a differenza di st.tabs, gira solo la sezione attiva.
+# Ogni sezione è un fragment: i widget al suo interno rieseguono solo quella.
+SEZIONI = ["📊 Dashboard", "🕵️ Scraping", "✏️ Editor annunci", "🎛️ Settings slideshow", "⬆️ GitHub"]
+sezione = st.radio("Sezione", SEZIONI, horizontal=True, key="sezione", label_visibility="collapsed")
+
+# Profiling opzionale: CMS_PROFILE=1 oppure toggle nella sidebar
+with st.sidebar:
+    profiling.set_enabled(st.toggle("⏱️ Profiling", value=profiling.env_enabled(), key="profiling"))
+    if profiling.is_enabled():
+        st.toggle(f"🔬 Campionamento ({profiling.sampler_name()})", value=False, key="profiling_sampler")
+
+
+def profiled_section(nome: str):
+    """
+    Span "render:<nome>" (e campionamento, se attivo) attorno al corpo di una
+    sezione. Va sotto @st.fragment: un widget della sezione riesegue solo il
+    fragment, e la misura deve coprire anche quei rerun.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            label = f"render:{nome}"
+            if profiling.is_enabled() and st.session_state.get("profiling_sampler"):
+                with profiling.sampler(label), profiling.span(label):
+                    return fn(*args, **kwargs)
+            with profiling.span(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
 
 
 # =========================
 # DASHBOARD
 # =========================
-with tabs[0]:
+@st.fragment
+@profiled_section("📊 Dashboard")
+def render_dashboard():
     st.header("📊 Dashboard")
+    idx = get_search_index(stock_store.version())
+    annunci = idx.docs
 
     cols = st.columns([1, 1, 2])
     with cols[0]:
@@ -248,16 +417,20 @@ with tabs[0]:
             st.rerun()
     with cols[1]:
         st.metric("Annunci totali", len(annunci))
+        n_ko = sum(1 for a in annunci if a.get("immagine_ko"))
+        if n_ko:
+            st.caption(f"🚫 {n_ko} senza immagine, esclusi dallo slideshow")
     with cols[2]:
         st.caption(f"🕒 Ultimo refresh: {now_it}")
 
     st.subheader("📋 Lista annunci")
 
     if annunci:
-        ordered = sorted_annunci(annunci)
+        ordered = search_filters(idx, "dashboard")
+        if len(ordered) < len(annunci):
+            st.caption(f"{len(ordered)} di {len(annunci)} annunci")
         per_page = 20
-        num_pages = max(1, math.ceil(len(ordered) / per_page))
-        page = st.number_input("Pagina", min_value=1, max_value=num_pages, value=1, key="page_dashboard")
+        page = page_input("Pagina", len(ordered), per_page, "page_dashboard")
 
         start, end = (page - 1) * per_page, (page - 1) * per_page + per_page
 
@@ -267,7 +440,8 @@ with tabs[0]:
                 img_url = normalize_img_candidate(a.get("immagine", ""))
                 if img_url:
                     try:
-                        st.image(img_url, width=120)
+                        with profiling.span("st.image"):
+                            st.image(img_url, width=120)
                     except Exception:
                         st.write("⚠️ Immagine non caricabile")
             with col2:
@@ -276,37 +450,136 @@ with tabs[0]:
                 link = a.get("link", "")
                 if link:
                     st.write(f"[🔗 Vai all'annuncio]({link})")
+                if a.get("immagine_ko"):
+                    st.warning(IMAGE_KO_MSG)
     else:
         st.info("Nessun annuncio disponibile.")
 
+    # Toggle invece di expander: la query (e l'import di pyarrow) parte solo su richiesta
+    if storico.disponibile() and st.toggle("📉 Ribassi di prezzo (ultimi 7 giorni)", key="show_drops"):
+        with st.container(border=True):
+            drops = storico.price_drops(STORICO_DIR, days=7)
+            if drops:
+                for d in drops:
+                    ribasso = f"{d['ribasso']:,}".replace(",", ".")
+                    st.write(f"**{d['titolo']}** — {d['prezzo_prima']} → {d['prezzo_ora']} (-{ribasso} €)")
+            else:
+                st.caption("Nessun ribasso registrato nello storico.")
+
+    if storico.disponibile() and st.toggle("🕰️ Da più tempo in salone", key="show_days_on_lot"):
+        with st.container(border=True):
+            titoli = {a.get("link"): a.get("titolo", "") for a in annunci}
+            fermi = [r for r in storico.days_on_lot(STORICO_DIR) if r["in_stock"] and r["link"] in titoli][:10]
+            if fermi:
+                for r in fermi:
+                    st.write(f"**{titoli[r['link']]}** — {r['giorni']} giorni (dal {r['primo_giorno']})")
+            else:
+                st.caption("Nessun annuncio registrato nello storico.")
+
 
 # =========================
 # SCRAPING
 # =========================
-with tabs[1]:
+@st.cache_resource
+def get_scrape_log() -> LogSink:
+    """Log dello scraping: ultime voci in memoria, storico completo su file ruotati."""
+    return LogSink(capacity=5000, path=SCRAPE_LOG_FILE)
+
+
+@st.cache_resource
+def get_scrape_job() -> dict:
+    """Thread dello scraping in corso, condiviso tra le sessioni (uno alla volta)."""
+    return {"thread": None, "lock": threading.Lock()}
+
+
+def scraping_running() -> bool:
+    thread = get_scrape_job()["thread"]
+    return thread is not None and thread.is_alive()
+
+
+def scrape_worker(log: LogSink, enrich_details: bool):
+    """Scraping completo in background. Gira fuori dallo script: niente chiamate `st.*` qui."""
+    try:
+        from scraper import run_scraper
+
+        risultati = run_scraper(log_fn=log)
+        if enrich_details:
+            from enrich import DetailCache, enrich_listings
+
+            enrich_listings(risultati, DetailCache(DETAIL_CACHE_FILE), log_fn=log)
+        stock_store.save(risultati)
+        log.log("INFO", f"Salvato: {stock_store.path}")
+        if storico.disponibile():
+            log.log("INFO", f"Storico: {storico.append_snapshot(risultati, STORICO_DIR)}")
+    except Exception as e:
+        log.log("ERROR", f"Scraping interrotto: {e!r}")
+
+
+def start_scraping(enrich_details: bool) -> bool:
+    job = get_scrape_job()
+    with job["lock"]:
+        if scraping_running():
+            return False
+        log = get_scrape_log()
+        log.log("INFO", f"=== Avvio scraping ({now_it}) ===")
+        job["thread"] = threading.Thread(target=scrape_worker, args=(log, enrich_details),
+                                         name="scraping", daemon=True)
+        job["thread"].start()
+    return True
+
+
+def render_scraping_log(min_level: str):
+    """Coda del log (al massimo LOG_VISIBLE righe), letta dal buffer condiviso."""
+    log = get_scrape_log()
+    entries = log.entries(min_level=min_level, limit=LOG_VISIBLE)
+    st.code("\n".join(format_entry(e) for e in entries) or "Nessun messaggio.", language=None, height=400)
+    st.caption(f"{log.last_seq} messaggi in totale, ultimi {len(entries)} mostrati. "
+               f"Storico completo in `{SCRAPE_LOG_FILE}`.")
+
+
+@st.fragment(run_every=1.0)
+@profiled_section("🕵️ Scraping live")
+def render_scraping_live(min_level: str):
+    """Durante lo scraping si aggiorna da sola ogni secondo."""
+    render_scraping_log(min_level)
+    if not scraping_running():
+        # Finito: un rerun completo ferma il polling e aggiorna le altre sezioni
+        st.rerun()
+
+
+@st.fragment
+@profiled_section("🕵️ Scraping")
+def render_scraping():
     st.header("🕵️ Scraping")
 
-    if st.session_state.scraping_in_progress:
+    running = scraping_running()
+    if running:
         st.info("Scraping in corso...")
-        log_lines = []
-        risultati = run_scraper(log_fn=lambda msg: log_lines.append(str(msg)))
-        save_json(STOCK_FILE, risultati)
-        log_lines.append(f"Salvato: {STOCK_FILE}")
-        st.session_state.scraping_log = "\n".join(log_lines)
-        st.session_state.scraping_in_progress = False
     else:
+        enrich_details = st.checkbox(
+            "📸 Galleria e specifiche dalle pagine di dettaglio", value=True, key="enrich_details",
+            help="Scarica solo i dettagli degli annunci nuovi o cambiati dall'ultimo scraping.",
+        )
         if st.button("▶️ Avvia scraping"):
-            st.session_state.scraping_in_progress = True
+            start_scraping(enrich_details)
             st.rerun()
 
-    st.text_area("Log scraping", st.session_state.scraping_log, height=400)
+    min_level = st.radio("Livello minimo", LEVELS, index=LEVELS.index("INFO"), horizontal=True, key="scraping_level")
+    if running:
+        render_scraping_live(min_level)
+    else:
+        render_scraping_log(min_level)
 
 
 # =========================
 # EDITOR ANNUNCI
 # =========================
-with tabs[2]:
+@st.fragment
+@profiled_section("✏️ Editor annunci")
+def render_editor():
     st.header("✏️ Editor annunci")
+    idx = get_search_index(stock_store.version())
+    annunci = idx.docs
 
     top_cols = st.columns([1, 2, 2])
     with top_cols[0]:
@@ -322,10 +595,11 @@ with tabs[2]:
                 resolve_conflicts_and_save()
 
     if annunci:
-        ordered = sorted_annunci(annunci)
+        ordered = search_filters(idx, "editor")
+        if len(ordered) < len(annunci):
+            st.caption(f"{len(ordered)} di {len(annunci)} annunci")
         per_page = 20
-        num_pages = max(1, math.ceil(len(ordered) / per_page))
-        page = st.number_input("Pagina editor", min_value=1, max_value=num_pages, value=1, key="editor_page")
+        page = page_input("Pagina editor", len(ordered), per_page, "editor_page")
 
         start, end = (page - 1) * per_page, (page - 1) * per_page + per_page
         page_slice = ordered[start:end]
@@ -337,7 +611,8 @@ with tabs[2]:
                 img_url = normalize_img_candidate(a.get("immagine", ""))
                 if img_url:
                     try:
-                        st.image(img_url, width=120)
+                        with profiling.span("st.image"):
+                            st.image(img_url, width=120)
                     except Exception:
                         st.write("⚠️ Immagine non caricabile")
             with colB:
@@ -348,6 +623,8 @@ with tabs[2]:
                     st.text_input("Anno", a.get("anno", ""), key=f"anno_{unique_key}", on_change=set_editor_changed)
                     st.text_input("Km", a.get("km", ""), key=f"km_{unique_key}", on_change=set_editor_changed)
                     st.number_input("Posizione", 1, len(annunci), int(a.get("posizione", 1)), key=f"pos_{unique_key}", on_change=set_editor_changed)
+                if a.get("immagine_ko"):
+                    st.warning(IMAGE_KO_MSG)
 
         st.markdown("---")
         bottom_cols = st.columns([1, 2, 2])
@@ -370,14 +647,20 @@ with tabs[2]:
 # =========================
 # SETTINGS SLIDESHOW
 # =========================
-with tabs[3]:
+@st.fragment
+@profiled_section("🎛️ Settings slideshow")
+def render_settings():
     st.header("🎛️ Settings slideshow")
+    store = get_settings_store()
+    settings = store.load()
 
-    settings["durata_slide"] = st.slider("Durata slide (sec)", 3, 20, settings.get("durata_slide", 8))
-    settings["max_annunci"] = st.slider("Numero massimo annunci", 5, 100, settings.get("max_annunci", 20))
-    settings["ordine"] = st.selectbox("Ordine", ["Casuale", "Posizione"], index=["Casuale", "Posizione"].index(settings.get("ordine", "Casuale")))
+    durata = st.slider("Durata slide (sec)", 3, 20, settings["durata_slide"])
+    max_annunci = st.slider("Numero massimo annunci", 5, 100, settings["max_annunci"])
+    ordine = st.selectbox("Ordine", list(ORDINI), index=ORDINI.index(settings["ordine"]))
 
-    save_json(SETTINGS_FILE, settings)
+    # Scrive su disco solo se qualcosa è cambiato (con un attimo di ritardo)
+    if store.update(durata_slide=durata, max_annunci=max_annunci, ordine=ordine):
+        settings = store.load()
     st.success("✅ Impostazioni slideshow salvate automaticamente.")
 
     st.divider()
@@ -407,8 +690,8 @@ with tabs[3]:
                 st.write(f"`{promo_github_path}`")
             with col3:
                 if st.button("❌ Rimuovi", key=f"del_promo_{i}"):
-                    settings["promo"].pop(i)
-                    save_json(SETTINGS_FILE, settings)
+                    store.update(promo=current_promos[:i] + current_promos[i + 1:])
+                    store.flush()
                     st.rerun()
     else:
         st.info("Nessuna promo configurata.")
@@ -425,9 +708,9 @@ with tabs[3]:
         with open(save_path, "wb") as f:
             f.write(uploaded.getbuffer())
         github_path = f"static/promos/{uploaded.name}"
-        if github_path not in settings.get("promo", []):
-            settings.setdefault("promo", []).append(github_path)
-            save_json(SETTINGS_FILE, settings)
+        if github_path not in settings["promo"]:
+            store.update(promo=settings["promo"] + [github_path])
+            store.flush()
         st.success(f"✅ '{uploaded.name}' salvata. Ricordati di fare l'upload su GitHub.")
         st.rerun()
 
@@ -435,8 +718,12 @@ with tabs[3]:
 # =========================
 # GITHUB
 # =========================
-with tabs[4]:
+@st.fragment
+@profiled_section("⬆️ GitHub")
+def render_github():
     st.header("⬆️ Upload su GitHub")
+    settings = load_settings()
+    secrets = load_json(SECRETS_FILE, {})
 
     username = st.text_input("Username", secrets.get("github_user", ""))
     repo     = st.text_input("Repository", secrets.get("github_repo", ""))
@@ -451,22 +738,73 @@ with tabs[4]:
 
     st.divider()
     # Mostra sempre cosa verrà pushato
-    promo_files = [
-        (os.path.join(PROMO_DIR, os.path.basename(p)), p)
-        for p in settings.get("promo", [])
-        if os.path.exists(os.path.join(PROMO_DIR, os.path.basename(p)))
-    ]
-    st.write(f"**File da caricare:** `stock.json`, `settings.json`"
+    promo_files = promo_entries(settings)
+    st.write(f"**File da caricare:** `stock.json`, `settings.json`, `playlist.json`"
              + (f" + {len(promo_files)} file promo" if promo_files else ""))
 
+    check_images = st.checkbox("🖼️ Verifica le immagini prima di pubblicare", value=True, key="check_images",
+                               help="Ripara le immagini morte con la galleria, altrimenti le segnala.")
+
     if st.button("🚀 Carica su GitHub"):
-        file_entries = [
-            (STOCK_FILE, "stock.json"),
-            (SETTINGS_FILE, "settings.json"),
-        ] + promo_files
+        file_entries = build_publish_entries(promo_files, check_images)
         success = push_to_github(username, repo, token, file_entries)
         if success:
             st.success("✅ Upload completato con successo.")
         else:
             st.error("❌ Errore durante l’upload.")
 
+    st.divider()
+    st.subheader("🏠 Pubblicazione locale (LAN)")
+    st.caption("Per un kiosk sulla stessa rete: niente attesa di GitHub Pages. "
+               "Avvia il server con `python publish_local.py serve` e apri "
+               "`http://<ip-di-questo-pc>:8080/slideshow.html` sul kiosk.")
+    if st.button("🏠 Pubblica in locale"):
+        from publish_local import publish_local
+
+        index = publish_local(build_publish_entries(promo_files, check_images), LOCAL_PUBLISH_DIR)
+        st.session_state.log.append(f"🏠 Pubblicati in locale {len(index)} file in '{LOCAL_PUBLISH_DIR}'")
+        st.success(f"✅ Pubblicazione locale aggiornata ({len(index)} file).")
+
+
+# =========================
+# RENDER SEZIONE ATTIVA
+# =========================
+render = {
+    "📊 Dashboard": render_dashboard,
+    "🕵️ Scraping": render_scraping,
+    "✏️ Editor annunci": render_editor,
+    "🎛️ Settings slideshow": render_settings,
+    "⬆️ GitHub": render_github,
+}[sezione]
+render()
+
+
+# =========================
+# PROFILER
+# =========================
+@st.fragment(run_every=2.0)
+def render_profiler():
+    """Si aggiorna da solo: i rerun dei soli fragment non rieseguono la sidebar."""
+    if st.button("🧹 Azzera misure", key="profiling_reset"):
+        profiling.reset()
+    rows = profiling.summary()
+    if rows:
+        st.dataframe(rows, hide_index=True)
+        with st.expander("🌳 Albero degli span"):
+            st.code(profiling.tree(), language=None)
+    else:
+        st.caption("Nessuna misura ancora registrata.")
+    report = profiling.last_report()
+    if report:
+        with st.expander(f"🔬 {report['kind']} — {report['label']}"):
+            st.code(report["text"], language=None)
+            if report.get("html"):
+                import streamlit.components.v1 as components
+                components.html(report["html"], height=600, scrolling=True)
+
+
+if profiling.is_enabled():
+    with st.sidebar:
+        st.divider()
+        st.subheader("⏱️ Profiler")
+        render_profiler()
@@ -0,0 +1,12 @@
+@echo off
+cd /d "%~dp0"
+echo.
+echo  ============================================
+echo   Showroom locale - server in avvio...
+echo  ============================================
+echo.
+echo  Sul kiosk apri: http://IP-DI-QUESTO-PC:8080/slideshow.html
+echo  Per chiudere: premi CTRL+C in questa finestra
+echo.
+python publish_local.py serve --port 8080
+pause
@@ -0,0 +1,64 @@
+"""
+bench_importtime.py — Costo di avvio dei moduli del CMS (`python -X importtime`).
+
+Per ogni entry point importa il modulo in un processo pulito, somma il tempo
+cumulativo dei moduli top-level e segnala quali dipendenze pesanti sono state
+caricate (dovrebbero arrivare solo quando servono: scraping, GitHub, storico).
+
+Uso (dalla cartella NEWSECTION):
+    python bench/bench_importtime.py
+    python bench/bench_importtime.py --moduli scraper app --top 15
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+# Dipendenze che non devono essere importate all'avvio
+HEAVY = ("bs4", "requests", "github", "pyarrow", "lxml")
+
+LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def importtime(module: str) -> list[tuple[int, int, int, str]]:
+    """Ritorna (self_us, cumulative_us, livello, nome) per ogni modulo importato."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} fallito:\n{proc.stderr[-2000:]}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        m = LINE.match(line)
+        if m:
+            self_us, cum_us, indent, name = m.groups()
+            rows.append((int(self_us), int(cum_us), len(indent) // 2, name))
+    return rows
+
+
+def report(module: str, top: int) -> None:
+    rows = importtime(module)
+    total = sum(cum for _, cum, level, _ in rows if level == 0)
+    loaded = {name.split(".")[0] for *_, name in rows}
+    heavy = [h for h in HEAVY if h in loaded]
+    print(f"== import {module}: {total / 1000:.1f} ms, {len(rows)} moduli")
+    print(f"   dipendenze pesanti caricate: {', '.join(heavy) or 'nessuna'}")
+    # Import diretti del modulo (livello 1): dove va il tempo
+    for _, cum, _, name in sorted((r for r in rows if r[2] == 1), key=lambda r: -r[1])[:top]:
+        print(f"   {cum / 1000:9.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--moduli", nargs="+", default=["scraper", "app"])
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    for mod in args.moduli:
+        report(mod, args.top)
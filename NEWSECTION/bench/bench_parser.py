@@ -0,0 +1,54 @@
+"""
+bench_parser.py — Parser delle card: BeautifulSoup scritto a mano contro la
+specifica compilata in XPath (lxml).
+
+Per ogni fixture misura il costo di una pagina come la vede scrape_section:
+annunci + controllo della pagina successiva (due analisi con bs4, una con
+lxml), e verifica che i risultati coincidano.
+
+Uso (dalla cartella NEWSECTION):
+    python bench/bench_parser.py
+    python bench/bench_parser.py --ripetizioni 50
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from scraper import parse_page  # noqa: E402
+
+BASE = "https://www.rotoloautomobili.com"
+
+
+def timed(html: str, engine: str, n: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        parse_page(html, 1, BASE, engine)
+    return (time.perf_counter() - t0) * 1000 / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ripetizioni", type=int, default=20)
+    args = parser.parse_args()
+
+    tot = {"bs4": 0.0, "lxml": 0.0}
+    for path in sorted((ROOT / "tests" / "fixtures").glob("*_page*.html")):
+        html = path.read_text(encoding="utf-8")
+        assert parse_page(html, 1, BASE, "bs4") == parse_page(html, 1, BASE, "lxml"), path.name
+        ms = {engine: timed(html, engine, args.ripetizioni) for engine in tot}
+        for engine in tot:
+            tot[engine] += ms[engine]
+        print(f"  {path.name:<20} {os.path.getsize(path) / 1024:5.0f} KB  "
+              f"bs4 {ms['bs4']:7.2f} ms  lxml {ms['lxml']:6.2f} ms  ×{ms['bs4'] / ms['lxml']:.1f}")
+    print(f"  {'totale':<20} {'':8} bs4 {tot['bs4']:7.2f} ms  lxml {tot['lxml']:6.2f} ms  ×{tot['bs4'] / tot['lxml']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+bench_rerun.py — Latenza dei rerun del CMS Streamlit.
+
+Esegue app.py con `streamlit.testing.v1.AppTest` su uno stock sintetico in una
+cartella temporanea e misura:
+- primo caricamento (script completo);
+- rerun dopo la modifica di un campo dell'Editor (il caso "digito un titolo").
+
+Uso (dalla cartella NEWSECTION):
+    python bench/bench_rerun.py --annunci 500 --ripetizioni 10
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from streamlit.testing.v1 import AppTest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(os.path.dirname(HERE), "app.py")
+EDITOR = "✏️ Editor annunci"
+
+
+def synthetic_stock(n: int) -> list[dict]:
+    return [
+        {
+            "titolo": f"FIAT Panda {i}",
+            "prezzo": f"{5 + i % 30}.900 €",
+            "anno": str(2010 + i % 15),
+            "km": str(1000 * i),
+            "alimentazione": "Benzina",
+            "cambio": "manuale",
+            "link": f"https://www.rotoloautomobili.com/auto/usato/fiat-panda-{i}/",
+            "immagine": "",
+            "tipo": "usato",
+            "posizione": i + 1,
+        }
+        for i in range(n)
+    ]
+
+
+def _timed(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) * 1000
+
+
+def bench(n_annunci: int, ripetizioni: int) -> dict:
+    workdir = tempfile.mkdtemp(prefix="bench_rerun_")
+    cwd = os.getcwd()
+    sys.path.insert(0, os.path.dirname(APP))
+    try:
+        os.chdir(workdir)
+        os.makedirs("data")
+        stock = synthetic_stock(n_annunci)
+        with open(os.path.join("data", "stock.json"), "w", encoding="utf-8") as f:
+            json.dump(stock, f)
+
+        primo, modifica = [], []
+        for _ in range(ripetizioni):
+            at = AppTest.from_file(APP, default_timeout=120)
+            primo.append(_timed(at.run))
+            # Porta l'Editor in primo piano se la navigazione è a sezioni
+            nav = [r for r in at.radio if r.key == "sezione"]
+            if nav:
+                nav[0].set_value(EDITOR)
+                at.run()
+            field = at.text_input(key=f"titolo_{stock[0]['link']}")
+            field.set_value(field.value + " x")
+            modifica.append(_timed(at.run))
+        return {
+            "annunci": n_annunci,
+            "primo_caricamento_ms": statistics.median(primo),
+            "rerun_modifica_editor_ms": statistics.median(modifica),
+        }
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--annunci", type=int, default=500)
+    parser.add_argument("--ripetizioni", type=int, default=10)
+    args = parser.parse_args()
+    for k, v in bench(args.annunci, args.ripetizioni).items():
+        print(f"{k:28s} {v:10.1f}" if isinstance(v, float) else f"{k:28s} {v:>10}")
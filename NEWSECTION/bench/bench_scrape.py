@@ -0,0 +1,98 @@
+"""
+bench_scrape.py — Scraping completo contro il sito finto (bench/fake_dealer.py).
+
+Per ogni configurazione dello scraper avvia un sito finto nuovo, esegue
+`run_scraper` end to end e riporta:
+- durata, pagine/s e annunci/s;
+- annunci trovati rispetto a quelli attesi (persi per errori o /Error);
+- retry fatti dallo scraper e risposte 503 / redirect servite dal sito;
+- picco di memoria allocata (tracemalloc, in un secondo giro separato per
+  non falsare i tempi).
+
+Uso (dalla cartella NEWSECTION):
+    python bench/bench_scrape.py
+    python bench/bench_scrape.py --pagine 1000 --latenza 0.02 --errori 0.05 --redirect 0.01
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, HERE)
+
+from fake_dealer import SECTION_PATHS, FakeDealer  # noqa: E402
+from scraper import run_scraper  # noqa: E402
+
+# Nome → argomenti extra per run_scraper
+CONFIGS: dict[str, dict] = {
+    "bs4": {"engine": "bs4"},
+    "lxml": {"engine": "lxml"},
+}
+
+
+def run(config: dict, site_args: dict, memory: bool = False) -> dict:
+    retries = 0
+
+    def log_fn(msg):
+        nonlocal retries
+        if "Tentativo" in str(msg):
+            retries += 1
+
+    with FakeDealer(**site_args) as site:
+        if memory:
+            tracemalloc.start()
+        t0 = time.perf_counter()
+        results = run_scraper(log_fn=log_fn, base_url=site.url, delay=0, max_pages=10**6, **config)
+        elapsed = time.perf_counter() - t0
+        peak = tracemalloc.get_traced_memory()[1] if memory else None
+        if memory:
+            tracemalloc.stop()
+        return {
+            "secondi": elapsed,
+            "trovati": len(results),
+            "attesi": site.expected,
+            "retry": retries,
+            "peak_mb": peak / 2**20 if peak is not None else None,
+            **site.stats,
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pagine", type=int, default=50, help="pagine per sezione")
+    parser.add_argument("--per-pagina", type=int, default=20)
+    parser.add_argument("--latenza", type=float, default=0.0, help="secondi per richiesta")
+    parser.add_argument("--errori", type=float, default=0.0, help="quota di risposte 503")
+    parser.add_argument("--redirect", type=float, default=0.0, help="quota di redirect a /Error")
+    parser.add_argument("--config", nargs="+", default=list(CONFIGS), choices=list(CONFIGS))
+    parser.add_argument("--no-memoria", action="store_true", help="salta il giro con tracemalloc")
+    args = parser.parse_args()
+
+    site_args = {
+        "pages": {s: args.pagine for s in SECTION_PATHS},
+        "per_page": args.per_pagina,
+        "latency": args.latenza,
+        "error_rate": args.errori,
+        "redirect_rate": args.redirect,
+    }
+    print(f"Sito finto: {args.pagine} pagine × {len(SECTION_PATHS)} sezioni × {args.per_pagina} annunci, "
+          f"latenza {args.latenza * 1000:.0f} ms, errori {args.errori:.0%}, redirect {args.redirect:.0%}")
+    for name in args.config:
+        r = run(CONFIGS[name], site_args)
+        if not args.no_memoria:
+            r["peak_mb"] = run(CONFIGS[name], site_args, memory=True)["peak_mb"]
+        mem = f"{r['peak_mb']:6.1f} MB" if r["peak_mb"] is not None else "     -"
+        print(
+            f"  {name:<10} {r['secondi']:7.2f} s  {r['pagine'] / r['secondi']:7.1f} pag/s  "
+            f"{r['trovati'] / r['secondi']:8.0f} annunci/s  trovati {r['trovati']}/{r['attesi']}  "
+            f"retry {r['retry']} (503: {r['errori']}, /Error: {r['redirect']})  picco {mem}"
+        )
+
+
+if __name__ == "__main__":
+    main()
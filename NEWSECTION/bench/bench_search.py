@@ -0,0 +1,100 @@
+"""
+bench_search.py — Costruzione e latenza delle query dell'indice di ricerca.
+
+Genera uno stock sintetico, misura la costruzione di `StockIndex` e la latenza
+media di una serie di query tipiche (testo, prefisso, faccette, intervalli),
+confrontandola con un filtro lineare sulla lista.
+
+Uso (dalla cartella NEWSECTION):
+    python bench/bench_search.py
+    python bench/bench_search.py --annunci 5000 --ripetizioni 500
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search import StockIndex, tokenize  # noqa: E402
+from storage import prezzo_to_int  # noqa: E402
+
+MODELLI = ["Fiat Panda", "Fiat 500", "Volkswagen Golf", "Volkswagen Polo", "Toyota Yaris",
+           "Renault Clio", "Peugeot 208", "Audi A3 Sportback", "BMW Serie 1", "Jeep Renegade"]
+VERSIONI = ["1.0 Hybrid", "1.2 Easy", "2.0 TDI", "1.5 eTSI", "Business", "Lounge", "S-Line"]
+
+QUERIES = [
+    {"text": "golf"},
+    {"text": "fiat pan"},
+    {"text": "tdi", "tipo": {"usato"}},
+    {"alimentazione": {"Diesel", "Ibrida"}, "cambio": {"Automatico"}},
+    {"text": "volks", "anno": (2018, 2022), "prezzo": (10000, 25000)},
+]
+
+
+def stock(n: int) -> list[dict]:
+    rnd = random.Random(42)
+    return [
+        {
+            "link": f"https://example.com/auto/{i}",
+            "titolo": f"{rnd.choice(MODELLI)} {rnd.choice(VERSIONI)}",
+            "prezzo": f"{rnd.randrange(5000, 40000, 100):,} €".replace(",", "."),
+            "anno": str(rnd.randrange(2010, 2025)),
+            "tipo": rnd.choice(["usato", "km0", "nuovo"]),
+            "alimentazione": rnd.choice(["Benzina", "Diesel", "Ibrida", "Elettrica"]),
+            "cambio": rnd.choice(["Manuale", "Automatico"]),
+        }
+        for i in range(n)
+    ]
+
+
+def linear(annunci, text="", anno=None, prezzo=None, **facets):
+    """Filtro di riferimento: scorre tutta la lista a ogni query."""
+    tokens = tokenize(text)
+    out = []
+    for a in annunci:
+        words = tokenize(a["titolo"])
+        if tokens and not (all(t in words for t in tokens[:-1]) and any(w.startswith(tokens[-1]) for w in words)):
+            continue
+        if any(values and a.get(f) not in values for f, values in facets.items()):
+            continue
+        if anno and not anno[0] <= int(a["anno"]) <= anno[1]:
+            continue
+        if prezzo and not prezzo[0] <= prezzo_to_int(a["prezzo"]) <= prezzo[1]:
+            continue
+        out.append(a)
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--annunci", type=int, default=2000)
+    parser.add_argument("--ripetizioni", type=int, default=200)
+    args = parser.parse_args()
+
+    annunci = stock(args.annunci)
+    t0 = time.perf_counter()
+    idx = StockIndex(annunci)
+    print(f"Costruzione indice ({args.annunci} annunci): {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+    for q in QUERIES:
+        q = dict(q)
+        text = q.pop("text", "")
+        assert idx.query(text, **q) == linear(annunci, text, **q)
+        t0 = time.perf_counter()
+        for _ in range(args.ripetizioni):
+            n = len(idx.query(text, **q))
+        t_idx = (time.perf_counter() - t0) * 1000 / args.ripetizioni
+        t0 = time.perf_counter()
+        for _ in range(max(1, args.ripetizioni // 20)):
+            linear(annunci, text, **q)
+        t_lin = (time.perf_counter() - t0) * 1000 / max(1, args.ripetizioni // 20)
+        label = " ".join([repr(text)] + [f"{k}={v}" for k, v in q.items()])
+        print(f"  {label:<70} {n:>5} risultati  indice {t_idx:7.3f} ms  lineare {t_lin:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+fake_dealer.py — Sito concessionario finto per provare lo scraper end to end.
+
+Genera pagine lista nello stile di rotoloautomobili.com usando le fixture in
+tests/fixtures come modelli (scheletro della pagina + card reali), con:
+- numero di pagine per sezione configurabile (anche migliaia);
+- latenza per richiesta;
+- tasso di errori 5xx e di redirect a /Error (come fa il sito vero quando
+  non gradisce i parametri);
+- contatori delle richieste servite, per confrontarli con quello che lo
+  scraper ha visto.
+
+Le pagine sono deterministiche (stessa pagina → stesse card), quindi un
+retry riceve lo stesso contenuto. Uso:
+
+    with FakeDealer(pages={"km0": 3, "usato": 10, "outlet": 2}) as site:
+        run_scraper(base_url=site.url, delay=0)
+
+oppure, da riga di comando, `python bench/fake_dealer.py --pagine 100`.
+"""
+from __future__ import annotations
+
+import argparse
+import html as html_lib
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+# Sezione → (path come in scraper.SECTIONS, fixture con le card)
+SECTION_PATHS = {
+    "km0": ("/lista-veicoli/km0/", "km0_page1.html"),
+    "usato": ("/lista-veicoli/usato/", "usato_page2.html"),
+    "outlet": ("/outlet/", "outlet_page1.html"),
+}
+
+# Id di partenza per sezione: link unici anche tra sezioni diverse
+SECTION_OFFSET = {"km0": 1_000_000, "usato": 2_000_000, "outlet": 3_000_000}
+
+_CARD_RE = re.compile(r'<a class="item" href="/auto/.*?</a>', re.S)
+_PAGEITEM_RE = re.compile(r'<a class="flx_itm[^"]*cta_pageitem".*?</a>', re.S)
+_PAGINATION_OPEN = re.compile(r'<div class="paginazione[^"]*">')
+
+ERROR_PAGE = "<html><body><h1>Errore</h1><p>La pagina richiesta non è disponibile.</p></body></html>"
+
+
+class _Template:
+    """Scheletro di una pagina lista e card di esempio, estratti da una fixture."""
+
+    def __init__(self, fixture: Path):
+        text = fixture.read_text(encoding="utf-8")
+        cards = list(_CARD_RE.finditer(text))
+        if not cards:
+            raise ValueError(f"Nessuna card nella fixture {fixture.name}")
+        self.head = text[:cards[0].start()]
+        tail = _PAGEITEM_RE.sub("", text[cards[-1].end():])
+        m = _PAGINATION_OPEN.search(tail)
+        self.tail_before, self.tail_after = (tail[:m.end()], tail[m.end():]) if m else (tail, "")
+        self.cards = [c.group() for c in cards]
+
+    def card(self, section: str, car_id: int, rnd: random.Random) -> str:
+        card = self.cards[car_id % len(self.cards)]
+        card = re.sub(r'href="/auto/[^"]*-\d+/"', f'href="/auto/{section}/auto-finta-{car_id}/"', card, count=1)
+        card = re.sub(r'data-codicestock="\d+"', f'data-codicestock="{car_id}"', card)
+        prezzo = f"{rnd.randrange(3000, 60000, 10):,} €".replace(",", ".")
+        return re.sub(r'<div class="prezzo">[^<]*</div>', f'<div class="prezzo">{prezzo}</div>', card, count=1)
+
+    def page(self, section: str, path: str, page: int, n_pages: int, per_page: int, seed: int) -> str:
+        rnd = random.Random(f"{seed}-{section}-{page}")
+        first = (page - 1) * per_page
+        cards = (
+            [self.card(section, SECTION_OFFSET[section] + first + i, rnd) for i in range(per_page)]
+            if 1 <= page <= n_pages else []
+        )
+        links = "".join(
+            f'<a class="flx_itm cta_pageitem" data-target="_partialListaVeicoli" '
+            f'href="{html_lib.escape(path)}?Page={p}"><span>{p}</span></a>'
+            for p in range(max(1, page - 2), min(n_pages, page + 2) + 1)
+        )
+        return self.head + "\n".join(cards) + self.tail_before + links + self.tail_after
+
+
+class FakeDealer:
+    """Server HTTP locale in un thread; `url` è il base_url da dare allo scraper."""
+
+    def __init__(
+        self,
+        pages: dict[str, int] | None = None,
+        per_page: int = 20,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        redirect_rate: float = 0.0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.pages = {s: 5 for s in SECTION_PATHS} if pages is None else dict(pages)
+        unknown = set(self.pages) - set(SECTION_PATHS)
+        if unknown:
+            raise ValueError(f"Sezioni sconosciute: {sorted(unknown)}. Valori validi: {list(SECTION_PATHS)}")
+        self.per_page = per_page
+        self.latency = latency
+        self.error_rate = error_rate
+        self.redirect_rate = redirect_rate
+        self.seed = seed
+        self._rnd = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"richieste": 0, "pagine": 0, "errori": 0, "redirect": 0}
+        self._templates = {s: _Template(FIXTURES / fixture) for s, (_, fixture) in SECTION_PATHS.items()}
+        self._routes = {path: s for s, (path, _) in SECTION_PATHS.items()}
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def expected(self) -> int:
+        """Annunci unici che uno scraping completo dovrebbe trovare."""
+        return sum(n * self.per_page for n in self.pages.values())
+
+    def _handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body: str = "", headers: dict | None = None):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                if site.latency:
+                    time.sleep(site.latency)
+                with site._lock:
+                    site.stats["richieste"] += 1
+                    roll = site._rnd.random()
+                if parts.path == "/Error":
+                    return self._send(200, ERROR_PAGE)
+                section = site._routes.get(parts.path)
+                if section is None or section not in site.pages:
+                    return self._send(404, ERROR_PAGE)
+                if roll < site.error_rate:
+                    with site._lock:
+                        site.stats["errori"] += 1
+                    return self._send(503, ERROR_PAGE)
+                if roll < site.error_rate + site.redirect_rate:
+                    with site._lock:
+                        site.stats["redirect"] += 1
+                    return self._send(302, "", {"Location": "/Error"})
+                try:
+                    page = int(parse_qs(parts.query).get("Page", ["1"])[0])
+                except ValueError:
+                    return self._send(302, "", {"Location": "/Error"})
+                with site._lock:
+                    site.stats["pagine"] += 1
+                body = site._templates[section].page(
+                    section, parts.path, page, site.pages[section], site.per_page, site.seed
+                )
+                self._send(200, body)
+
+        return Handler
+
+    def start(self) -> "FakeDealer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeDealer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sito concessionario finto per lo scraper")
+    parser.add_argument("--pagine", type=int, default=10, help="pagine per sezione")
+    parser.add_argument("--per-pagina", type=int, default=20)
+    parser.add_argument("--latenza", type=float, default=0.0, help="secondi per richiesta")
+    parser.add_argument("--errori", type=float, default=0.0, help="quota di risposte 503")
+    parser.add_argument("--redirect", type=float, default=0.0, help="quota di redirect a /Error")
+    parser.add_argument("--port", type=int, default=8090)
+    args = parser.parse_args()
+
+    site = FakeDealer({s: args.pagine for s in SECTION_PATHS}, args.per_pagina, args.latenza,
+                      args.errori, args.redirect, port=args.port)
+    print(f"Sito finto su {site.url} ({site.expected} annunci). Ctrl+C per uscire.")
+    try:
+        site._server.serve_forever()
+    except KeyboardInterrupt:
+        site.stop()
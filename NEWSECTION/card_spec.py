@@ -0,0 +1,223 @@
+"""
+card_spec.py — Layout delle card annuncio come specifica dichiarativa.
+
+Invece di navigare a mano il DOM (section1/t1/b, section2/t2/span, ...), il
+layout di un sito è descritto da un dict (vedi ROTOLO_SPEC) che viene
+compilato una volta in espressioni XPath precompilate di lxml. Ogni pagina
+viene parsata una sola volta: un XPath trova le card, uno la paginazione, e
+per ogni card ogni campo è una singola valutazione XPath.
+
+Formato della specifica:
+- "card": XPath delle card nella pagina;
+- "next_page": XPath degli href della paginazione;
+- "fields": campi in ordine di calcolo. Ogni campo è una regola o una lista
+  di regole alternative: vince il primo valore non vuoto tra le regole il
+  cui "if" (XPath booleano, relativo alla card) è vero. Una regola è:
+    {"xpath": ..., "text": "text" | "words" | "concat",
+     "sub": [(regex, sostituzione), ...], "url": True}
+    {"join": [campi]}   parti non vuote unite da spazio; se manca la prima
+                        parte vale solo la prima disponibile
+    {"value": costante}
+  Con "required": True una card senza quel campo viene scartata;
+- "output": campi restituiti, nell'ordine del dict risultante.
+
+Negli XPath `has-class('x')` è un'abbreviazione per il test sul token di
+classe (come `class_="x"` di BeautifulSoup). Modi di testo, con lo stesso
+risultato di BeautifulSoup: "text" = get_text(strip=True), "words" =
+get_text(" ", strip=True), "concat" = stringhe unite e poi strip.
+
+Un altro sito, o un layout cambiato, è una nuova specifica, non nuovo codice.
+lxml è opzionale: `disponibile()` dice se il motore si può usare.
+"""
+from __future__ import annotations
+
+import importlib.util
+import re
+
+# ── Specifica rotoloautomobili.com ────────────────────────────────────────────
+
+_SECTION1_T1 = "((.//div[has-class('section1')])[1]//div[has-class('t1')])[1]"
+_MARCA = f"({_SECTION1_T1}//b)[1]"
+_SECTION2 = "(.//div[has-class('section2')])[1]"
+_INFO_SPANS = "((.//div[has-class('info')])[1]//span)"
+
+
+def _pair(label: str) -> str:
+    """Valore dell'ultima riga t2 di section2 la cui etichetta contiene `label`."""
+    return (
+        f"(({_SECTION2}//div[has-class('t2')][count(.//span) >= 2]"
+        f"[contains(translate((.//span)[1], 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{label}')])"
+        f"[last()]//span)[2]"
+    )
+
+
+ROTOLO_SPEC = {
+    "card": "//a[has-class('item')][starts-with(@href, '/auto/')]",
+    "next_page": "(//div[has-class('paginazione')])[1]//a[has-class('cta_pageitem')]/@href",
+    "fields": {
+        "link": {"xpath": "@href", "url": True},
+        "tipo": {"xpath": f"{_INFO_SPANS}[1]"},
+        "anno": {"xpath": f"{_INFO_SPANS}[2]"},
+        # Prima <img> utile: niente logo marca né placeholder
+        "immagine": {
+            "xpath": "((.//div[has-class('image')])[1]//img/@src"
+                     "[. != ''][not(contains(., 'loghiqr.ibi.it'))][not(contains(., 'no_photo_default'))])[1]",
+            "url": True,
+        },
+        "marca": {"xpath": _MARCA},
+        # <b>MARCA</b> Modello base: solo i nodi di testo dopo il <b>
+        "modello_base": [
+            {"if": f"boolean({_MARCA})", "xpath": f"{_MARCA}/following-sibling::text()", "text": "concat"},
+            {"if": f"not({_MARCA})", "xpath": _SECTION1_T1, "text": "words"},
+        ],
+        "variante": {"xpath": "((.//div[has-class('section1')])[1]//div[has-class('t2')])[1]", "text": "words"},
+        "titolo": {"join": ["marca", "modello_base", "variante"], "required": True},
+        # "<b>Km</b> 203.000" → "203000"; le km0 senza dato hanno 0 km
+        "km": [
+            {"xpath": f"({_SECTION2}//div[has-class('t1')])[1]", "text": "words",
+             "sub": [(r"^[Kk]m\s*", ""), (r"[^\d]", "")]},
+            {"if": "contains(@href, '/km0/')", "value": "0"},
+        ],
+        "alimentazione": {"xpath": _pair("alimentazione")},
+        "cambio": {"xpath": _pair("cambio")},
+        "prezzo": {"xpath": "((.//div[has-class('section3')])[1]//div[has-class('prezzo')])[1]",
+                   "required": True},
+    },
+    "output": ["titolo", "prezzo", "anno", "km", "alimentazione", "cambio", "link", "immagine", "tipo"],
+}
+
+
+# ── Compilazione ──────────────────────────────────────────────────────────────
+
+_HAS_CLASS = re.compile(r"has-class\('([^']+)'\)")
+
+
+def disponibile() -> bool:
+    return importlib.util.find_spec("lxml") is not None
+
+
+def _expand(xpath: str) -> str:
+    return _HAS_CLASS.sub(
+        lambda m: f"contains(concat(' ', normalize-space(@class), ' '), ' {m.group(1)} ')", xpath
+    )
+
+
+def _text(nodes, mode: str) -> str:
+    """Testo dei risultati XPath (elementi o stringhe) secondo il modo della regola."""
+    strings = []
+    for node in nodes:
+        if isinstance(node, str):
+            strings.append(node)
+        else:
+            strings.extend(node.itertext())
+    if mode == "concat":
+        return "".join(strings).strip()
+    sep = " " if mode == "words" else ""
+    return sep.join(s.strip() for s in strings if s.strip())
+
+
+class _Rule:
+    def __init__(self, rule: dict):
+        from lxml import etree
+
+        unknown = set(rule) - {"xpath", "text", "sub", "url", "join", "value", "if", "required"}
+        if unknown:
+            raise ValueError(f"Chiavi sconosciute nella regola: {sorted(unknown)}")
+        self.cond = etree.XPath(_expand(rule["if"])) if "if" in rule else None
+        self.xpath = etree.XPath(_expand(rule["xpath"]), smart_strings=False) if "xpath" in rule else None
+        self.mode = rule.get("text", "text")
+        if self.mode not in ("text", "words", "concat"):
+            raise ValueError(f"Modo di testo sconosciuto: {self.mode!r}. Valori validi: ['text', 'words', 'concat']")
+        self.sub = [(re.compile(p), r) for p, r in rule.get("sub", ())]
+        self.url = rule.get("url", False)
+        self.join = rule.get("join")
+        self.value = rule.get("value")
+
+    def applies(self, card) -> bool:
+        return self.cond is None or bool(self.cond(card))
+
+    def evaluate(self, card, values: dict, base_url: str) -> str:
+        if self.value is not None:
+            return self.value
+        if self.join is not None:
+            parts = [values.get(name, "") for name in self.join]
+            if not parts[0]:
+                return next((p for p in parts if p), "")
+            return " ".join(p for p in parts if p).strip()
+        value = _text(self.xpath(card), self.mode)
+        for pattern, repl in self.sub:
+            value = pattern.sub(repl, value).strip()
+        if self.url and value and not value.startswith("http"):
+            value = base_url.rstrip("/") + value
+        return value
+
+
+class CompiledSpec:
+    """Specifica compilata: XPath precompilati, riusabili per tutte le pagine."""
+
+    def __init__(self, spec: dict):
+        from lxml import etree
+
+        self.cards = etree.XPath(_expand(spec["card"]))
+        self.next_page = etree.XPath(_expand(spec["next_page"]), smart_strings=False)
+        self.fields: list[tuple[str, list[_Rule], bool]] = []
+        for name, rules in spec["fields"].items():
+            rules = rules if isinstance(rules, list) else [rules]
+            required = any(r.get("required") for r in rules)
+            self.fields.append((name, [_Rule(r) for r in rules], required))
+        self.output = list(spec["output"])
+        missing = set(self.output) - {name for name, _, _ in self.fields}
+        if missing:
+            raise ValueError(f"Campi in output non definiti: {sorted(missing)}")
+
+    def parse_card(self, card, base_url: str) -> dict | None:
+        values: dict[str, str] = {}
+        for name, rules, required in self.fields:
+            value = ""
+            for rule in rules:
+                if rule.applies(card):
+                    value = rule.evaluate(card, values, base_url)
+                    if value:
+                        break
+            if required and not value:
+                return None
+            values[name] = value
+        return {name: values[name] for name in self.output}
+
+    def parse_page(self, html: str, base_url: str) -> tuple[list[dict], list[str]]:
+        """
+        Un solo parse: (annunci senza duplicati di link, href della paginazione).
+        Una pagina vuota, di soli spazi o commenti vale ([], []) come con bs4.
+        """
+        import lxml.html
+        from lxml import etree
+
+        try:
+            try:
+                root = lxml.html.fromstring(html)
+            except ValueError:
+                # str con dichiarazione <?xml ... encoding?>: lxml la rifiuta,
+                # quindi si riparte dai byte UTF-8 forzando la codifica
+                parser = lxml.html.HTMLParser(encoding="utf-8")
+                root = lxml.html.fromstring(html.encode("utf-8"), parser=parser)
+        except etree.ParserError:
+            return [], []
+        results, seen = [], set()
+        for card in self.cards(root):
+            listing = self.parse_card(card, base_url)
+            if listing is None or listing["link"] in seen:
+                continue
+            seen.add(listing["link"])
+            results.append(listing)
+        return results, list(self.next_page(root))
+
+
+_compiled: dict[int, CompiledSpec] = {}
+
+
+def compiled(spec: dict = ROTOLO_SPEC) -> CompiledSpec:
+    """Compila la specifica al primo uso e la riusa."""
+    key = id(spec)
+    if key not in _compiled:
+        _compiled[key] = CompiledSpec(spec)
+    return _compiled[key]
@@ -0,0 +1,276 @@
+"""
+enrich.py — Arricchimento degli annunci dalle pagine di dettaglio (/auto/...).
+
+Le pagine lista danno una sola immagine e pochi campi. Qui, per ogni annuncio
+nuovo o cambiato rispetto allo scraping precedente, si scarica la pagina di
+dettaglio e si aggiungono:
+- `galleria`: tutte le foto dell'auto (URL assoluti, in ordine, senza loghi
+  né placeholder);
+- `specifiche`: {etichetta: valore} dalle schede tecniche.
+
+"Cambiato" si decide con una firma dei campi della card (titolo, prezzo, km,
+anno, immagine): se la firma in cache coincide, i campi arricchiti si
+riprendono dalla cache senza richieste. Le pagine da scaricare vanno in un
+pool di thread limitato, con una Session per thread.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from urllib.parse import urljoin
+
+from profiling import profiled, span
+
+# ── Configurazione ────────────────────────────────────────────────────────────
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_TIMEOUT = 20.0
+MAX_RETRIES = 2
+
+# Campi della card che, se cambiano, rendono vecchio il dettaglio in cache
+FIRMA_FIELDS = ("titolo", "prezzo", "km", "anno", "immagine")
+
+# Campi aggiunti all'annuncio
+ENRICHED_FIELDS = ("galleria", "specifiche")
+
+_IMG_EXT = re.compile(r"\.(?:jpe?g|png|webp|avif)(?:$|\?)", re.I)
+# Loghi marca e placeholder del sito
+_EXCLUDE = ("loghiqr.ibi.it", "no_photo_default", "logo")
+# Contenitori della galleria (slider, carousel, ...): se presenti si cercano solo lì
+_GALLERY_CLASS = re.compile(r"galler|slider|swiper|carousel|foto|photo", re.I)
+# Card di altri annunci ("veicoli simili"): le loro foto non sono di questa auto
+_CARD_HREF = re.compile(r"^(?:https?://[^/]+)?/auto/")
+_SPEC_CLASS = re.compile(r"spec|scheda|dati|caratteristic|dettagl|equip|accessori", re.I)
+
+
+# ── Parsing ───────────────────────────────────────────────────────────────────
+
+def _spec_key(label: str) -> str:
+    label = unicodedata.normalize("NFKD", label).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "_", label.lower()).strip("_")
+
+
+def _img_sources(img) -> list[str]:
+    """src e varianti lazy-load di un <img>/<source>."""
+    out = []
+    for attr in ("data-src", "data-lazy", "data-original", "src", "href"):
+        value = img.get(attr)
+        if value and not value.startswith("data:"):
+            out.append(value)
+    srcset = img.get("data-srcset") or img.get("srcset")
+    if srcset:
+        out.append(srcset.split(",")[0].strip().split(" ")[0])
+    return out
+
+
+def _in_listing_card(el) -> bool:
+    return el.find_parent("a", class_="item", href=_CARD_HREF) is not None
+
+
+def parse_gallery(soup, page_url: str) -> list[str]:
+    """
+    URL assoluti delle foto, nell'ordine della pagina. Si cercano solo nei
+    contenitori della galleria: senza contenitore la galleria è vuota (il resto
+    della pagina può avere foto di altre auto, es. i "veicoli simili").
+    """
+    containers = [el for el in soup.find_all(class_=_GALLERY_CLASS)
+                  if not _in_listing_card(el)
+                  and (el.find(["img", "source"]) or el.find("a", href=_IMG_EXT))]
+    urls = []
+    for root in containers:
+        for el in root.find_all(["img", "source", "a"]):
+            if el.name == "a" and not _IMG_EXT.search(el.get("href", "")):
+                continue
+            if _in_listing_card(el):
+                continue
+            # Miniatura dentro un link alla foto grande: vale il link
+            if el.name != "a" and el.find_parent("a", href=_IMG_EXT):
+                continue
+            for src in _img_sources(el):
+                url = urljoin(page_url, src)
+                if any(x in url for x in _EXCLUDE):
+                    continue
+                if _IMG_EXT.search(url):
+                    urls.append(url)
+                    break
+    return list(dict.fromkeys(urls))
+
+
+def parse_specs(soup) -> dict[str, str]:
+    """
+    Coppie etichetta/valore delle schede tecniche. Riconosce le strutture
+    usate dal sito e quelle comuni: <dl><dt><dd>, righe di tabella e blocchi
+    con due <span> (come nelle card: <span>Cambio</span><span>manuale</span>).
+    """
+    specs: dict[str, str] = {}
+
+    def add(label, value):
+        key = _spec_key(label)
+        value = " ".join(value.split())
+        if key and value and key not in specs:
+            specs[key] = value
+
+    # Un solo passaggio in ordine di documento: a parità di etichetta vince la prima
+    for el in soup.find_all(["dt", "tr", "div", "li"]):
+        if el.name == "dt":
+            dd = el.find_next_sibling("dd")
+            if dd:
+                add(el.get_text(" ", strip=True), dd.get_text(" ", strip=True))
+        elif el.name == "tr":
+            cells = el.find_all(["th", "td"], recursive=False)
+            if len(cells) == 2:
+                add(cells[0].get_text(" ", strip=True), cells[1].get_text(" ", strip=True))
+        else:
+            spans = el.find_all("span", recursive=False)
+            if len(spans) == 2 and el.find_parent(class_=_SPEC_CLASS):
+                add(spans[0].get_text(" ", strip=True), spans[1].get_text(" ", strip=True))
+    return specs
+
+
+@profiled("enrich.parse_detail")
+def parse_detail(html: str, page_url: str) -> dict:
+    """Campi arricchiti ({"galleria", "specifiche"}) da una pagina di dettaglio."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    return {"galleria": parse_gallery(soup, page_url), "specifiche": parse_specs(soup)}
+
+
+# ── Cache ─────────────────────────────────────────────────────────────────────
+
+def firma(item: dict) -> str:
+    """Impronta dei campi della card: cambia se l'annuncio è stato modificato."""
+    raw = json.dumps([str(item.get(f, "")) for f in FIRMA_FIELDS], ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+class DetailCache:
+    """{link: {"firma", "galleria", "specifiche", "scaricato"}} su file JSON."""
+
+    def __init__(self, path: str | None):
+        self.path = path
+        self._data: dict[str, dict] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._data = data if isinstance(data, dict) else {}
+            except (json.JSONDecodeError, ValueError, OSError):
+                self._data = {}
+
+    def get(self, link: str) -> dict | None:
+        return self._data.get(link)
+
+    def put(self, link: str, entry: dict) -> None:
+        self._data[link] = entry
+
+    def prune(self, keep) -> int:
+        """Elimina i link non più in stock. Ritorna quanti ne ha tolti."""
+        keep = set(keep)
+        stale = [link for link in self._data if link not in keep]
+        for link in stale:
+            del self._data[link]
+        return len(stale)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._data, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+
+# ── Download ──────────────────────────────────────────────────────────────────
+
+_local = threading.local()
+
+
+def _session():
+    import requests
+    from scraper import HEADERS
+
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        _local.session = session
+    return session
+
+
+def fetch_detail(link: str, timeout: float = DEFAULT_TIMEOUT) -> dict | None:
+    """Scarica e parsa una pagina di dettaglio; None se non raggiungibile."""
+    import requests
+
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            with span("http.get"):
+                resp = _session().get(link, timeout=timeout)
+            # Il sito rimanda a /Error invece di rispondere 404
+            if resp.status_code == 404 or "/Error" in resp.url:
+                return None
+            resp.raise_for_status()
+            return parse_detail(resp.text, resp.url)
+        except requests.RequestException:
+            if attempt < MAX_RETRIES:
+                time.sleep(0.5 * attempt)
+    return None
+
+
+# ── Arricchimento ─────────────────────────────────────────────────────────────
+
+@profiled("enrich.enrich_listings")
+def enrich_listings(
+    annunci: list[dict],
+    cache: DetailCache | None = None,
+    log_fn: Callable = print,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    fetch: Callable[[str], dict | None] = fetch_detail,
+) -> dict:
+    """
+    Aggiunge `galleria` e `specifiche` agli annunci (in place). Scarica solo
+    i dettagli dei link nuovi o con firma cambiata; gli altri vengono dalla
+    cache. Ritorna le statistiche.
+    """
+    cache = cache or DetailCache(None)
+    todo = []
+    stats = {"annunci": len(annunci), "dalla_cache": 0, "scaricati": 0, "falliti": 0}
+    for item in annunci:
+        link = item.get("link")
+        if not link:
+            continue
+        entry = cache.get(link)
+        if entry and entry.get("firma") == firma(item):
+            item.update({f: entry[f] for f in ENRICHED_FIELDS if f in entry})
+            stats["dalla_cache"] += 1
+        else:
+            todo.append(item)
+
+    log_fn(f"[dettagli] {stats['dalla_cache']} dalla cache, {len(todo)} da scaricare")
+    t0 = time.perf_counter()
+    if todo:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="enrich") as pool:
+            for item, detail in zip(todo, pool.map(lambda a: fetch(a["link"]), todo)):
+                entry = cache.get(item["link"])
+                if detail is None:
+                    stats["falliti"] += 1
+                    # Riprova al prossimo giro, ma intanto tiene i dati vecchi se ci sono
+                    if entry:
+                        item.update({f: entry[f] for f in ENRICHED_FIELDS if f in entry})
+                    continue
+                stats["scaricati"] += 1
+                item.update(detail)
+                cache.put(item["link"], {"firma": firma(item), **detail, "scaricato": time.time()})
+
+    stats["rimossi_dalla_cache"] = cache.prune(a.get("link") for a in annunci)
+    cache.save()
+    stats["secondi"] = round(time.perf_counter() - t0, 2)
+    log_fn(f"[dettagli] scaricati {stats['scaricati']}, falliti {stats['falliti']} in {stats['secondi']} s")
+    return stats
@@ -0,0 +1,253 @@
+"""
+image_check.py — Verifica delle immagini degli annunci prima della pubblicazione.
+
+Un URL `immagine` rotto si vede solo sul kiosk (fallback `onError`). Qui ogni
+immagine dello stock viene controllata in anticipo:
+- HEAD, e se il server non lo supporta GET con `Range: bytes=0-0`;
+- richieste concorrenti in un pool limitato (asyncio sopra un executor di
+  thread con una Session `requests` per thread, connessioni riusate);
+- cache su disco per URL con TTL: scaduto il TTL, se c'è un ETag si rivalida
+  con `If-None-Match` (un 304 costa pochi byte);
+- gli annunci con immagine morta vengono riparati con il primo candidato vivo
+  della `galleria`, altrimenti (anche se non hanno proprio un URL) segnati
+  con `immagine_ko`: la playlist del kiosk li salta e l'Editor li evidenzia.
+
+`validate_images()` ritorna le modifiche nel formato di
+`stock_store.apply_edits()` ({link: {campo: valore}}).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# ── Configurazione ────────────────────────────────────────────────────────────
+
+DEFAULT_CONCURRENCY = 64
+DEFAULT_TIMEOUT = 8.0
+DEFAULT_TTL = 24 * 3600
+# Un esito negativo si riprova prima: può essere un errore temporaneo
+FAILED_TTL = 3600
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; CMS-Annunci image check)",
+    "Accept": "image/*",
+}
+
+# Status per cui HEAD non è affidabile e si riprova con una GET parziale
+_HEAD_UNSUPPORTED = {403, 405, 501}
+
+
+# ── Cache ─────────────────────────────────────────────────────────────────────
+
+class ImageCache:
+    """Esiti per URL su file JSON: {url: {"ok", "status", "etag", "checked"}}."""
+
+    def __init__(self, path: str | None, ttl: float = DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data: dict[str, dict] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._data = data if isinstance(data, dict) else {}
+            except (json.JSONDecodeError, ValueError, OSError):
+                self._data = {}
+
+    def get(self, url: str) -> dict | None:
+        with self._lock:
+            return self._data.get(url)
+
+    def fresh(self, url: str, now: float | None = None) -> dict | None:
+        """L'esito in cache se ancora valido per il suo TTL, altrimenti None."""
+        entry = self.get(url)
+        if entry is None:
+            return None
+        ttl = self.ttl if entry.get("ok") else min(self.ttl, FAILED_TTL)
+        if (now or time.time()) - entry.get("checked", 0) < ttl:
+            return entry
+        return None
+
+    def put(self, url: str, result: dict) -> None:
+        with self._lock:
+            self._data[url] = result
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            data = dict(self._data)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+
+# ── Controllo di un URL ───────────────────────────────────────────────────────
+
+_local = threading.local()
+
+
+def _session():
+    """Una Session per thread: keep-alive senza condividere lo stato tra thread."""
+    import requests
+
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        _local.session = session
+    return session
+
+
+def _is_image(resp) -> bool:
+    ctype = resp.headers.get("Content-Type", "")
+    # Alcuni CDN non mandano Content-Type su HEAD: in quel caso basta lo status
+    return not ctype or ctype.startswith("image/") or ctype.startswith("application/octet-stream")
+
+
+def check_url(
+    url: str, etag: str | None = None, timeout: float = DEFAULT_TIMEOUT, cached_ok: bool = True
+) -> dict:
+    """
+    Controlla un URL e ritorna {"ok", "status", "etag", "checked"}.
+    Con `etag` la richiesta è condizionale: 304 significa risorsa invariata,
+    quindi l'esito resta quello della verifica precedente (`cached_ok`): una
+    pagina HTML al posto della foto resta non valida anche se non cambia.
+    """
+    import requests
+
+    session = _session()
+    cond = {"If-None-Match": etag} if etag else {}
+    status = 0
+    try:
+        resp = session.head(url, headers=cond, timeout=timeout, allow_redirects=True)
+        if resp.status_code in _HEAD_UNSUPPORTED:
+            resp = session.get(url, headers={**cond, "Range": "bytes=0-0"},
+                               timeout=timeout, allow_redirects=True, stream=True)
+            resp.close()
+        status = resp.status_code
+        if status == 304:
+            ok, new_etag = cached_ok, etag
+        else:
+            ok = 200 <= status < 300 and _is_image(resp)
+            new_etag = resp.headers.get("ETag")
+    except requests.RequestException:
+        ok, new_etag = False, None
+    return {"ok": ok, "status": status, "etag": new_etag, "checked": time.time()}
+
+
+async def _check_all(urls: list[str], cache: ImageCache, concurrency: int, timeout: float) -> dict[str, dict]:
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="image-check") as pool:
+        async def one(url: str) -> tuple[str, dict]:
+            previous = cache.get(url) or {}
+            result = await loop.run_in_executor(
+                pool, check_url, url, previous.get("etag"), timeout, previous.get("ok", False)
+            )
+            cache.put(url, result)
+            return url, result
+
+        return dict(await asyncio.gather(*(one(u) for u in urls)))
+
+
+def check_urls(
+    urls,
+    cache: ImageCache | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> tuple[dict[str, dict], int]:
+    """
+    Controlla gli URL (deduplicati) usando la cache dove ancora valida.
+    Ritorna ({url: esito}, quanti presi dalla cache).
+    """
+    cache = cache or ImageCache(None)
+    now = time.time()
+    results: dict[str, dict] = {}
+    todo = []
+    for url in dict.fromkeys(urls):
+        entry = cache.fresh(url, now)
+        if entry is not None:
+            results[url] = entry
+        else:
+            todo.append(url)
+    from_cache = len(results)
+    if todo:
+        results.update(asyncio.run(_check_all(todo, cache, max(1, concurrency), timeout)))
+    return results, from_cache
+
+
+# ── Annunci ───────────────────────────────────────────────────────────────────
+
+def _candidates(item: dict) -> list[str]:
+    """Immagine principale seguita dalla galleria, solo URL http(s), senza duplicati."""
+    urls = [item.get("immagine", "")] + list(item.get("galleria") or [])
+    return list(dict.fromkeys(u for u in urls if isinstance(u, str) and u.startswith(("http://", "https://"))))
+
+
+def validate_images(
+    annunci: list[dict],
+    cache: ImageCache | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> tuple[dict[str, dict], dict]:
+    """
+    Verifica le immagini dello stock in due passate: prima le principali, poi
+    i candidati della galleria solo per gli annunci con immagine morta.
+    Ritorna (modifiche {link: campi}, statistiche).
+    """
+    t0 = time.perf_counter()
+    candidates = {a["link"]: _candidates(a) for a in annunci if a.get("link")}
+    primary = {link: urls[0] for link, urls in candidates.items() if urls}
+
+    results, from_cache = check_urls(primary.values(), cache, concurrency, timeout)
+    dead = [link for link, url in primary.items() if not results[url]["ok"]]
+
+    fallback = [u for link in dead for u in candidates[link][1:]]
+    if fallback:
+        more, cached = check_urls(fallback, cache, concurrency, timeout)
+        results.update(more)
+        from_cache += cached
+
+    edits: dict[str, dict] = {}
+    stats = {"controllate": len(results), "dalla_cache": from_cache, "ok": 0, "riparate": 0, "ko": 0}
+    by_link = {a["link"]: a for a in annunci if a.get("link")}
+    # Anche gli annunci senza alcun URL http: nessuna immagine da mostrare, quindi KO
+    for link, item in by_link.items():
+        alive = next((u for u in candidates[link] if results[u]["ok"]), None)
+        if alive and alive == item.get("immagine"):
+            stats["ok"] += 1
+            fields = {"immagine_ko": False} if item.get("immagine_ko") else {}
+        elif alive:
+            stats["riparate"] += 1
+            fields = {"immagine": alive}
+            if item.get("immagine_ko"):
+                fields["immagine_ko"] = False
+        else:
+            stats["ko"] += 1
+            fields = {} if item.get("immagine_ko") else {"immagine_ko": True}
+        if fields:
+            edits[link] = fields
+
+    if cache is not None:
+        cache.save()
+    stats["secondi"] = round(time.perf_counter() - t0, 2)
+    return edits, stats
+
+
+# ── CLI ───────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    from storage import open_stock_store
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    store = open_stock_store(os.path.join(here, "data"))
+    cache = ImageCache(os.path.join(here, "data", "immagini_cache.json"))
+    edits, stats = validate_images(store.load(), cache)
+    store.apply_edits(edits, reorder=False)
+    print(stats)
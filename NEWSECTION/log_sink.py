@@ -0,0 +1,136 @@
+"""
+log_sink.py — Log strutturato con buffer circolare e file ruotati.
+
+`LogSink` sostituisce la lista di righe dello scraping:
+- in memoria tiene solo le ultime `capacity` voci (deque limitata), ognuna
+  con numero progressivo, ora, livello e messaggio;
+- su disco scrive tutto in un file di testo ruotato a `max_bytes`
+  (log → log.1 → log.2 ..., al massimo `backups` file vecchi);
+- è thread-safe e si usa direttamente come `log_fn` dello scraper: il
+  livello si ricava dal testo del messaggio (LEVEL_RULES).
+
+Chi mostra il log legge solo la coda che gli serve (`entries`), filtrata per
+livello, o le voci nuove dopo un numero progressivo (`after`).
+"""
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from collections import deque
+
+# ── Configurazione ────────────────────────────────────────────────────────────
+
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+_RANK = {name: i for i, name in enumerate(LEVELS)}
+
+# Livello dedotto dai messaggi dello scraper (prima regola che corrisponde)
+LEVEL_RULES = (
+    (re.compile(r"tutti i tentativi falliti|interrott|Errore", re.I), "ERROR"),
+    (re.compile(r"Tentativo \d+/\d+ fallito|Raggiunto limite|falliti [1-9]", re.I), "WARNING"),
+    (re.compile(r"Pagina \d+\.\.\.$"), "DEBUG"),
+)
+
+
+def level_of(msg: str) -> str:
+    for pattern, level in LEVEL_RULES:
+        if pattern.search(msg):
+            return level
+    return "INFO"
+
+
+def format_entry(entry: dict) -> str:
+    return f"{time.strftime('%H:%M:%S', time.localtime(entry['ts']))} {entry['level']:<7} {entry['msg']}"
+
+
+# ── Sink ──────────────────────────────────────────────────────────────────────
+
+class LogSink:
+    """Buffer circolare di voci di log, con copia completa su file ruotati."""
+
+    def __init__(self, capacity: int = 2000, path: str | None = None,
+                 max_bytes: int = 1_000_000, backups: int = 3):
+        self.capacity = capacity
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+        self._buffer: deque[dict] = deque(maxlen=capacity)
+        self._seq = 0
+        self._file = None
+
+    def __call__(self, msg) -> None:
+        """Interfaccia `log_fn`: una voce per riga non vuota, livello dedotto dal testo."""
+        for line in str(msg).splitlines():
+            if line.strip():
+                self.log(level_of(line), line)
+
+    def log(self, level: str, msg: str) -> dict:
+        if level not in _RANK:
+            raise ValueError(f"Livello sconosciuto: {level!r}. Valori validi: {list(LEVELS)}")
+        with self._lock:
+            self._seq += 1
+            entry = {"seq": self._seq, "ts": time.time(), "level": level, "msg": str(msg)}
+            self._buffer.append(entry)
+            if self.path:
+                self._write(format_entry(entry) + "\n")
+        return entry
+
+    # ── File ──
+
+    def _write(self, line: str) -> None:
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+        self._file.write(line)
+        if self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    # ── Lettura ──
+
+    @property
+    def last_seq(self) -> int:
+        """Numero progressivo dell'ultima voce (0 se vuoto)."""
+        return self._seq
+
+    @property
+    def dropped(self) -> int:
+        """Voci uscite dal buffer (restano solo nel file)."""
+        with self._lock:
+            return self._seq - len(self._buffer)
+
+    def entries(self, after: int = 0, min_level: str = "DEBUG", limit: int | None = None) -> list[dict]:
+        """
+        Voci con seq > `after` e livello >= `min_level`, in ordine. Con `limit`
+        solo le ultime `limit`. Si scorre dalla fine e ci si ferma appena
+        possibile: al massimo `capacity` voci, mai lo storico completo.
+        """
+        rank = _RANK[min_level]
+        out = []
+        with self._lock:
+            for entry in reversed(self._buffer):
+                if entry["seq"] <= after or (limit is not None and len(out) >= limit):
+                    break
+                if _RANK[entry["level"]] >= rank:
+                    out.append(entry)
+        out.reverse()
+        return out
@@ -0,0 +1,187 @@
+"""
+profiling.py — Misure di tempo opzionali per CMS e scraper.
+
+Spento di default. Si attiva con la variabile d'ambiente CMS_PROFILE=1 oppure
+dal toggle nella sidebar del CMS (`set_enabled`). Da spento, `span()` e
+`profiled()` costano un controllo di flag.
+
+- `span(nome)`: context manager che registra la durata di un blocco; gli span
+  annidati vengono registrati con il percorso completo ("render/load_json").
+- `profiled(nome)`: lo stesso, come decorator.
+- `sampler()`: profiler a campionamento attorno a un blocco — pyinstrument se
+  installato, altrimenti cProfile della libreria standard.
+- `summary()` / `tree()`: aggregati per il pannello del CMS.
+"""
+from __future__ import annotations
+
+import functools
+import importlib.util
+import io
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# ── Configurazione ────────────────────────────────────────────────────────────
+
+ENV_VAR = "CMS_PROFILE"
+
+# Ultimi span conservati (circa qualche decina di rerun)
+MAX_SPANS = 5000
+
+_spans: deque[tuple[str, float, float]] = deque(maxlen=MAX_SPANS)
+_lock = threading.Lock()
+_stack: ContextVar[tuple[str, ...]] = ContextVar("profiling_stack", default=())
+_last_report: dict = {}
+
+
+def env_enabled() -> bool:
+    """True se il profiling è richiesto da variabile d'ambiente."""
+    return os.environ.get(ENV_VAR, "").lower() in ("1", "true", "yes", "on")
+
+
+_enabled = env_enabled()
+
+
+def set_enabled(value: bool) -> None:
+    global _enabled
+    _enabled = bool(value)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    with _lock:
+        _spans.clear()
+        _last_report.clear()
+
+
+# ── Span ──────────────────────────────────────────────────────────────────────
+
+@contextmanager
+def span(name: str):
+    """Misura il blocco e lo registra come figlio dello span corrente."""
+    if not _enabled:
+        yield
+        return
+    path = _stack.get() + (name,)
+    token = _stack.set(path)
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - t0) * 1000
+        _stack.reset(token)
+        with _lock:
+            _spans.append(("/".join(path), elapsed, time.time()))
+
+
+def profiled(name: str | None = None):
+    """Decorator: `@profiled()` usa il nome qualificato della funzione."""
+    def decorator(fn):
+        label = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with span(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ── Profiler a campionamento ──────────────────────────────────────────────────
+
+def sampler_name() -> str:
+    return "pyinstrument" if importlib.util.find_spec("pyinstrument") else "cProfile"
+
+
+@contextmanager
+def sampler(label: str = "rerun"):
+    """
+    Profila il blocco con pyinstrument (HTML con flame/call tree) o cProfile
+    (testo, funzioni ordinate per tempo cumulativo). Il risultato è letto
+    con `last_report()`.
+    """
+    if not _enabled:
+        yield
+        return
+    # Import al primo uso: il profiler non deve pesare sull'avvio
+    if sampler_name() == "pyinstrument":
+        import pyinstrument
+
+        profiler = pyinstrument.Profiler(interval=0.001)
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            report = {"label": label, "kind": "pyinstrument", "html": profiler.output_html(),
+                      "text": profiler.output_text(unicode=True)}
+            with _lock:
+                _last_report.clear()
+                _last_report.update(report)
+        return
+
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(40)
+        with _lock:
+            _last_report.clear()
+            _last_report.update({"label": label, "kind": "cProfile", "text": out.getvalue()})
+
+
+def last_report() -> dict:
+    with _lock:
+        return dict(_last_report)
+
+
+# ── Report ────────────────────────────────────────────────────────────────────
+
+def summary() -> list[dict]:
+    """Aggregato per span: chiamate, totale, media e massimo in ms (per totale decrescente)."""
+    with _lock:
+        spans = list(_spans)
+    agg: dict[str, list[float]] = {}
+    for path, ms, _ in spans:
+        agg.setdefault(path, []).append(ms)
+    rows = [
+        {
+            "span": path,
+            "chiamate": len(values),
+            "totale_ms": round(sum(values), 2),
+            "media_ms": round(sum(values) / len(values), 3),
+            "max_ms": round(max(values), 2),
+        }
+        for path, values in agg.items()
+    ]
+    rows.sort(key=lambda r: r["totale_ms"], reverse=True)
+    return rows
+
+
+def tree() -> str:
+    """Vista ad albero (tipo flame graph testuale) del tempo totale per span."""
+    rows = summary()
+    if not rows:
+        return ""
+    totals = {r["span"]: r for r in rows}
+    lines = []
+    for path in sorted(totals):
+        r = totals[path]
+        depth = path.count("/")
+        leaf = path.rsplit("/", 1)[-1]
+        lines.append(f"{'  ' * depth}{leaf:<{max(1, 48 - 2 * depth)}} {r['totale_ms']:>10.1f} ms  ×{r['chiamate']}")
+    return "\n".join(lines)
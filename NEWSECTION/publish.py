@@ -0,0 +1,290 @@
+"""
+publish.py — Artefatti pubblicati per il kiosk.
+
+Trasforma `data/stock.json` + `settings.json` in una `playlist.json` pronta da
+riprodurre: ordine (`ordine`), troncamento (`max_annunci`) e promo ogni
+PROMO_EVERY auto sono già applicati, con solo i campi che le slide mostrano.
+Il kiosk non deve più mescolare né filtrare l'intero stock ad ogni caricamento.
+
+Pubblica anche un feed versionato dello stock (`feed/`): un manifest con numero
+di versione crescente, delta JSON Patch (RFC 6902) tra versioni consecutive
+calcolati sul documento {link: annuncio}, e snapshot completi ogni
+FEED_SNAPSHOT_EVERY versioni per chi è rimasto troppo indietro. Un kiosk
+indietro di una versione scarica poche centinaia di byte invece dello stock.
+
+Uso da riga di comando (dalla cartella NEWSECTION):
+    python publish.py
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+
+from settings_store import DEFAULT_SETTINGS
+from storage import load_json, save_json, pos_key
+
+# ── Configurazione ────────────────────────────────────────────────────────────
+
+PLAYLIST_VERSION = 1
+
+# Ogni quante auto inserire una promo (come `buildSlides` in Showroom.jsx)
+PROMO_EVERY = 4
+
+# Campi letti da CarSlide / MiniCarCard; il resto dello stock non serve al kiosk
+CAR_FIELDS = ("titolo", "prezzo", "anno", "km", "alimentazione", "cambio", "immagine", "tipo", "link")
+
+# Uno snapshot completo ogni N versioni del feed
+FEED_SNAPSHOT_EVERY = 20
+
+
+# ── Playlist ──────────────────────────────────────────────────────────────────
+
+def playlist_seed(annunci: list[dict], settings: dict) -> int:
+    """
+    Seed deterministico derivato dal contenuto: stessi stock e settings
+    producono sempre la stessa playlist, uno stock diverso la rimescola.
+    """
+    h = hashlib.sha256()
+    for link in sorted(a.get("link", "") for a in annunci):
+        h.update(link.encode("utf-8"))
+    h.update(json.dumps(settings, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    return int.from_bytes(h.digest()[:8], "big")
+
+
+def slim_car(annuncio: dict) -> dict:
+    """Solo i campi mostrati dalle slide, senza valori vuoti."""
+    return {k: annuncio[k] for k in CAR_FIELDS if annuncio.get(k) not in (None, "")}
+
+
+def build_playlist(
+    annunci: list[dict],
+    settings: dict,
+    seed: int | None = None,
+    feed_versione: int | None = None,
+) -> dict:
+    """
+    Costruisce la playlist del kiosk.
+    - ordine "Posizione": per posizione crescente; "Casuale": mescolato con `seed`
+    - al massimo `max_annunci` auto, escluse quelle con `immagine_ko` (nessuna
+      immagine raggiungibile all'ultima verifica, vedi image_check.py)
+    - una promo ogni PROMO_EVERY auto, a rotazione sulla lista `promo`
+    `feed_versione` indica la versione del feed da cui il kiosk applicherà i delta.
+    """
+    settings = {**DEFAULT_SETTINGS, **(settings or {})}
+    if seed is None:
+        seed = playlist_seed(annunci, settings)
+
+    cars = [a for a in annunci if a.get("link") and not a.get("immagine_ko")]
+    if settings["ordine"] == "Posizione":
+        cars.sort(key=pos_key)
+    else:
+        cars.sort(key=lambda a: a["link"])
+        random.Random(seed).shuffle(cars)
+
+    try:
+        max_annunci = int(settings["max_annunci"])
+    except (TypeError, ValueError):
+        max_annunci = DEFAULT_SETTINGS["max_annunci"]
+    cars = cars[:max(0, max_annunci)]
+
+    promos = list(settings.get("promo") or [])
+    slides = []
+    for n, car in enumerate(cars, start=1):
+        slides.append({"type": "car", "data": slim_car(car)})
+        if promos and n % PROMO_EVERY == 0:
+            slides.append({"type": "promo", "data": promos[(n // PROMO_EVERY - 1) % len(promos)]})
+
+    playlist = {
+        "versione": PLAYLIST_VERSION,
+        "seed": seed,
+        "durata_slide": settings["durata_slide"],
+        "max_annunci": max_annunci,
+        "slides": slides,
+    }
+    if feed_versione is not None:
+        playlist["feed_versione"] = feed_versione
+    return playlist
+
+
+def write_playlist(
+    stock_path: str,
+    settings_path: str,
+    out_path: str,
+    seed: int | None = None,
+    feed_versione: int | None = None,
+) -> dict:
+    """Legge stock e settings da disco e scrive la playlist compatta."""
+    annunci = load_json(stock_path, [])
+    if not isinstance(annunci, list):
+        annunci = []
+    settings = load_json(settings_path, DEFAULT_SETTINGS)
+    playlist = build_playlist(annunci, settings, seed=seed, feed_versione=feed_versione)
+    # Atomico (il subscriber delle impostazioni la riscrive da un altro thread)
+    # e senza indentazione: il file viaggia verso il kiosk
+    save_json(out_path, playlist, compact=True)
+    return playlist
+
+
+# ── Feed versionato ───────────────────────────────────────────────────────────
+
+def feed_document(annunci: list[dict]) -> dict:
+    """
+    Documento del feed: {link: annuncio ridotto ai campi del kiosk}.
+    Come `build_playlist` esclude gli annunci con `immagine_ko`: segnalarne uno
+    produce una "remove" nel delta, ripararlo una "add".
+    """
+    return {a["link"]: slim_car(a) for a in annunci if a.get("link") and not a.get("immagine_ko")}
+
+
+def _pointer(*parts: str) -> str:
+    """JSON Pointer (RFC 6901): '~' → '~0', '/' → '~1'."""
+    return "".join("/" + p.replace("~", "~0").replace("/", "~1") for p in parts)
+
+
+def _unpointer(path: str) -> list[str]:
+    return [p.replace("~1", "/").replace("~0", "~") for p in path.split("/")[1:]]
+
+
+def diff_feed(old: dict, new: dict) -> list[dict]:
+    """
+    Delta JSON Patch tra due documenti del feed, confrontati per link.
+    Annunci nuovi/rimossi → add/remove dell'intero annuncio;
+    annunci modificati → add/remove/replace dei soli campi cambiati.
+    """
+    ops = []
+    for link in old:
+        if link not in new:
+            ops.append({"op": "remove", "path": _pointer(link)})
+    for link, car in new.items():
+        prev = old.get(link)
+        if prev is None:
+            ops.append({"op": "add", "path": _pointer(link), "value": car})
+            continue
+        for field in prev:
+            if field not in car:
+                ops.append({"op": "remove", "path": _pointer(link, field)})
+        for field, value in car.items():
+            if field not in prev:
+                ops.append({"op": "add", "path": _pointer(link, field), "value": value})
+            elif prev[field] != value:
+                ops.append({"op": "replace", "path": _pointer(link, field), "value": value})
+    return ops
+
+
+def apply_feed_patch(doc: dict, ops: list[dict]) -> dict:
+    """Applica un delta prodotto da `diff_feed` (ritorna un nuovo documento)."""
+    out = {link: dict(car) for link, car in doc.items()}
+    for op in ops:
+        parts = _unpointer(op["path"])
+        target = out
+        for part in parts[:-1]:
+            target = target[part]
+        if op["op"] == "remove":
+            del target[parts[-1]]
+        else:
+            target[parts[-1]] = op["value"]
+    return out
+
+
+def publish_feed(
+    annunci: list[dict], feed_dir: str, snapshot_every: int = FEED_SNAPSHOT_EVERY
+) -> tuple[dict, list[str]]:
+    """
+    Pubblica una nuova versione del feed se lo stock è cambiato.
+
+    File in `feed_dir`:
+    - manifest.json: {"versione", "snapshot", "delta_da", "snapshot_ogni"}
+    - delta-N.json: patch dalla versione N-1 alla N
+    - snapshot-N.json: documento completo alla versione N
+    - corrente.json: documento completo dell'ultima versione (base del prossimo diff)
+
+    Un client alla versione V >= delta_da si aggiorna con i soli delta V+1..N;
+    più indietro, riparte da snapshot-<snapshot> e applica i delta successivi.
+    Vengono conservati gli ultimi due snapshot e i delta successivi al più vecchio.
+
+    Ritorna (manifest, file scritti) — i percorsi sono relativi a `feed_dir`.
+    """
+    os.makedirs(feed_dir, exist_ok=True)
+    manifest_path = os.path.join(feed_dir, "manifest.json")
+    current_path = os.path.join(feed_dir, "corrente.json")
+    manifest = load_json(manifest_path, None)
+    new_doc = feed_document(annunci)
+
+    if manifest is None:
+        versione, old_doc = 0, None
+    else:
+        versione, old_doc = manifest["versione"], load_json(current_path, {})
+        if old_doc == new_doc:
+            return manifest, []
+
+    versione += 1
+    written = []
+
+    def _write(name: str, data) -> None:
+        save_json(os.path.join(feed_dir, name), data, compact=True)
+        written.append(name)
+
+    if old_doc is not None:
+        _write(f"delta-{versione}.json", {"da": versione - 1, "a": versione, "patch": diff_feed(old_doc, new_doc)})
+
+    snapshots = [] if manifest is None else list(manifest.get("snapshots", []))
+    if old_doc is None or versione % snapshot_every == 0:
+        _write(f"snapshot-{versione}.json", {"versione": versione, "stock": new_doc})
+        snapshots = (snapshots + [versione])[-2:]
+
+    # Pulizia: file più vecchi del primo snapshot conservato
+    for name in os.listdir(feed_dir):
+        kind, _, num = name.removesuffix(".json").partition("-")
+        if kind in ("delta", "snapshot") and num.isdigit():
+            n = int(num)
+            if (kind == "delta" and n <= snapshots[0]) or (kind == "snapshot" and n not in snapshots):
+                os.remove(os.path.join(feed_dir, name))
+
+    save_json(current_path, new_doc)
+    manifest = {
+        "versione": versione,
+        "snapshot": snapshots[-1],
+        "snapshots": snapshots,
+        "delta_da": snapshots[0],
+        "snapshot_ogni": snapshot_every,
+    }
+    _write("manifest.json", manifest)
+    return manifest, written
+
+
+def feed_files(feed_dir: str) -> list[str]:
+    """
+    File del feed da pubblicare: tutti i delta e gli snapshot conservati, poi
+    manifest.json (per ultimo, così non punta mai a un delta non ancora caricato).
+    Pubblicarli tutti, non solo quelli appena scritti da `publish_feed`, fa sì
+    che un push fallito non lasci buchi: il feed avanza anche senza push, ma il
+    push successivo porta con sé le versioni mancanti.
+    """
+    if not os.path.exists(os.path.join(feed_dir, "manifest.json")):
+        return []
+    retained = []
+    for name in os.listdir(feed_dir):
+        kind, _, num = name.removesuffix(".json").partition("-")
+        if kind in ("delta", "snapshot") and num.isdigit():
+            retained.append((int(num), kind, name))
+    return [name for _, _, name in sorted(retained)] + ["manifest.json"]
+
+
+# ── Entrypoint ────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    here = os.path.dirname(os.path.abspath(__file__))
+    stock_path = os.path.join(here, "data", "stock.json")
+    stock = load_json(stock_path, [])
+    manifest, files = publish_feed(stock if isinstance(stock, list) else [], os.path.join(here, "data", "feed"))
+    print(f"feed v{manifest['versione']}: {', '.join(files) or 'nessuna modifica'}")
+    out = os.path.join(here, "data", "playlist.json")
+    pl = write_playlist(
+        stock_path,
+        os.path.join(here, "settings.json"),
+        out,
+        feed_versione=manifest["versione"],
+    )
+    print(f"{out}: {len(pl['slides'])} slide")
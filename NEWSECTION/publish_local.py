@@ -0,0 +1,383 @@
+"""
+publish_local.py — Pubblicazione sulla LAN dello showroom, senza GitHub Pages.
+
+`publish_local()` accetta le stesse voci (local_path, public_path) di
+`push_to_github` e le scrive content-addressed in una cartella:
+
+    <out_dir>/objects/ab/abcdef....        contenuto (nome = sha256)
+    <out_dir>/objects/ab/abcdef....gz      variante gzip precompressa
+    <out_dir>/objects/ab/abcdef....br      variante brotli (se il modulo c'è)
+    <out_dir>/index.json                   public_path → oggetto
+
+`make_server()` crea un server statico leggero che risponde dall'indice con ETag
+forte (lo sha256), 304 su If-None-Match, varianti precompresse secondo
+Accept-Encoding, richieste Range per i video promo e Cache-Control adatti:
+il polling HEAD del kiosk costa un 304 senza corpo. I percorsi non pubblicati
+(pagina del kiosk, assets/) vengono serviti da `static_root`.
+
+Uso da riga di comando (dalla cartella NEWSECTION):
+    python publish_local.py serve --port 8080
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import posixpath
+import re
+import tempfile
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dipende dall'ambiente
+    brotli = None
+
+# ── Configurazione ────────────────────────────────────────────────────────────
+
+INDEX_NAME = "index.json"
+
+# Tipi che vale la pena precomprimere (i video e le immagini sono già compressi)
+COMPRESSIBLE = {".json", ".html", ".js", ".css", ".svg", ".txt"}
+
+# File che non cambiano mai a parità di nome: cache lunga lato kiosk.
+# Solo il bundle con hash nel nome: delta-N/snapshot-N del feed possono essere
+# rigenerati con contenuto diverso (es. cartella feed/ ricreata).
+IMMUTABLE_PATTERNS = (
+    re.compile(r"^assets/"),
+)
+
+# Da `static_root` si serve solo il frontend buildato: mai NEWSECTION/ (secrets.json!)
+STATIC_ALLOWED = re.compile(r"^(?:[^/]+\.html|assets/[^/]+|static/[^/]+/[^/]+)$")
+
+CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+# Promo: nome stabile ma contenuto modificabile dal CMS
+CACHE_MEDIA = "public, max-age=3600"
+# JSON letti dal kiosk: sempre rivalidati (costo: un 304 via ETag)
+CACHE_REVALIDATE = "no-cache"
+
+
+# ── Pubblicazione ─────────────────────────────────────────────────────────────
+
+def _object_path(out_dir: str, sha: str) -> str:
+    return os.path.join(out_dir, "objects", sha[:2], sha)
+
+
+# Pubblicazioni serializzate: il pulsante "Pubblica in locale" e il subscriber
+# delle impostazioni (thread della scrittura differita) leggono e riscrivono
+# lo stesso index.json. Rientrante: chi legge la pubblicazione corrente prima
+# di ripubblicare (vedi app.on_settings_changed) tiene il lock per tutto il giro
+PUBLISH_LOCK = threading.RLock()
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """File temporaneo con nome univoco nella stessa cartella, poi os.replace."""
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                               dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def publish_local(file_entries: list[tuple[str, str]], out_dir: str, partial: bool = False) -> dict:
+    """
+    Copia i file nella cartella di pubblicazione, content-addressed.
+    L'indice diventa esattamente l'insieme delle voci pubblicate: promo tolte
+    dalle impostazioni e delta del feed già ripuliti spariscono anche dalla LAN.
+    Con partial=True aggiorna solo le voci passate e conserva le altre (es. solo
+    settings e playlist dopo una modifica delle impostazioni).
+    Ritorna l'indice aggiornato.
+    """
+    with PUBLISH_LOCK:
+        os.makedirs(out_dir, exist_ok=True)
+        index_path = os.path.join(out_dir, INDEX_NAME)
+        index = {}
+        if partial:
+            try:
+                with open(index_path, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+            except (OSError, ValueError):
+                pass
+
+        for local_path, public_path in file_entries:
+            with open(local_path, "rb") as f:
+                content = f.read()
+            sha = hashlib.sha256(content).hexdigest()
+            obj = _object_path(out_dir, sha)
+            ext = os.path.splitext(public_path)[1].lower()
+            entry = {
+                "sha": sha,
+                "size": len(content),
+                "type": mimetypes.guess_type(public_path)[0] or "application/octet-stream",
+                "encodings": [],
+            }
+            if not os.path.exists(obj):
+                os.makedirs(os.path.dirname(obj), exist_ok=True)
+                _write_atomic(obj, content)
+            if ext in COMPRESSIBLE:
+                variants = [("gzip", ".gz", lambda b: gzip.compress(b, compresslevel=9, mtime=0))]
+                if brotli is not None:
+                    variants.insert(0, ("br", ".br", lambda b: brotli.compress(b, quality=11)))
+                for encoding, suffix, compress in variants:
+                    if not os.path.exists(obj + suffix):
+                        _write_atomic(obj + suffix, compress(content))
+                    entry["encodings"].append(encoding)
+            index[public_path.lstrip("/")] = entry
+
+        _write_atomic(index_path, json.dumps(index, ensure_ascii=False, indent=2).encode("utf-8"))
+        _gc_objects(out_dir, index)
+        return index
+
+
+def published_file(out_dir: str, public_path: str) -> str | None:
+    """Percorso su disco del contenuto pubblicato come `public_path`, o None."""
+    try:
+        with open(os.path.join(out_dir, INDEX_NAME), "r", encoding="utf-8") as f:
+            entry = json.load(f).get(public_path.lstrip("/"))
+    except (OSError, ValueError):
+        return None
+    return _object_path(out_dir, entry["sha"]) if entry else None
+
+
+def _gc_objects(out_dir: str, index: dict) -> None:
+    """Rimuove gli oggetti non più referenziati dall'indice."""
+    live = {e["sha"] for e in index.values()}
+    root = os.path.join(out_dir, "objects")
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if name.split(".")[0] not in live:
+                os.remove(os.path.join(dirpath, name))
+
+
+# ── Server ────────────────────────────────────────────────────────────────────
+
+def cache_control(public_path: str, content_type: str) -> str:
+    if any(p.search(public_path) for p in IMMUTABLE_PATTERNS):
+        return CACHE_IMMUTABLE
+    if content_type.startswith(("image/", "video/")):
+        return CACHE_MEDIA
+    return CACHE_REVALIDATE
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Interpreta un singolo intervallo "bytes=a-b" / "bytes=a-" / "bytes=-n".
+    Ritorna (start, end) inclusivi, oppure None se non soddisfacibile.
+    """
+    m = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", header or "")
+    if not m or (not m.group(1) and not m.group(2)):
+        return None
+    if not m.group(1):
+        length = int(m.group(2))
+        if length == 0:
+            return None
+        return max(0, size - length), size - 1
+    start = int(m.group(1))
+    end = int(m.group(2)) if m.group(2) else size - 1
+    if start >= size or end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def is_safe_path(path: str) -> bool:
+    """
+    False per percorsi che potrebbero uscire dalla cartella servita: segmenti
+    "..", separatori Windows ("\\", anche come %5C) e ":" (unità, flussi NTFS).
+    """
+    if "\\" in path or ":" in path or "\0" in path:
+        return False
+    return ".." not in path.split("/")
+
+
+class _Index:
+    """Indice della pubblicazione, ricaricato solo quando cambia su disco."""
+
+    def __init__(self, out_dir: str):
+        self.path = os.path.join(out_dir, INDEX_NAME)
+        self._mtime = None
+        self._data: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, public_path: str) -> dict | None:
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+        with self._lock:
+            if mtime != self._mtime:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._data = json.load(f)
+                self._mtime = mtime
+            return self._data.get(public_path)
+
+
+class _StaticEtags:
+    """ETag sha256 per i file di `static_root`, calcolato una volta per (mtime, size)."""
+
+    def __init__(self):
+        self._cache: dict[str, tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str, st: os.stat_result) -> str:
+        with self._lock:
+            cached = self._cache.get(path)
+            if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return cached[2]
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        sha = h.hexdigest()
+        with self._lock:
+            self._cache[path] = (st.st_mtime_ns, st.st_size, sha)
+        return sha
+
+
+def make_handler(out_dir: str, static_root: str | None = None):
+    index = _Index(out_dir)
+    etags = _StaticEtags()
+    root_real = os.path.realpath(static_root) if static_root is not None else None
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "ShowroomLocale/1.0"
+
+        def log_message(self, format, *args):  # silenzioso: gira sul PC del salone
+            pass
+
+        def do_HEAD(self):
+            self._serve(head=True)
+
+        def do_GET(self):
+            self._serve(head=False)
+
+        def _resolve(self, public_path: str):
+            """Ritorna (file, content_type, sha, encodings) oppure None."""
+            entry = index.get(public_path)
+            if entry is not None:
+                return _object_path(out_dir, entry["sha"]), entry["type"], entry["sha"], entry["encodings"]
+            if static_root is None or not STATIC_ALLOWED.match(public_path):
+                return None
+            local = os.path.realpath(os.path.join(static_root, *public_path.split("/")))
+            # Difesa in profondità: anche con symlink o separatori del SO si resta in static_root
+            if os.path.commonpath([local, root_real]) != root_real or not os.path.isfile(local):
+                return None
+            ctype = mimetypes.guess_type(local)[0] or "application/octet-stream"
+            return local, ctype, etags.get(local, os.stat(local)), []
+
+        def _serve(self, head: bool):
+            raw = unquote(urlsplit(self.path).path)
+            if not is_safe_path(raw):
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return
+            public_path = posixpath.normpath(raw).lstrip("/")
+            if public_path in ("", "."):
+                public_path = "index.html"
+            resolved = self._resolve(public_path)
+            if resolved is None:
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return
+            path, ctype, sha, encodings = resolved
+            etag = f'"{sha}"'
+            common = {
+                "ETag": etag,
+                "Cache-Control": cache_control(public_path, ctype),
+                "Vary": "Accept-Encoding",
+                "Accept-Ranges": "bytes",
+            }
+
+            inm = self.headers.get("If-None-Match", "")
+            if etag in (t.strip() for t in inm.split(",")) or inm.strip() == "*":
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                for k, v in common.items():
+                    self.send_header(k, v)
+                self.end_headers()
+                return
+
+            accepted = {
+                t.split(";")[0].strip().lower()
+                for t in self.headers.get("Accept-Encoding", "").split(",")
+            }
+            range_header = self.headers.get("Range")
+            encoding = None
+            if not range_header:
+                encoding = next((e for e in encodings if e in accepted), None)
+            if encoding:
+                path = path + {"br": ".br", "gzip": ".gz"}[encoding]
+            size = os.path.getsize(path)
+
+            start, end = 0, size - 1
+            status = HTTPStatus.OK
+            if range_header and self.headers.get("If-Range", etag) == etag:
+                rng = parse_range(range_header, size)
+                if rng is None:
+                    self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                    self.send_header("Content-Range", f"bytes */{size}")
+                    for k, v in common.items():
+                        self.send_header(k, v)
+                    self.end_headers()
+                    return
+                start, end = rng
+                status = HTTPStatus.PARTIAL_CONTENT
+
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(end - start + 1))
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            if status == HTTPStatus.PARTIAL_CONTENT:
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            for k, v in common.items():
+                self.send_header(k, v)
+            self.end_headers()
+            if head:
+                return
+            with open(path, "rb") as f:
+                f.seek(start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = f.read(min(1 << 16, remaining))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    remaining -= len(chunk)
+
+    return Handler
+
+
+def make_server(out_dir: str, host: str = "0.0.0.0", port: int = 8080, static_root: str | None = None):
+    """Crea il server (non avviato): `server.serve_forever()` per partire."""
+    return ThreadingHTTPServer((host, port), make_handler(out_dir, static_root))
+
+
+# ── Entrypoint ────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Server locale dello showroom")
+    parser.add_argument("command", choices=["serve"])
+    parser.add_argument("--dir", default=os.path.join(here, "data", "pubblicazione"))
+    parser.add_argument("--root", default=os.path.dirname(here), help="pagina del kiosk e assets/")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    os.makedirs(args.dir, exist_ok=True)
+    server = make_server(args.dir, args.host, args.port, static_root=args.root)
+    print(f"Showroom locale su http://{args.host}:{args.port}/slideshow.html (CTRL+C per chiudere)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -1,17 +1,25 @@
 """
 scraper.py — Parser per rotoloautomobili.com
 Estrae annunci dalle sezioni km0, usato e outlet.
+
+Due motori di parsing (`engine`):
+- "lxml": specifica dichiarativa compilata in XPath (card_spec.py), una sola
+  analisi per pagina; default se lxml è installato;
+- "bs4": il parser BeautifulSoup scritto a mano, sempre disponibile.
+
+`requests` e BeautifulSoup vengono importati solo quando servono (parsing o
+scraping), così il modulo si importa senza costi all'avvio del CMS.
 """
 from __future__ import annotations
 
+import importlib.util
 import random
 import re
 import time
 from typing import Callable
 from urllib.parse import unquote
 
-import requests
-from bs4 import BeautifulSoup, NavigableString, Tag
+from profiling import profiled, span
 
 # ── Configurazione ────────────────────────────────────────────────────────────
 
@@ -22,9 +30,18 @@ HEADERS = {
     "Accept-Language": "it-IT,it;q=0.9",
 }
 
+ENGINES = ("lxml", "bs4")
+DEFAULT_ENGINE = "lxml" if importlib.util.find_spec("lxml") else "bs4"
+
+# Limiti dello scraping di una sezione
+MAX_PAGES = 50
+MAX_RETRIES = 3
+MAX_EMPTY = 2
+
+# "path" è relativo a BASE_URL (o al base_url passato a scrape_section)
 SECTIONS: dict[str, dict] = {
     "km0": {
-        "url": f"{BASE_URL}/lista-veicoli/km0/",
+        "path": "/lista-veicoli/km0/",
         "page_params": lambda page: {
             "Is5OrMorePosti": "False",
             "IsIvaEsposta": "False",
@@ -33,7 +50,7 @@ SECTIONS: dict[str, dict] = {
         },
     },
     "usato": {
-        "url": f"{BASE_URL}/lista-veicoli/usato/",
+        "path": "/lista-veicoli/usato/",
         # Parametri completi richiesti dal sito — versione ridotta causa redirect a /Error
         "page_params": lambda page: {
             "Is5OrMorePosti": "False",
@@ -50,7 +67,7 @@ SECTIONS: dict[str, dict] = {
         },
     },
     "outlet": {
-        "url": f"{BASE_URL}/outlet/",
+        "path": "/outlet/",
         "page_params": lambda page: {
             "Is5OrMorePosti": "False",
             "IsIvaEsposta": "False",
@@ -65,11 +82,37 @@ SECTIONS: dict[str, dict] = {
 
 # ── Parsing ───────────────────────────────────────────────────────────────────
 
-def parse_listings_from_html(html: str, base_url: str = BASE_URL) -> list[dict]:
+def _check_engine(engine: str) -> None:
+    if engine not in ENGINES:
+        raise ValueError(f"Motore sconosciuto: {engine!r}. Valori validi: {list(ENGINES)}")
+
+
+@profiled("scraper.parse_page")
+def parse_page(html: str, page: int, base_url: str = BASE_URL, engine: str = DEFAULT_ENGINE) -> tuple[list[dict], bool]:
+    """(annunci della pagina, esiste la pagina successiva)."""
+    _check_engine(engine)
+    if engine == "lxml":
+        from card_spec import compiled
+
+        listings, hrefs = compiled().parse_page(html, base_url)
+        return listings, _links_to_page(hrefs, page + 1)
+    return parse_listings_from_html(html, base_url, engine), has_next_page(html, page, engine)
+
+
+@profiled("scraper.parse_listings_from_html")
+def parse_listings_from_html(html: str, base_url: str = BASE_URL, engine: str = DEFAULT_ENGINE) -> list[dict]:
     """
     Trova tutti i tag <a class="item" href="/auto/..."> e li parsa.
     Restituisce una lista di dict con i dati dell'annuncio.
     """
+    _check_engine(engine)
+    if engine == "lxml":
+        from card_spec import compiled
+
+        return compiled().parse_page(html, base_url)[0]
+
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html, "html.parser")
     cards = soup.find_all("a", class_="item", href=re.compile(r"^/auto/"))
     results = []
@@ -91,6 +134,8 @@ def _parse_card(a_tag, base_url: str = BASE_URL) -> dict | None:
     Estrae i campi da un singolo tag <a class="item" href="/auto/...">.
     Restituisce None se il tag non è un annuncio valido.
     """
+    from bs4 import NavigableString
+
     href = a_tag.get("href", "")
     if not href.startswith("/auto/"):
         return None
@@ -224,41 +269,62 @@ def _parse_card(a_tag, base_url: str = BASE_URL) -> dict | None:
 
 # ── Paginazione ───────────────────────────────────────────────────────────────
 
-def has_next_page(html: str, current_page: int) -> bool:
+def _links_to_page(hrefs, page: int) -> bool:
+    return any(re.search(rf"[?&][Pp]age={page}(?:[&%#]|$)", unquote(h or "")) for h in hrefs)
+
+
+def has_next_page(html: str, current_page: int, engine: str = DEFAULT_ENGINE) -> bool:
     """
     Controlla se nella paginazione esiste un link per la pagina current_page+1.
     """
+    _check_engine(engine)
+    if engine == "lxml":
+        from card_spec import compiled
+
+        return _links_to_page(compiled().parse_page(html, BASE_URL)[1], current_page + 1)
+
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html, "html.parser")
-    next_page = current_page + 1
     pag_div = soup.find("div", class_="paginazione")
     if not pag_div:
         return False
-    for a in pag_div.find_all("a", class_="cta_pageitem"):
-        href = unquote(a.get("href", ""))
-        if re.search(rf"[?&][Pp]age={next_page}(?:[&%#]|$)", href):
-            return True
-    return False
+    return _links_to_page((a.get("href", "") for a in pag_div.find_all("a", class_="cta_pageitem")), current_page + 1)
 
 
 # ── Scraping ──────────────────────────────────────────────────────────────────
 
-def scrape_section(section_name: str, log_fn=print, delay: float = 1.5) -> list[dict]:
-    """Scrapa una sezione completa con paginazione."""
+@profiled("scraper.scrape_section")
+def scrape_section(
+    section_name: str,
+    log_fn=print,
+    delay: float = 1.5,
+    base_url: str = BASE_URL,
+    max_pages: int = MAX_PAGES,
+    engine: str = DEFAULT_ENGINE,
+) -> list[dict]:
+    """
+    Scrapa una sezione completa con paginazione.
+    `base_url` permette di puntare a un'altra istanza del sito (es. il sito
+    finto di bench/fake_dealer.py); `delay` è la pausa tra le pagine.
+    """
+    import requests
+
+    _check_engine(engine)
+
     if section_name not in SECTIONS:
         raise ValueError(
             f"Sezione sconosciuta: {section_name!r}. Valori validi: {list(SECTIONS)}"
         )
 
     config = SECTIONS[section_name]
+    url = base_url.rstrip("/") + config["path"]
     all_listings: list[dict] = []
     seen_links: set[str] = set()
     page = 1
     empty_pages = 0
-    MAX_EMPTY = 2
-    MAX_RETRIES = 3
-    MAX_PAGES = 50
 
-    while page <= MAX_PAGES:
+    while page <= max_pages:
         params = config["page_params"](page)
         log_fn(f"[{section_name}] Pagina {page}...")
 
@@ -266,7 +332,8 @@ def scrape_section(section_name: str, log_fn=print, delay: float = 1.5) -> list[
         html = None
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                resp = requests.get(config["url"], params=params, headers=HEADERS, timeout=20)
+                with span("http.get"):
+                    resp = requests.get(url, params=params, headers=HEADERS, timeout=20)
                 resp.raise_for_status()
                 html = resp.text
                 break
@@ -283,7 +350,7 @@ def scrape_section(section_name: str, log_fn=print, delay: float = 1.5) -> list[
             page += 1
             continue
 
-        new_listings = parse_listings_from_html(html)
+        new_listings, has_next = parse_page(html, page, base_url, engine)
         if not new_listings:
             empty_pages += 1
             log_fn(f"[{section_name}] Pagina {page} vuota ({empty_pages}/{MAX_EMPTY}).")
@@ -303,20 +370,27 @@ def scrape_section(section_name: str, log_fn=print, delay: float = 1.5) -> list[
 
         log_fn(f"[{section_name}] Pagina {page}: +{new_count} nuovi (tot: {len(all_listings)})")
 
-        if not has_next_page(html, page):
+        if not has_next:
             log_fn(f"[{section_name}] Fine sezione (nessuna pagina successiva).")
             break
 
         page += 1
-        time.sleep(delay + random.uniform(0, 0.5))
+        time.sleep(delay + random.uniform(0, delay / 3))
 
-    if page > MAX_PAGES:
-        log_fn(f"[{section_name}] Raggiunto limite massimo di {MAX_PAGES} pagine.")
+    if page > max_pages:
+        log_fn(f"[{section_name}] Raggiunto limite massimo di {max_pages} pagine.")
 
     return all_listings
 
 
-def run_scraper(log_fn: Callable = print) -> list[dict]:
+@profiled("scraper.run_scraper")
+def run_scraper(
+    log_fn: Callable = print,
+    base_url: str = BASE_URL,
+    delay: float = 1.5,
+    max_pages: int = MAX_PAGES,
+    engine: str = DEFAULT_ENGINE,
+) -> list[dict]:
     """
     Scrapa tutte e 3 le sezioni, deduplica per link, mescola e assegna posizioni.
     """
@@ -325,7 +399,8 @@ def run_scraper(log_fn: Callable = print) -> list[dict]:
 
     for section_name in SECTIONS:
         log_fn(f"\n=== Sezione: {section_name} ===")
-        listings = scrape_section(section_name, log_fn=log_fn)
+        listings = scrape_section(section_name, log_fn=log_fn, delay=delay,
+                                  base_url=base_url, max_pages=max_pages, engine=engine)
         for l in listings:
             if l["link"] not in seen_links:
                 seen_links.add(l["link"])
@@ -0,0 +1,196 @@
+"""
+search.py — Indice invertito e filtri a faccette sullo stock.
+
+`StockIndex` si costruisce una volta per versione dello stock e risponde alle
+query in memoria, senza riscorrere gli annunci:
+- testo libero sui token di `titolo` (marca, modello, variante), con
+  completamento per prefisso dell'ultima parola ("golf var" → "variant");
+- faccette esatte su `tipo`, `alimentazione`, `cambio`;
+- intervalli su anno e prezzo.
+
+Ogni insieme di risultati è un bitset (un `int` Python: bit i = annuncio i),
+quindi le intersezioni sono AND tra interi e i conteggi delle faccette sono
+`bit_count()`. Su qualche migliaio di annunci una query resta sotto il
+millisecondo.
+"""
+from __future__ import annotations
+
+import bisect
+import re
+import unicodedata
+
+from storage import prezzo_to_int
+
+# ── Configurazione ────────────────────────────────────────────────────────────
+
+FACETS = ("tipo", "alimentazione", "cambio")
+
+# Granularità dei bitset prefissi per gli intervalli (anno, prezzo)
+_BLOCK = 64
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Minuscolo, senza accenti, spezzato su tutto ciò che non è lettera o cifra."""
+    text = unicodedata.normalize("NFKD", str(text or "")).encode("ascii", "ignore").decode("ascii")
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _anno(value) -> int | None:
+    m = re.search(r"\d{4}", str(value or ""))
+    return int(m.group()) if m else None
+
+
+# ── Intervalli ────────────────────────────────────────────────────────────────
+
+class _RangeIndex:
+    """
+    Valori numerici ordinati con bitset cumulativi ogni _BLOCK posizioni:
+    un intervallo costa due bisect, un AND-NOT e al più 2·_BLOCK bit sparsi.
+    """
+
+    def __init__(self, pairs: list[tuple[int, int]]):
+        pairs = sorted(pairs)
+        self.values = [v for v, _ in pairs]
+        self.ids = [i for _, i in pairs]
+        self.checkpoints = [0]
+        bits = 0
+        for n, doc_id in enumerate(self.ids, start=1):
+            bits |= 1 << doc_id
+            if n % _BLOCK == 0:
+                self.checkpoints.append(bits)
+
+    def _prefix(self, n: int) -> int:
+        """Bitset dei primi n valori in ordine."""
+        block, rest = divmod(n, _BLOCK)
+        bits = self.checkpoints[block]
+        for doc_id in self.ids[block * _BLOCK: block * _BLOCK + rest]:
+            bits |= 1 << doc_id
+        return bits
+
+    def between(self, lo: int | None, hi: int | None) -> int:
+        start = 0 if lo is None else bisect.bisect_left(self.values, lo)
+        end = len(self.values) if hi is None else bisect.bisect_right(self.values, hi)
+        if end <= start:
+            return 0
+        return self._prefix(end) & ~self._prefix(start)
+
+    @property
+    def bounds(self) -> tuple[int, int] | None:
+        return (self.values[0], self.values[-1]) if self.values else None
+
+
+# ── Indice ────────────────────────────────────────────────────────────────────
+
+class StockIndex:
+    """Indice in memoria su una lista di annunci (l'ordine della lista è conservato)."""
+
+    def __init__(self, annunci: list[dict]):
+        self.docs = list(annunci)
+        self.all = (1 << len(self.docs)) - 1
+        self.postings: dict[str, int] = {}
+        self.facets: dict[str, dict[str, int]] = {f: {} for f in FACETS}
+        anni, prezzi = [], []
+
+        for i, a in enumerate(self.docs):
+            bit = 1 << i
+            for tok in set(tokenize(a.get("titolo", ""))):
+                self.postings[tok] = self.postings.get(tok, 0) | bit
+            for f in FACETS:
+                value = str(a.get(f) or "").strip()
+                if value:
+                    self.facets[f][value] = self.facets[f].get(value, 0) | bit
+            anno = _anno(a.get("anno"))
+            if anno is not None:
+                anni.append((anno, i))
+            prezzo = prezzo_to_int(a.get("prezzo"))
+            if prezzo is not None:
+                prezzi.append((prezzo, i))
+
+        self.vocab = sorted(self.postings)
+        self.anno = _RangeIndex(anni)
+        self.prezzo = _RangeIndex(prezzi)
+        self._prefix_cache: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    # ── Testo ──
+
+    def _prefix_bits(self, prefix: str) -> int:
+        """Unione dei posting di tutti i token che iniziano con `prefix` (memoizzata)."""
+        cached = self._prefix_cache.get(prefix)
+        if cached is not None:
+            return cached
+        bits = 0
+        start = bisect.bisect_left(self.vocab, prefix)
+        for tok in self.vocab[start:]:
+            if not tok.startswith(prefix):
+                break
+            bits |= self.postings[tok]
+        self._prefix_cache[prefix] = bits
+        return bits
+
+    def match_text(self, query: str) -> int:
+        """Tutti i token devono comparire; l'ultimo può essere un prefisso."""
+        tokens = tokenize(query)
+        bits = self.all
+        for n, tok in enumerate(tokens):
+            if n == len(tokens) - 1:
+                bits &= self._prefix_bits(tok)
+            else:
+                bits &= self.postings.get(tok, 0)
+            if not bits:
+                break
+        return bits
+
+    # ── Query ──
+
+    def query_bits(
+        self,
+        text: str = "",
+        anno: tuple[int | None, int | None] | None = None,
+        prezzo: tuple[int | None, int | None] | None = None,
+        **facets,
+    ) -> int:
+        """
+        Bitset dei risultati. Le faccette si passano per nome con un insieme di
+        valori ammessi (OR dentro la faccetta, AND tra faccette):
+            idx.query_bits("panda", tipo={"usato"}, prezzo=(None, 10000))
+        """
+        bits = self.match_text(text) if text else self.all
+        for name, values in facets.items():
+            if name not in self.facets:
+                raise ValueError(f"Faccetta sconosciuta: {name!r}. Valori validi: {list(self.facets)}")
+            if values:
+                sel = 0
+                for v in values:
+                    sel |= self.facets[name].get(v, 0)
+                bits &= sel
+        if anno is not None:
+            bits &= self.anno.between(*anno)
+        if prezzo is not None:
+            bits &= self.prezzo.between(*prezzo)
+        return bits
+
+    def ids(self, bits: int) -> list[int]:
+        """Indici dei bit accesi, in ordine crescente."""
+        out = []
+        while bits:
+            low = bits & -bits
+            out.append(low.bit_length() - 1)
+            bits ^= low
+        return out
+
+    def query(self, *args, **kwargs) -> list[dict]:
+        """Come `query_bits`, ma ritorna gli annunci nell'ordine dell'indice."""
+        return [self.docs[i] for i in self.ids(self.query_bits(*args, **kwargs))]
+
+    def facet_counts(self, bits: int | None = None) -> dict[str, dict[str, int]]:
+        """Conteggio per valore di ogni faccetta, ristretto a `bits` se indicato."""
+        bits = self.all if bits is None else bits
+        return {
+            f: {v: (b & bits).bit_count() for v, b in sorted(values.items())}
+            for f, values in self.facets.items()
+        }
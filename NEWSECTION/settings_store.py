@@ -0,0 +1,191 @@
+"""
+settings_store.py — Impostazioni dello slideshow con scrittura solo se cambiano.
+
+Il CMS rieseguiva `save_json(SETTINGS_FILE, settings)` ad ogni rerun: scritture
+continue su disco e un mtime di settings.json sempre nuovo. `SettingsStore`:
+- valida i valori contro SCHEMA (caricamento tollerante, aggiornamenti severi);
+- tiene le impostazioni in memoria e segna "dirty" solo i cambiamenti reali;
+- scrive su disco in modo atomico, dopo `debounce` secondi senza modifiche
+  (lo slider trascinato produce una sola scrittura);
+- dopo ogni scrittura avvisa i subscriber (es. rigenerazione della playlist).
+"""
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+import threading
+from typing import Callable
+
+log = logging.getLogger(__name__)
+
+# ── Schema ────────────────────────────────────────────────────────────────────
+
+DEFAULT_SETTINGS = {
+    "durata_slide": 8,
+    "max_annunci": 20,
+    "ordine": "Casuale",
+    "promo": [],
+}
+
+ORDINI = ("Casuale", "Posizione")
+
+# campo → (tipo, vincolo): range (min, max) per gli interi, valori ammessi per le stringhe
+SCHEMA = {
+    "durata_slide": (int, (3, 20)),
+    "max_annunci": (int, (5, 100)),
+    "ordine": (str, ORDINI),
+    "promo": (list, None),
+}
+
+
+def validate_field(key: str, value):
+    """Ritorna il valore normalizzato o solleva ValueError."""
+    if key not in SCHEMA:
+        raise ValueError(f"Impostazione sconosciuta: {key!r}. Valori validi: {list(SCHEMA)}")
+    kind, rule = SCHEMA[key]
+    if kind is int:
+        if isinstance(value, bool):
+            raise ValueError(f"{key}: atteso un intero, ricevuto {value!r}")
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{key}: atteso un intero, ricevuto {value!r}") from None
+        lo, hi = rule
+        if not lo <= value <= hi:
+            raise ValueError(f"{key}: {value} fuori dall'intervallo {lo}-{hi}")
+    elif kind is str:
+        if value not in rule:
+            raise ValueError(f"{key}: {value!r} non ammesso. Valori validi: {list(rule)}")
+    elif kind is list:
+        if not isinstance(value, list) or not all(isinstance(p, str) for p in value):
+            raise ValueError(f"{key}: attesa una lista di percorsi")
+        value = list(value)
+    return value
+
+
+def validate(data) -> dict:
+    """
+    Normalizza un dict di impostazioni letto da disco: i campi mancanti o non
+    validi tornano al default, le chiavi sconosciute vengono conservate.
+    """
+    out = dict(data) if isinstance(data, dict) else {}
+    for key, default in DEFAULT_SETTINGS.items():
+        try:
+            out[key] = validate_field(key, out[key])
+        except (KeyError, ValueError):
+            out[key] = copy.deepcopy(default)
+    return out
+
+
+# ── Store ─────────────────────────────────────────────────────────────────────
+
+class SettingsStore:
+    """Impostazioni in memoria con dirty tracking e scrittura differita."""
+
+    def __init__(self, path: str, debounce: float = 1.0):
+        self.path = path
+        self.debounce = debounce
+        self._lock = threading.RLock()
+        self._timer: threading.Timer | None = None
+        self._subscribers: list[Callable[[dict], None]] = []
+        self._dirty = False
+        self._mtime = None
+        self._data = validate({})
+        self._reload()
+
+    def _reload(self) -> None:
+        """Rilegge da disco se il file è cambiato (es. modificato a mano)."""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except (json.JSONDecodeError, ValueError, OSError):
+            raw = {}
+        self._data = validate(raw)
+        self._mtime = mtime
+
+    # ── Lettura ──
+
+    def load(self) -> dict:
+        """Copia delle impostazioni correnti (comprese le modifiche non ancora scritte)."""
+        with self._lock:
+            if not self._dirty:
+                self._reload()
+            return copy.deepcopy(self._data)
+
+    def get(self, key: str):
+        return self.load()[key]
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    # ── Scrittura ──
+
+    def update(self, **changes) -> bool:
+        """
+        Valida e applica le modifiche. Ritorna True solo se qualcosa è
+        davvero cambiato; in quel caso programma la scrittura su disco.
+        """
+        validated = {k: validate_field(k, v) for k, v in changes.items()}
+        with self._lock:
+            if not self._dirty:
+                self._reload()
+            changed = {k: v for k, v in validated.items() if self._data.get(k) != v}
+            if not changed:
+                return False
+            self._data.update(changed)
+            self._dirty = True
+            self._schedule()
+        return True
+
+    def _schedule(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        if self.debounce <= 0:
+            self._timer = None
+            self.flush()
+            return
+        self._timer = threading.Timer(self.debounce, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self) -> bool:
+        """Scrive subito le modifiche pendenti. Ritorna True se ha scritto."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return False
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, self.path)
+            self._mtime = os.stat(self.path).st_mtime_ns
+            self._dirty = False
+            snapshot = copy.deepcopy(self._data)
+            subscribers = list(self._subscribers)
+        # Un subscriber che fallisce non deve fermare gli altri né il chiamante
+        # (di solito il thread del Timer, dove l'eccezione andrebbe persa)
+        for fn in subscribers:
+            try:
+                fn(snapshot)
+            except Exception:
+                log.exception("Subscriber delle impostazioni fallito: %r", fn)
+        return True
+
+    # ── Notifiche ──
+
+    def subscribe(self, fn: Callable[[dict], None]) -> Callable[[], None]:
+        """Registra `fn(settings)`, chiamata dopo ogni scrittura. Ritorna la funzione per disiscriversi."""
+        with self._lock:
+            self._subscribers.append(fn)
+        return lambda: self._subscribers.remove(fn)
@@ -0,0 +1,352 @@
+"""
+storage.py — Persistenza dello stock annunci per il CMS.
+
+Due backend con la stessa interfaccia:
+- JsonStockStore: l'array `data/stock.json` letto e riscritto per intero
+  (comportamento storico, default).
+- SqliteStockStore: database SQLite con `link` come chiave primaria e indici su
+  `posizione`, `tipo` e prezzo numerico. Le modifiche dall'Editor aggiornano
+  solo le righe toccate, in un'unica transazione; `stock.json` per il kiosk
+  viene prodotto con `export_json()` al momento della pubblicazione.
+
+Il backend si sceglie con la variabile d'ambiente CMS_STOCK_BACKEND
+("json" oppure "sqlite").
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+from profiling import profiled
+
+# ── Configurazione ────────────────────────────────────────────────────────────
+
+BACKEND_ENV = "CMS_STOCK_BACKEND"
+
+# Colonne con un indice o un significato proprio; gli altri campi dell'annuncio
+# finiscono nella colonna JSON `extra` (così lo schema non va toccato quando
+# lo scraper aggiunge campi nuovi).
+COLUMNS = (
+    "link", "titolo", "prezzo", "anno", "km", "alimentazione",
+    "cambio", "immagine", "tipo", "posizione",
+)
+
+# Colonne TEXT nullable: NULL = campo assente nell'annuncio, così `load()` è
+# l'inverso di `save()` come per il backend JSON
+TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS {name} (
+    link          TEXT PRIMARY KEY,
+    titolo        TEXT,
+    prezzo        TEXT,
+    prezzo_num    INTEGER,
+    anno          TEXT,
+    km            TEXT,
+    alimentazione TEXT,
+    cambio        TEXT,
+    immagine      TEXT,
+    tipo          TEXT,
+    posizione     INTEGER,
+    extra         TEXT NOT NULL DEFAULT '{{}}'
+);
+"""
+
+INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_annunci_posizione ON annunci(posizione);
+CREATE INDEX IF NOT EXISTS idx_annunci_tipo ON annunci(tipo);
+CREATE INDEX IF NOT EXISTS idx_annunci_prezzo ON annunci(prezzo_num);
+"""
+
+SCHEMA = TABLE_SQL.format(name="annunci") + INDEX_SQL
+
+
+# ── Utility JSON ──────────────────────────────────────────────────────────────
+
+@profiled("load_json")
+def load_json(path, default):
+    """Carica JSON in modo robusto. Se mancante/corrotto, ritorna default."""
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, ValueError):
+            return default
+    return default
+
+
+def save_json(path, data, compact=False):
+    """
+    Salva l'intero JSON (indentato, utf-8) in modo atomico: file temporaneo
+    nella stessa cartella + os.replace. Chi legge in parallelo (lo scraping gira
+    in un thread) vede il file vecchio o quello nuovo, mai uno troncato.
+    compact=True: senza spazi, per i file che viaggiano verso il kiosk.
+    """
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                               dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            if compact:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            else:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        for attempt in range(5):
+            try:
+                os.replace(tmp, path)
+                break
+            except PermissionError:
+                # Windows: la destinazione può essere aperta per un istante da un lettore
+                if attempt == 4:
+                    raise
+                time.sleep(0.05 * (attempt + 1))
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def pos_key(item):
+    """Chiave di ordinamento: posizione numerica (se valida), tie-breaker = link."""
+    raw = item.get("posizione", None)
+    try:
+        p = int(raw)
+    except (TypeError, ValueError):
+        p = 10_000_000
+    return (p, item.get("link", ""))
+
+
+def file_version(path: str) -> str:
+    """Token che cambia a ogni scrittura del file (mtime in ns + dimensione)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return "0"
+    return f"{st.st_mtime_ns}-{st.st_size}"
+
+
+def prezzo_to_int(prezzo) -> int | None:
+    """
+    "20.900 €" → 20900. Ritorna None se il prezzo non contiene cifre.
+    I decimali (",00") vengono scartati.
+    """
+    text = str(prezzo or "").split(",")[0]
+    digits = re.sub(r"[^\d]", "", text)
+    return int(digits) if digits else None
+
+
+def renumber(annunci: list[dict]) -> list[dict]:
+    """Ordina per posizione e riassegna posizioni sequenziali 1..N (in place)."""
+    annunci.sort(key=pos_key)
+    for i, item in enumerate(annunci):
+        item["posizione"] = i + 1
+    return annunci
+
+
+# ── Backend JSON ──────────────────────────────────────────────────────────────
+
+class JsonStockStore:
+    """Backend storico: un unico array JSON riscritto per intero."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @profiled("stock_store.load")
+    def load(self) -> list[dict]:
+        data = load_json(self.path, [])
+        return data if isinstance(data, list) else []
+
+    @profiled("stock_store.save")
+    def save(self, annunci: list[dict]) -> None:
+        save_json(self.path, annunci)
+
+    def apply_edits(self, edits: dict[str, dict], reorder: bool = True) -> int:
+        """
+        Applica le modifiche {link: {campo: valore}} e, se richiesto,
+        riassegna le posizioni. Ritorna il numero di annunci modificati.
+        """
+        annunci = self.load()
+        changed = 0
+        for item in annunci:
+            fields = edits.get(item.get("link"))
+            if fields:
+                item.update(fields)
+                changed += 1
+        if reorder:
+            renumber(annunci)
+        self.save(annunci)
+        return changed
+
+    def version(self) -> str:
+        """Cambia a ogni salvataggio: chiave per le cache derivate (es. indice di ricerca)."""
+        return file_version(self.path)
+
+    def export_json(self, path: str) -> None:
+        """Scrive lo stock.json per il kiosk (no-op se coincide con il file del backend)."""
+        if os.path.abspath(path) != os.path.abspath(self.path):
+            save_json(path, self.load())
+
+
+# ── Backend SQLite ────────────────────────────────────────────────────────────
+
+class SqliteStockStore:
+    """
+    Backend SQLite. Al primo avvio, se il database è vuoto, importa
+    `seed_json` (lo stock.json esistente) così il passaggio di backend
+    non perde dati.
+    """
+
+    def __init__(self, path: str, seed_json: str | None = None):
+        self.path = path
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+            self._migrate(conn)
+            empty = conn.execute("SELECT COUNT(*) FROM annunci").fetchone()[0] == 0
+        if empty and seed_json:
+            seed = JsonStockStore(seed_json).load()
+            if seed:
+                self.save(seed)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connessione con commit/rollback automatico e chiusura garantita."""
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Database creati con colonne TEXT NOT NULL: ricopia la tabella con lo schema attuale."""
+        notnull = {r["name"]: r["notnull"] for r in conn.execute("PRAGMA table_info(annunci)")}
+        if not notnull.get("titolo"):
+            return
+        conn.executescript(
+            TABLE_SQL.format(name="annunci_nuova")
+            + "INSERT INTO annunci_nuova SELECT * FROM annunci;"
+            "DROP TABLE annunci;"
+            "ALTER TABLE annunci_nuova RENAME TO annunci;"
+            + INDEX_SQL
+        )
+
+    @staticmethod
+    def _to_row(item: dict) -> dict:
+        """
+        Campi assenti → NULL. Valori che la colonna non conserva tali e quali
+        (None esplicito, non stringhe, posizione non intera) vanno anche in
+        `extra`, che in lettura ha la precedenza.
+        """
+        row, extra = {}, {}
+        for col in COLUMNS:
+            value = item.get(col)
+            if col == "posizione":
+                exact = isinstance(value, int) and not isinstance(value, bool)
+                try:
+                    row[col] = int(value)
+                except (TypeError, ValueError):
+                    row[col] = None
+            else:
+                exact = isinstance(value, str)
+                row[col] = None if value is None else str(value)
+            if col in item and not exact:
+                extra[col] = value
+        row["prezzo_num"] = prezzo_to_int(item.get("prezzo"))
+        extra.update({k: v for k, v in item.items() if k not in COLUMNS})
+        row["extra"] = json.dumps(extra, ensure_ascii=False)
+        return row
+
+    @staticmethod
+    def _from_row(row: sqlite3.Row) -> dict:
+        item = {col: row[col] for col in COLUMNS if row[col] is not None}
+        item.update(json.loads(row["extra"] or "{}"))
+        return item
+
+    def _upsert(self, conn: sqlite3.Connection, rows: Iterable[dict]) -> None:
+        cols = COLUMNS + ("prezzo_num", "extra")
+        conn.executemany(
+            f"INSERT OR REPLACE INTO annunci ({', '.join(cols)}) "
+            f"VALUES ({', '.join(':' + c for c in cols)})",
+            list(rows),
+        )
+
+    @profiled("stock_store.load")
+    def load(self) -> list[dict]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM annunci ORDER BY posizione IS NULL, posizione, link"
+            ).fetchall()
+        return [self._from_row(r) for r in rows]
+
+    def get(self, link: str) -> dict | None:
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM annunci WHERE link = ?", (link,)).fetchone()
+        return self._from_row(row) if row else None
+
+    @profiled("stock_store.save")
+    def save(self, annunci: list[dict]) -> None:
+        """Sostituisce l'intero stock (es. dopo uno scraping) in una transazione."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM annunci")
+            self._upsert(conn, (self._to_row(a) for a in annunci if a.get("link")))
+
+    def apply_edits(self, edits: dict[str, dict], reorder: bool = True) -> int:
+        """
+        Aggiorna solo le righe modificate, tutto in una transazione.
+        Con reorder=True riassegna anche le posizioni 1..N (solo la colonna
+        `posizione` delle righe che cambiano numero).
+        """
+        changed = 0
+        with self._connect() as conn:
+            for link, fields in edits.items():
+                row = conn.execute("SELECT * FROM annunci WHERE link = ?", (link,)).fetchone()
+                if row is None or not fields:
+                    continue
+                item = self._from_row(row)
+                item.update(fields)
+                self._upsert(conn, [self._to_row(item)])
+                changed += 1
+            if reorder:
+                current = [
+                    {"link": r["link"], "posizione": r["posizione"]}
+                    for r in conn.execute("SELECT link, posizione FROM annunci")
+                ]
+                conn.executemany(
+                    "UPDATE annunci SET posizione = ? WHERE link = ?",
+                    [
+                        (i + 1, item["link"])
+                        for i, item in enumerate(sorted(current, key=pos_key))
+                        if item["posizione"] != i + 1
+                    ],
+                )
+        return changed
+
+    def version(self) -> str:
+        """Cambia a ogni transazione che scrive (mtime del file del database)."""
+        return file_version(self.path)
+
+    def export_json(self, path: str) -> None:
+        """Produce lo stock.json letto dal kiosk."""
+        save_json(path, self.load())
+
+
+# ── Factory ───────────────────────────────────────────────────────────────────
+
+def open_stock_store(data_dir: str, backend: str | None = None):
+    """
+    Ritorna il backend configurato per la cartella dati.
+    backend: "json" | "sqlite"; se None usa CMS_STOCK_BACKEND (default "json").
+    """
+    backend = (backend or os.environ.get(BACKEND_ENV, "json")).lower()
+    os.makedirs(data_dir, exist_ok=True)
+    stock_json = os.path.join(data_dir, "stock.json")
+    if backend == "json":
+        return JsonStockStore(stock_json)
+    if backend == "sqlite":
+        return SqliteStockStore(os.path.join(data_dir, "stock.db"), seed_json=stock_json)
+    raise ValueError(f"Backend sconosciuto: {backend!r}. Valori validi: ['json', 'sqlite']")
@@ -0,0 +1,188 @@
+"""
+storico.py — Storico append-only di prezzi e disponibilità.
+
+Ogni scraping aggiunge uno snapshot dello stock in formato Parquet, partizionato
+per giorno (layout hive: `data/storico/giorno=YYYY-MM-DD/<ora>.parquet`).
+Nessun file viene mai riscritto: lo storico cresce di un file per scraping.
+
+Le query leggono solo le colonne necessarie e, quando possibile, solo le
+partizioni del periodo richiesto; i risultati sono aggregati batch per batch,
+quindi anni di snapshot giornalieri non vengono mai caricati tutti in memoria.
+
+Richiede `pyarrow` (dipendenza opzionale): senza, `disponibile()` ritorna
+False e il CMS salta lo storico. pyarrow è pesante da importare, quindi viene
+caricato solo alla prima scrittura o query.
+"""
+from __future__ import annotations
+
+import importlib.util
+import os
+from datetime import date, datetime, timedelta
+
+from storage import prezzo_to_int
+
+# ── Configurazione ────────────────────────────────────────────────────────────
+
+PARTITION_KEY = "giorno"
+
+
+def _arrow():
+    """Importa pyarrow al primo uso: (pyarrow, pyarrow.dataset, pyarrow.parquet)."""
+    if not disponibile():
+        raise RuntimeError("Storico non disponibile: installa pyarrow (pip install pyarrow).")
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    return pa, ds, pq
+
+
+def _schema():
+    pa, _, _ = _arrow()
+    return pa.schema([
+        ("ts", pa.timestamp("s")),
+        ("link", pa.string()),
+        ("titolo", pa.string()),
+        ("tipo", pa.string()),
+        ("prezzo", pa.string()),
+        ("prezzo_num", pa.int64()),
+        ("anno", pa.string()),
+        ("km", pa.string()),
+    ])
+
+
+def disponibile() -> bool:
+    """True se pyarrow è installato (senza importarlo)."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _dataset(root: str):
+    pa, ds, _ = _arrow()
+    key = pa.field(PARTITION_KEY, pa.string())
+    partitioning = ds.partitioning(pa.schema([key]), flavor="hive")
+    return ds.dataset(
+        root, format="parquet", partitioning=partitioning, schema=_schema().append(key)
+    )
+
+
+# ── Scrittura ─────────────────────────────────────────────────────────────────
+
+def append_snapshot(annunci: list[dict], root: str, ts: datetime | None = None) -> str:
+    """
+    Aggiunge uno snapshot dello stock allo storico.
+    Ritorna il percorso del file Parquet scritto.
+    """
+    pa, _, pq = _arrow()
+    ts = (ts or datetime.now()).replace(microsecond=0)
+    rows = [a for a in annunci if a.get("link")]
+    table = pa.Table.from_pydict(
+        {
+            "ts": [ts] * len(rows),
+            "link": [a["link"] for a in rows],
+            "titolo": [str(a.get("titolo", "")) for a in rows],
+            "tipo": [str(a.get("tipo", "")) for a in rows],
+            "prezzo": [str(a.get("prezzo", "")) for a in rows],
+            "prezzo_num": [prezzo_to_int(a.get("prezzo")) for a in rows],
+            "anno": [str(a.get("anno", "")) for a in rows],
+            "km": [str(a.get("km", "")) for a in rows],
+        },
+        schema=_schema(),
+    )
+    part_dir = os.path.join(root, f"{PARTITION_KEY}={ts.date().isoformat()}")
+    os.makedirs(part_dir, exist_ok=True)
+    path = os.path.join(part_dir, f"{ts.strftime('%H%M%S')}.parquet")
+    # Due scraping nello stesso secondo: non sovrascrivere mai
+    n = 1
+    while os.path.exists(path):
+        path = os.path.join(part_dir, f"{ts.strftime('%H%M%S')}-{n}.parquet")
+        n += 1
+    # File temporaneo con "." iniziale (ignorato dalle query sul dataset) e poi
+    # os.replace: un crash a metà scrittura non lascia un Parquet troncato
+    tmp = os.path.join(part_dir, f".{os.path.basename(path)}.tmp")
+    try:
+        pq.write_table(table, tmp, compression="zstd")
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return path
+
+
+# ── Query ─────────────────────────────────────────────────────────────────────
+
+def _iter_rows(root: str, columns: list[str], since: date | None = None):
+    """Scorre lo storico batch per batch, leggendo solo le colonne richieste."""
+    _, ds, _ = _arrow()
+    if not os.path.isdir(root):
+        return
+    flt = ds.field(PARTITION_KEY) >= since.isoformat() if since else None
+    for batch in _dataset(root).to_batches(columns=columns, filter=flt):
+        yield from zip(*(batch.column(c).to_pylist() for c in columns))
+
+
+def price_drops(root: str, days: int = 7, today: date | None = None) -> list[dict]:
+    """
+    Annunci il cui prezzo è sceso negli ultimi `days` giorni: confronta la
+    prima e l'ultima rilevazione del periodo. Ordinati per ribasso maggiore.
+    """
+    since = (today or date.today()) - timedelta(days=days)
+    first: dict[str, tuple] = {}
+    last: dict[str, tuple] = {}
+    for ts, link, titolo, prezzo, prezzo_num in _iter_rows(
+        root, ["ts", "link", "titolo", "prezzo", "prezzo_num"], since
+    ):
+        if prezzo_num is None:
+            continue
+        obs = (ts, prezzo_num, prezzo, titolo)
+        if link not in first or ts < first[link][0]:
+            first[link] = obs
+        if link not in last or ts > last[link][0]:
+            last[link] = obs
+
+    drops = []
+    for link, (_, old_num, old_prezzo, _) in first.items():
+        _, new_num, new_prezzo, titolo = last[link]
+        if new_num < old_num:
+            drops.append({
+                "link": link,
+                "titolo": titolo,
+                "prezzo_prima": old_prezzo,
+                "prezzo_ora": new_prezzo,
+                "ribasso": old_num - new_num,
+            })
+    drops.sort(key=lambda d: d["ribasso"], reverse=True)
+    return drops
+
+
+def days_on_lot(root: str) -> list[dict]:
+    """
+    Giorni di permanenza per annuncio: dal primo all'ultimo giorno in cui
+    compare nello storico. `in_stock` è False se l'annuncio non compare
+    nell'ultimo giorno registrato (venduto o rimosso).
+    """
+    seen: dict[str, list[str]] = {}
+    ultimo_giorno = ""
+    for link, giorno in _iter_rows(root, ["link", PARTITION_KEY]):
+        span = seen.get(link)
+        if span is None:
+            seen[link] = [giorno, giorno]
+        else:
+            if giorno < span[0]:
+                span[0] = giorno
+            if giorno > span[1]:
+                span[1] = giorno
+        if giorno > ultimo_giorno:
+            ultimo_giorno = giorno
+
+    risultati = []
+    for link, (primo, ultimo) in seen.items():
+        giorni = (date.fromisoformat(ultimo) - date.fromisoformat(primo)).days + 1
+        risultati.append({
+            "link": link,
+            "primo_giorno": primo,
+            "ultimo_giorno": ultimo,
+            "giorni": giorni,
+            "in_stock": ultimo == ultimo_giorno,
+        })
+    risultati.sort(key=lambda r: r["giorni"], reverse=True)
+    return risultati
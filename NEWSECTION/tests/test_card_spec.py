@@ -0,0 +1,104 @@
+# NEWSECTION/tests/test_card_spec.py
+"""
+Test della specifica dichiarativa delle card: stesso risultato del parser
+BeautifulSoup su tutte le fixture, e un layout diverso descritto solo da una
+nuova specifica.
+"""
+import sys, pathlib
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+import pytest
+from pathlib import Path
+
+pytest.importorskip("lxml")
+
+from card_spec import CompiledSpec, ROTOLO_SPEC
+from scraper import has_next_page, parse_listings_from_html, parse_page
+
+FIXTURES = Path(__file__).parent / "fixtures"
+BASE = "https://www.rotoloautomobili.com"
+PAGES = sorted(p.name for p in FIXTURES.glob("*_page*.html"))
+
+
+@pytest.mark.parametrize("fixture", PAGES)
+def test_stessi_annunci_del_parser_bs4(fixture):
+    html = (FIXTURES / fixture).read_text(encoding="utf-8")
+    assert parse_listings_from_html(html, BASE, engine="lxml") == parse_listings_from_html(html, BASE, engine="bs4")
+
+
+@pytest.mark.parametrize("fixture", PAGES)
+def test_stessa_paginazione_del_parser_bs4(fixture):
+    html = (FIXTURES / fixture).read_text(encoding="utf-8")
+    for page in range(1, 11):
+        assert has_next_page(html, page, engine="lxml") == has_next_page(html, page, engine="bs4")
+
+
+@pytest.mark.parametrize("html", ["", "   \n\t", "<!-- nessun annuncio -->", "<?xml version='1.0'?>"])
+def test_pagina_vuota_come_bs4(html):
+    for engine in ("lxml", "bs4"):
+        assert parse_page(html, 1, BASE, engine=engine) == ([], False)
+        assert parse_listings_from_html(html, BASE, engine=engine) == []
+        assert has_next_page(html, 1, engine=engine) is False
+
+
+def test_parse_page_un_solo_parse():
+    html = (FIXTURES / "usato_page2.html").read_text(encoding="utf-8")
+    listings, has_next = parse_page(html, 2, BASE, engine="lxml")
+    assert listings == parse_listings_from_html(html, BASE, engine="bs4")
+    assert has_next is True
+
+
+@pytest.mark.parametrize("decl", ['<?xml version="1.0" encoding="utf-8"?>\n', "<?xml version='1.0' encoding='ISO-8859-1'?>"])
+def test_dichiarazione_xml_con_encoding(decl):
+    # lxml rifiuta una str con encoding dichiarato (ValueError): stessi annunci di bs4
+    html = decl + (FIXTURES / "usato_page2.html").read_text(encoding="utf-8")
+    listings, has_next = parse_page(html, 2, BASE, engine="lxml")
+    assert listings and listings == parse_listings_from_html(html, BASE, engine="bs4")
+    assert has_next is True
+
+
+def test_motore_sconosciuto():
+    with pytest.raises(ValueError):
+        parse_listings_from_html("<html></html>", BASE, engine="regex")
+
+
+ALTRO_SITO = """
+<ul class="risultati">
+  <li class="auto" data-url="/veicolo/1">
+    <h3>Toyota <em>Yaris</em> 1.5 Hybrid</h3>
+    <p class="costo">14.900 €</p>
+    <dl><dt>Anno</dt><dd>2021</dd><dt>Km</dt><dd>35.000 km</dd></dl>
+  </li>
+  <li class="auto" data-url="/veicolo/2"><h3>Senza prezzo</h3></li>
+</ul>
+<nav><a href="?page=2">2</a></nav>
+"""
+
+ALTRO_SPEC = {
+    "card": "//li[has-class('auto')]",
+    "next_page": "//nav/a/@href",
+    "fields": {
+        "link": {"xpath": "@data-url", "url": True},
+        "titolo": {"xpath": "h3", "text": "words", "required": True},
+        "prezzo": {"xpath": "p[has-class('costo')]", "required": True},
+        "anno": {"xpath": "dl/dt[. = 'Anno']/following-sibling::dd[1]"},
+        "km": {"xpath": "dl/dt[. = 'Km']/following-sibling::dd[1]", "sub": [(r"[^\d]", "")]},
+    },
+    "output": ["titolo", "prezzo", "anno", "km", "link"],
+}
+
+
+def test_altro_layout_solo_con_una_specifica():
+    listings, hrefs = CompiledSpec(ALTRO_SPEC).parse_page(ALTRO_SITO, "https://altro.example")
+    assert listings == [{
+        "titolo": "Toyota Yaris 1.5 Hybrid", "prezzo": "14.900 €", "anno": "2021",
+        "km": "35000", "link": "https://altro.example/veicolo/1",
+    }]
+    assert hrefs == ["?page=2"]
+
+
+def test_specifica_non_valida():
+    with pytest.raises(ValueError):
+        CompiledSpec({**ROTOLO_SPEC, "output": ["titolo", "colore"]})
+    with pytest.raises(ValueError):
+        CompiledSpec({**ROTOLO_SPEC, "fields": {"titolo": {"xpath": "h3", "css": "h3"}}})
@@ -0,0 +1,96 @@
+# NEWSECTION/tests/test_enrich.py
+"""
+Test dell'arricchimento dai dettagli: parsing della pagina e download solo
+per gli annunci nuovi o cambiati.
+"""
+import sys, pathlib
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+import pytest
+from pathlib import Path
+from bs4 import BeautifulSoup
+from enrich import DetailCache, enrich_listings, firma, parse_detail, parse_gallery
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PAGE = "https://www.rotoloautomobili.com/auto/usato/mg-mg3-31986/"
+S3 = "https://mulitpubblicatorebucket.s3.eu-central-1.amazonaws.com"
+
+
+@pytest.fixture(scope="module")
+def detail():
+    return parse_detail((FIXTURES / "dettaglio_esempio.html").read_text(encoding="utf-8"), PAGE)
+
+
+class TestParseDetail:
+    def test_galleria_senza_loghi_ne_miniature(self, detail):
+        assert detail["galleria"] == [
+            f"{S3}/mg3_1.jpg",
+            f"{S3}/mg3_2.jpg",
+            "https://www.rotoloautomobili.com/upload/mg3_3.webp",
+        ]
+
+    def test_galleria_senza_contenitore_vuota(self):
+        # Pagina lista: solo card di altre auto, nessun contenitore galleria
+        html = (FIXTURES / "km0_page1.html").read_text(encoding="utf-8")
+        assert parse_detail(html, PAGE)["galleria"] == []
+        soup = BeautifulSoup('<div><img src="/upload/altra.jpg"/></div>', "html.parser")
+        assert parse_gallery(soup, PAGE) == []
+
+    def test_specifiche(self, detail):
+        specs = detail["specifiche"]
+        assert specs["potenza"] == "143 CV (105 kW)"
+        assert specs["colore_esterno"] == "Bianco perlato"
+        assert specs["immatricolazione"] == "03/2025"
+        assert specs["cambio"] == "automatico"
+
+
+class TestEnrich:
+    @pytest.fixture
+    def fetched(self):
+        return []
+
+    @pytest.fixture
+    def fetch(self, fetched):
+        def fetch(link):
+            fetched.append(link)
+            if link.endswith("rotto/"):
+                return None
+            return {"galleria": [f"{link}1.jpg"], "specifiche": {"potenza": "100 CV"}}
+        return fetch
+
+    def _annunci(self):
+        return [
+            {"link": "https://x/auto/a/", "titolo": "Panda", "prezzo": "9.000 €"},
+            {"link": "https://x/auto/b/", "titolo": "Golf", "prezzo": "20.000 €"},
+        ]
+
+    def test_scarica_solo_nuovi_o_cambiati(self, tmp_path, fetch, fetched):
+        path = str(tmp_path / "dettagli.json")
+        annunci = self._annunci()
+        stats = enrich_listings(annunci, DetailCache(path), log_fn=lambda m: None, fetch=fetch)
+        assert stats["scaricati"] == 2 and annunci[0]["galleria"] == ["https://x/auto/a/1.jpg"]
+
+        fetched.clear()
+        annunci = self._annunci()
+        annunci[1]["prezzo"] = "18.500 €"
+        annunci.append({"link": "https://x/auto/c/", "titolo": "500"})
+        stats = enrich_listings(annunci, DetailCache(path), log_fn=lambda m: None, fetch=fetch)
+        assert sorted(fetched) == ["https://x/auto/b/", "https://x/auto/c/"]
+        assert stats["dalla_cache"] == 1
+        assert annunci[0]["specifiche"] == {"potenza": "100 CV"}
+
+    def test_fallimento_tiene_i_dati_vecchi_e_riprova(self, fetch, fetched):
+        cache = DetailCache(None)
+        item = {"link": "https://x/auto/rotto/", "titolo": "Clio", "prezzo": "1 €"}
+        cache.put(item["link"], {"firma": "vecchia", "galleria": ["old.jpg"], "specifiche": {}})
+        stats = enrich_listings([item], cache, log_fn=lambda m: None, fetch=fetch)
+        assert stats["falliti"] == 1 and item["galleria"] == ["old.jpg"]
+        assert cache.get(item["link"])["firma"] == "vecchia"
+
+    def test_link_spariti_tolti_dalla_cache(self, fetch):
+        cache = DetailCache(None)
+        cache.put("https://x/auto/venduta/", {"firma": "f"})
+        annunci = self._annunci()
+        stats = enrich_listings(annunci, cache, log_fn=lambda m: None, fetch=fetch)
+        assert stats["rimossi_dalla_cache"] == 1 and cache.get("https://x/auto/venduta/") is None
+        assert cache.get(annunci[0]["link"])["firma"] == firma(annunci[0])
@@ -0,0 +1,126 @@
+# NEWSECTION/tests/test_image_check.py
+"""
+Test della verifica immagini contro un piccolo server HTTP locale.
+"""
+import sys, pathlib
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from image_check import ImageCache, check_url, check_urls, validate_images
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits: list = []
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, body: bool):
+        self.hits.append((self.command, self.path))
+        if self.path.startswith("/dead"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        if self.path.startswith("/nohead") and self.command == "HEAD":
+            self.send_response(405)
+            self.end_headers()
+            return
+        if self.path.startswith("/html"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(206 if self.headers.get("Range") else 200)
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", "1")
+        self.end_headers()
+        if body:
+            self.wfile.write(b"x")
+
+    def do_HEAD(self):
+        self._reply(body=False)
+
+    def do_GET(self):
+        self._reply(body=True)
+
+
+@pytest.fixture
+def base():
+    _Handler.hits = []
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+class TestCheckUrl:
+    def test_esiti(self, base):
+        assert check_url(f"{base}/ok.jpg")["ok"] is True
+        assert check_url(f"{base}/dead.jpg")["ok"] is False
+        assert check_url(f"{base}/html")["ok"] is False
+        assert check_url("http://127.0.0.1:1/irraggiungibile.jpg", timeout=1)["ok"] is False
+
+    def test_fallback_a_get_parziale(self, base):
+        result = check_url(f"{base}/nohead.jpg")
+        assert result["ok"] is True and result["status"] == 206
+        assert [m for m, _ in _Handler.hits] == ["HEAD", "GET"]
+
+    def test_rivalidazione_con_etag(self, base):
+        result = check_url(f"{base}/ok.jpg", etag='"v1"')
+        assert result == {**result, "ok": True, "status": 304, "etag": '"v1"'}
+
+
+class TestCache:
+    def test_esiti_freschi_non_rifanno_richieste(self, base, tmp_path):
+        cache = ImageCache(str(tmp_path / "cache.json"))
+        urls = [f"{base}/a.jpg", f"{base}/b.jpg", f"{base}/a.jpg"]
+        results, cached = check_urls(urls, cache)
+        assert cached == 0 and len(results) == 2 and len(_Handler.hits) == 2
+        cache.save()
+
+        results, cached = check_urls(urls, ImageCache(str(tmp_path / "cache.json")))
+        assert cached == 2 and len(_Handler.hits) == 2
+
+    def test_ttl_scaduto_rivalida_con_etag(self, base, tmp_path):
+        cache = ImageCache(None, ttl=0)
+        check_urls([f"{base}/a.jpg"], cache)
+        results, cached = check_urls([f"{base}/a.jpg"], cache)
+        assert cached == 0 and results[f"{base}/a.jpg"]["status"] == 304
+        assert results[f"{base}/a.jpg"]["ok"] is True
+
+    def test_304_conserva_un_esito_negativo(self, base):
+        # Verifica precedente fallita (es. non era un'immagine) con lo stesso ETag:
+        # il 304 dice solo che la risorsa non è cambiata
+        cache = ImageCache(None, ttl=0)
+        cache.put(f"{base}/a.jpg", {"ok": False, "status": 200, "etag": '"v1"', "checked": 0})
+        results, _ = check_urls([f"{base}/a.jpg"], cache)
+        assert results[f"{base}/a.jpg"] == {**results[f"{base}/a.jpg"], "ok": False, "status": 304}
+
+
+class TestValidate:
+    def test_ripara_con_galleria_o_segnala(self, base):
+        annunci = [
+            {"link": "ok", "immagine": f"{base}/ok.jpg", "galleria": [f"{base}/g0.jpg"]},
+            {"link": "rip", "immagine": f"{base}/dead1.jpg", "galleria": [f"{base}/dead2.jpg", f"{base}/g1.jpg"]},
+            {"link": "ko", "immagine": f"{base}/dead3.jpg"},
+            {"link": "ok-di-nuovo", "immagine": f"{base}/ok2.jpg", "immagine_ko": True},
+            {"link": "vuota", "immagine": ""},
+        ]
+        edits, stats = validate_images(annunci, concurrency=4)
+        assert edits == {
+            "rip": {"immagine": f"{base}/g1.jpg"},
+            "ko": {"immagine_ko": True},
+            "ok-di-nuovo": {"immagine_ko": False},
+            "vuota": {"immagine_ko": True},
+        }
+        assert (stats["ok"], stats["riparate"], stats["ko"]) == (2, 1, 2)
+        # La galleria si controlla solo per le immagini morte
+        assert ("HEAD", "/g0.jpg") not in _Handler.hits
@@ -0,0 +1,71 @@
+# NEWSECTION/tests/test_log_sink.py
+"""
+Test del log dello scraping: buffer limitato, livelli, lettura della coda e
+rotazione dei file.
+"""
+import sys, pathlib
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+import threading
+import pytest
+from log_sink import LogSink, level_of
+
+
+class TestBuffer:
+    def test_tiene_solo_le_ultime_voci(self):
+        log = LogSink(capacity=10)
+        for i in range(25):
+            log.log("INFO", f"riga {i}")
+        entries = log.entries()
+        assert [e["msg"] for e in entries] == [f"riga {i}" for i in range(15, 25)]
+        assert log.last_seq == 25 and log.dropped == 15
+
+    def test_coda_dopo_un_progressivo_e_per_livello(self):
+        log = LogSink()
+        for i in range(10):
+            log.log("WARNING" if i % 3 == 0 else "INFO", f"riga {i}")
+        assert [e["seq"] for e in log.entries(after=7)] == [8, 9, 10]
+        assert [e["msg"] for e in log.entries(min_level="WARNING")] == ["riga 0", "riga 3", "riga 6", "riga 9"]
+        assert [e["msg"] for e in log.entries(min_level="WARNING", limit=2)] == ["riga 6", "riga 9"]
+
+    def test_livello_sconosciuto(self):
+        with pytest.raises(ValueError):
+            LogSink().log("TRACE", "x")
+
+    def test_scritture_concorrenti(self):
+        log = LogSink(capacity=100_000)
+        threads = [threading.Thread(target=lambda: [log("msg") for _ in range(500)]) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        seqs = [e["seq"] for e in log.entries()]
+        assert seqs == list(range(1, 4001))
+
+
+class TestLivelli:
+    def test_livello_dedotto_dai_messaggi_dello_scraper(self):
+        assert level_of("[usato] Pagina 3...") == "DEBUG"
+        assert level_of("[usato] Pagina 3: +12 nuovi (tot: 36)") == "INFO"
+        assert level_of("[usato] Tentativo 1/3 fallito: timeout") == "WARNING"
+        assert level_of("[usato] Pagina 4: tutti i tentativi falliti, passo alla successiva.") == "ERROR"
+        assert level_of("[dettagli] scaricati 10, falliti 0 in 1.2 s") == "INFO"
+
+    def test_log_fn_una_voce_per_riga(self):
+        log = LogSink()
+        log("\n=== Sezione: km0 ===\n")
+        assert [e["msg"] for e in log.entries()] == ["=== Sezione: km0 ==="]
+
+
+def test_rotazione_su_disco(tmp_path):
+    path = tmp_path / "log" / "scraping.log"
+    log = LogSink(capacity=5, path=str(path), max_bytes=200, backups=2)
+    for i in range(62):
+        log.log("INFO", f"messaggio numero {i:03d}")
+    log.close()
+    files = sorted(p.name for p in path.parent.iterdir())
+    assert files == ["scraping.log", "scraping.log.1", "scraping.log.2"]
+    assert all(p.stat().st_size < 250 for p in path.parent.iterdir())
+    # Le ultime righe sono nel file corrente, le più vecchie oltre i backup sono eliminate
+    assert "messaggio numero 061" in path.read_text(encoding="utf-8")
+    assert "messaggio numero 000" not in "".join(p.read_text(encoding="utf-8") for p in path.parent.iterdir())
@@ -0,0 +1,50 @@
+# NEWSECTION/tests/test_profiling.py
+"""
+Test degli span di profiling e del report aggregato.
+"""
+import sys, pathlib
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+import pytest
+import profiling
+
+
+@pytest.fixture(autouse=True)
+def attivo():
+    profiling.set_enabled(True)
+    profiling.reset()
+    yield
+    profiling.set_enabled(False)
+    profiling.reset()
+
+
+class TestSpan:
+    def test_span_annidati(self):
+        with profiling.span("render"):
+            with profiling.span("load_json"):
+                pass
+            with profiling.span("load_json"):
+                pass
+        rows = {r["span"]: r for r in profiling.summary()}
+        assert rows["render/load_json"]["chiamate"] == 2
+        assert rows["render"]["chiamate"] == 1
+        assert "load_json" in profiling.tree()
+
+    def test_decorator(self):
+        @profiling.profiled("somma")
+        def somma(a, b):
+            return a + b
+        assert somma(1, 2) == 3
+        assert profiling.summary()[0]["span"] == "somma"
+
+    def test_spento_non_registra(self):
+        profiling.set_enabled(False)
+        with profiling.span("x"):
+            pass
+        assert profiling.summary() == []
+
+    def test_sampler_produce_report(self):
+        with profiling.sampler("prova"):
+            sum(range(10000))
+        report = profiling.last_report()
+        assert report["label"] == "prova" and report["text"]
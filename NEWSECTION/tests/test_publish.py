@@ -0,0 +1,143 @@
+# NEWSECTION/tests/test_publish.py
+"""
+Test della playlist precalcolata per il kiosk.
+"""
+import sys, pathlib
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+import json
+from publish import (
+    build_playlist, write_playlist, CAR_FIELDS,
+    feed_document, diff_feed, apply_feed_patch, publish_feed, feed_files,
+)
+
+ANNUNCI = [
+    {"titolo": f"Auto {i}", "prezzo": f"{i}.000 €", "link": f"https://x/auto/{i}/",
+     "posizione": 11 - i, "km": "", "tipo": "usato", "extra_non_usato": "x"}
+    for i in range(1, 11)
+]
+
+
+def _cars(playlist):
+    return [s["data"] for s in playlist["slides"] if s["type"] == "car"]
+
+
+class TestPlaylist:
+    def test_ordine_posizione(self):
+        pl = build_playlist(ANNUNCI, {"ordine": "Posizione", "max_annunci": 100})
+        assert [c["titolo"] for c in _cars(pl)][:3] == ["Auto 10", "Auto 9", "Auto 8"]
+
+    def test_max_annunci(self):
+        pl = build_playlist(ANNUNCI, {"ordine": "Posizione", "max_annunci": 5})
+        assert len(_cars(pl)) == 5
+
+    def test_casuale_deterministico(self):
+        s = {"ordine": "Casuale", "max_annunci": 100}
+        assert build_playlist(ANNUNCI, s) == build_playlist(list(reversed(ANNUNCI)), s)
+        assert _cars(build_playlist(ANNUNCI, s, seed=1)) != _cars(build_playlist(ANNUNCI, s, seed=2))
+
+    def test_promo_ogni_4_auto(self):
+        pl = build_playlist(ANNUNCI, {"ordine": "Posizione", "max_annunci": 100, "promo": ["p1.jpg", "p2.mp4"]})
+        types = [s["type"] for s in pl["slides"]]
+        assert types[4] == "promo" and types[9] == "promo"
+        promos = [s["data"] for s in pl["slides"] if s["type"] == "promo"]
+        assert promos == ["p1.jpg", "p2.mp4"]
+
+    def test_salta_auto_con_immagine_ko(self):
+        annunci = [dict(a) for a in ANNUNCI]
+        annunci[0]["immagine_ko"] = True
+        links = [c["link"] for c in _cars(build_playlist(annunci, {"ordine": "Posizione", "max_annunci": 100}))]
+        assert annunci[0]["link"] not in links and len(links) == len(ANNUNCI) - 1
+
+    def test_solo_campi_renderizzati(self):
+        pl = build_playlist(ANNUNCI, {"max_annunci": 100})
+        for car in _cars(pl):
+            assert set(car) <= set(CAR_FIELDS)
+            assert "km" not in car  # vuoto → omesso
+
+    def test_write_playlist(self, tmp_path):
+        (tmp_path / "stock.json").write_text(json.dumps(ANNUNCI), encoding="utf-8")
+        (tmp_path / "settings.json").write_text(json.dumps({"durata_slide": 6}), encoding="utf-8")
+        out = tmp_path / "playlist.json"
+        write_playlist(str(tmp_path / "stock.json"), str(tmp_path / "settings.json"), str(out))
+        data = json.loads(out.read_text(encoding="utf-8"))
+        assert data["durata_slide"] == 6
+        assert len(_cars(data)) == 10
+
+
+# ── Feed versionato ───────────────────────────────────────────────────────────
+
+def _load(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+class TestFeed:
+    def test_diff_e_patch_ricostruiscono_il_documento(self):
+        old = feed_document(ANNUNCI)
+        new_annunci = [dict(a) for a in ANNUNCI[1:]] + [{"titolo": "Nuova", "prezzo": "1 €", "link": "https://x/auto/new/"}]
+        new_annunci[0]["prezzo"] = "999 €"
+        new_annunci[1]["km"] = "1000"
+        new = feed_document(new_annunci)
+        ops = diff_feed(old, new)
+        assert apply_feed_patch(old, ops) == new
+        assert {op["op"] for op in ops} == {"add", "remove", "replace"}
+
+    def test_delta_piccolo_per_un_cambio_prezzo(self):
+        old = feed_document(ANNUNCI)
+        changed = [dict(a) for a in ANNUNCI]
+        changed[3]["prezzo"] = "1.234 €"
+        ops = diff_feed(old, feed_document(changed))
+        assert ops == [{"op": "replace", "path": "/https:~1~1x~1auto~14~1/prezzo", "value": "1.234 €"}]
+        assert len(json.dumps(ops)) < 300
+
+    def test_versioni_monotone_e_nessuna_versione_senza_modifiche(self, tmp_path):
+        feed = tmp_path / "feed"
+        m1, files1 = publish_feed(ANNUNCI, str(feed))
+        assert m1["versione"] == 1 and "snapshot-1.json" in files1
+        m2, files2 = publish_feed(ANNUNCI, str(feed))
+        assert m2["versione"] == 1 and files2 == []
+        changed = [dict(a) for a in ANNUNCI]
+        changed[0]["prezzo"] = "1 €"
+        m3, files3 = publish_feed(changed, str(feed))
+        assert m3["versione"] == 2 and "delta-2.json" in files3
+        assert _load(feed / "delta-2.json")["da"] == 1
+
+    def test_catch_up_da_snapshot_e_pulizia(self, tmp_path):
+        feed = tmp_path / "feed"
+        stock = [dict(a) for a in ANNUNCI]
+        for i in range(12):
+            stock[0]["prezzo"] = f"{i} €"
+            manifest, _ = publish_feed(stock, str(feed), snapshot_every=5)
+        assert manifest["versione"] == 12
+        assert manifest["snapshots"] == [5, 10]
+        names = {p.name for p in feed.iterdir()}
+        assert "snapshot-1.json" not in names and "delta-5.json" not in names
+        # Ricostruzione: ultimo snapshot + delta successivi
+        doc = _load(feed / f"snapshot-{manifest['snapshot']}.json")["stock"]
+        for v in range(manifest["snapshot"] + 1, manifest["versione"] + 1):
+            doc = apply_feed_patch(doc, _load(feed / f"delta-{v}.json")["patch"])
+        assert doc == feed_document(stock)
+
+    def test_file_da_pubblicare_includono_le_versioni_non_caricate(self, tmp_path):
+        # Due pubblicazioni senza push riuscito: il push successivo deve
+        # portare tutti i delta, non solo l'ultimo
+        feed = tmp_path / "feed"
+        assert feed_files(str(feed)) == []
+        stock = [dict(a) for a in ANNUNCI]
+        for prezzo in ("1 €", "2 €", "3 €"):
+            stock[0]["prezzo"] = prezzo
+            publish_feed(stock, str(feed))
+        assert feed_files(str(feed)) == ["snapshot-1.json", "delta-2.json", "delta-3.json", "manifest.json"]
+
+    def test_auto_con_immagine_ko_fuori_da_snapshot_e_delta(self, tmp_path):
+        feed = tmp_path / "feed"
+        ko = [dict(a) for a in ANNUNCI]
+        ko[0]["immagine_ko"] = True
+        publish_feed(ko, str(feed))
+        assert ko[0]["link"] not in _load(feed / "snapshot-1.json")["stock"]
+        # Nuova auto già segnalata: niente "add" nel delta
+        ko.append({**ANNUNCI[1], "link": "https://x/auto/nuova/", "immagine_ko": True})
+        ko[1]["immagine_ko"] = True
+        publish_feed(ko, str(feed))
+        patch = _load(feed / "delta-2.json")["patch"]
+        assert patch == [{"op": "remove", "path": "/https:~1~1x~1auto~12~1"}]
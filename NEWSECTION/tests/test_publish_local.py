@@ -0,0 +1,185 @@
+# NEWSECTION/tests/test_publish_local.py
+"""
+Test della pubblicazione locale e del server statico con cache.
+"""
+import sys, pathlib
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+import gzip
+import http.client
+import threading
+import pytest
+from publish_local import (
+    is_safe_path, publish_local, published_file, make_server, parse_range, cache_control,
+)
+
+
+@pytest.fixture
+def server(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "stock.json").write_text('[{"titolo": "FIAT Panda"}]' * 50, encoding="utf-8")
+    (src / "promo.mp4").write_bytes(bytes(range(256)) * 4)
+    root = tmp_path / "root"
+    (root / "NEWSECTION").mkdir(parents=True)
+    (root / "NEWSECTION" / "secrets.json").write_text("{}", encoding="utf-8")
+    (root / "slideshow.html").write_text("<html></html>", encoding="utf-8")
+    out = tmp_path / "pub"
+    publish_local([
+        (str(src / "stock.json"), "stock.json"),
+        (str(src / "promo.mp4"), "static/promos/promo.mp4"),
+    ], str(out))
+    srv = make_server(str(out), "127.0.0.1", 0, static_root=str(root))
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _request(srv, method, path, headers=None):
+    conn = http.client.HTTPConnection("127.0.0.1", srv.server_address[1], timeout=5)
+    conn.request(method, path, headers=headers or {})
+    resp = conn.getresponse()
+    body = resp.read()
+    conn.close()
+    return resp, body
+
+
+class TestParseRange:
+    def test_intervalli(self):
+        assert parse_range("bytes=0-9", 100) == (0, 9)
+        assert parse_range("bytes=90-", 100) == (90, 99)
+        assert parse_range("bytes=-10", 100) == (90, 99)
+        assert parse_range("bytes=0-500", 100) == (0, 99)
+
+    def test_non_soddisfacibile(self):
+        assert parse_range("bytes=100-", 100) is None
+        assert parse_range("items=0-1", 100) is None
+
+
+def test_is_safe_path():
+    assert is_safe_path("/assets/index-abc.js")
+    assert not is_safe_path("/assets/..\\NEWSECTION\\secrets.json")
+    assert not is_safe_path("/../NEWSECTION/secrets.json")
+    assert not is_safe_path("/assets/C:secrets.json")
+
+
+def test_published_file_contenuto_pubblicato(tmp_path):
+    src = tmp_path / "stock.json"
+    src.write_text('[{"titolo": "pubblicato"}]', encoding="utf-8")
+    out = tmp_path / "pub"
+    assert published_file(str(out), "stock.json") is None
+    publish_local([(str(src), "stock.json")], str(out))
+    src.write_text('[{"titolo": "non ancora pubblicato"}]', encoding="utf-8")
+    with open(published_file(str(out), "/stock.json"), encoding="utf-8") as f:
+        assert "non ancora" not in f.read()
+    assert published_file(str(out), "playlist.json") is None
+
+
+def test_ripubblicazione_rimuove_le_voci_non_pubblicate(tmp_path):
+    src = tmp_path / "x.json"
+    src.write_text("{}", encoding="utf-8")
+    out = str(tmp_path / "pub")
+    publish_local([(str(src), "stock.json"), (str(src), "feed/delta-1.json")], out)
+    index = publish_local([(str(src), "stock.json")], out)
+    assert set(index) == {"stock.json"}
+    assert published_file(out, "feed/delta-1.json") is None
+
+
+def test_pubblicazione_parziale_conserva_le_altre_voci(tmp_path):
+    src = tmp_path / "x.json"
+    src.write_text("{}", encoding="utf-8")
+    out = str(tmp_path / "pub")
+    publish_local([(str(src), "stock.json")], out)
+    index = publish_local([(str(src), "settings.json")], out, partial=True)
+    assert set(index) == {"stock.json", "settings.json"}
+
+
+def test_pubblicazioni_concorrenti(tmp_path):
+    # Pulsante e subscriber delle impostazioni insieme: indice sempre valido,
+    # nessun file temporaneo rimasto
+    out = str(tmp_path / "pub")
+    srcs = []
+    for i in range(8):
+        src = tmp_path / f"s{i}.json"
+        src.write_text(f'{{"n": {i}}}', encoding="utf-8")
+        srcs.append(str(src))
+    threads = [
+        threading.Thread(target=publish_local, args=([(src, f"f{i}.json")], out), kwargs={"partial": True})
+        for i, src in enumerate(srcs)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert all(published_file(out, f"f{i}.json") for i in range(8))
+    assert not [p for p in (tmp_path / "pub").rglob("*.tmp")]
+
+
+def test_feed_sempre_rivalidato():
+    # delta-N può essere rigenerato con contenuto diverso: niente cache immutabile
+    assert cache_control("feed/delta-3.json", "application/json") == "no-cache"
+    assert "immutable" in cache_control("assets/slideshow-abc.js", "text/javascript")
+
+
+class TestServer:
+    def test_etag_e_304(self, server):
+        resp, _ = _request(server, "HEAD", "/stock.json")
+        etag = resp.getheader("ETag")
+        assert resp.status == 200 and etag.startswith('"')
+        assert resp.getheader("Cache-Control") == "no-cache"
+        resp, body = _request(server, "GET", "/stock.json", {"If-None-Match": etag})
+        assert resp.status == 304 and body == b""
+
+    def test_variante_gzip(self, server):
+        resp, body = _request(server, "GET", "/stock.json", {"Accept-Encoding": "gzip"})
+        assert resp.getheader("Content-Encoding") == "gzip"
+        assert gzip.decompress(body).startswith(b'[{"titolo"')
+
+    def test_range_video(self, server):
+        resp, body = _request(server, "GET", "/static/promos/promo.mp4", {"Range": "bytes=10-19"})
+        assert resp.status == 206
+        assert resp.getheader("Content-Range") == "bytes 10-19/1024"
+        assert body == bytes(range(10, 20))
+
+    def test_range_non_soddisfacibile(self, server):
+        resp, _ = _request(server, "GET", "/static/promos/promo.mp4", {"Range": "bytes=5000-"})
+        assert resp.status == 416
+
+    def test_pagina_kiosk_da_static_root(self, server):
+        resp, body = _request(server, "GET", "/slideshow.html")
+        assert resp.status == 200 and body == b"<html></html>"
+
+    def test_secrets_mai_serviti(self, server):
+        resp, _ = _request(server, "GET", "/NEWSECTION/secrets.json")
+        assert resp.status == 404
+        resp, _ = _request(server, "GET", "/../NEWSECTION/secrets.json")
+        assert resp.status == 404
+
+    def test_traversal_windows_rifiutato(self, server):
+        # assets/..\NEWSECTION\secrets.json corrisponde a assets/[^/]+ ma su Windows esce da assets/
+        for path in ("/assets/..%5CNEWSECTION%5Csecrets.json", "/assets/C:secrets.json",
+                     "/assets/%2E%2E/NEWSECTION/secrets.json"):
+            resp, _ = _request(server, "GET", path)
+            assert resp.status == 404, path
+
+    def test_symlink_fuori_da_static_root(self, server, tmp_path):
+        outside = tmp_path / "fuori"
+        outside.mkdir()
+        (outside / "secrets.json").write_text("{}", encoding="utf-8")
+        try:
+            (tmp_path / "root" / "assets").symlink_to(outside, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlink non disponibili")
+        resp, _ = _request(server, "GET", "/assets/secrets.json")
+        assert resp.status == 404
+
+    def test_ripubblicazione_aggiorna_etag_e_rimuove_oggetti(self, server, tmp_path):
+        resp, _ = _request(server, "HEAD", "/stock.json")
+        old = resp.getheader("ETag")
+        (tmp_path / "src" / "stock.json").write_text("[]", encoding="utf-8")
+        publish_local([(str(tmp_path / "src" / "stock.json"), "stock.json")], str(tmp_path / "pub"))
+        resp, _ = _request(server, "HEAD", "/stock.json")
+        assert resp.getheader("ETag") != old
+        objects = [p.name for p in (tmp_path / "pub" / "objects").rglob("*")]
+        assert old.strip('"') not in objects
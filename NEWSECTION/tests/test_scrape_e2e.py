@@ -0,0 +1,36 @@
+# NEWSECTION/tests/test_scrape_e2e.py
+"""
+Test end to end di run_scraper contro il sito finto di bench/fake_dealer.py.
+"""
+import sys, pathlib
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "bench"))
+
+from fake_dealer import FakeDealer
+from scraper import run_scraper, scrape_section
+
+
+def test_scraping_completo_trova_tutti_gli_annunci():
+    with FakeDealer(pages={"km0": 2, "usato": 3, "outlet": 1}, per_page=5) as site:
+        results = run_scraper(log_fn=lambda m: None, base_url=site.url, delay=0)
+        assert len(results) == site.expected == 30
+        assert len({r["link"] for r in results}) == 30
+        assert all(r["link"].startswith(site.url + "/auto/") for r in results)
+        assert sorted(r["posizione"] for r in results) == list(range(1, 31))
+        # Una richiesta per pagina: la paginazione ferma lo scraper sull'ultima
+        assert site.stats["richieste"] == 6
+
+
+def test_errori_recuperati_con_retry():
+    log = []
+    with FakeDealer(pages={"usato": 6}, per_page=3, error_rate=0.3, seed=7) as site:
+        results = scrape_section("usato", log_fn=log.append, delay=0, base_url=site.url)
+        assert site.stats["errori"] > 0
+        assert sum("Tentativo" in m for m in log) == site.stats["errori"]
+        assert len(results) == site.expected
+
+
+def test_max_pages():
+    with FakeDealer(pages={"km0": 10}, per_page=2) as site:
+        results = scrape_section("km0", log_fn=lambda m: None, delay=0, base_url=site.url, max_pages=3)
+        assert len(results) == 6
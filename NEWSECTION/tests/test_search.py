@@ -0,0 +1,90 @@
+# NEWSECTION/tests/test_search.py
+"""
+Test dell'indice di ricerca: token, prefissi, faccette, intervalli e conteggi.
+"""
+import sys, pathlib
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+import pytest
+from search import StockIndex, tokenize
+from storage import JsonStockStore
+
+
+ANNUNCI = [
+    {"link": "a", "titolo": "FIAT Panda 1.2 Easy", "prezzo": "8.900 €", "anno": "03/2018",
+     "tipo": "usato", "alimentazione": "Benzina", "cambio": "Manuale"},
+    {"link": "b", "titolo": "Volkswagen Golf Variant 2.0 TDI", "prezzo": "21.500 €", "anno": "2021",
+     "tipo": "usato", "alimentazione": "Diesel", "cambio": "Automatico"},
+    {"link": "c", "titolo": "Fiat 500e Icône", "prezzo": "29.000 €", "anno": "2024",
+     "tipo": "km0", "alimentazione": "Elettrica", "cambio": "Automatico"},
+    {"link": "d", "titolo": "Volkswagen Golf 1.5 eTSI", "prezzo": "", "anno": "",
+     "tipo": "usato", "alimentazione": "Ibrida", "cambio": "Automatico"},
+]
+
+
+@pytest.fixture
+def idx():
+    return StockIndex(ANNUNCI)
+
+
+def links(results):
+    return [a["link"] for a in results]
+
+
+class TestTesto:
+    def test_tokenize_minuscolo_senza_accenti(self):
+        assert tokenize("Fiat 500e Icône 1.2") == ["fiat", "500e", "icone", "1", "2"]
+
+    def test_tutti_i_token_devono_comparire(self, idx):
+        assert links(idx.query("golf tdi")) == ["b"]
+        assert links(idx.query("fiat")) == ["a", "c"]
+
+    def test_ultimo_token_come_prefisso(self, idx):
+        assert links(idx.query("golf var")) == ["b"]
+        assert links(idx.query("volks")) == ["b", "d"]
+        assert idx.query("var golf") == []
+
+    def test_query_vuota_ritorna_tutto_in_ordine(self, idx):
+        assert links(idx.query("")) == ["a", "b", "c", "d"]
+
+
+class TestFaccette:
+    def test_or_dentro_la_faccetta_and_tra_faccette(self, idx):
+        assert links(idx.query(alimentazione={"Diesel", "Benzina"})) == ["a", "b"]
+        assert links(idx.query(tipo={"usato"}, cambio={"Automatico"})) == ["b", "d"]
+
+    def test_faccetta_sconosciuta_solleva(self, idx):
+        with pytest.raises(ValueError):
+            idx.query(colore={"rosso"})
+
+    def test_conteggi_ristretti_ai_risultati(self, idx):
+        counts = idx.facet_counts(idx.query_bits("golf"))
+        assert counts["tipo"] == {"km0": 0, "usato": 2}
+        assert idx.facet_counts()["cambio"] == {"Automatico": 3, "Manuale": 1}
+
+
+class TestIntervalli:
+    def test_anno_e_prezzo(self, idx):
+        assert links(idx.query(anno=(2020, None))) == ["b", "c"]
+        assert links(idx.query(prezzo=(None, 22000))) == ["a", "b"]
+        assert links(idx.query("fiat", prezzo=(9000, 30000))) == ["c"]
+        assert idx.query(anno=(2030, 2040)) == []
+
+    def test_intervalli_su_molti_annunci(self):
+        annunci = [{"link": str(i), "titolo": f"Auto {i}", "prezzo": f"{(i * 37) % 1000 * 100} €",
+                    "anno": str(2000 + i % 25)} for i in range(500)]
+        idx = StockIndex(annunci)
+        got = links(idx.query(prezzo=(20000, 45000), anno=(2010, 2015)))
+        expected = [a["link"] for a in annunci
+                    if 20000 <= (int(a["link"]) * 37) % 1000 * 100 <= 45000 and 2010 <= int(a["anno"]) <= 2015]
+        assert got == expected
+        assert idx.anno.bounds == (2000, 2024)
+
+
+def test_versione_cambia_al_salvataggio(tmp_path):
+    store = JsonStockStore(str(tmp_path / "stock.json"))
+    v0 = store.version()
+    store.save(ANNUNCI)
+    v1 = store.version()
+    store.save(ANNUNCI[:2])
+    assert len({v0, v1, store.version()}) == 3
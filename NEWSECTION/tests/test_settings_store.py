@@ -0,0 +1,87 @@
+# NEWSECTION/tests/test_settings_store.py
+"""
+Test dello store delle impostazioni: validazione, dirty tracking, scrittura differita.
+"""
+import sys, pathlib
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+import json
+import time
+import pytest
+from settings_store import SettingsStore, validate, DEFAULT_SETTINGS
+
+
+@pytest.fixture
+def path(tmp_path):
+    p = tmp_path / "settings.json"
+    p.write_text(json.dumps({"durata_slide": 6, "max_annunci": 100, "ordine": "Casuale", "promo": []}), encoding="utf-8")
+    return p
+
+
+class TestValidazione:
+    def test_valori_non_validi_tornano_al_default(self):
+        data = validate({"durata_slide": 999, "ordine": "Alfabetico", "extra": 1})
+        assert data["durata_slide"] == DEFAULT_SETTINGS["durata_slide"]
+        assert data["ordine"] == DEFAULT_SETTINGS["ordine"]
+        assert data["extra"] == 1
+
+    def test_update_non_valido_solleva(self, path):
+        store = SettingsStore(str(path), debounce=0)
+        with pytest.raises(ValueError):
+            store.update(durata_slide=1)
+        with pytest.raises(ValueError):
+            store.update(colore="rosso")
+
+
+class TestScrittura:
+    def test_nessuna_scrittura_senza_modifiche(self, path):
+        store = SettingsStore(str(path), debounce=0)
+        mtime = path.stat().st_mtime_ns
+        assert store.update(durata_slide=6, max_annunci=100, ordine="Casuale") is False
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_debounce_una_sola_scrittura(self, path):
+        store = SettingsStore(str(path), debounce=0.05)
+        calls = []
+        store.subscribe(calls.append)
+        for v in (7, 8, 9, 10):
+            assert store.update(durata_slide=v)
+        assert store.dirty
+        assert json.loads(path.read_text(encoding="utf-8"))["durata_slide"] == 6
+        time.sleep(0.3)
+        assert not store.dirty
+        assert json.loads(path.read_text(encoding="utf-8"))["durata_slide"] == 10
+        assert [c["durata_slide"] for c in calls] == [10]
+
+    def test_flush_immediato(self, path):
+        store = SettingsStore(str(path), debounce=60)
+        store.update(promo=["static/promos/a.jpg"])
+        assert store.flush() is True
+        assert json.loads(path.read_text(encoding="utf-8"))["promo"] == ["static/promos/a.jpg"]
+        assert store.flush() is False
+
+    def test_subscriber_non_chiamato_senza_modifiche(self, path):
+        store = SettingsStore(str(path), debounce=0)
+        calls = []
+        store.subscribe(calls.append)
+        store.update(ordine="Casuale")
+        assert calls == []
+
+    def test_subscriber_che_fallisce_non_blocca_gli_altri(self, path, caplog):
+        store = SettingsStore(str(path), debounce=0)
+        calls = []
+
+        def rotto(settings):
+            raise OSError("disco pieno")
+
+        store.subscribe(rotto)
+        store.subscribe(calls.append)
+        assert store.update(durata_slide=5)
+        assert [c["durata_slide"] for c in calls] == [5]
+        assert "disco pieno" in caplog.text
+
+    def test_modifica_esterna_ricaricata(self, path):
+        store = SettingsStore(str(path), debounce=0)
+        time.sleep(0.01)
+        path.write_text(json.dumps({"durata_slide": 12}), encoding="utf-8")
+        assert store.get("durata_slide") == 12
@@ -0,0 +1,144 @@
+# NEWSECTION/tests/test_storage.py
+"""
+Test dei backend di persistenza dello stock (JSON e SQLite).
+"""
+import sys, pathlib
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+import json
+import threading
+import pytest
+from storage import (
+    JsonStockStore, SqliteStockStore, load_json, open_stock_store, prezzo_to_int, save_json,
+)
+
+ANNUNCI = [
+    {"titolo": "FIAT Panda", "prezzo": "7.700 €", "anno": "2016", "km": "55228",
+     "alimentazione": "Benzina", "cambio": "manuale", "link": "https://x/auto/b/",
+     "immagine": "", "tipo": "usato", "posizione": 2},
+    {"titolo": "JEEP Avenger", "prezzo": "24.500 €", "anno": "2025", "km": "0",
+     "alimentazione": "Elettrica", "cambio": "automatico", "link": "https://x/auto/a/",
+     "immagine": "", "tipo": "km0", "posizione": 1, "galleria": ["g1.jpg"]},
+]
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path):
+    s = open_stock_store(str(tmp_path), backend=request.param)
+    s.save([dict(a) for a in ANNUNCI])
+    return s
+
+
+class TestPrezzo:
+    def test_prezzo_con_separatore_migliaia(self):
+        assert prezzo_to_int("20.900 €") == 20900
+
+    def test_prezzo_con_decimali(self):
+        assert prezzo_to_int("1.234,50 €") == 1234
+
+    def test_prezzo_vuoto(self):
+        assert prezzo_to_int("") is None
+        assert prezzo_to_int(None) is None
+
+
+def test_save_json_atomico_con_letture_concorrenti(tmp_path):
+    path = str(tmp_path / "stock.json")
+    data = [dict(a, posizione=i) for i in range(500) for a in ANNUNCI]
+    save_json(path, data)
+    stop = threading.Event()
+
+    def writer():
+        while not stop.is_set():
+            save_json(path, data)
+
+    t = threading.Thread(target=writer)
+    t.start()
+    try:
+        for _ in range(200):
+            assert load_json(path, None) == data
+    finally:
+        stop.set()
+        t.join()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["stock.json"]
+
+
+class TestStockStore:
+    def test_roundtrip_conserva_campi(self, store):
+        by_link = {a["link"]: a for a in store.load()}
+        for orig in ANNUNCI:
+            assert by_link[orig["link"]] == orig
+
+    def test_load_inverso_di_save(self, store):
+        annunci = [
+            {"link": "https://x/auto/minimo/"},
+            {"link": "https://x/auto/none/", "titolo": None, "prezzo": "", "posizione": None},
+            {"link": "https://x/auto/tipi/", "km": 55228, "posizione": "3", "anno": 2016, "immagine_ko": True},
+            {"link": "https://x/auto/pos/", "titolo": "FIAT Panda", "posizione": 7, "galleria": []},
+        ]
+        store.save([dict(a) for a in annunci])
+        by_link = {a["link"]: a for a in store.load()}
+        assert [by_link[a["link"]] for a in annunci] == annunci
+
+    def test_apply_edits_modifica_solo_righe_indicate(self, store):
+        n = store.apply_edits({"https://x/auto/b/": {"prezzo": "6.900 €"}}, reorder=False)
+        assert n == 1
+        by_link = {a["link"]: a for a in store.load()}
+        assert by_link["https://x/auto/b/"]["prezzo"] == "6.900 €"
+        assert by_link["https://x/auto/a/"]["prezzo"] == "24.500 €"
+
+    def test_apply_edits_link_sconosciuto_ignorato(self, store):
+        assert store.apply_edits({"https://x/auto/zzz/": {"prezzo": "1 €"}}) == 0
+
+    def test_reorder_riassegna_posizioni(self, store):
+        store.apply_edits({"https://x/auto/b/": {"posizione": 0}}, reorder=True)
+        by_link = {a["link"]: a["posizione"] for a in store.load()}
+        assert by_link == {"https://x/auto/b/": 1, "https://x/auto/a/": 2}
+
+    def test_export_json_per_kiosk(self, store, tmp_path):
+        out = tmp_path / "export" / "stock.json"
+        out.parent.mkdir()
+        store.export_json(str(out))
+        exported = json.loads(out.read_text(encoding="utf-8"))
+        assert sorted(a["link"] for a in exported) == sorted(a["link"] for a in ANNUNCI)
+
+
+class TestSqlite:
+    def test_import_iniziale_da_stock_json(self, tmp_path):
+        JsonStockStore(str(tmp_path / "stock.json")).save(ANNUNCI)
+        s = open_stock_store(str(tmp_path), backend="sqlite")
+        assert len(s.load()) == len(ANNUNCI)
+
+    def test_load_ordinato_per_posizione(self, tmp_path):
+        s = SqliteStockStore(str(tmp_path / "stock.db"))
+        s.save(ANNUNCI)
+        assert [a["posizione"] for a in s.load()] == [1, 2]
+
+    def test_indici_presenti(self, tmp_path):
+        import sqlite3
+        s = SqliteStockStore(str(tmp_path / "stock.db"))
+        with sqlite3.connect(s.path) as conn:
+            names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        assert {"idx_annunci_posizione", "idx_annunci_tipo", "idx_annunci_prezzo"} <= names
+
+    def test_migra_database_con_colonne_not_null(self, tmp_path):
+        import sqlite3
+        db = tmp_path / "stock.db"
+        conn = sqlite3.connect(db)
+        conn.executescript(
+            "CREATE TABLE annunci (link TEXT PRIMARY KEY, titolo TEXT NOT NULL DEFAULT '', "
+            "prezzo TEXT NOT NULL DEFAULT '', prezzo_num INTEGER, anno TEXT NOT NULL DEFAULT '', "
+            "km TEXT NOT NULL DEFAULT '', alimentazione TEXT NOT NULL DEFAULT '', "
+            "cambio TEXT NOT NULL DEFAULT '', immagine TEXT NOT NULL DEFAULT '', "
+            "tipo TEXT NOT NULL DEFAULT '', posizione INTEGER, extra TEXT NOT NULL DEFAULT '{}');"
+            "INSERT INTO annunci (link, titolo, posizione) VALUES ('https://x/auto/a/', 'JEEP', 1);"
+        )
+        conn.commit()
+        conn.close()
+        store = SqliteStockStore(str(db))
+        assert store.load()[0]["titolo"] == "JEEP"
+        store.save([{"link": "https://x/auto/b/", "titolo": None}])
+        assert store.load() == [{"link": "https://x/auto/b/", "titolo": None}]
+
+    def test_backend_sconosciuto(self, tmp_path):
+        with pytest.raises(ValueError):
+            open_stock_store(str(tmp_path), backend="redis")
@@ -0,0 +1,63 @@
+# NEWSECTION/tests/test_storico.py
+"""
+Test dello storico Parquet di prezzi e disponibilità.
+"""
+import sys, pathlib
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+import pytest
+from datetime import date, datetime
+
+pytest.importorskip("pyarrow")
+
+from storico import append_snapshot, price_drops, days_on_lot
+
+
+def _annuncio(link, prezzo):
+    return {"link": link, "titolo": f"Auto {link}", "prezzo": prezzo, "tipo": "usato"}
+
+
+@pytest.fixture
+def root(tmp_path):
+    r = str(tmp_path / "storico")
+    append_snapshot([_annuncio("a", "10.000 €"), _annuncio("b", "8.000 €")], r, datetime(2026, 3, 1, 9))
+    append_snapshot([_annuncio("a", "9.500 €"), _annuncio("b", "8.000 €")], r, datetime(2026, 3, 5, 9))
+    append_snapshot([_annuncio("a", "9.000 €"), _annuncio("c", "5.000 €")], r, datetime(2026, 3, 6, 9))
+    return r
+
+
+class TestSnapshot:
+    def test_partizione_per_giorno(self, root):
+        parts = sorted(p.name for p in pathlib.Path(root).iterdir())
+        assert parts == ["giorno=2026-03-01", "giorno=2026-03-05", "giorno=2026-03-06"]
+
+    def test_stesso_secondo_non_sovrascrive(self, tmp_path):
+        r = str(tmp_path / "s")
+        ts = datetime(2026, 3, 1, 9)
+        p1 = append_snapshot([_annuncio("a", "1 €")], r, ts)
+        p2 = append_snapshot([_annuncio("a", "1 €")], r, ts)
+        assert p1 != p2
+
+    def test_nessun_file_temporaneo(self, root):
+        files = [p.name for p in pathlib.Path(root).rglob("*") if p.is_file()]
+        assert files and all(f.endswith(".parquet") and not f.startswith(".") for f in files)
+
+
+class TestQuery:
+    def test_ribassi_ultimi_7_giorni(self, root):
+        drops = price_drops(root, days=7, today=date(2026, 3, 6))
+        assert [d["link"] for d in drops] == ["a"]
+        assert drops[0]["ribasso"] == 1000
+
+    def test_ribassi_finestra_esclude_snapshot_vecchi(self, root):
+        drops = price_drops(root, days=1, today=date(2026, 3, 6))
+        assert drops[0]["prezzo_prima"] == "9.500 €"
+
+    def test_giorni_in_stock(self, root):
+        by_link = {r["link"]: r for r in days_on_lot(root)}
+        assert by_link["a"]["giorni"] == 6 and by_link["a"]["in_stock"]
+        assert by_link["b"]["giorni"] == 5 and not by_link["b"]["in_stock"]
+        assert by_link["c"]["giorni"] == 1
+
+    def test_storico_assente(self, tmp_path):
+        assert days_on_lot(str(tmp_path / "vuoto")) == []
@@ -0,0 +1,752 @@
+(function(){const q=document.createElement("link").relList;if(q&&q.supports&&q.supports("modulepreload"))return;for(const H of document.querySelectorAll('link[rel="modulepreload"]'))m(H);new MutationObserver(H=>{for(const Y of H)if(Y.type==="childList")for(const al of Y.addedNodes)al.tagName==="LINK"&&al.rel==="modulepreload"&&m(al)}).observe(document,{childList:!0,subtree:!0});function C(H){const Y={};return H.integrity&&(Y.integrity=H.integrity),H.referrerPolicy&&(Y.referrerPolicy=H.referrerPolicy),H.crossOrigin==="use-credentials"?Y.credentials="include":H.crossOrigin==="anonymous"?Y.credentials="omit":Y.credentials="same-origin",Y}function m(H){if(H.ep)return;H.ep=!0;const Y=C(H);fetch(H.href,Y)}})();var dc={exports:{}},Ee={};var pd;function ay(){if(pd)return Ee;pd=1;var p=Symbol.for("react.transitional.element"),q=Symbol.for("react.fragment");function C(m,H,Y){var al=null;if(Y!==void 0&&(al=""+Y),H.key!==void 0&&(al=""+H.key),"key"in H){Y={};for(var rl in H)rl!=="key"&&(Y[rl]=H[rl])}else Y=H;return H=Y.ref,{$$typeof:p,type:m,key:al,ref:H!==void 0?H:null,props:Y}}return Ee.Fragment=q,Ee.jsx=C,Ee.jsxs=C,Ee}var zd;function uy(){return zd||(zd=1,dc.exports=ay()),dc.exports}var N=uy(),mc={exports:{}},G={};var Td;function ey(){if(Td)return G;Td=1;var p=Symbol.for("react.transitional.element"),q=Symbol.for("react.portal"),C=Symbol.for("react.fragment"),m=Symbol.for("react.strict_mode"),H=Symbol.for("react.profiler"),Y=Symbol.for("react.consumer"),al=Symbol.for("react.context"),rl=Symbol.for("react.forward_ref"),M=Symbol.for("react.suspense"),E=Symbol.for("react.memo"),V=Symbol.for("react.lazy"),U=Symbol.for("react.activity"),I=Symbol.iterator;function Xl(o){return o===null||typeof o!="object"?null:(o=I&&o[I]||o["@@iterator"],typeof o=="function"?o:null)}var Gl={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},xl=Object.assign,wl={};function Zl(o,T,O){this.props=o,this.context=T,this.refs=wl,this.updater=O||Gl}Zl.prototype.isReactComponent={},Zl.prototype.setState=function(o,T){if(typeof o!="object"&&typeof o!="function"&&o!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,o,T,"setState")},Zl.prototype.forceUpdate=function(o){this.updater.enqueueForceUpdate(this,o,"forceUpdate")};function Vl(){}Vl.prototype=Zl.prototype;function K(o,T,O){this.props=o,this.context=T,this.refs=wl,this.updater=O||Gl}var gl=K.prototype=new Vl;gl.constructor=K,xl(gl,Zl.prototype),gl.isPureReactComponent=!0;var Ll=Array.isArray;function Nl(){}var L={H:null,A:null,T:null,S:null},Wl=Object.prototype.hasOwnProperty;function Mt(o,T,O){var D=O.ref;return{$$typeof:p,type:o,key:T,ref:D!==void 0?D:null,props:O}}function La(o,T){return Mt(o.type,T,o.props)}function Dt(o){return typeof o=="object"&&o!==null&&o.$$typeof===p}function $l(o){var T={"=":"=0",":":"=2"};return"$"+o.replace(/[=:]/g,function(O){return T[O]})}var Ea=/\/+/g;function Rt(o,T){return typeof o=="object"&&o!==null&&o.key!=null?$l(""+o.key):T.toString(36)}function Et(o){switch(o.status){case"fulfilled":return o.value;case"rejected":throw o.reason;default:switch(typeof o.status=="string"?o.then(Nl,Nl):(o.status="pending",o.then(function(T){o.status==="pending"&&(o.status="fulfilled",o.value=T)},function(T){o.status==="pending"&&(o.status="rejected",o.reason=T)})),o.status){case"fulfilled":return o.value;case"rejected":throw o.reason}}throw o}function S(o,T,O,D,Q){var J=typeof o;(J==="undefined"||J==="boolean")&&(o=null);var el=!1;if(o===null)el=!0;else switch(J){case"bigint":case"string":case"number":el=!0;break;case"object":switch(o.$$typeof){case p:case q:el=!0;break;case V:return el=o._init,S(el(o._payload),T,O,D,Q)}}if(el)return Q=Q(o),el=D===""?"."+Rt(o,0):D,Ll(Q)?(O="",el!=null&&(O=el.replace(Ea,"$&/")+"/"),S(Q,T,O,"",function(Uu){return Uu})):Q!=null&&(Dt(Q)&&(Q=La(Q,O+(Q.key==null||o&&o.key===Q.key?"":(""+Q.key).replace(Ea,"$&/")+"/")+el)),T.push(Q)),1;el=0;var Kl=D===""?".":D+":";if(Ll(o))for(var pl=0;pl<o.length;pl++)D=o[pl],J=Kl+Rt(D,pl),el+=S(D,T,O,J,Q);else if(pl=Xl(o),typeof pl=="function")for(o=pl.call(o),pl=0;!(D=o.next()).done;)D=D.value,J=Kl+Rt(D,pl++),el+=S(D,T,O,J,Q);else if(J==="object"){if(typeof o.then=="function")return S(Et(o),T,O,D,Q);throw T=String(o),Error("Objects are not valid as a React child (found: "+(T==="[object Object]"?"object with keys {"+Object.keys(o).join(", ")+"}":T)+"). If you meant to render a collection of children, use an array instead.")}return el}function A(o,T,O){if(o==null)return o;var D=[],Q=0;return S(o,D,"","",function(J){return T.call(O,J,Q++)}),D}function B(o){if(o._status===-1){var T=o._result;T=T(),T.then(function(O){(o._status===0||o._status===-1)&&(o._status=1,o._result=O)},function(O){(o._status===0||o._status===-1)&&(o._status=2,o._result=O)}),o._status===-1&&(o._status=0,o._result=T)}if(o._status===1)return o._result.default;throw o._result}var fl=typeof reportError=="function"?reportError:function(o){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var T=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof o=="object"&&o!==null&&typeof o.message=="string"?String(o.message):String(o),error:o});if(!window.dispatchEvent(T))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",o);return}console.error(o)},dl={map:A,forEach:function(o,T,O){A(o,function(){T.apply(this,arguments)},O)},count:function(o){var T=0;return A(o,function(){T++}),T},toArray:function(o){return A(o,function(T){return T})||[]},only:function(o){if(!Dt(o))throw Error("React.Children.only expected to receive a single React element child.");return o}};return G.Activity=U,G.Children=dl,G.Component=Zl,G.Fragment=C,G.Profiler=H,G.PureComponent=K,G.StrictMode=m,G.Suspense=M,G.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=L,G.__COMPILER_RUNTIME={__proto__:null,c:function(o){return L.H.useMemoCache(o)}},G.cache=function(o){return function(){return o.apply(null,arguments)}},G.cacheSignal=function(){return null},G.cloneElement=function(o,T,O){if(o==null)throw Error("The argument must be a React element, but you passed "+o+".");var D=xl({},o.props),Q=o.key;if(T!=null)for(J in T.key!==void 0&&(Q=""+T.key),T)!Wl.call(T,J)||J==="key"||J==="__self"||J==="__source"||J==="ref"&&T.ref===void 0||(D[J]=T[J]);var J=arguments.length-2;if(J===1)D.children=O;else if(1<J){for(var el=Array(J),Kl=0;Kl<J;Kl++)el[Kl]=arguments[Kl+2];D.children=el}return Mt(o.type,Q,D)},G.createContext=function(o){return o={$$typeof:al,_currentValue:o,_currentValue2:o,_threadCount:0,Provider:null,Consumer:null},o.Provider=o,o.Consumer={$$typeof:Y,_context:o},o},G.createElement=function(o,T,O){var D,Q={},J=null;if(T!=null)for(D in T.key!==void 0&&(J=""+T.key),T)Wl.call(T,D)&&D!=="key"&&D!=="__self"&&D!=="__source"&&(Q[D]=T[D]);var el=arguments.length-2;if(el===1)Q.children=O;else if(1<el){for(var Kl=Array(el),pl=0;pl<el;pl++)Kl[pl]=arguments[pl+2];Q.children=Kl}if(o&&o.defaultProps)for(D in el=o.defaultProps,el)Q[D]===void 0&&(Q[D]=el[D]);return Mt(o,J,Q)},G.createRef=function(){return{current:null}},G.forwardRef=function(o){return{$$typeof:rl,render:o}},G.isValidElement=Dt,G.lazy=function(o){return{$$typeof:V,_payload:{_status:-1,_result:o},_init:B}},G.memo=function(o,T){return{$$typeof:E,type:o,compare:T===void 0?null:T}},G.startTransition=function(o){var T=L.T,O={};L.T=O;try{var D=o(),Q=L.S;Q!==null&&Q(O,D),typeof D=="object"&&D!==null&&typeof D.then=="function"&&D.then(Nl,fl)}catch(J){fl(J)}finally{T!==null&&O.types!==null&&(T.types=O.types),L.T=T}},G.unstable_useCacheRefresh=function(){return L.H.useCacheRefresh()},G.use=function(o){return L.H.use(o)},G.useActionState=function(o,T,O){return L.H.useActionState(o,T,O)},G.useCallback=function(o,T){return L.H.useCallback(o,T)},G.useContext=function(o){return L.H.useContext(o)},G.useDebugValue=function(){},G.useDeferredValue=function(o,T){return L.H.useDeferredValue(o,T)},G.useEffect=function(o,T){return L.H.useEffect(o,T)},G.useEffectEvent=function(o){return L.H.useEffectEvent(o)},G.useId=function(){return L.H.useId()},G.useImperativeHandle=function(o,T,O){return L.H.useImperativeHandle(o,T,O)},G.useInsertionEffect=function(o,T){return L.H.useInsertionEffect(o,T)},G.useLayoutEffect=function(o,T){return L.H.useLayoutEffect(o,T)},G.useMemo=function(o,T){return L.H.useMemo(o,T)},G.useOptimistic=function(o,T){return L.H.useOptimistic(o,T)},G.useReducer=function(o,T,O){return L.H.useReducer(o,T,O)},G.useRef=function(o){return L.H.useRef(o)},G.useState=function(o){return L.H.useState(o)},G.useSyncExternalStore=function(o,T,O){return L.H.useSyncExternalStore(o,T,O)},G.useTransition=function(){return L.H.useTransition()},G.version="19.2.4",G}var Ed;function gc(){return Ed||(Ed=1,mc.exports=ey()),mc.exports}var Dl=gc(),vc={exports:{}},Ae={},yc={exports:{}},hc={};var Ad;function ny(){return Ad||(Ad=1,(function(p){function q(S,A){var B=S.length;S.push(A);l:for(;0<B;){var fl=B-1>>>1,dl=S[fl];if(0<H(dl,A))S[fl]=A,S[B]=dl,B=fl;else break l}}function C(S){return S.length===0?null:S[0]}function m(S){if(S.length===0)return null;var A=S[0],B=S.pop();if(B!==A){S[0]=B;l:for(var fl=0,dl=S.length,o=dl>>>1;fl<o;){var T=2*(fl+1)-1,O=S[T],D=T+1,Q=S[D];if(0>H(O,B))D<dl&&0>H(Q,O)?(S[fl]=Q,S[D]=B,fl=D):(S[fl]=O,S[T]=B,fl=T);else if(D<dl&&0>H(Q,B))S[fl]=Q,S[D]=B,fl=D;else break l}}return A}function H(S,A){var B=S.sortIndex-A.sortIndex;return B!==0?B:S.id-A.id}if(p.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var Y=performance;p.unstable_now=function(){return Y.now()}}else{var al=Date,rl=al.now();p.unstable_now=function(){return al.now()-rl}}var M=[],E=[],V=1,U=null,I=3,Xl=!1,Gl=!1,xl=!1,wl=!1,Zl=typeof setTimeout=="function"?setTimeout:null,Vl=typeof clearTimeout=="function"?clearTimeout:null,K=typeof setImmediate<"u"?setImmediate:null;function gl(S){for(var A=C(E);A!==null;){if(A.callback===null)m(E);else if(A.startTime<=S)m(E),A.sortIndex=A.expirationTime,q(M,A);else break;A=C(E)}}function Ll(S){if(xl=!1,gl(S),!Gl)if(C(M)!==null)Gl=!0,Nl||(Nl=!0,$l());else{var A=C(E);A!==null&&Et(Ll,A.startTime-S)}}var Nl=!1,L=-1,Wl=5,Mt=-1;function La(){return wl?!0:!(p.unstable_now()-Mt<Wl)}function Dt(){if(wl=!1,Nl){var S=p.unstable_now();Mt=S;var A=!0;try{l:{Gl=!1,xl&&(xl=!1,Vl(L),L=-1),Xl=!0;var B=I;try{t:{for(gl(S),U=C(M);U!==null&&!(U.expirationTime>S&&La());){var fl=U.callback;if(typeof fl=="function"){U.callback=null,I=U.priorityLevel;var dl=fl(U.expirationTime<=S);if(S=p.unstable_now(),typeof dl=="function"){U.callback=dl,gl(S),A=!0;break t}U===C(M)&&m(M),gl(S)}else m(M);U=C(M)}if(U!==null)A=!0;else{var o=C(E);o!==null&&Et(Ll,o.startTime-S),A=!1}}break l}finally{U=null,I=B,Xl=!1}A=void 0}}finally{A?$l():Nl=!1}}}var $l;if(typeof K=="function")$l=function(){K(Dt)};else if(typeof MessageChannel<"u"){var Ea=new MessageChannel,Rt=Ea.port2;Ea.port1.onmessage=Dt,$l=function(){Rt.postMessage(null)}}else $l=function(){Zl(Dt,0)};function Et(S,A){L=Zl(function(){S(p.unstable_now())},A)}p.unstable_IdlePriority=5,p.unstable_ImmediatePriority=1,p.unstable_LowPriority=4,p.unstable_NormalPriority=3,p.unstable_Profiling=null,p.unstable_UserBlockingPriority=2,p.unstable_cancelCallback=function(S){S.callback=null},p.unstable_forceFrameRate=function(S){0>S||125<S?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):Wl=0<S?Math.floor(1e3/S):5},p.unstable_getCurrentPriorityLevel=function(){return I},p.unstable_next=function(S){switch(I){case 1:case 2:case 3:var A=3;break;default:A=I}var B=I;I=A;try{return S()}finally{I=B}},p.unstable_requestPaint=function(){wl=!0},p.unstable_runWithPriority=function(S,A){switch(S){case 1:case 2:case 3:case 4:case 5:break;default:S=3}var B=I;I=S;try{return A()}finally{I=B}},p.unstable_scheduleCallback=function(S,A,B){var fl=p.unstable_now();switch(typeof B=="object"&&B!==null?(B=B.delay,B=typeof B=="number"&&0<B?fl+B:fl):B=fl,S){case 1:var dl=-1;break;case 2:dl=250;break;case 5:dl=1073741823;break;case 4:dl=1e4;break;default:dl=5e3}return dl=B+dl,S={id:V++,callback:A,priorityLevel:S,startTime:B,expirationTime:dl,sortIndex:-1},B>fl?(S.sortIndex=B,q(E,S),C(M)===null&&S===C(E)&&(xl?(Vl(L),L=-1):xl=!0,Et(Ll,B-fl))):(S.sortIndex=dl,q(M,S),Gl||Xl||(Gl=!0,Nl||(Nl=!0,$l()))),S},p.unstable_shouldYield=La,p.unstable_wrapCallback=function(S){var A=I;return function(){var B=I;I=A;try{return S.apply(this,arguments)}finally{I=B}}}})(hc)),hc}var Od;function iy(){return Od||(Od=1,yc.exports=ny()),yc.exports}var rc={exports:{}},Ql={};var _d;function fy(){if(_d)return Ql;_d=1;var p=gc();function q(M){var E="https://react.dev/errors/"+M;if(1<arguments.length){E+="?args[]="+encodeURIComponent(arguments[1]);for(var V=2;V<arguments.length;V++)E+="&args[]="+encodeURIComponent(arguments[V])}return"Minified React error #"+M+"; visit "+E+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function C(){}var m={d:{f:C,r:function(){throw Error(q(522))},D:C,C,L:C,m:C,X:C,S:C,M:C},p:0,findDOMNode:null},H=Symbol.for("react.portal");function Y(M,E,V){var U=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:H,key:U==null?null:""+U,children:M,containerInfo:E,implementation:V}}var al=p.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function rl(M,E){if(M==="font")return"";if(typeof E=="string")return E==="use-credentials"?E:""}return Ql.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=m,Ql.createPortal=function(M,E){var V=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!E||E.nodeType!==1&&E.nodeType!==9&&E.nodeType!==11)throw Error(q(299));return Y(M,E,null,V)},Ql.flushSync=function(M){var E=al.T,V=m.p;try{if(al.T=null,m.p=2,M)return M()}finally{al.T=E,m.p=V,m.d.f()}},Ql.preconnect=function(M,E){typeof M=="string"&&(E?(E=E.crossOrigin,E=typeof E=="string"?E==="use-credentials"?E:"":void 0):E=null,m.d.C(M,E))},Ql.prefetchDNS=function(M){typeof M=="string"&&m.d.D(M)},Ql.preinit=function(M,E){if(typeof M=="string"&&E&&typeof E.as=="string"){var V=E.as,U=rl(V,E.crossOrigin),I=typeof E.integrity=="string"?E.integrity:void 0,Xl=typeof E.fetchPriority=="string"?E.fetchPriority:void 0;V==="style"?m.d.S(M,typeof E.precedence=="string"?E.precedence:void 0,{crossOrigin:U,integrity:I,fetchPriority:Xl}):V==="script"&&m.d.X(M,{crossOrigin:U,integrity:I,fetchPriority:Xl,nonce:typeof E.nonce=="string"?E.nonce:void 0})}},Ql.preinitModule=function(M,E){if(typeof M=="string")if(typeof E=="object"&&E!==null){if(E.as==null||E.as==="script"){var V=rl(E.as,E.crossOrigin);m.d.M(M,{crossOrigin:V,integrity:typeof E.integrity=="string"?E.integrity:void 0,nonce:typeof E.nonce=="string"?E.nonce:void 0})}}else E==null&&m.d.M(M)},Ql.preload=function(M,E){if(typeof M=="string"&&typeof E=="object"&&E!==null&&typeof E.as=="string"){var V=E.as,U=rl(V,E.crossOrigin);m.d.L(M,V,{crossOrigin:U,integrity:typeof E.integrity=="string"?E.integrity:void 0,nonce:typeof E.nonce=="string"?E.nonce:void 0,type:typeof E.type=="string"?E.type:void 0,fetchPriority:typeof E.fetchPriority=="string"?E.fetchPriority:void 0,referrerPolicy:typeof E.referrerPolicy=="string"?E.referrerPolicy:void 0,imageSrcSet:typeof E.imageSrcSet=="string"?E.imageSrcSet:void 0,imageSizes:typeof E.imageSizes=="string"?E.imageSizes:void 0,media:typeof E.media=="string"?E.media:void 0})}},Ql.preloadModule=function(M,E){if(typeof M=="string")if(E){var V=rl(E.as,E.crossOrigin);m.d.m(M,{as:typeof E.as=="string"&&E.as!=="script"?E.as:void 0,crossOrigin:V,integrity:typeof E.integrity=="string"?E.integrity:void 0})}else m.d.m(M)},Ql.requestFormReset=function(M){m.d.r(M)},Ql.unstable_batchedUpdates=function(M,E){return M(E)},Ql.useFormState=function(M,E,V){return al.H.useFormState(M,E,V)},Ql.useFormStatus=function(){return al.H.useHostTransitionStatus()},Ql.version="19.2.4",Ql}var Md;function cy(){if(Md)return rc.exports;Md=1;function p(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(p)}catch(q){console.error(q)}}return p(),rc.exports=fy(),rc.exports}var Dd;function sy(){if(Dd)return Ae;Dd=1;var p=iy(),q=gc(),C=cy();function m(l){var t="https://react.dev/errors/"+l;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var a=2;a<arguments.length;a++)t+="&args[]="+encodeURIComponent(arguments[a])}return"Minified React error #"+l+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function H(l){return!(!l||l.nodeType!==1&&l.nodeType!==9&&l.nodeType!==11)}function Y(l){var t=l,a=l;if(l.alternate)for(;t.return;)t=t.return;else{l=t;do t=l,(t.flags&4098)!==0&&(a=t.return),l=t.return;while(l)}return t.tag===3?a:null}function al(l){if(l.tag===13){var t=l.memoizedState;if(t===null&&(l=l.alternate,l!==null&&(t=l.memoizedState)),t!==null)return t.dehydrated}return null}function rl(l){if(l.tag===31){var t=l.memoizedState;if(t===null&&(l=l.alternate,l!==null&&(t=l.memoizedState)),t!==null)return t.dehydrated}return null}function M(l){if(Y(l)!==l)throw Error(m(188))}function E(l){var t=l.alternate;if(!t){if(t=Y(l),t===null)throw Error(m(188));return t!==l?null:l}for(var a=l,u=t;;){var e=a.return;if(e===null)break;var n=e.alternate;if(n===null){if(u=e.return,u!==null){a=u;continue}break}if(e.child===n.child){for(n=e.child;n;){if(n===a)return M(e),l;if(n===u)return M(e),t;n=n.sibling}throw Error(m(188))}if(a.return!==u.return)a=e,u=n;else{for(var i=!1,f=e.child;f;){if(f===a){i=!0,a=e,u=n;break}if(f===u){i=!0,u=e,a=n;break}f=f.sibling}if(!i){for(f=n.child;f;){if(f===a){i=!0,a=n,u=e;break}if(f===u){i=!0,u=n,a=e;break}f=f.sibling}if(!i)throw Error(m(189))}}if(a.alternate!==u)throw Error(m(190))}if(a.tag!==3)throw Error(m(188));return a.stateNode.current===a?l:t}function V(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l;for(l=l.child;l!==null;){if(t=V(l),t!==null)return t;l=l.sibling}return null}var U=Object.assign,I=Symbol.for("react.element"),Xl=Symbol.for("react.transitional.element"),Gl=Symbol.for("react.portal"),xl=Symbol.for("react.fragment"),wl=Symbol.for("react.strict_mode"),Zl=Symbol.for("react.profiler"),Vl=Symbol.for("react.consumer"),K=Symbol.for("react.context"),gl=Symbol.for("react.forward_ref"),Ll=Symbol.for("react.suspense"),Nl=Symbol.for("react.suspense_list"),L=Symbol.for("react.memo"),Wl=Symbol.for("react.lazy"),Mt=Symbol.for("react.activity"),La=Symbol.for("react.memo_cache_sentinel"),Dt=Symbol.iterator;function $l(l){return l===null||typeof l!="object"?null:(l=Dt&&l[Dt]||l["@@iterator"],typeof l=="function"?l:null)}var Ea=Symbol.for("react.client.reference");function Rt(l){if(l==null)return null;if(typeof l=="function")return l.$$typeof===Ea?null:l.displayName||l.name||null;if(typeof l=="string")return l;switch(l){case xl:return"Fragment";case Zl:return"Profiler";case wl:return"StrictMode";case Ll:return"Suspense";case Nl:return"SuspenseList";case Mt:return"Activity"}if(typeof l=="object")switch(l.$$typeof){case Gl:return"Portal";case K:return l.displayName||"Context";case Vl:return(l._context.displayName||"Context")+".Consumer";case gl:var t=l.render;return l=l.displayName,l||(l=t.displayName||t.name||"",l=l!==""?"ForwardRef("+l+")":"ForwardRef"),l;case L:return t=l.displayName||null,t!==null?t:Rt(l.type)||"Memo";case Wl:t=l._payload,l=l._init;try{return Rt(l(t))}catch{}}return null}var Et=Array.isArray,S=q.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,A=C.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,B={pending:!1,data:null,method:null,action:null},fl=[],dl=-1;function o(l){return{current:l}}function T(l){0>dl||(l.current=fl[dl],fl[dl]=null,dl--)}function O(l,t){dl++,fl[dl]=l.current,l.current=t}var D=o(null),Q=o(null),J=o(null),el=o(null);function Kl(l,t){switch(O(J,t),O(Q,l),O(D,null),t.nodeType){case 9:case 11:l=(l=t.documentElement)&&(l=l.namespaceURI)?Vo(l):0;break;default:if(l=t.tagName,t=t.namespaceURI)t=Vo(t),l=Lo(t,l);else switch(l){case"svg":l=1;break;case"math":l=2;break;default:l=0}}T(D),O(D,l)}function pl(){T(D),T(Q),T(J)}function Uu(l){l.memoizedState!==null&&O(el,l);var t=D.current,a=Lo(t,l.type);t!==a&&(O(Q,l),O(D,a))}function Oe(l){Q.current===l&&(T(D),T(Q)),el.current===l&&(T(el),be._currentValue=B)}var Jn,Sc;function Aa(l){if(Jn===void 0)try{throw Error()}catch(a){var t=a.stack.trim().match(/\n( *(at )?)/);Jn=t&&t[1]||"",Sc=-1<a.stack.indexOf(`
+    at`)?" (<anonymous>)":-1<a.stack.indexOf("@")?"@unknown:0:0":""}return`
+`+Jn+l+Sc}var wn=!1;function Wn(l,t){if(!l||wn)return"";wn=!0;var a=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var u={DetermineComponentFrameRoot:function(){try{if(t){var z=function(){throw Error()};if(Object.defineProperty(z.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(z,[])}catch(r){var h=r}Reflect.construct(l,[],z)}else{try{z.call()}catch(r){h=r}l.call(z.prototype)}}else{try{throw Error()}catch(r){h=r}(z=l())&&typeof z.catch=="function"&&z.catch(function(){})}}catch(r){if(r&&h&&typeof r.stack=="string")return[r.stack,h.stack]}return[null,null]}};u.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var e=Object.getOwnPropertyDescriptor(u.DetermineComponentFrameRoot,"name");e&&e.configurable&&Object.defineProperty(u.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var n=u.DetermineComponentFrameRoot(),i=n[0],f=n[1];if(i&&f){var c=i.split(`
+`),y=f.split(`
+`);for(e=u=0;u<c.length&&!c[u].includes("DetermineComponentFrameRoot");)u++;for(;e<y.length&&!y[e].includes("DetermineComponentFrameRoot");)e++;if(u===c.length||e===y.length)for(u=c.length-1,e=y.length-1;1<=u&&0<=e&&c[u]!==y[e];)e--;for(;1<=u&&0<=e;u--,e--)if(c[u]!==y[e]){if(u!==1||e!==1)do if(u--,e--,0>e||c[u]!==y[e]){var g=`
+`+c[u].replace(" at new "," at ");return l.displayName&&g.includes("<anonymous>")&&(g=g.replace("<anonymous>",l.displayName)),g}while(1<=u&&0<=e);break}}}finally{wn=!1,Error.prepareStackTrace=a}return(a=l?l.displayName||l.name:"")?Aa(a):""}function Rd(l,t){switch(l.tag){case 26:case 27:case 5:return Aa(l.type);case 16:return Aa("Lazy");case 13:return l.child!==t&&t!==null?Aa("Suspense Fallback"):Aa("Suspense");case 19:return Aa("SuspenseList");case 0:case 15:return Wn(l.type,!1);case 11:return Wn(l.type.render,!1);case 1:return Wn(l.type,!0);case 31:return Aa("Activity");default:return""}}function bc(l){try{var t="",a=null;do t+=Rd(l,a),a=l,l=l.return;while(l);return t}catch(u){return`
+Error generating stack: `+u.message+`
+`+u.stack}}var $n=Object.prototype.hasOwnProperty,kn=p.unstable_scheduleCallback,Fn=p.unstable_cancelCallback,Cd=p.unstable_shouldYield,jd=p.unstable_requestPaint,ut=p.unstable_now,qd=p.unstable_getCurrentPriorityLevel,pc=p.unstable_ImmediatePriority,zc=p.unstable_UserBlockingPriority,_e=p.unstable_NormalPriority,Bd=p.unstable_LowPriority,Tc=p.unstable_IdlePriority,Yd=p.log,Gd=p.unstable_setDisableYieldValue,Hu=null,et=null;function It(l){if(typeof Yd=="function"&&Gd(l),et&&typeof et.setStrictMode=="function")try{et.setStrictMode(Hu,l)}catch{}}var nt=Math.clz32?Math.clz32:Zd,Qd=Math.log,Xd=Math.LN2;function Zd(l){return l>>>=0,l===0?32:31-(Qd(l)/Xd|0)|0}var Me=256,De=262144,xe=4194304;function Oa(l){var t=l&42;if(t!==0)return t;switch(l&-l){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return l&261888;case 262144:case 524288:case 1048576:case 2097152:return l&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return l&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return l}}function Ue(l,t,a){var u=l.pendingLanes;if(u===0)return 0;var e=0,n=l.suspendedLanes,i=l.pingedLanes;l=l.warmLanes;var f=u&134217727;return f!==0?(u=f&~n,u!==0?e=Oa(u):(i&=f,i!==0?e=Oa(i):a||(a=f&~l,a!==0&&(e=Oa(a))))):(f=u&~n,f!==0?e=Oa(f):i!==0?e=Oa(i):a||(a=u&~l,a!==0&&(e=Oa(a)))),e===0?0:t!==0&&t!==e&&(t&n)===0&&(n=e&-e,a=t&-t,n>=a||n===32&&(a&4194048)!==0)?t:e}function Nu(l,t){return(l.pendingLanes&~(l.suspendedLanes&~l.pingedLanes)&t)===0}function Vd(l,t){switch(l){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function Ec(){var l=xe;return xe<<=1,(xe&62914560)===0&&(xe=4194304),l}function In(l){for(var t=[],a=0;31>a;a++)t.push(l);return t}function Ru(l,t){l.pendingLanes|=t,t!==268435456&&(l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0)}function Ld(l,t,a,u,e,n){var i=l.pendingLanes;l.pendingLanes=a,l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0,l.expiredLanes&=a,l.entangledLanes&=a,l.errorRecoveryDisabledLanes&=a,l.shellSuspendCounter=0;var f=l.entanglements,c=l.expirationTimes,y=l.hiddenUpdates;for(a=i&~a;0<a;){var g=31-nt(a),z=1<<g;f[g]=0,c[g]=-1;var h=y[g];if(h!==null)for(y[g]=null,g=0;g<h.length;g++){var r=h[g];r!==null&&(r.lane&=-536870913)}a&=~z}u!==0&&Ac(l,u,0),n!==0&&e===0&&l.tag!==0&&(l.suspendedLanes|=n&~(i&~t))}function Ac(l,t,a){l.pendingLanes|=t,l.suspendedLanes&=~t;var u=31-nt(t);l.entangledLanes|=t,l.entanglements[u]=l.entanglements[u]|1073741824|a&261930}function Oc(l,t){var a=l.entangledLanes|=t;for(l=l.entanglements;a;){var u=31-nt(a),e=1<<u;e&t|l[u]&t&&(l[u]|=t),a&=~e}}function _c(l,t){var a=t&-t;return a=(a&42)!==0?1:Pn(a),(a&(l.suspendedLanes|t))!==0?0:a}function Pn(l){switch(l){case 2:l=1;break;case 8:l=4;break;case 32:l=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:l=128;break;case 268435456:l=134217728;break;default:l=0}return l}function li(l){return l&=-l,2<l?8<l?(l&134217727)!==0?32:268435456:8:2}function Mc(){var l=A.p;return l!==0?l:(l=window.event,l===void 0?32:vd(l.type))}function Dc(l,t){var a=A.p;try{return A.p=l,t()}finally{A.p=a}}var Pt=Math.random().toString(36).slice(2),Rl="__reactFiber$"+Pt,kl="__reactProps$"+Pt,Ka="__reactContainer$"+Pt,ti="__reactEvents$"+Pt,Kd="__reactListeners$"+Pt,Jd="__reactHandles$"+Pt,xc="__reactResources$"+Pt,Cu="__reactMarker$"+Pt;function ai(l){delete l[Rl],delete l[kl],delete l[ti],delete l[Kd],delete l[Jd]}function Ja(l){var t=l[Rl];if(t)return t;for(var a=l.parentNode;a;){if(t=a[Ka]||a[Rl]){if(a=t.alternate,t.child!==null||a!==null&&a.child!==null)for(l=Fo(l);l!==null;){if(a=l[Rl])return a;l=Fo(l)}return t}l=a,a=l.parentNode}return null}function wa(l){if(l=l[Rl]||l[Ka]){var t=l.tag;if(t===5||t===6||t===13||t===31||t===26||t===27||t===3)return l}return null}function ju(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l.stateNode;throw Error(m(33))}function Wa(l){var t=l[xc];return t||(t=l[xc]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function Ul(l){l[Cu]=!0}var Uc=new Set,Hc={};function _a(l,t){$a(l,t),$a(l+"Capture",t)}function $a(l,t){for(Hc[l]=t,l=0;l<t.length;l++)Uc.add(t[l])}var wd=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Nc={},Rc={};function Wd(l){return $n.call(Rc,l)?!0:$n.call(Nc,l)?!1:wd.test(l)?Rc[l]=!0:(Nc[l]=!0,!1)}function He(l,t,a){if(Wd(t))if(a===null)l.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":l.removeAttribute(t);return;case"boolean":var u=t.toLowerCase().slice(0,5);if(u!=="data-"&&u!=="aria-"){l.removeAttribute(t);return}}l.setAttribute(t,""+a)}}function Ne(l,t,a){if(a===null)l.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(t);return}l.setAttribute(t,""+a)}}function Ct(l,t,a,u){if(u===null)l.removeAttribute(a);else{switch(typeof u){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(a);return}l.setAttributeNS(t,a,""+u)}}function vt(l){switch(typeof l){case"bigint":case"boolean":case"number":case"string":case"undefined":return l;case"object":return l;default:return""}}function Cc(l){var t=l.type;return(l=l.nodeName)&&l.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function $d(l,t,a){var u=Object.getOwnPropertyDescriptor(l.constructor.prototype,t);if(!l.hasOwnProperty(t)&&typeof u<"u"&&typeof u.get=="function"&&typeof u.set=="function"){var e=u.get,n=u.set;return Object.defineProperty(l,t,{configurable:!0,get:function(){return e.call(this)},set:function(i){a=""+i,n.call(this,i)}}),Object.defineProperty(l,t,{enumerable:u.enumerable}),{getValue:function(){return a},setValue:function(i){a=""+i},stopTracking:function(){l._valueTracker=null,delete l[t]}}}}function ui(l){if(!l._valueTracker){var t=Cc(l)?"checked":"value";l._valueTracker=$d(l,t,""+l[t])}}function jc(l){if(!l)return!1;var t=l._valueTracker;if(!t)return!0;var a=t.getValue(),u="";return l&&(u=Cc(l)?l.checked?"true":"false":l.value),l=u,l!==a?(t.setValue(l),!0):!1}function Re(l){if(l=l||(typeof document<"u"?document:void 0),typeof l>"u")return null;try{return l.activeElement||l.body}catch{return l.body}}var kd=/[\n"\\]/g;function yt(l){return l.replace(kd,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function ei(l,t,a,u,e,n,i,f){l.name="",i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"?l.type=i:l.removeAttribute("type"),t!=null?i==="number"?(t===0&&l.value===""||l.value!=t)&&(l.value=""+vt(t)):l.value!==""+vt(t)&&(l.value=""+vt(t)):i!=="submit"&&i!=="reset"||l.removeAttribute("value"),t!=null?ni(l,i,vt(t)):a!=null?ni(l,i,vt(a)):u!=null&&l.removeAttribute("value"),e==null&&n!=null&&(l.defaultChecked=!!n),e!=null&&(l.checked=e&&typeof e!="function"&&typeof e!="symbol"),f!=null&&typeof f!="function"&&typeof f!="symbol"&&typeof f!="boolean"?l.name=""+vt(f):l.removeAttribute("name")}function qc(l,t,a,u,e,n,i,f){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(l.type=n),t!=null||a!=null){if(!(n!=="submit"&&n!=="reset"||t!=null)){ui(l);return}a=a!=null?""+vt(a):"",t=t!=null?""+vt(t):a,f||t===l.value||(l.value=t),l.defaultValue=t}u=u??e,u=typeof u!="function"&&typeof u!="symbol"&&!!u,l.checked=f?l.checked:!!u,l.defaultChecked=!!u,i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"&&(l.name=i),ui(l)}function ni(l,t,a){t==="number"&&Re(l.ownerDocument)===l||l.defaultValue===""+a||(l.defaultValue=""+a)}function ka(l,t,a,u){if(l=l.options,t){t={};for(var e=0;e<a.length;e++)t["$"+a[e]]=!0;for(a=0;a<l.length;a++)e=t.hasOwnProperty("$"+l[a].value),l[a].selected!==e&&(l[a].selected=e),e&&u&&(l[a].defaultSelected=!0)}else{for(a=""+vt(a),t=null,e=0;e<l.length;e++){if(l[e].value===a){l[e].selected=!0,u&&(l[e].defaultSelected=!0);return}t!==null||l[e].disabled||(t=l[e])}t!==null&&(t.selected=!0)}}function Bc(l,t,a){if(t!=null&&(t=""+vt(t),t!==l.value&&(l.value=t),a==null)){l.defaultValue!==t&&(l.defaultValue=t);return}l.defaultValue=a!=null?""+vt(a):""}function Yc(l,t,a,u){if(t==null){if(u!=null){if(a!=null)throw Error(m(92));if(Et(u)){if(1<u.length)throw Error(m(93));u=u[0]}a=u}a==null&&(a=""),t=a}a=vt(t),l.defaultValue=a,u=l.textContent,u===a&&u!==""&&u!==null&&(l.value=u),ui(l)}function Fa(l,t){if(t){var a=l.firstChild;if(a&&a===l.lastChild&&a.nodeType===3){a.nodeValue=t;return}}l.textContent=t}var Fd=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Gc(l,t,a){var u=t.indexOf("--")===0;a==null||typeof a=="boolean"||a===""?u?l.setProperty(t,""):t==="float"?l.cssFloat="":l[t]="":u?l.setProperty(t,a):typeof a!="number"||a===0||Fd.has(t)?t==="float"?l.cssFloat=a:l[t]=(""+a).trim():l[t]=a+"px"}function Qc(l,t,a){if(t!=null&&typeof t!="object")throw Error(m(62));if(l=l.style,a!=null){for(var u in a)!a.hasOwnProperty(u)||t!=null&&t.hasOwnProperty(u)||(u.indexOf("--")===0?l.setProperty(u,""):u==="float"?l.cssFloat="":l[u]="");for(var e in t)u=t[e],t.hasOwnProperty(e)&&a[e]!==u&&Gc(l,e,u)}else for(var n in t)t.hasOwnProperty(n)&&Gc(l,n,t[n])}function ii(l){if(l.indexOf("-")===-1)return!1;switch(l){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Id=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Pd=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Ce(l){return Pd.test(""+l)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":l}function jt(){}var fi=null;function ci(l){return l=l.target||l.srcElement||window,l.correspondingUseElement&&(l=l.correspondingUseElement),l.nodeType===3?l.parentNode:l}var Ia=null,Pa=null;function Xc(l){var t=wa(l);if(t&&(l=t.stateNode)){var a=l[kl]||null;l:switch(l=t.stateNode,t.type){case"input":if(ei(l,a.value,a.defaultValue,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name),t=a.name,a.type==="radio"&&t!=null){for(a=l;a.parentNode;)a=a.parentNode;for(a=a.querySelectorAll('input[name="'+yt(""+t)+'"][type="radio"]'),t=0;t<a.length;t++){var u=a[t];if(u!==l&&u.form===l.form){var e=u[kl]||null;if(!e)throw Error(m(90));ei(u,e.value,e.defaultValue,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name)}}for(t=0;t<a.length;t++)u=a[t],u.form===l.form&&jc(u)}break l;case"textarea":Bc(l,a.value,a.defaultValue);break l;case"select":t=a.value,t!=null&&ka(l,!!a.multiple,t,!1)}}}var si=!1;function Zc(l,t,a){if(si)return l(t,a);si=!0;try{var u=l(t);return u}finally{if(si=!1,(Ia!==null||Pa!==null)&&(Tn(),Ia&&(t=Ia,l=Pa,Pa=Ia=null,Xc(t),l)))for(t=0;t<l.length;t++)Xc(l[t])}}function qu(l,t){var a=l.stateNode;if(a===null)return null;var u=a[kl]||null;if(u===null)return null;a=u[t];l:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(u=!u.disabled)||(l=l.type,u=!(l==="button"||l==="input"||l==="select"||l==="textarea")),l=!u;break l;default:l=!1}if(l)return null;if(a&&typeof a!="function")throw Error(m(231,t,typeof a));return a}var qt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),oi=!1;if(qt)try{var Bu={};Object.defineProperty(Bu,"passive",{get:function(){oi=!0}}),window.addEventListener("test",Bu,Bu),window.removeEventListener("test",Bu,Bu)}catch{oi=!1}var la=null,di=null,je=null;function Vc(){if(je)return je;var l,t=di,a=t.length,u,e="value"in la?la.value:la.textContent,n=e.length;for(l=0;l<a&&t[l]===e[l];l++);var i=a-l;for(u=1;u<=i&&t[a-u]===e[n-u];u++);return je=e.slice(l,1<u?1-u:void 0)}function qe(l){var t=l.keyCode;return"charCode"in l?(l=l.charCode,l===0&&t===13&&(l=13)):l=t,l===10&&(l=13),32<=l||l===13?l:0}function Be(){return!0}function Lc(){return!1}function Fl(l){function t(a,u,e,n,i){this._reactName=a,this._targetInst=e,this.type=u,this.nativeEvent=n,this.target=i,this.currentTarget=null;for(var f in l)l.hasOwnProperty(f)&&(a=l[f],this[f]=a?a(n):n[f]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?Be:Lc,this.isPropagationStopped=Lc,this}return U(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var a=this.nativeEvent;a&&(a.preventDefault?a.preventDefault():typeof a.returnValue!="unknown"&&(a.returnValue=!1),this.isDefaultPrevented=Be)},stopPropagation:function(){var a=this.nativeEvent;a&&(a.stopPropagation?a.stopPropagation():typeof a.cancelBubble!="unknown"&&(a.cancelBubble=!0),this.isPropagationStopped=Be)},persist:function(){},isPersistent:Be}),t}var Ma={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(l){return l.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Ye=Fl(Ma),Yu=U({},Ma,{view:0,detail:0}),lm=Fl(Yu),mi,vi,Gu,Ge=U({},Yu,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:hi,button:0,buttons:0,relatedTarget:function(l){return l.relatedTarget===void 0?l.fromElement===l.srcElement?l.toElement:l.fromElement:l.relatedTarget},movementX:function(l){return"movementX"in l?l.movementX:(l!==Gu&&(Gu&&l.type==="mousemove"?(mi=l.screenX-Gu.screenX,vi=l.screenY-Gu.screenY):vi=mi=0,Gu=l),mi)},movementY:function(l){return"movementY"in l?l.movementY:vi}}),Kc=Fl(Ge),tm=U({},Ge,{dataTransfer:0}),am=Fl(tm),um=U({},Yu,{relatedTarget:0}),yi=Fl(um),em=U({},Ma,{animationName:0,elapsedTime:0,pseudoElement:0}),nm=Fl(em),im=U({},Ma,{clipboardData:function(l){return"clipboardData"in l?l.clipboardData:window.clipboardData}}),fm=Fl(im),cm=U({},Ma,{data:0}),Jc=Fl(cm),sm={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},om={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},dm={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function mm(l){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(l):(l=dm[l])?!!t[l]:!1}function hi(){return mm}var vm=U({},Yu,{key:function(l){if(l.key){var t=sm[l.key]||l.key;if(t!=="Unidentified")return t}return l.type==="keypress"?(l=qe(l),l===13?"Enter":String.fromCharCode(l)):l.type==="keydown"||l.type==="keyup"?om[l.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:hi,charCode:function(l){return l.type==="keypress"?qe(l):0},keyCode:function(l){return l.type==="keydown"||l.type==="keyup"?l.keyCode:0},which:function(l){return l.type==="keypress"?qe(l):l.type==="keydown"||l.type==="keyup"?l.keyCode:0}}),ym=Fl(vm),hm=U({},Ge,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),wc=Fl(hm),rm=U({},Yu,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:hi}),gm=Fl(rm),Sm=U({},Ma,{propertyName:0,elapsedTime:0,pseudoElement:0}),bm=Fl(Sm),pm=U({},Ge,{deltaX:function(l){return"deltaX"in l?l.deltaX:"wheelDeltaX"in l?-l.wheelDeltaX:0},deltaY:function(l){return"deltaY"in l?l.deltaY:"wheelDeltaY"in l?-l.wheelDeltaY:"wheelDelta"in l?-l.wheelDelta:0},deltaZ:0,deltaMode:0}),zm=Fl(pm),Tm=U({},Ma,{newState:0,oldState:0}),Em=Fl(Tm),Am=[9,13,27,32],ri=qt&&"CompositionEvent"in window,Qu=null;qt&&"documentMode"in document&&(Qu=document.documentMode);var Om=qt&&"TextEvent"in window&&!Qu,Wc=qt&&(!ri||Qu&&8<Qu&&11>=Qu),$c=" ",kc=!1;function Fc(l,t){switch(l){case"keyup":return Am.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Ic(l){return l=l.detail,typeof l=="object"&&"data"in l?l.data:null}var lu=!1;function _m(l,t){switch(l){case"compositionend":return Ic(t);case"keypress":return t.which!==32?null:(kc=!0,$c);case"textInput":return l=t.data,l===$c&&kc?null:l;default:return null}}function Mm(l,t){if(lu)return l==="compositionend"||!ri&&Fc(l,t)?(l=Vc(),je=di=la=null,lu=!1,l):null;switch(l){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Wc&&t.locale!=="ko"?null:t.data;default:return null}}var Dm={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Pc(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t==="input"?!!Dm[l.type]:t==="textarea"}function l0(l,t,a,u){Ia?Pa?Pa.push(u):Pa=[u]:Ia=u,t=xn(t,"onChange"),0<t.length&&(a=new Ye("onChange","change",null,a,u),l.push({event:a,listeners:t}))}var Xu=null,Zu=null;function xm(l){Bo(l,0)}function Qe(l){var t=ju(l);if(jc(t))return l}function t0(l,t){if(l==="change")return t}var a0=!1;if(qt){var gi;if(qt){var Si="oninput"in document;if(!Si){var u0=document.createElement("div");u0.setAttribute("oninput","return;"),Si=typeof u0.oninput=="function"}gi=Si}else gi=!1;a0=gi&&(!document.documentMode||9<document.documentMode)}function e0(){Xu&&(Xu.detachEvent("onpropertychange",n0),Zu=Xu=null)}function n0(l){if(l.propertyName==="value"&&Qe(Zu)){var t=[];l0(t,Zu,l,ci(l)),Zc(xm,t)}}function Um(l,t,a){l==="focusin"?(e0(),Xu=t,Zu=a,Xu.attachEvent("onpropertychange",n0)):l==="focusout"&&e0()}function Hm(l){if(l==="selectionchange"||l==="keyup"||l==="keydown")return Qe(Zu)}function Nm(l,t){if(l==="click")return Qe(t)}function Rm(l,t){if(l==="input"||l==="change")return Qe(t)}function Cm(l,t){return l===t&&(l!==0||1/l===1/t)||l!==l&&t!==t}var it=typeof Object.is=="function"?Object.is:Cm;function Vu(l,t){if(it(l,t))return!0;if(typeof l!="object"||l===null||typeof t!="object"||t===null)return!1;var a=Object.keys(l),u=Object.keys(t);if(a.length!==u.length)return!1;for(u=0;u<a.length;u++){var e=a[u];if(!$n.call(t,e)||!it(l[e],t[e]))return!1}return!0}function i0(l){for(;l&&l.firstChild;)l=l.firstChild;return l}function f0(l,t){var a=i0(l);l=0;for(var u;a;){if(a.nodeType===3){if(u=l+a.textContent.length,l<=t&&u>=t)return{node:a,offset:t-l};l=u}l:{for(;a;){if(a.nextSibling){a=a.nextSibling;break l}a=a.parentNode}a=void 0}a=i0(a)}}function c0(l,t){return l&&t?l===t?!0:l&&l.nodeType===3?!1:t&&t.nodeType===3?c0(l,t.parentNode):"contains"in l?l.contains(t):l.compareDocumentPosition?!!(l.compareDocumentPosition(t)&16):!1:!1}function s0(l){l=l!=null&&l.ownerDocument!=null&&l.ownerDocument.defaultView!=null?l.ownerDocument.defaultView:window;for(var t=Re(l.document);t instanceof l.HTMLIFrameElement;){try{var a=typeof t.contentWindow.location.href=="string"}catch{a=!1}if(a)l=t.contentWindow;else break;t=Re(l.document)}return t}function bi(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t&&(t==="input"&&(l.type==="text"||l.type==="search"||l.type==="tel"||l.type==="url"||l.type==="password")||t==="textarea"||l.contentEditable==="true")}var jm=qt&&"documentMode"in document&&11>=document.documentMode,tu=null,pi=null,Lu=null,zi=!1;function o0(l,t,a){var u=a.window===a?a.document:a.nodeType===9?a:a.ownerDocument;zi||tu==null||tu!==Re(u)||(u=tu,"selectionStart"in u&&bi(u)?u={start:u.selectionStart,end:u.selectionEnd}:(u=(u.ownerDocument&&u.ownerDocument.defaultView||window).getSelection(),u={anchorNode:u.anchorNode,anchorOffset:u.anchorOffset,focusNode:u.focusNode,focusOffset:u.focusOffset}),Lu&&Vu(Lu,u)||(Lu=u,u=xn(pi,"onSelect"),0<u.length&&(t=new Ye("onSelect","select",null,t,a),l.push({event:t,listeners:u}),t.target=tu)))}function Da(l,t){var a={};return a[l.toLowerCase()]=t.toLowerCase(),a["Webkit"+l]="webkit"+t,a["Moz"+l]="moz"+t,a}var au={animationend:Da("Animation","AnimationEnd"),animationiteration:Da("Animation","AnimationIteration"),animationstart:Da("Animation","AnimationStart"),transitionrun:Da("Transition","TransitionRun"),transitionstart:Da("Transition","TransitionStart"),transitioncancel:Da("Transition","TransitionCancel"),transitionend:Da("Transition","TransitionEnd")},Ti={},d0={};qt&&(d0=document.createElement("div").style,"AnimationEvent"in window||(delete au.animationend.animation,delete au.animationiteration.animation,delete au.animationstart.animation),"TransitionEvent"in window||delete au.transitionend.transition);function xa(l){if(Ti[l])return Ti[l];if(!au[l])return l;var t=au[l],a;for(a in t)if(t.hasOwnProperty(a)&&a in d0)return Ti[l]=t[a];return l}var m0=xa("animationend"),v0=xa("animationiteration"),y0=xa("animationstart"),qm=xa("transitionrun"),Bm=xa("transitionstart"),Ym=xa("transitioncancel"),h0=xa("transitionend"),r0=new Map,Ei="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");Ei.push("scrollEnd");function At(l,t){r0.set(l,t),_a(t,[l])}var Xe=typeof reportError=="function"?reportError:function(l){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof l=="object"&&l!==null&&typeof l.message=="string"?String(l.message):String(l),error:l});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",l);return}console.error(l)},ht=[],uu=0,Ai=0;function Ze(){for(var l=uu,t=Ai=uu=0;t<l;){var a=ht[t];ht[t++]=null;var u=ht[t];ht[t++]=null;var e=ht[t];ht[t++]=null;var n=ht[t];if(ht[t++]=null,u!==null&&e!==null){var i=u.pending;i===null?e.next=e:(e.next=i.next,i.next=e),u.pending=e}n!==0&&g0(a,e,n)}}function Ve(l,t,a,u){ht[uu++]=l,ht[uu++]=t,ht[uu++]=a,ht[uu++]=u,Ai|=u,l.lanes|=u,l=l.alternate,l!==null&&(l.lanes|=u)}function Oi(l,t,a,u){return Ve(l,t,a,u),Le(l)}function Ua(l,t){return Ve(l,null,null,t),Le(l)}function g0(l,t,a){l.lanes|=a;var u=l.alternate;u!==null&&(u.lanes|=a);for(var e=!1,n=l.return;n!==null;)n.childLanes|=a,u=n.alternate,u!==null&&(u.childLanes|=a),n.tag===22&&(l=n.stateNode,l===null||l._visibility&1||(e=!0)),l=n,n=n.return;return l.tag===3?(n=l.stateNode,e&&t!==null&&(e=31-nt(a),l=n.hiddenUpdates,u=l[e],u===null?l[e]=[t]:u.push(t),t.lane=a|536870912),n):null}function Le(l){if(50<me)throw me=0,jf=null,Error(m(185));for(var t=l.return;t!==null;)l=t,t=l.return;return l.tag===3?l.stateNode:null}var eu={};function Gm(l,t,a,u){this.tag=l,this.key=a,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=u,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function ft(l,t,a,u){return new Gm(l,t,a,u)}function _i(l){return l=l.prototype,!(!l||!l.isReactComponent)}function Bt(l,t){var a=l.alternate;return a===null?(a=ft(l.tag,t,l.key,l.mode),a.elementType=l.elementType,a.type=l.type,a.stateNode=l.stateNode,a.alternate=l,l.alternate=a):(a.pendingProps=t,a.type=l.type,a.flags=0,a.subtreeFlags=0,a.deletions=null),a.flags=l.flags&65011712,a.childLanes=l.childLanes,a.lanes=l.lanes,a.child=l.child,a.memoizedProps=l.memoizedProps,a.memoizedState=l.memoizedState,a.updateQueue=l.updateQueue,t=l.dependencies,a.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},a.sibling=l.sibling,a.index=l.index,a.ref=l.ref,a.refCleanup=l.refCleanup,a}function S0(l,t){l.flags&=65011714;var a=l.alternate;return a===null?(l.childLanes=0,l.lanes=t,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=a.childLanes,l.lanes=a.lanes,l.child=a.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=a.memoizedProps,l.memoizedState=a.memoizedState,l.updateQueue=a.updateQueue,l.type=a.type,t=a.dependencies,l.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),l}function Ke(l,t,a,u,e,n){var i=0;if(u=l,typeof l=="function")_i(l)&&(i=1);else if(typeof l=="string")i=Lv(l,a,D.current)?26:l==="html"||l==="head"||l==="body"?27:5;else l:switch(l){case Mt:return l=ft(31,a,t,e),l.elementType=Mt,l.lanes=n,l;case xl:return Ha(a.children,e,n,t);case wl:i=8,e|=24;break;case Zl:return l=ft(12,a,t,e|2),l.elementType=Zl,l.lanes=n,l;case Ll:return l=ft(13,a,t,e),l.elementType=Ll,l.lanes=n,l;case Nl:return l=ft(19,a,t,e),l.elementType=Nl,l.lanes=n,l;default:if(typeof l=="object"&&l!==null)switch(l.$$typeof){case K:i=10;break l;case Vl:i=9;break l;case gl:i=11;break l;case L:i=14;break l;case Wl:i=16,u=null;break l}i=29,a=Error(m(130,l===null?"null":typeof l,"")),u=null}return t=ft(i,a,t,e),t.elementType=l,t.type=u,t.lanes=n,t}function Ha(l,t,a,u){return l=ft(7,l,u,t),l.lanes=a,l}function Mi(l,t,a){return l=ft(6,l,null,t),l.lanes=a,l}function b0(l){var t=ft(18,null,null,0);return t.stateNode=l,t}function Di(l,t,a){return t=ft(4,l.children!==null?l.children:[],l.key,t),t.lanes=a,t.stateNode={containerInfo:l.containerInfo,pendingChildren:null,implementation:l.implementation},t}var p0=new WeakMap;function rt(l,t){if(typeof l=="object"&&l!==null){var a=p0.get(l);return a!==void 0?a:(t={value:l,source:t,stack:bc(t)},p0.set(l,t),t)}return{value:l,source:t,stack:bc(t)}}var nu=[],iu=0,Je=null,Ku=0,gt=[],St=0,ta=null,xt=1,Ut="";function Yt(l,t){nu[iu++]=Ku,nu[iu++]=Je,Je=l,Ku=t}function z0(l,t,a){gt[St++]=xt,gt[St++]=Ut,gt[St++]=ta,ta=l;var u=xt;l=Ut;var e=32-nt(u)-1;u&=~(1<<e),a+=1;var n=32-nt(t)+e;if(30<n){var i=e-e%5;n=(u&(1<<i)-1).toString(32),u>>=i,e-=i,xt=1<<32-nt(t)+e|a<<e|u,Ut=n+l}else xt=1<<n|a<<e|u,Ut=l}function xi(l){l.return!==null&&(Yt(l,1),z0(l,1,0))}function Ui(l){for(;l===Je;)Je=nu[--iu],nu[iu]=null,Ku=nu[--iu],nu[iu]=null;for(;l===ta;)ta=gt[--St],gt[St]=null,Ut=gt[--St],gt[St]=null,xt=gt[--St],gt[St]=null}function T0(l,t){gt[St++]=xt,gt[St++]=Ut,gt[St++]=ta,xt=t.id,Ut=t.overflow,ta=l}var Cl=null,vl=null,F=!1,aa=null,bt=!1,Hi=Error(m(519));function ua(l){var t=Error(m(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw Ju(rt(t,l)),Hi}function E0(l){var t=l.stateNode,a=l.type,u=l.memoizedProps;switch(t[Rl]=l,t[kl]=u,a){case"dialog":W("cancel",t),W("close",t);break;case"iframe":case"object":case"embed":W("load",t);break;case"video":case"audio":for(a=0;a<ye.length;a++)W(ye[a],t);break;case"source":W("error",t);break;case"img":case"image":case"link":W("error",t),W("load",t);break;case"details":W("toggle",t);break;case"input":W("invalid",t),qc(t,u.value,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name,!0);break;case"select":W("invalid",t);break;case"textarea":W("invalid",t),Yc(t,u.value,u.defaultValue,u.children)}a=u.children,typeof a!="string"&&typeof a!="number"&&typeof a!="bigint"||t.textContent===""+a||u.suppressHydrationWarning===!0||Xo(t.textContent,a)?(u.popover!=null&&(W("beforetoggle",t),W("toggle",t)),u.onScroll!=null&&W("scroll",t),u.onScrollEnd!=null&&W("scrollend",t),u.onClick!=null&&(t.onclick=jt),t=!0):t=!1,t||ua(l,!0)}function A0(l){for(Cl=l.return;Cl;)switch(Cl.tag){case 5:case 31:case 13:bt=!1;return;case 27:case 3:bt=!0;return;default:Cl=Cl.return}}function fu(l){if(l!==Cl)return!1;if(!F)return A0(l),F=!0,!1;var t=l.tag,a;if((a=t!==3&&t!==27)&&((a=t===5)&&(a=l.type,a=!(a!=="form"&&a!=="button")||kf(l.type,l.memoizedProps)),a=!a),a&&vl&&ua(l),A0(l),t===13){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(m(317));vl=ko(l)}else if(t===31){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(m(317));vl=ko(l)}else t===27?(t=vl,ga(l.type)?(l=tc,tc=null,vl=l):vl=t):vl=Cl?zt(l.stateNode.nextSibling):null;return!0}function Na(){vl=Cl=null,F=!1}function Ni(){var l=aa;return l!==null&&(tt===null?tt=l:tt.push.apply(tt,l),aa=null),l}function Ju(l){aa===null?aa=[l]:aa.push(l)}var Ri=o(null),Ra=null,Gt=null;function ea(l,t,a){O(Ri,t._currentValue),t._currentValue=a}function Qt(l){l._currentValue=Ri.current,T(Ri)}function Ci(l,t,a){for(;l!==null;){var u=l.alternate;if((l.childLanes&t)!==t?(l.childLanes|=t,u!==null&&(u.childLanes|=t)):u!==null&&(u.childLanes&t)!==t&&(u.childLanes|=t),l===a)break;l=l.return}}function ji(l,t,a,u){var e=l.child;for(e!==null&&(e.return=l);e!==null;){var n=e.dependencies;if(n!==null){var i=e.child;n=n.firstContext;l:for(;n!==null;){var f=n;n=e;for(var c=0;c<t.length;c++)if(f.context===t[c]){n.lanes|=a,f=n.alternate,f!==null&&(f.lanes|=a),Ci(n.return,a,l),u||(i=null);break l}n=f.next}}else if(e.tag===18){if(i=e.return,i===null)throw Error(m(341));i.lanes|=a,n=i.alternate,n!==null&&(n.lanes|=a),Ci(i,a,l),i=null}else i=e.child;if(i!==null)i.return=e;else for(i=e;i!==null;){if(i===l){i=null;break}if(e=i.sibling,e!==null){e.return=i.return,i=e;break}i=i.return}e=i}}function cu(l,t,a,u){l=null;for(var e=t,n=!1;e!==null;){if(!n){if((e.flags&524288)!==0)n=!0;else if((e.flags&262144)!==0)break}if(e.tag===10){var i=e.alternate;if(i===null)throw Error(m(387));if(i=i.memoizedProps,i!==null){var f=e.type;it(e.pendingProps.value,i.value)||(l!==null?l.push(f):l=[f])}}else if(e===el.current){if(i=e.alternate,i===null)throw Error(m(387));i.memoizedState.memoizedState!==e.memoizedState.memoizedState&&(l!==null?l.push(be):l=[be])}e=e.return}l!==null&&ji(t,l,a,u),t.flags|=262144}function we(l){for(l=l.firstContext;l!==null;){if(!it(l.context._currentValue,l.memoizedValue))return!0;l=l.next}return!1}function Ca(l){Ra=l,Gt=null,l=l.dependencies,l!==null&&(l.firstContext=null)}function jl(l){return O0(Ra,l)}function We(l,t){return Ra===null&&Ca(l),O0(l,t)}function O0(l,t){var a=t._currentValue;if(t={context:t,memoizedValue:a,next:null},Gt===null){if(l===null)throw Error(m(308));Gt=t,l.dependencies={lanes:0,firstContext:t},l.flags|=524288}else Gt=Gt.next=t;return a}var Qm=typeof AbortController<"u"?AbortController:function(){var l=[],t=this.signal={aborted:!1,addEventListener:function(a,u){l.push(u)}};this.abort=function(){t.aborted=!0,l.forEach(function(a){return a()})}},Xm=p.unstable_scheduleCallback,Zm=p.unstable_NormalPriority,El={$$typeof:K,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function qi(){return{controller:new Qm,data:new Map,refCount:0}}function wu(l){l.refCount--,l.refCount===0&&Xm(Zm,function(){l.controller.abort()})}var Wu=null,Bi=0,su=0,ou=null;function Vm(l,t){if(Wu===null){var a=Wu=[];Bi=0,su=Xf(),ou={status:"pending",value:void 0,then:function(u){a.push(u)}}}return Bi++,t.then(_0,_0),t}function _0(){if(--Bi===0&&Wu!==null){ou!==null&&(ou.status="fulfilled");var l=Wu;Wu=null,su=0,ou=null;for(var t=0;t<l.length;t++)(0,l[t])()}}function Lm(l,t){var a=[],u={status:"pending",value:null,reason:null,then:function(e){a.push(e)}};return l.then(function(){u.status="fulfilled",u.value=t;for(var e=0;e<a.length;e++)(0,a[e])(t)},function(e){for(u.status="rejected",u.reason=e,e=0;e<a.length;e++)(0,a[e])(void 0)}),u}var M0=S.S;S.S=function(l,t){oo=ut(),typeof t=="object"&&t!==null&&typeof t.then=="function"&&Vm(l,t),M0!==null&&M0(l,t)};var ja=o(null);function Yi(){var l=ja.current;return l!==null?l:ml.pooledCache}function $e(l,t){t===null?O(ja,ja.current):O(ja,t.pool)}function D0(){var l=Yi();return l===null?null:{parent:El._currentValue,pool:l}}var du=Error(m(460)),Gi=Error(m(474)),ke=Error(m(542)),Fe={then:function(){}};function x0(l){return l=l.status,l==="fulfilled"||l==="rejected"}function U0(l,t,a){switch(a=l[a],a===void 0?l.push(t):a!==t&&(t.then(jt,jt),t=a),t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,N0(l),l;default:if(typeof t.status=="string")t.then(jt,jt);else{if(l=ml,l!==null&&100<l.shellSuspendCounter)throw Error(m(482));l=t,l.status="pending",l.then(function(u){if(t.status==="pending"){var e=t;e.status="fulfilled",e.value=u}},function(u){if(t.status==="pending"){var e=t;e.status="rejected",e.reason=u}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,N0(l),l}throw Ba=t,du}}function qa(l){try{var t=l._init;return t(l._payload)}catch(a){throw a!==null&&typeof a=="object"&&typeof a.then=="function"?(Ba=a,du):a}}var Ba=null;function H0(){if(Ba===null)throw Error(m(459));var l=Ba;return Ba=null,l}function N0(l){if(l===du||l===ke)throw Error(m(483))}var mu=null,$u=0;function Ie(l){var t=$u;return $u+=1,mu===null&&(mu=[]),U0(mu,l,t)}function ku(l,t){t=t.props.ref,l.ref=t!==void 0?t:null}function Pe(l,t){throw t.$$typeof===I?Error(m(525)):(l=Object.prototype.toString.call(t),Error(m(31,l==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":l)))}function R0(l){function t(d,s){if(l){var v=d.deletions;v===null?(d.deletions=[s],d.flags|=16):v.push(s)}}function a(d,s){if(!l)return null;for(;s!==null;)t(d,s),s=s.sibling;return null}function u(d){for(var s=new Map;d!==null;)d.key!==null?s.set(d.key,d):s.set(d.index,d),d=d.sibling;return s}function e(d,s){return d=Bt(d,s),d.index=0,d.sibling=null,d}function n(d,s,v){return d.index=v,l?(v=d.alternate,v!==null?(v=v.index,v<s?(d.flags|=67108866,s):v):(d.flags|=67108866,s)):(d.flags|=1048576,s)}function i(d){return l&&d.alternate===null&&(d.flags|=67108866),d}function f(d,s,v,b){return s===null||s.tag!==6?(s=Mi(v,d.mode,b),s.return=d,s):(s=e(s,v),s.return=d,s)}function c(d,s,v,b){var R=v.type;return R===xl?g(d,s,v.props.children,b,v.key):s!==null&&(s.elementType===R||typeof R=="object"&&R!==null&&R.$$typeof===Wl&&qa(R)===s.type)?(s=e(s,v.props),ku(s,v),s.return=d,s):(s=Ke(v.type,v.key,v.props,null,d.mode,b),ku(s,v),s.return=d,s)}function y(d,s,v,b){return s===null||s.tag!==4||s.stateNode.containerInfo!==v.containerInfo||s.stateNode.implementation!==v.implementation?(s=Di(v,d.mode,b),s.return=d,s):(s=e(s,v.children||[]),s.return=d,s)}function g(d,s,v,b,R){return s===null||s.tag!==7?(s=Ha(v,d.mode,b,R),s.return=d,s):(s=e(s,v),s.return=d,s)}function z(d,s,v){if(typeof s=="string"&&s!==""||typeof s=="number"||typeof s=="bigint")return s=Mi(""+s,d.mode,v),s.return=d,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case Xl:return v=Ke(s.type,s.key,s.props,null,d.mode,v),ku(v,s),v.return=d,v;case Gl:return s=Di(s,d.mode,v),s.return=d,s;case Wl:return s=qa(s),z(d,s,v)}if(Et(s)||$l(s))return s=Ha(s,d.mode,v,null),s.return=d,s;if(typeof s.then=="function")return z(d,Ie(s),v);if(s.$$typeof===K)return z(d,We(d,s),v);Pe(d,s)}return null}function h(d,s,v,b){var R=s!==null?s.key:null;if(typeof v=="string"&&v!==""||typeof v=="number"||typeof v=="bigint")return R!==null?null:f(d,s,""+v,b);if(typeof v=="object"&&v!==null){switch(v.$$typeof){case Xl:return v.key===R?c(d,s,v,b):null;case Gl:return v.key===R?y(d,s,v,b):null;case Wl:return v=qa(v),h(d,s,v,b)}if(Et(v)||$l(v))return R!==null?null:g(d,s,v,b,null);if(typeof v.then=="function")return h(d,s,Ie(v),b);if(v.$$typeof===K)return h(d,s,We(d,v),b);Pe(d,v)}return null}function r(d,s,v,b,R){if(typeof b=="string"&&b!==""||typeof b=="number"||typeof b=="bigint")return d=d.get(v)||null,f(s,d,""+b,R);if(typeof b=="object"&&b!==null){switch(b.$$typeof){case Xl:return d=d.get(b.key===null?v:b.key)||null,c(s,d,b,R);case Gl:return d=d.get(b.key===null?v:b.key)||null,y(s,d,b,R);case Wl:return b=qa(b),r(d,s,v,b,R)}if(Et(b)||$l(b))return d=d.get(v)||null,g(s,d,b,R,null);if(typeof b.then=="function")return r(d,s,v,Ie(b),R);if(b.$$typeof===K)return r(d,s,v,We(s,b),R);Pe(s,b)}return null}function _(d,s,v,b){for(var R=null,ll=null,x=s,Z=s=0,k=null;x!==null&&Z<v.length;Z++){x.index>Z?(k=x,x=null):k=x.sibling;var tl=h(d,x,v[Z],b);if(tl===null){x===null&&(x=k);break}l&&x&&tl.alternate===null&&t(d,x),s=n(tl,s,Z),ll===null?R=tl:ll.sibling=tl,ll=tl,x=k}if(Z===v.length)return a(d,x),F&&Yt(d,Z),R;if(x===null){for(;Z<v.length;Z++)x=z(d,v[Z],b),x!==null&&(s=n(x,s,Z),ll===null?R=x:ll.sibling=x,ll=x);return F&&Yt(d,Z),R}for(x=u(x);Z<v.length;Z++)k=r(x,d,Z,v[Z],b),k!==null&&(l&&k.alternate!==null&&x.delete(k.key===null?Z:k.key),s=n(k,s,Z),ll===null?R=k:ll.sibling=k,ll=k);return l&&x.forEach(function(Ta){return t(d,Ta)}),F&&Yt(d,Z),R}function j(d,s,v,b){if(v==null)throw Error(m(151));for(var R=null,ll=null,x=s,Z=s=0,k=null,tl=v.next();x!==null&&!tl.done;Z++,tl=v.next()){x.index>Z?(k=x,x=null):k=x.sibling;var Ta=h(d,x,tl.value,b);if(Ta===null){x===null&&(x=k);break}l&&x&&Ta.alternate===null&&t(d,x),s=n(Ta,s,Z),ll===null?R=Ta:ll.sibling=Ta,ll=Ta,x=k}if(tl.done)return a(d,x),F&&Yt(d,Z),R;if(x===null){for(;!tl.done;Z++,tl=v.next())tl=z(d,tl.value,b),tl!==null&&(s=n(tl,s,Z),ll===null?R=tl:ll.sibling=tl,ll=tl);return F&&Yt(d,Z),R}for(x=u(x);!tl.done;Z++,tl=v.next())tl=r(x,d,Z,tl.value,b),tl!==null&&(l&&tl.alternate!==null&&x.delete(tl.key===null?Z:tl.key),s=n(tl,s,Z),ll===null?R=tl:ll.sibling=tl,ll=tl);return l&&x.forEach(function(ty){return t(d,ty)}),F&&Yt(d,Z),R}function ol(d,s,v,b){if(typeof v=="object"&&v!==null&&v.type===xl&&v.key===null&&(v=v.props.children),typeof v=="object"&&v!==null){switch(v.$$typeof){case Xl:l:{for(var R=v.key;s!==null;){if(s.key===R){if(R=v.type,R===xl){if(s.tag===7){a(d,s.sibling),b=e(s,v.props.children),b.return=d,d=b;break l}}else if(s.elementType===R||typeof R=="object"&&R!==null&&R.$$typeof===Wl&&qa(R)===s.type){a(d,s.sibling),b=e(s,v.props),ku(b,v),b.return=d,d=b;break l}a(d,s);break}else t(d,s);s=s.sibling}v.type===xl?(b=Ha(v.props.children,d.mode,b,v.key),b.return=d,d=b):(b=Ke(v.type,v.key,v.props,null,d.mode,b),ku(b,v),b.return=d,d=b)}return i(d);case Gl:l:{for(R=v.key;s!==null;){if(s.key===R)if(s.tag===4&&s.stateNode.containerInfo===v.containerInfo&&s.stateNode.implementation===v.implementation){a(d,s.sibling),b=e(s,v.children||[]),b.return=d,d=b;break l}else{a(d,s);break}else t(d,s);s=s.sibling}b=Di(v,d.mode,b),b.return=d,d=b}return i(d);case Wl:return v=qa(v),ol(d,s,v,b)}if(Et(v))return _(d,s,v,b);if($l(v)){if(R=$l(v),typeof R!="function")throw Error(m(150));return v=R.call(v),j(d,s,v,b)}if(typeof v.then=="function")return ol(d,s,Ie(v),b);if(v.$$typeof===K)return ol(d,s,We(d,v),b);Pe(d,v)}return typeof v=="string"&&v!==""||typeof v=="number"||typeof v=="bigint"?(v=""+v,s!==null&&s.tag===6?(a(d,s.sibling),b=e(s,v),b.return=d,d=b):(a(d,s),b=Mi(v,d.mode,b),b.return=d,d=b),i(d)):a(d,s)}return function(d,s,v,b){try{$u=0;var R=ol(d,s,v,b);return mu=null,R}catch(x){if(x===du||x===ke)throw x;var ll=ft(29,x,null,d.mode);return ll.lanes=b,ll.return=d,ll}}}var Ya=R0(!0),C0=R0(!1),na=!1;function Qi(l){l.updateQueue={baseState:l.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Xi(l,t){l=l.updateQueue,t.updateQueue===l&&(t.updateQueue={baseState:l.baseState,firstBaseUpdate:l.firstBaseUpdate,lastBaseUpdate:l.lastBaseUpdate,shared:l.shared,callbacks:null})}function ia(l){return{lane:l,tag:0,payload:null,callback:null,next:null}}function fa(l,t,a){var u=l.updateQueue;if(u===null)return null;if(u=u.shared,(ul&2)!==0){var e=u.pending;return e===null?t.next=t:(t.next=e.next,e.next=t),u.pending=t,t=Le(l),g0(l,null,a),t}return Ve(l,u,t,a),Le(l)}function Fu(l,t,a){if(t=t.updateQueue,t!==null&&(t=t.shared,(a&4194048)!==0)){var u=t.lanes;u&=l.pendingLanes,a|=u,t.lanes=a,Oc(l,a)}}function Zi(l,t){var a=l.updateQueue,u=l.alternate;if(u!==null&&(u=u.updateQueue,a===u)){var e=null,n=null;if(a=a.firstBaseUpdate,a!==null){do{var i={lane:a.lane,tag:a.tag,payload:a.payload,callback:null,next:null};n===null?e=n=i:n=n.next=i,a=a.next}while(a!==null);n===null?e=n=t:n=n.next=t}else e=n=t;a={baseState:u.baseState,firstBaseUpdate:e,lastBaseUpdate:n,shared:u.shared,callbacks:u.callbacks},l.updateQueue=a;return}l=a.lastBaseUpdate,l===null?a.firstBaseUpdate=t:l.next=t,a.lastBaseUpdate=t}var Vi=!1;function Iu(){if(Vi){var l=ou;if(l!==null)throw l}}function Pu(l,t,a,u){Vi=!1;var e=l.updateQueue;na=!1;var n=e.firstBaseUpdate,i=e.lastBaseUpdate,f=e.shared.pending;if(f!==null){e.shared.pending=null;var c=f,y=c.next;c.next=null,i===null?n=y:i.next=y,i=c;var g=l.alternate;g!==null&&(g=g.updateQueue,f=g.lastBaseUpdate,f!==i&&(f===null?g.firstBaseUpdate=y:f.next=y,g.lastBaseUpdate=c))}if(n!==null){var z=e.baseState;i=0,g=y=c=null,f=n;do{var h=f.lane&-536870913,r=h!==f.lane;if(r?($&h)===h:(u&h)===h){h!==0&&h===su&&(Vi=!0),g!==null&&(g=g.next={lane:0,tag:f.tag,payload:f.payload,callback:null,next:null});l:{var _=l,j=f;h=t;var ol=a;switch(j.tag){case 1:if(_=j.payload,typeof _=="function"){z=_.call(ol,z,h);break l}z=_;break l;case 3:_.flags=_.flags&-65537|128;case 0:if(_=j.payload,h=typeof _=="function"?_.call(ol,z,h):_,h==null)break l;z=U({},z,h);break l;case 2:na=!0}}h=f.callback,h!==null&&(l.flags|=64,r&&(l.flags|=8192),r=e.callbacks,r===null?e.callbacks=[h]:r.push(h))}else r={lane:h,tag:f.tag,payload:f.payload,callback:f.callback,next:null},g===null?(y=g=r,c=z):g=g.next=r,i|=h;if(f=f.next,f===null){if(f=e.shared.pending,f===null)break;r=f,f=r.next,r.next=null,e.lastBaseUpdate=r,e.shared.pending=null}}while(!0);g===null&&(c=z),e.baseState=c,e.firstBaseUpdate=y,e.lastBaseUpdate=g,n===null&&(e.shared.lanes=0),ma|=i,l.lanes=i,l.memoizedState=z}}function j0(l,t){if(typeof l!="function")throw Error(m(191,l));l.call(t)}function q0(l,t){var a=l.callbacks;if(a!==null)for(l.callbacks=null,l=0;l<a.length;l++)j0(a[l],t)}var vu=o(null),ln=o(0);function B0(l,t){l=$t,O(ln,l),O(vu,t),$t=l|t.baseLanes}function Li(){O(ln,$t),O(vu,vu.current)}function Ki(){$t=ln.current,T(vu),T(ln)}var ct=o(null),pt=null;function ca(l){var t=l.alternate;O(zl,zl.current&1),O(ct,l),pt===null&&(t===null||vu.current!==null||t.memoizedState!==null)&&(pt=l)}function Ji(l){O(zl,zl.current),O(ct,l),pt===null&&(pt=l)}function Y0(l){l.tag===22?(O(zl,zl.current),O(ct,l),pt===null&&(pt=l)):sa()}function sa(){O(zl,zl.current),O(ct,ct.current)}function st(l){T(ct),pt===l&&(pt=null),T(zl)}var zl=o(0);function tn(l){for(var t=l;t!==null;){if(t.tag===13){var a=t.memoizedState;if(a!==null&&(a=a.dehydrated,a===null||Pf(a)||lc(a)))return t}else if(t.tag===19&&(t.memoizedProps.revealOrder==="forwards"||t.memoizedProps.revealOrder==="backwards"||t.memoizedProps.revealOrder==="unstable_legacy-backwards"||t.memoizedProps.revealOrder==="together")){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Xt=0,X=null,cl=null,Al=null,an=!1,yu=!1,Ga=!1,un=0,le=0,hu=null,Km=0;function Sl(){throw Error(m(321))}function wi(l,t){if(t===null)return!1;for(var a=0;a<t.length&&a<l.length;a++)if(!it(l[a],t[a]))return!1;return!0}function Wi(l,t,a,u,e,n){return Xt=n,X=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,S.H=l===null||l.memoizedState===null?zs:of,Ga=!1,n=a(u,e),Ga=!1,yu&&(n=Q0(t,a,u,e)),G0(l),n}function G0(l){S.H=ue;var t=cl!==null&&cl.next!==null;if(Xt=0,Al=cl=X=null,an=!1,le=0,hu=null,t)throw Error(m(300));l===null||Ol||(l=l.dependencies,l!==null&&we(l)&&(Ol=!0))}function Q0(l,t,a,u){X=l;var e=0;do{if(yu&&(hu=null),le=0,yu=!1,25<=e)throw Error(m(301));if(e+=1,Al=cl=null,l.updateQueue!=null){var n=l.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}S.H=Ts,n=t(a,u)}while(yu);return n}function Jm(){var l=S.H,t=l.useState()[0];return t=typeof t.then=="function"?te(t):t,l=l.useState()[0],(cl!==null?cl.memoizedState:null)!==l&&(X.flags|=1024),t}function $i(){var l=un!==0;return un=0,l}function ki(l,t,a){t.updateQueue=l.updateQueue,t.flags&=-2053,l.lanes&=~a}function Fi(l){if(an){for(l=l.memoizedState;l!==null;){var t=l.queue;t!==null&&(t.pending=null),l=l.next}an=!1}Xt=0,Al=cl=X=null,yu=!1,le=un=0,hu=null}function Jl(){var l={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Al===null?X.memoizedState=Al=l:Al=Al.next=l,Al}function Tl(){if(cl===null){var l=X.alternate;l=l!==null?l.memoizedState:null}else l=cl.next;var t=Al===null?X.memoizedState:Al.next;if(t!==null)Al=t,cl=l;else{if(l===null)throw X.alternate===null?Error(m(467)):Error(m(310));cl=l,l={memoizedState:cl.memoizedState,baseState:cl.baseState,baseQueue:cl.baseQueue,queue:cl.queue,next:null},Al===null?X.memoizedState=Al=l:Al=Al.next=l}return Al}function en(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function te(l){var t=le;return le+=1,hu===null&&(hu=[]),l=U0(hu,l,t),t=X,(Al===null?t.memoizedState:Al.next)===null&&(t=t.alternate,S.H=t===null||t.memoizedState===null?zs:of),l}function nn(l){if(l!==null&&typeof l=="object"){if(typeof l.then=="function")return te(l);if(l.$$typeof===K)return jl(l)}throw Error(m(438,String(l)))}function Ii(l){var t=null,a=X.updateQueue;if(a!==null&&(t=a.memoCache),t==null){var u=X.alternate;u!==null&&(u=u.updateQueue,u!==null&&(u=u.memoCache,u!=null&&(t={data:u.data.map(function(e){return e.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),a===null&&(a=en(),X.updateQueue=a),a.memoCache=t,a=t.data[t.index],a===void 0)for(a=t.data[t.index]=Array(l),u=0;u<l;u++)a[u]=La;return t.index++,a}function Zt(l,t){return typeof t=="function"?t(l):t}function fn(l){var t=Tl();return Pi(t,cl,l)}function Pi(l,t,a){var u=l.queue;if(u===null)throw Error(m(311));u.lastRenderedReducer=a;var e=l.baseQueue,n=u.pending;if(n!==null){if(e!==null){var i=e.next;e.next=n.next,n.next=i}t.baseQueue=e=n,u.pending=null}if(n=l.baseState,e===null)l.memoizedState=n;else{t=e.next;var f=i=null,c=null,y=t,g=!1;do{var z=y.lane&-536870913;if(z!==y.lane?($&z)===z:(Xt&z)===z){var h=y.revertLane;if(h===0)c!==null&&(c=c.next={lane:0,revertLane:0,gesture:null,action:y.action,hasEagerState:y.hasEagerState,eagerState:y.eagerState,next:null}),z===su&&(g=!0);else if((Xt&h)===h){y=y.next,h===su&&(g=!0);continue}else z={lane:0,revertLane:y.revertLane,gesture:null,action:y.action,hasEagerState:y.hasEagerState,eagerState:y.eagerState,next:null},c===null?(f=c=z,i=n):c=c.next=z,X.lanes|=h,ma|=h;z=y.action,Ga&&a(n,z),n=y.hasEagerState?y.eagerState:a(n,z)}else h={lane:z,revertLane:y.revertLane,gesture:y.gesture,action:y.action,hasEagerState:y.hasEagerState,eagerState:y.eagerState,next:null},c===null?(f=c=h,i=n):c=c.next=h,X.lanes|=z,ma|=z;y=y.next}while(y!==null&&y!==t);if(c===null?i=n:c.next=f,!it(n,l.memoizedState)&&(Ol=!0,g&&(a=ou,a!==null)))throw a;l.memoizedState=n,l.baseState=i,l.baseQueue=c,u.lastRenderedState=n}return e===null&&(u.lanes=0),[l.memoizedState,u.dispatch]}function lf(l){var t=Tl(),a=t.queue;if(a===null)throw Error(m(311));a.lastRenderedReducer=l;var u=a.dispatch,e=a.pending,n=t.memoizedState;if(e!==null){a.pending=null;var i=e=e.next;do n=l(n,i.action),i=i.next;while(i!==e);it(n,t.memoizedState)||(Ol=!0),t.memoizedState=n,t.baseQueue===null&&(t.baseState=n),a.lastRenderedState=n}return[n,u]}function X0(l,t,a){var u=X,e=Tl(),n=F;if(n){if(a===void 0)throw Error(m(407));a=a()}else a=t();var i=!it((cl||e).memoizedState,a);if(i&&(e.memoizedState=a,Ol=!0),e=e.queue,uf(L0.bind(null,u,e,l),[l]),e.getSnapshot!==t||i||Al!==null&&Al.memoizedState.tag&1){if(u.flags|=2048,ru(9,{destroy:void 0},V0.bind(null,u,e,a,t),null),ml===null)throw Error(m(349));n||(Xt&127)!==0||Z0(u,t,a)}return a}function Z0(l,t,a){l.flags|=16384,l={getSnapshot:t,value:a},t=X.updateQueue,t===null?(t=en(),X.updateQueue=t,t.stores=[l]):(a=t.stores,a===null?t.stores=[l]:a.push(l))}function V0(l,t,a,u){t.value=a,t.getSnapshot=u,K0(t)&&J0(l)}function L0(l,t,a){return a(function(){K0(t)&&J0(l)})}function K0(l){var t=l.getSnapshot;l=l.value;try{var a=t();return!it(l,a)}catch{return!0}}function J0(l){var t=Ua(l,2);t!==null&&at(t,l,2)}function tf(l){var t=Jl();if(typeof l=="function"){var a=l;if(l=a(),Ga){It(!0);try{a()}finally{It(!1)}}}return t.memoizedState=t.baseState=l,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Zt,lastRenderedState:l},t}function w0(l,t,a,u){return l.baseState=a,Pi(l,cl,typeof u=="function"?u:Zt)}function wm(l,t,a,u,e){if(on(l))throw Error(m(485));if(l=t.action,l!==null){var n={payload:e,action:l,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(i){n.listeners.push(i)}};S.T!==null?a(!0):n.isTransition=!1,u(n),a=t.pending,a===null?(n.next=t.pending=n,W0(t,n)):(n.next=a.next,t.pending=a.next=n)}}function W0(l,t){var a=t.action,u=t.payload,e=l.state;if(t.isTransition){var n=S.T,i={};S.T=i;try{var f=a(e,u),c=S.S;c!==null&&c(i,f),$0(l,t,f)}catch(y){af(l,t,y)}finally{n!==null&&i.types!==null&&(n.types=i.types),S.T=n}}else try{n=a(e,u),$0(l,t,n)}catch(y){af(l,t,y)}}function $0(l,t,a){a!==null&&typeof a=="object"&&typeof a.then=="function"?a.then(function(u){k0(l,t,u)},function(u){return af(l,t,u)}):k0(l,t,a)}function k0(l,t,a){t.status="fulfilled",t.value=a,F0(t),l.state=a,t=l.pending,t!==null&&(a=t.next,a===t?l.pending=null:(a=a.next,t.next=a,W0(l,a)))}function af(l,t,a){var u=l.pending;if(l.pending=null,u!==null){u=u.next;do t.status="rejected",t.reason=a,F0(t),t=t.next;while(t!==u)}l.action=null}function F0(l){l=l.listeners;for(var t=0;t<l.length;t++)(0,l[t])()}function I0(l,t){return t}function P0(l,t){if(F){var a=ml.formState;if(a!==null){l:{var u=X;if(F){if(vl){t:{for(var e=vl,n=bt;e.nodeType!==8;){if(!n){e=null;break t}if(e=zt(e.nextSibling),e===null){e=null;break t}}n=e.data,e=n==="F!"||n==="F"?e:null}if(e){vl=zt(e.nextSibling),u=e.data==="F!";break l}}ua(u)}u=!1}u&&(t=a[0])}}return a=Jl(),a.memoizedState=a.baseState=t,u={pending:null,lanes:0,dispatch:null,lastRenderedReducer:I0,lastRenderedState:t},a.queue=u,a=Ss.bind(null,X,u),u.dispatch=a,u=tf(!1),n=sf.bind(null,X,!1,u.queue),u=Jl(),e={state:t,dispatch:null,action:l,pending:null},u.queue=e,a=wm.bind(null,X,e,n,a),e.dispatch=a,u.memoizedState=l,[t,a,!1]}function ls(l){var t=Tl();return ts(t,cl,l)}function ts(l,t,a){if(t=Pi(l,t,I0)[0],l=fn(Zt)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var u=te(t)}catch(i){throw i===du?ke:i}else u=t;t=Tl();var e=t.queue,n=e.dispatch;return a!==t.memoizedState&&(X.flags|=2048,ru(9,{destroy:void 0},Wm.bind(null,e,a),null)),[u,n,l]}function Wm(l,t){l.action=t}function as(l){var t=Tl(),a=cl;if(a!==null)return ts(t,a,l);Tl(),t=t.memoizedState,a=Tl();var u=a.queue.dispatch;return a.memoizedState=l,[t,u,!1]}function ru(l,t,a,u){return l={tag:l,create:a,deps:u,inst:t,next:null},t=X.updateQueue,t===null&&(t=en(),X.updateQueue=t),a=t.lastEffect,a===null?t.lastEffect=l.next=l:(u=a.next,a.next=l,l.next=u,t.lastEffect=l),l}function us(){return Tl().memoizedState}function cn(l,t,a,u){var e=Jl();X.flags|=l,e.memoizedState=ru(1|t,{destroy:void 0},a,u===void 0?null:u)}function sn(l,t,a,u){var e=Tl();u=u===void 0?null:u;var n=e.memoizedState.inst;cl!==null&&u!==null&&wi(u,cl.memoizedState.deps)?e.memoizedState=ru(t,n,a,u):(X.flags|=l,e.memoizedState=ru(1|t,n,a,u))}function es(l,t){cn(8390656,8,l,t)}function uf(l,t){sn(2048,8,l,t)}function $m(l){X.flags|=4;var t=X.updateQueue;if(t===null)t=en(),X.updateQueue=t,t.events=[l];else{var a=t.events;a===null?t.events=[l]:a.push(l)}}function ns(l){var t=Tl().memoizedState;return $m({ref:t,nextImpl:l}),function(){if((ul&2)!==0)throw Error(m(440));return t.impl.apply(void 0,arguments)}}function is(l,t){return sn(4,2,l,t)}function fs(l,t){return sn(4,4,l,t)}function cs(l,t){if(typeof t=="function"){l=l();var a=t(l);return function(){typeof a=="function"?a():t(null)}}if(t!=null)return l=l(),t.current=l,function(){t.current=null}}function ss(l,t,a){a=a!=null?a.concat([l]):null,sn(4,4,cs.bind(null,t,l),a)}function ef(){}function os(l,t){var a=Tl();t=t===void 0?null:t;var u=a.memoizedState;return t!==null&&wi(t,u[1])?u[0]:(a.memoizedState=[l,t],l)}function ds(l,t){var a=Tl();t=t===void 0?null:t;var u=a.memoizedState;if(t!==null&&wi(t,u[1]))return u[0];if(u=l(),Ga){It(!0);try{l()}finally{It(!1)}}return a.memoizedState=[u,t],u}function nf(l,t,a){return a===void 0||(Xt&1073741824)!==0&&($&261930)===0?l.memoizedState=t:(l.memoizedState=a,l=vo(),X.lanes|=l,ma|=l,a)}function ms(l,t,a,u){return it(a,t)?a:vu.current!==null?(l=nf(l,a,u),it(l,t)||(Ol=!0),l):(Xt&42)===0||(Xt&1073741824)!==0&&($&261930)===0?(Ol=!0,l.memoizedState=a):(l=vo(),X.lanes|=l,ma|=l,t)}function vs(l,t,a,u,e){var n=A.p;A.p=n!==0&&8>n?n:8;var i=S.T,f={};S.T=f,sf(l,!1,t,a);try{var c=e(),y=S.S;if(y!==null&&y(f,c),c!==null&&typeof c=="object"&&typeof c.then=="function"){var g=Lm(c,u);ae(l,t,g,mt(l))}else ae(l,t,u,mt(l))}catch(z){ae(l,t,{then:function(){},status:"rejected",reason:z},mt())}finally{A.p=n,i!==null&&f.types!==null&&(i.types=f.types),S.T=i}}function km(){}function ff(l,t,a,u){if(l.tag!==5)throw Error(m(476));var e=ys(l).queue;vs(l,e,t,B,a===null?km:function(){return hs(l),a(u)})}function ys(l){var t=l.memoizedState;if(t!==null)return t;t={memoizedState:B,baseState:B,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Zt,lastRenderedState:B},next:null};var a={};return t.next={memoizedState:a,baseState:a,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Zt,lastRenderedState:a},next:null},l.memoizedState=t,l=l.alternate,l!==null&&(l.memoizedState=t),t}function hs(l){var t=ys(l);t.next===null&&(t=l.alternate.memoizedState),ae(l,t.next.queue,{},mt())}function cf(){return jl(be)}function rs(){return Tl().memoizedState}function gs(){return Tl().memoizedState}function Fm(l){for(var t=l.return;t!==null;){switch(t.tag){case 24:case 3:var a=mt();l=ia(a);var u=fa(t,l,a);u!==null&&(at(u,t,a),Fu(u,t,a)),t={cache:qi()},l.payload=t;return}t=t.return}}function Im(l,t,a){var u=mt();a={lane:u,revertLane:0,gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},on(l)?bs(t,a):(a=Oi(l,t,a,u),a!==null&&(at(a,l,u),ps(a,t,u)))}function Ss(l,t,a){var u=mt();ae(l,t,a,u)}function ae(l,t,a,u){var e={lane:u,revertLane:0,gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null};if(on(l))bs(t,e);else{var n=l.alternate;if(l.lanes===0&&(n===null||n.lanes===0)&&(n=t.lastRenderedReducer,n!==null))try{var i=t.lastRenderedState,f=n(i,a);if(e.hasEagerState=!0,e.eagerState=f,it(f,i))return Ve(l,t,e,0),ml===null&&Ze(),!1}catch{}if(a=Oi(l,t,e,u),a!==null)return at(a,l,u),ps(a,t,u),!0}return!1}function sf(l,t,a,u){if(u={lane:2,revertLane:Xf(),gesture:null,action:u,hasEagerState:!1,eagerState:null,next:null},on(l)){if(t)throw Error(m(479))}else t=Oi(l,a,u,2),t!==null&&at(t,l,2)}function on(l){var t=l.alternate;return l===X||t!==null&&t===X}function bs(l,t){yu=an=!0;var a=l.pending;a===null?t.next=t:(t.next=a.next,a.next=t),l.pending=t}function ps(l,t,a){if((a&4194048)!==0){var u=t.lanes;u&=l.pendingLanes,a|=u,t.lanes=a,Oc(l,a)}}var ue={readContext:jl,use:nn,useCallback:Sl,useContext:Sl,useEffect:Sl,useImperativeHandle:Sl,useLayoutEffect:Sl,useInsertionEffect:Sl,useMemo:Sl,useReducer:Sl,useRef:Sl,useState:Sl,useDebugValue:Sl,useDeferredValue:Sl,useTransition:Sl,useSyncExternalStore:Sl,useId:Sl,useHostTransitionStatus:Sl,useFormState:Sl,useActionState:Sl,useOptimistic:Sl,useMemoCache:Sl,useCacheRefresh:Sl};ue.useEffectEvent=Sl;var zs={readContext:jl,use:nn,useCallback:function(l,t){return Jl().memoizedState=[l,t===void 0?null:t],l},useContext:jl,useEffect:es,useImperativeHandle:function(l,t,a){a=a!=null?a.concat([l]):null,cn(4194308,4,cs.bind(null,t,l),a)},useLayoutEffect:function(l,t){return cn(4194308,4,l,t)},useInsertionEffect:function(l,t){cn(4,2,l,t)},useMemo:function(l,t){var a=Jl();t=t===void 0?null:t;var u=l();if(Ga){It(!0);try{l()}finally{It(!1)}}return a.memoizedState=[u,t],u},useReducer:function(l,t,a){var u=Jl();if(a!==void 0){var e=a(t);if(Ga){It(!0);try{a(t)}finally{It(!1)}}}else e=t;return u.memoizedState=u.baseState=e,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:l,lastRenderedState:e},u.queue=l,l=l.dispatch=Im.bind(null,X,l),[u.memoizedState,l]},useRef:function(l){var t=Jl();return l={current:l},t.memoizedState=l},useState:function(l){l=tf(l);var t=l.queue,a=Ss.bind(null,X,t);return t.dispatch=a,[l.memoizedState,a]},useDebugValue:ef,useDeferredValue:function(l,t){var a=Jl();return nf(a,l,t)},useTransition:function(){var l=tf(!1);return l=vs.bind(null,X,l.queue,!0,!1),Jl().memoizedState=l,[!1,l]},useSyncExternalStore:function(l,t,a){var u=X,e=Jl();if(F){if(a===void 0)throw Error(m(407));a=a()}else{if(a=t(),ml===null)throw Error(m(349));($&127)!==0||Z0(u,t,a)}e.memoizedState=a;var n={value:a,getSnapshot:t};return e.queue=n,es(L0.bind(null,u,n,l),[l]),u.flags|=2048,ru(9,{destroy:void 0},V0.bind(null,u,n,a,t),null),a},useId:function(){var l=Jl(),t=ml.identifierPrefix;if(F){var a=Ut,u=xt;a=(u&~(1<<32-nt(u)-1)).toString(32)+a,t="_"+t+"R_"+a,a=un++,0<a&&(t+="H"+a.toString(32)),t+="_"}else a=Km++,t="_"+t+"r_"+a.toString(32)+"_";return l.memoizedState=t},useHostTransitionStatus:cf,useFormState:P0,useActionState:P0,useOptimistic:function(l){var t=Jl();t.memoizedState=t.baseState=l;var a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=a,t=sf.bind(null,X,!0,a),a.dispatch=t,[l,t]},useMemoCache:Ii,useCacheRefresh:function(){return Jl().memoizedState=Fm.bind(null,X)},useEffectEvent:function(l){var t=Jl(),a={impl:l};return t.memoizedState=a,function(){if((ul&2)!==0)throw Error(m(440));return a.impl.apply(void 0,arguments)}}},of={readContext:jl,use:nn,useCallback:os,useContext:jl,useEffect:uf,useImperativeHandle:ss,useInsertionEffect:is,useLayoutEffect:fs,useMemo:ds,useReducer:fn,useRef:us,useState:function(){return fn(Zt)},useDebugValue:ef,useDeferredValue:function(l,t){var a=Tl();return ms(a,cl.memoizedState,l,t)},useTransition:function(){var l=fn(Zt)[0],t=Tl().memoizedState;return[typeof l=="boolean"?l:te(l),t]},useSyncExternalStore:X0,useId:rs,useHostTransitionStatus:cf,useFormState:ls,useActionState:ls,useOptimistic:function(l,t){var a=Tl();return w0(a,cl,l,t)},useMemoCache:Ii,useCacheRefresh:gs};of.useEffectEvent=ns;var Ts={readContext:jl,use:nn,useCallback:os,useContext:jl,useEffect:uf,useImperativeHandle:ss,useInsertionEffect:is,useLayoutEffect:fs,useMemo:ds,useReducer:lf,useRef:us,useState:function(){return lf(Zt)},useDebugValue:ef,useDeferredValue:function(l,t){var a=Tl();return cl===null?nf(a,l,t):ms(a,cl.memoizedState,l,t)},useTransition:function(){var l=lf(Zt)[0],t=Tl().memoizedState;return[typeof l=="boolean"?l:te(l),t]},useSyncExternalStore:X0,useId:rs,useHostTransitionStatus:cf,useFormState:as,useActionState:as,useOptimistic:function(l,t){var a=Tl();return cl!==null?w0(a,cl,l,t):(a.baseState=l,[l,a.queue.dispatch])},useMemoCache:Ii,useCacheRefresh:gs};Ts.useEffectEvent=ns;function df(l,t,a,u){t=l.memoizedState,a=a(u,t),a=a==null?t:U({},t,a),l.memoizedState=a,l.lanes===0&&(l.updateQueue.baseState=a)}var mf={enqueueSetState:function(l,t,a){l=l._reactInternals;var u=mt(),e=ia(u);e.payload=t,a!=null&&(e.callback=a),t=fa(l,e,u),t!==null&&(at(t,l,u),Fu(t,l,u))},enqueueReplaceState:function(l,t,a){l=l._reactInternals;var u=mt(),e=ia(u);e.tag=1,e.payload=t,a!=null&&(e.callback=a),t=fa(l,e,u),t!==null&&(at(t,l,u),Fu(t,l,u))},enqueueForceUpdate:function(l,t){l=l._reactInternals;var a=mt(),u=ia(a);u.tag=2,t!=null&&(u.callback=t),t=fa(l,u,a),t!==null&&(at(t,l,a),Fu(t,l,a))}};function Es(l,t,a,u,e,n,i){return l=l.stateNode,typeof l.shouldComponentUpdate=="function"?l.shouldComponentUpdate(u,n,i):t.prototype&&t.prototype.isPureReactComponent?!Vu(a,u)||!Vu(e,n):!0}function As(l,t,a,u){l=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(a,u),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(a,u),t.state!==l&&mf.enqueueReplaceState(t,t.state,null)}function Qa(l,t){var a=t;if("ref"in t){a={};for(var u in t)u!=="ref"&&(a[u]=t[u])}if(l=l.defaultProps){a===t&&(a=U({},a));for(var e in l)a[e]===void 0&&(a[e]=l[e])}return a}function Os(l){Xe(l)}function _s(l){console.error(l)}function Ms(l){Xe(l)}function dn(l,t){try{var a=l.onUncaughtError;a(t.value,{componentStack:t.stack})}catch(u){setTimeout(function(){throw u})}}function Ds(l,t,a){try{var u=l.onCaughtError;u(a.value,{componentStack:a.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(e){setTimeout(function(){throw e})}}function vf(l,t,a){return a=ia(a),a.tag=3,a.payload={element:null},a.callback=function(){dn(l,t)},a}function xs(l){return l=ia(l),l.tag=3,l}function Us(l,t,a,u){var e=a.type.getDerivedStateFromError;if(typeof e=="function"){var n=u.value;l.payload=function(){return e(n)},l.callback=function(){Ds(t,a,u)}}var i=a.stateNode;i!==null&&typeof i.componentDidCatch=="function"&&(l.callback=function(){Ds(t,a,u),typeof e!="function"&&(va===null?va=new Set([this]):va.add(this));var f=u.stack;this.componentDidCatch(u.value,{componentStack:f!==null?f:""})})}function Pm(l,t,a,u,e){if(a.flags|=32768,u!==null&&typeof u=="object"&&typeof u.then=="function"){if(t=a.alternate,t!==null&&cu(t,a,e,!0),a=ct.current,a!==null){switch(a.tag){case 31:case 13:return pt===null?En():a.alternate===null&&bl===0&&(bl=3),a.flags&=-257,a.flags|=65536,a.lanes=e,u===Fe?a.flags|=16384:(t=a.updateQueue,t===null?a.updateQueue=new Set([u]):t.add(u),Yf(l,u,e)),!1;case 22:return a.flags|=65536,u===Fe?a.flags|=16384:(t=a.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([u])},a.updateQueue=t):(a=t.retryQueue,a===null?t.retryQueue=new Set([u]):a.add(u)),Yf(l,u,e)),!1}throw Error(m(435,a.tag))}return Yf(l,u,e),En(),!1}if(F)return t=ct.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=e,u!==Hi&&(l=Error(m(422),{cause:u}),Ju(rt(l,a)))):(u!==Hi&&(t=Error(m(423),{cause:u}),Ju(rt(t,a))),l=l.current.alternate,l.flags|=65536,e&=-e,l.lanes|=e,u=rt(u,a),e=vf(l.stateNode,u,e),Zi(l,e),bl!==4&&(bl=2)),!1;var n=Error(m(520),{cause:u});if(n=rt(n,a),de===null?de=[n]:de.push(n),bl!==4&&(bl=2),t===null)return!0;u=rt(u,a),a=t;do{switch(a.tag){case 3:return a.flags|=65536,l=e&-e,a.lanes|=l,l=vf(a.stateNode,u,l),Zi(a,l),!1;case 1:if(t=a.type,n=a.stateNode,(a.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(va===null||!va.has(n))))return a.flags|=65536,e&=-e,a.lanes|=e,e=xs(e),Us(e,l,a,u),Zi(a,e),!1}a=a.return}while(a!==null);return!1}var yf=Error(m(461)),Ol=!1;function ql(l,t,a,u){t.child=l===null?C0(t,null,a,u):Ya(t,l.child,a,u)}function Hs(l,t,a,u,e){a=a.render;var n=t.ref;if("ref"in u){var i={};for(var f in u)f!=="ref"&&(i[f]=u[f])}else i=u;return Ca(t),u=Wi(l,t,a,i,n,e),f=$i(),l!==null&&!Ol?(ki(l,t,e),Vt(l,t,e)):(F&&f&&xi(t),t.flags|=1,ql(l,t,u,e),t.child)}function Ns(l,t,a,u,e){if(l===null){var n=a.type;return typeof n=="function"&&!_i(n)&&n.defaultProps===void 0&&a.compare===null?(t.tag=15,t.type=n,Rs(l,t,n,u,e)):(l=Ke(a.type,null,u,t,t.mode,e),l.ref=t.ref,l.return=t,t.child=l)}if(n=l.child,!Tf(l,e)){var i=n.memoizedProps;if(a=a.compare,a=a!==null?a:Vu,a(i,u)&&l.ref===t.ref)return Vt(l,t,e)}return t.flags|=1,l=Bt(n,u),l.ref=t.ref,l.return=t,t.child=l}function Rs(l,t,a,u,e){if(l!==null){var n=l.memoizedProps;if(Vu(n,u)&&l.ref===t.ref)if(Ol=!1,t.pendingProps=u=n,Tf(l,e))(l.flags&131072)!==0&&(Ol=!0);else return t.lanes=l.lanes,Vt(l,t,e)}return hf(l,t,a,u,e)}function Cs(l,t,a,u){var e=u.children,n=l!==null?l.memoizedState:null;if(l===null&&t.stateNode===null&&(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),u.mode==="hidden"){if((t.flags&128)!==0){if(n=n!==null?n.baseLanes|a:a,l!==null){for(u=t.child=l.child,e=0;u!==null;)e=e|u.lanes|u.childLanes,u=u.sibling;u=e&~n}else u=0,t.child=null;return js(l,t,n,a,u)}if((a&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},l!==null&&$e(t,n!==null?n.cachePool:null),n!==null?B0(t,n):Li(),Y0(t);else return u=t.lanes=536870912,js(l,t,n!==null?n.baseLanes|a:a,a,u)}else n!==null?($e(t,n.cachePool),B0(t,n),sa(),t.memoizedState=null):(l!==null&&$e(t,null),Li(),sa());return ql(l,t,e,a),t.child}function ee(l,t){return l!==null&&l.tag===22||t.stateNode!==null||(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),t.sibling}function js(l,t,a,u,e){var n=Yi();return n=n===null?null:{parent:El._currentValue,pool:n},t.memoizedState={baseLanes:a,cachePool:n},l!==null&&$e(t,null),Li(),Y0(t),l!==null&&cu(l,t,u,!0),t.childLanes=e,null}function mn(l,t){return t=yn({mode:t.mode,children:t.children},l.mode),t.ref=l.ref,l.child=t,t.return=l,t}function qs(l,t,a){return Ya(t,l.child,null,a),l=mn(t,t.pendingProps),l.flags|=2,st(t),t.memoizedState=null,l}function lv(l,t,a){var u=t.pendingProps,e=(t.flags&128)!==0;if(t.flags&=-129,l===null){if(F){if(u.mode==="hidden")return l=mn(t,u),t.lanes=536870912,ee(null,l);if(Ji(t),(l=vl)?(l=$o(l,bt),l=l!==null&&l.data==="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:ta!==null?{id:xt,overflow:Ut}:null,retryLane:536870912,hydrationErrors:null},a=b0(l),a.return=t,t.child=a,Cl=t,vl=null)):l=null,l===null)throw ua(t);return t.lanes=536870912,null}return mn(t,u)}var n=l.memoizedState;if(n!==null){var i=n.dehydrated;if(Ji(t),e)if(t.flags&256)t.flags&=-257,t=qs(l,t,a);else if(t.memoizedState!==null)t.child=l.child,t.flags|=128,t=null;else throw Error(m(558));else if(Ol||cu(l,t,a,!1),e=(a&l.childLanes)!==0,Ol||e){if(u=ml,u!==null&&(i=_c(u,a),i!==0&&i!==n.retryLane))throw n.retryLane=i,Ua(l,i),at(u,l,i),yf;En(),t=qs(l,t,a)}else l=n.treeContext,vl=zt(i.nextSibling),Cl=t,F=!0,aa=null,bt=!1,l!==null&&T0(t,l),t=mn(t,u),t.flags|=4096;return t}return l=Bt(l.child,{mode:u.mode,children:u.children}),l.ref=t.ref,t.child=l,l.return=t,l}function vn(l,t){var a=t.ref;if(a===null)l!==null&&l.ref!==null&&(t.flags|=4194816);else{if(typeof a!="function"&&typeof a!="object")throw Error(m(284));(l===null||l.ref!==a)&&(t.flags|=4194816)}}function hf(l,t,a,u,e){return Ca(t),a=Wi(l,t,a,u,void 0,e),u=$i(),l!==null&&!Ol?(ki(l,t,e),Vt(l,t,e)):(F&&u&&xi(t),t.flags|=1,ql(l,t,a,e),t.child)}function Bs(l,t,a,u,e,n){return Ca(t),t.updateQueue=null,a=Q0(t,u,a,e),G0(l),u=$i(),l!==null&&!Ol?(ki(l,t,n),Vt(l,t,n)):(F&&u&&xi(t),t.flags|=1,ql(l,t,a,n),t.child)}function Ys(l,t,a,u,e){if(Ca(t),t.stateNode===null){var n=eu,i=a.contextType;typeof i=="object"&&i!==null&&(n=jl(i)),n=new a(u,n),t.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=mf,t.stateNode=n,n._reactInternals=t,n=t.stateNode,n.props=u,n.state=t.memoizedState,n.refs={},Qi(t),i=a.contextType,n.context=typeof i=="object"&&i!==null?jl(i):eu,n.state=t.memoizedState,i=a.getDerivedStateFromProps,typeof i=="function"&&(df(t,a,i,u),n.state=t.memoizedState),typeof a.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(i=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),i!==n.state&&mf.enqueueReplaceState(n,n.state,null),Pu(t,u,n,e),Iu(),n.state=t.memoizedState),typeof n.componentDidMount=="function"&&(t.flags|=4194308),u=!0}else if(l===null){n=t.stateNode;var f=t.memoizedProps,c=Qa(a,f);n.props=c;var y=n.context,g=a.contextType;i=eu,typeof g=="object"&&g!==null&&(i=jl(g));var z=a.getDerivedStateFromProps;g=typeof z=="function"||typeof n.getSnapshotBeforeUpdate=="function",f=t.pendingProps!==f,g||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(f||y!==i)&&As(t,n,u,i),na=!1;var h=t.memoizedState;n.state=h,Pu(t,u,n,e),Iu(),y=t.memoizedState,f||h!==y||na?(typeof z=="function"&&(df(t,a,z,u),y=t.memoizedState),(c=na||Es(t,a,c,u,h,y,i))?(g||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(t.flags|=4194308)):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=u,t.memoizedState=y),n.props=u,n.state=y,n.context=i,u=c):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),u=!1)}else{n=t.stateNode,Xi(l,t),i=t.memoizedProps,g=Qa(a,i),n.props=g,z=t.pendingProps,h=n.context,y=a.contextType,c=eu,typeof y=="object"&&y!==null&&(c=jl(y)),f=a.getDerivedStateFromProps,(y=typeof f=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(i!==z||h!==c)&&As(t,n,u,c),na=!1,h=t.memoizedState,n.state=h,Pu(t,u,n,e),Iu();var r=t.memoizedState;i!==z||h!==r||na||l!==null&&l.dependencies!==null&&we(l.dependencies)?(typeof f=="function"&&(df(t,a,f,u),r=t.memoizedState),(g=na||Es(t,a,g,u,h,r,c)||l!==null&&l.dependencies!==null&&we(l.dependencies))?(y||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(u,r,c),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(u,r,c)),typeof n.componentDidUpdate=="function"&&(t.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof n.componentDidUpdate!="function"||i===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||i===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),t.memoizedProps=u,t.memoizedState=r),n.props=u,n.state=r,n.context=c,u=g):(typeof n.componentDidUpdate!="function"||i===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||i===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),u=!1)}return n=u,vn(l,t),u=(t.flags&128)!==0,n||u?(n=t.stateNode,a=u&&typeof a.getDerivedStateFromError!="function"?null:n.render(),t.flags|=1,l!==null&&u?(t.child=Ya(t,l.child,null,e),t.child=Ya(t,null,a,e)):ql(l,t,a,e),t.memoizedState=n.state,l=t.child):l=Vt(l,t,e),l}function Gs(l,t,a,u){return Na(),t.flags|=256,ql(l,t,a,u),t.child}var rf={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function gf(l){return{baseLanes:l,cachePool:D0()}}function Sf(l,t,a){return l=l!==null?l.childLanes&~a:0,t&&(l|=dt),l}function Qs(l,t,a){var u=t.pendingProps,e=!1,n=(t.flags&128)!==0,i;if((i=n)||(i=l!==null&&l.memoizedState===null?!1:(zl.current&2)!==0),i&&(e=!0,t.flags&=-129),i=(t.flags&32)!==0,t.flags&=-33,l===null){if(F){if(e?ca(t):sa(),(l=vl)?(l=$o(l,bt),l=l!==null&&l.data!=="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:ta!==null?{id:xt,overflow:Ut}:null,retryLane:536870912,hydrationErrors:null},a=b0(l),a.return=t,t.child=a,Cl=t,vl=null)):l=null,l===null)throw ua(t);return lc(l)?t.lanes=32:t.lanes=536870912,null}var f=u.children;return u=u.fallback,e?(sa(),e=t.mode,f=yn({mode:"hidden",children:f},e),u=Ha(u,e,a,null),f.return=t,u.return=t,f.sibling=u,t.child=f,u=t.child,u.memoizedState=gf(a),u.childLanes=Sf(l,i,a),t.memoizedState=rf,ee(null,u)):(ca(t),bf(t,f))}var c=l.memoizedState;if(c!==null&&(f=c.dehydrated,f!==null)){if(n)t.flags&256?(ca(t),t.flags&=-257,t=pf(l,t,a)):t.memoizedState!==null?(sa(),t.child=l.child,t.flags|=128,t=null):(sa(),f=u.fallback,e=t.mode,u=yn({mode:"visible",children:u.children},e),f=Ha(f,e,a,null),f.flags|=2,u.return=t,f.return=t,u.sibling=f,t.child=u,Ya(t,l.child,null,a),u=t.child,u.memoizedState=gf(a),u.childLanes=Sf(l,i,a),t.memoizedState=rf,t=ee(null,u));else if(ca(t),lc(f)){if(i=f.nextSibling&&f.nextSibling.dataset,i)var y=i.dgst;i=y,u=Error(m(419)),u.stack="",u.digest=i,Ju({value:u,source:null,stack:null}),t=pf(l,t,a)}else if(Ol||cu(l,t,a,!1),i=(a&l.childLanes)!==0,Ol||i){if(i=ml,i!==null&&(u=_c(i,a),u!==0&&u!==c.retryLane))throw c.retryLane=u,Ua(l,u),at(i,l,u),yf;Pf(f)||En(),t=pf(l,t,a)}else Pf(f)?(t.flags|=192,t.child=l.child,t=null):(l=c.treeContext,vl=zt(f.nextSibling),Cl=t,F=!0,aa=null,bt=!1,l!==null&&T0(t,l),t=bf(t,u.children),t.flags|=4096);return t}return e?(sa(),f=u.fallback,e=t.mode,c=l.child,y=c.sibling,u=Bt(c,{mode:"hidden",children:u.children}),u.subtreeFlags=c.subtreeFlags&65011712,y!==null?f=Bt(y,f):(f=Ha(f,e,a,null),f.flags|=2),f.return=t,u.return=t,u.sibling=f,t.child=u,ee(null,u),u=t.child,f=l.child.memoizedState,f===null?f=gf(a):(e=f.cachePool,e!==null?(c=El._currentValue,e=e.parent!==c?{parent:c,pool:c}:e):e=D0(),f={baseLanes:f.baseLanes|a,cachePool:e}),u.memoizedState=f,u.childLanes=Sf(l,i,a),t.memoizedState=rf,ee(l.child,u)):(ca(t),a=l.child,l=a.sibling,a=Bt(a,{mode:"visible",children:u.children}),a.return=t,a.sibling=null,l!==null&&(i=t.deletions,i===null?(t.deletions=[l],t.flags|=16):i.push(l)),t.child=a,t.memoizedState=null,a)}function bf(l,t){return t=yn({mode:"visible",children:t},l.mode),t.return=l,l.child=t}function yn(l,t){return l=ft(22,l,null,t),l.lanes=0,l}function pf(l,t,a){return Ya(t,l.child,null,a),l=bf(t,t.pendingProps.children),l.flags|=2,t.memoizedState=null,l}function Xs(l,t,a){l.lanes|=t;var u=l.alternate;u!==null&&(u.lanes|=t),Ci(l.return,t,a)}function zf(l,t,a,u,e,n){var i=l.memoizedState;i===null?l.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:u,tail:a,tailMode:e,treeForkCount:n}:(i.isBackwards=t,i.rendering=null,i.renderingStartTime=0,i.last=u,i.tail=a,i.tailMode=e,i.treeForkCount=n)}function Zs(l,t,a){var u=t.pendingProps,e=u.revealOrder,n=u.tail;u=u.children;var i=zl.current,f=(i&2)!==0;if(f?(i=i&1|2,t.flags|=128):i&=1,O(zl,i),ql(l,t,u,a),u=F?Ku:0,!f&&l!==null&&(l.flags&128)!==0)l:for(l=t.child;l!==null;){if(l.tag===13)l.memoizedState!==null&&Xs(l,a,t);else if(l.tag===19)Xs(l,a,t);else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break l;for(;l.sibling===null;){if(l.return===null||l.return===t)break l;l=l.return}l.sibling.return=l.return,l=l.sibling}switch(e){case"forwards":for(a=t.child,e=null;a!==null;)l=a.alternate,l!==null&&tn(l)===null&&(e=a),a=a.sibling;a=e,a===null?(e=t.child,t.child=null):(e=a.sibling,a.sibling=null),zf(t,!1,e,a,n,u);break;case"backwards":case"unstable_legacy-backwards":for(a=null,e=t.child,t.child=null;e!==null;){if(l=e.alternate,l!==null&&tn(l)===null){t.child=e;break}l=e.sibling,e.sibling=a,a=e,e=l}zf(t,!0,a,null,n,u);break;case"together":zf(t,!1,null,null,void 0,u);break;default:t.memoizedState=null}return t.child}function Vt(l,t,a){if(l!==null&&(t.dependencies=l.dependencies),ma|=t.lanes,(a&t.childLanes)===0)if(l!==null){if(cu(l,t,a,!1),(a&t.childLanes)===0)return null}else return null;if(l!==null&&t.child!==l.child)throw Error(m(153));if(t.child!==null){for(l=t.child,a=Bt(l,l.pendingProps),t.child=a,a.return=t;l.sibling!==null;)l=l.sibling,a=a.sibling=Bt(l,l.pendingProps),a.return=t;a.sibling=null}return t.child}function Tf(l,t){return(l.lanes&t)!==0?!0:(l=l.dependencies,!!(l!==null&&we(l)))}function tv(l,t,a){switch(t.tag){case 3:Kl(t,t.stateNode.containerInfo),ea(t,El,l.memoizedState.cache),Na();break;case 27:case 5:Uu(t);break;case 4:Kl(t,t.stateNode.containerInfo);break;case 10:ea(t,t.type,t.memoizedProps.value);break;case 31:if(t.memoizedState!==null)return t.flags|=128,Ji(t),null;break;case 13:var u=t.memoizedState;if(u!==null)return u.dehydrated!==null?(ca(t),t.flags|=128,null):(a&t.child.childLanes)!==0?Qs(l,t,a):(ca(t),l=Vt(l,t,a),l!==null?l.sibling:null);ca(t);break;case 19:var e=(l.flags&128)!==0;if(u=(a&t.childLanes)!==0,u||(cu(l,t,a,!1),u=(a&t.childLanes)!==0),e){if(u)return Zs(l,t,a);t.flags|=128}if(e=t.memoizedState,e!==null&&(e.rendering=null,e.tail=null,e.lastEffect=null),O(zl,zl.current),u)break;return null;case 22:return t.lanes=0,Cs(l,t,a,t.pendingProps);case 24:ea(t,El,l.memoizedState.cache)}return Vt(l,t,a)}function Vs(l,t,a){if(l!==null)if(l.memoizedProps!==t.pendingProps)Ol=!0;else{if(!Tf(l,a)&&(t.flags&128)===0)return Ol=!1,tv(l,t,a);Ol=(l.flags&131072)!==0}else Ol=!1,F&&(t.flags&1048576)!==0&&z0(t,Ku,t.index);switch(t.lanes=0,t.tag){case 16:l:{var u=t.pendingProps;if(l=qa(t.elementType),t.type=l,typeof l=="function")_i(l)?(u=Qa(l,u),t.tag=1,t=Ys(null,t,l,u,a)):(t.tag=0,t=hf(null,t,l,u,a));else{if(l!=null){var e=l.$$typeof;if(e===gl){t.tag=11,t=Hs(null,t,l,u,a);break l}else if(e===L){t.tag=14,t=Ns(null,t,l,u,a);break l}}throw t=Rt(l)||l,Error(m(306,t,""))}}return t;case 0:return hf(l,t,t.type,t.pendingProps,a);case 1:return u=t.type,e=Qa(u,t.pendingProps),Ys(l,t,u,e,a);case 3:l:{if(Kl(t,t.stateNode.containerInfo),l===null)throw Error(m(387));u=t.pendingProps;var n=t.memoizedState;e=n.element,Xi(l,t),Pu(t,u,null,a);var i=t.memoizedState;if(u=i.cache,ea(t,El,u),u!==n.cache&&ji(t,[El],a,!0),Iu(),u=i.element,n.isDehydrated)if(n={element:u,isDehydrated:!1,cache:i.cache},t.updateQueue.baseState=n,t.memoizedState=n,t.flags&256){t=Gs(l,t,u,a);break l}else if(u!==e){e=rt(Error(m(424)),t),Ju(e),t=Gs(l,t,u,a);break l}else for(l=t.stateNode.containerInfo,l.nodeType===9?l=l.body:l=l.nodeName==="HTML"?l.ownerDocument.body:l,vl=zt(l.firstChild),Cl=t,F=!0,aa=null,bt=!0,a=C0(t,null,u,a),t.child=a;a;)a.flags=a.flags&-3|4096,a=a.sibling;else{if(Na(),u===e){t=Vt(l,t,a);break l}ql(l,t,u,a)}t=t.child}return t;case 26:return vn(l,t),l===null?(a=td(t.type,null,t.pendingProps,null))?t.memoizedState=a:F||(a=t.type,l=t.pendingProps,u=Un(J.current).createElement(a),u[Rl]=t,u[kl]=l,Bl(u,a,l),Ul(u),t.stateNode=u):t.memoizedState=td(t.type,l.memoizedProps,t.pendingProps,l.memoizedState),null;case 27:return Uu(t),l===null&&F&&(u=t.stateNode=Io(t.type,t.pendingProps,J.current),Cl=t,bt=!0,e=vl,ga(t.type)?(tc=e,vl=zt(u.firstChild)):vl=e),ql(l,t,t.pendingProps.children,a),vn(l,t),l===null&&(t.flags|=4194304),t.child;case 5:return l===null&&F&&((e=u=vl)&&(u=Hv(u,t.type,t.pendingProps,bt),u!==null?(t.stateNode=u,Cl=t,vl=zt(u.firstChild),bt=!1,e=!0):e=!1),e||ua(t)),Uu(t),e=t.type,n=t.pendingProps,i=l!==null?l.memoizedProps:null,u=n.children,kf(e,n)?u=null:i!==null&&kf(e,i)&&(t.flags|=32),t.memoizedState!==null&&(e=Wi(l,t,Jm,null,null,a),be._currentValue=e),vn(l,t),ql(l,t,u,a),t.child;case 6:return l===null&&F&&((l=a=vl)&&(a=Nv(a,t.pendingProps,bt),a!==null?(t.stateNode=a,Cl=t,vl=null,l=!0):l=!1),l||ua(t)),null;case 13:return Qs(l,t,a);case 4:return Kl(t,t.stateNode.containerInfo),u=t.pendingProps,l===null?t.child=Ya(t,null,u,a):ql(l,t,u,a),t.child;case 11:return Hs(l,t,t.type,t.pendingProps,a);case 7:return ql(l,t,t.pendingProps,a),t.child;case 8:return ql(l,t,t.pendingProps.children,a),t.child;case 12:return ql(l,t,t.pendingProps.children,a),t.child;case 10:return u=t.pendingProps,ea(t,t.type,u.value),ql(l,t,u.children,a),t.child;case 9:return e=t.type._context,u=t.pendingProps.children,Ca(t),e=jl(e),u=u(e),t.flags|=1,ql(l,t,u,a),t.child;case 14:return Ns(l,t,t.type,t.pendingProps,a);case 15:return Rs(l,t,t.type,t.pendingProps,a);case 19:return Zs(l,t,a);case 31:return lv(l,t,a);case 22:return Cs(l,t,a,t.pendingProps);case 24:return Ca(t),u=jl(El),l===null?(e=Yi(),e===null&&(e=ml,n=qi(),e.pooledCache=n,n.refCount++,n!==null&&(e.pooledCacheLanes|=a),e=n),t.memoizedState={parent:u,cache:e},Qi(t),ea(t,El,e)):((l.lanes&a)!==0&&(Xi(l,t),Pu(t,null,null,a),Iu()),e=l.memoizedState,n=t.memoizedState,e.parent!==u?(e={parent:u,cache:u},t.memoizedState=e,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=e),ea(t,El,u)):(u=n.cache,ea(t,El,u),u!==e.cache&&ji(t,[El],a,!0))),ql(l,t,t.pendingProps.children,a),t.child;case 29:throw t.pendingProps}throw Error(m(156,t.tag))}function Lt(l){l.flags|=4}function Ef(l,t,a,u,e){if((t=(l.mode&32)!==0)&&(t=!1),t){if(l.flags|=16777216,(e&335544128)===e)if(l.stateNode.complete)l.flags|=8192;else if(go())l.flags|=8192;else throw Ba=Fe,Gi}else l.flags&=-16777217}function Ls(l,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)l.flags&=-16777217;else if(l.flags|=16777216,!id(t))if(go())l.flags|=8192;else throw Ba=Fe,Gi}function hn(l,t){t!==null&&(l.flags|=4),l.flags&16384&&(t=l.tag!==22?Ec():536870912,l.lanes|=t,pu|=t)}function ne(l,t){if(!F)switch(l.tailMode){case"hidden":t=l.tail;for(var a=null;t!==null;)t.alternate!==null&&(a=t),t=t.sibling;a===null?l.tail=null:a.sibling=null;break;case"collapsed":a=l.tail;for(var u=null;a!==null;)a.alternate!==null&&(u=a),a=a.sibling;u===null?t||l.tail===null?l.tail=null:l.tail.sibling=null:u.sibling=null}}function yl(l){var t=l.alternate!==null&&l.alternate.child===l.child,a=0,u=0;if(t)for(var e=l.child;e!==null;)a|=e.lanes|e.childLanes,u|=e.subtreeFlags&65011712,u|=e.flags&65011712,e.return=l,e=e.sibling;else for(e=l.child;e!==null;)a|=e.lanes|e.childLanes,u|=e.subtreeFlags,u|=e.flags,e.return=l,e=e.sibling;return l.subtreeFlags|=u,l.childLanes=a,t}function av(l,t,a){var u=t.pendingProps;switch(Ui(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return yl(t),null;case 1:return yl(t),null;case 3:return a=t.stateNode,u=null,l!==null&&(u=l.memoizedState.cache),t.memoizedState.cache!==u&&(t.flags|=2048),Qt(El),pl(),a.pendingContext&&(a.context=a.pendingContext,a.pendingContext=null),(l===null||l.child===null)&&(fu(t)?Lt(t):l===null||l.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,Ni())),yl(t),null;case 26:var e=t.type,n=t.memoizedState;return l===null?(Lt(t),n!==null?(yl(t),Ls(t,n)):(yl(t),Ef(t,e,null,u,a))):n?n!==l.memoizedState?(Lt(t),yl(t),Ls(t,n)):(yl(t),t.flags&=-16777217):(l=l.memoizedProps,l!==u&&Lt(t),yl(t),Ef(t,e,l,u,a)),null;case 27:if(Oe(t),a=J.current,e=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==u&&Lt(t);else{if(!u){if(t.stateNode===null)throw Error(m(166));return yl(t),null}l=D.current,fu(t)?E0(t):(l=Io(e,u,a),t.stateNode=l,Lt(t))}return yl(t),null;case 5:if(Oe(t),e=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==u&&Lt(t);else{if(!u){if(t.stateNode===null)throw Error(m(166));return yl(t),null}if(n=D.current,fu(t))E0(t);else{var i=Un(J.current);switch(n){case 1:n=i.createElementNS("http://www.w3.org/2000/svg",e);break;case 2:n=i.createElementNS("http://www.w3.org/1998/Math/MathML",e);break;default:switch(e){case"svg":n=i.createElementNS("http://www.w3.org/2000/svg",e);break;case"math":n=i.createElementNS("http://www.w3.org/1998/Math/MathML",e);break;case"script":n=i.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild);break;case"select":n=typeof u.is=="string"?i.createElement("select",{is:u.is}):i.createElement("select"),u.multiple?n.multiple=!0:u.size&&(n.size=u.size);break;default:n=typeof u.is=="string"?i.createElement(e,{is:u.is}):i.createElement(e)}}n[Rl]=t,n[kl]=u;l:for(i=t.child;i!==null;){if(i.tag===5||i.tag===6)n.appendChild(i.stateNode);else if(i.tag!==4&&i.tag!==27&&i.child!==null){i.child.return=i,i=i.child;continue}if(i===t)break l;for(;i.sibling===null;){if(i.return===null||i.return===t)break l;i=i.return}i.sibling.return=i.return,i=i.sibling}t.stateNode=n;l:switch(Bl(n,e,u),e){case"button":case"input":case"select":case"textarea":u=!!u.autoFocus;break l;case"img":u=!0;break l;default:u=!1}u&&Lt(t)}}return yl(t),Ef(t,t.type,l===null?null:l.memoizedProps,t.pendingProps,a),null;case 6:if(l&&t.stateNode!=null)l.memoizedProps!==u&&Lt(t);else{if(typeof u!="string"&&t.stateNode===null)throw Error(m(166));if(l=J.current,fu(t)){if(l=t.stateNode,a=t.memoizedProps,u=null,e=Cl,e!==null)switch(e.tag){case 27:case 5:u=e.memoizedProps}l[Rl]=t,l=!!(l.nodeValue===a||u!==null&&u.suppressHydrationWarning===!0||Xo(l.nodeValue,a)),l||ua(t,!0)}else l=Un(l).createTextNode(u),l[Rl]=t,t.stateNode=l}return yl(t),null;case 31:if(a=t.memoizedState,l===null||l.memoizedState!==null){if(u=fu(t),a!==null){if(l===null){if(!u)throw Error(m(318));if(l=t.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(m(557));l[Rl]=t}else Na(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;yl(t),l=!1}else a=Ni(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=a),l=!0;if(!l)return t.flags&256?(st(t),t):(st(t),null);if((t.flags&128)!==0)throw Error(m(558))}return yl(t),null;case 13:if(u=t.memoizedState,l===null||l.memoizedState!==null&&l.memoizedState.dehydrated!==null){if(e=fu(t),u!==null&&u.dehydrated!==null){if(l===null){if(!e)throw Error(m(318));if(e=t.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(m(317));e[Rl]=t}else Na(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;yl(t),e=!1}else e=Ni(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=e),e=!0;if(!e)return t.flags&256?(st(t),t):(st(t),null)}return st(t),(t.flags&128)!==0?(t.lanes=a,t):(a=u!==null,l=l!==null&&l.memoizedState!==null,a&&(u=t.child,e=null,u.alternate!==null&&u.alternate.memoizedState!==null&&u.alternate.memoizedState.cachePool!==null&&(e=u.alternate.memoizedState.cachePool.pool),n=null,u.memoizedState!==null&&u.memoizedState.cachePool!==null&&(n=u.memoizedState.cachePool.pool),n!==e&&(u.flags|=2048)),a!==l&&a&&(t.child.flags|=8192),hn(t,t.updateQueue),yl(t),null);case 4:return pl(),l===null&&Kf(t.stateNode.containerInfo),yl(t),null;case 10:return Qt(t.type),yl(t),null;case 19:if(T(zl),u=t.memoizedState,u===null)return yl(t),null;if(e=(t.flags&128)!==0,n=u.rendering,n===null)if(e)ne(u,!1);else{if(bl!==0||l!==null&&(l.flags&128)!==0)for(l=t.child;l!==null;){if(n=tn(l),n!==null){for(t.flags|=128,ne(u,!1),l=n.updateQueue,t.updateQueue=l,hn(t,l),t.subtreeFlags=0,l=a,a=t.child;a!==null;)S0(a,l),a=a.sibling;return O(zl,zl.current&1|2),F&&Yt(t,u.treeForkCount),t.child}l=l.sibling}u.tail!==null&&ut()>pn&&(t.flags|=128,e=!0,ne(u,!1),t.lanes=4194304)}else{if(!e)if(l=tn(n),l!==null){if(t.flags|=128,e=!0,l=l.updateQueue,t.updateQueue=l,hn(t,l),ne(u,!0),u.tail===null&&u.tailMode==="hidden"&&!n.alternate&&!F)return yl(t),null}else 2*ut()-u.renderingStartTime>pn&&a!==536870912&&(t.flags|=128,e=!0,ne(u,!1),t.lanes=4194304);u.isBackwards?(n.sibling=t.child,t.child=n):(l=u.last,l!==null?l.sibling=n:t.child=n,u.last=n)}return u.tail!==null?(l=u.tail,u.rendering=l,u.tail=l.sibling,u.renderingStartTime=ut(),l.sibling=null,a=zl.current,O(zl,e?a&1|2:a&1),F&&Yt(t,u.treeForkCount),l):(yl(t),null);case 22:case 23:return st(t),Ki(),u=t.memoizedState!==null,l!==null?l.memoizedState!==null!==u&&(t.flags|=8192):u&&(t.flags|=8192),u?(a&536870912)!==0&&(t.flags&128)===0&&(yl(t),t.subtreeFlags&6&&(t.flags|=8192)):yl(t),a=t.updateQueue,a!==null&&hn(t,a.retryQueue),a=null,l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),u=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(u=t.memoizedState.cachePool.pool),u!==a&&(t.flags|=2048),l!==null&&T(ja),null;case 24:return a=null,l!==null&&(a=l.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),Qt(El),yl(t),null;case 25:return null;case 30:return null}throw Error(m(156,t.tag))}function uv(l,t){switch(Ui(t),t.tag){case 1:return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 3:return Qt(El),pl(),l=t.flags,(l&65536)!==0&&(l&128)===0?(t.flags=l&-65537|128,t):null;case 26:case 27:case 5:return Oe(t),null;case 31:if(t.memoizedState!==null){if(st(t),t.alternate===null)throw Error(m(340));Na()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 13:if(st(t),l=t.memoizedState,l!==null&&l.dehydrated!==null){if(t.alternate===null)throw Error(m(340));Na()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 19:return T(zl),null;case 4:return pl(),null;case 10:return Qt(t.type),null;case 22:case 23:return st(t),Ki(),l!==null&&T(ja),l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 24:return Qt(El),null;case 25:return null;default:return null}}function Ks(l,t){switch(Ui(t),t.tag){case 3:Qt(El),pl();break;case 26:case 27:case 5:Oe(t);break;case 4:pl();break;case 31:t.memoizedState!==null&&st(t);break;case 13:st(t);break;case 19:T(zl);break;case 10:Qt(t.type);break;case 22:case 23:st(t),Ki(),l!==null&&T(ja);break;case 24:Qt(El)}}function ie(l,t){try{var a=t.updateQueue,u=a!==null?a.lastEffect:null;if(u!==null){var e=u.next;a=e;do{if((a.tag&l)===l){u=void 0;var n=a.create,i=a.inst;u=n(),i.destroy=u}a=a.next}while(a!==e)}}catch(f){il(t,t.return,f)}}function oa(l,t,a){try{var u=t.updateQueue,e=u!==null?u.lastEffect:null;if(e!==null){var n=e.next;u=n;do{if((u.tag&l)===l){var i=u.inst,f=i.destroy;if(f!==void 0){i.destroy=void 0,e=t;var c=a,y=f;try{y()}catch(g){il(e,c,g)}}}u=u.next}while(u!==n)}}catch(g){il(t,t.return,g)}}function Js(l){var t=l.updateQueue;if(t!==null){var a=l.stateNode;try{q0(t,a)}catch(u){il(l,l.return,u)}}}function ws(l,t,a){a.props=Qa(l.type,l.memoizedProps),a.state=l.memoizedState;try{a.componentWillUnmount()}catch(u){il(l,t,u)}}function fe(l,t){try{var a=l.ref;if(a!==null){switch(l.tag){case 26:case 27:case 5:var u=l.stateNode;break;case 30:u=l.stateNode;break;default:u=l.stateNode}typeof a=="function"?l.refCleanup=a(u):a.current=u}}catch(e){il(l,t,e)}}function Ht(l,t){var a=l.ref,u=l.refCleanup;if(a!==null)if(typeof u=="function")try{u()}catch(e){il(l,t,e)}finally{l.refCleanup=null,l=l.alternate,l!=null&&(l.refCleanup=null)}else if(typeof a=="function")try{a(null)}catch(e){il(l,t,e)}else a.current=null}function Ws(l){var t=l.type,a=l.memoizedProps,u=l.stateNode;try{l:switch(t){case"button":case"input":case"select":case"textarea":a.autoFocus&&u.focus();break l;case"img":a.src?u.src=a.src:a.srcSet&&(u.srcset=a.srcSet)}}catch(e){il(l,l.return,e)}}function Af(l,t,a){try{var u=l.stateNode;Ov(u,l.type,a,t),u[kl]=t}catch(e){il(l,l.return,e)}}function $s(l){return l.tag===5||l.tag===3||l.tag===26||l.tag===27&&ga(l.type)||l.tag===4}function Of(l){l:for(;;){for(;l.sibling===null;){if(l.return===null||$s(l.return))return null;l=l.return}for(l.sibling.return=l.return,l=l.sibling;l.tag!==5&&l.tag!==6&&l.tag!==18;){if(l.tag===27&&ga(l.type)||l.flags&2||l.child===null||l.tag===4)continue l;l.child.return=l,l=l.child}if(!(l.flags&2))return l.stateNode}}function _f(l,t,a){var u=l.tag;if(u===5||u===6)l=l.stateNode,t?(a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a).insertBefore(l,t):(t=a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a,t.appendChild(l),a=a._reactRootContainer,a!=null||t.onclick!==null||(t.onclick=jt));else if(u!==4&&(u===27&&ga(l.type)&&(a=l.stateNode,t=null),l=l.child,l!==null))for(_f(l,t,a),l=l.sibling;l!==null;)_f(l,t,a),l=l.sibling}function rn(l,t,a){var u=l.tag;if(u===5||u===6)l=l.stateNode,t?a.insertBefore(l,t):a.appendChild(l);else if(u!==4&&(u===27&&ga(l.type)&&(a=l.stateNode),l=l.child,l!==null))for(rn(l,t,a),l=l.sibling;l!==null;)rn(l,t,a),l=l.sibling}function ks(l){var t=l.stateNode,a=l.memoizedProps;try{for(var u=l.type,e=t.attributes;e.length;)t.removeAttributeNode(e[0]);Bl(t,u,a),t[Rl]=l,t[kl]=a}catch(n){il(l,l.return,n)}}var Kt=!1,_l=!1,Mf=!1,Fs=typeof WeakSet=="function"?WeakSet:Set,Hl=null;function ev(l,t){if(l=l.containerInfo,Wf=Bn,l=s0(l),bi(l)){if("selectionStart"in l)var a={start:l.selectionStart,end:l.selectionEnd};else l:{a=(a=l.ownerDocument)&&a.defaultView||window;var u=a.getSelection&&a.getSelection();if(u&&u.rangeCount!==0){a=u.anchorNode;var e=u.anchorOffset,n=u.focusNode;u=u.focusOffset;try{a.nodeType,n.nodeType}catch{a=null;break l}var i=0,f=-1,c=-1,y=0,g=0,z=l,h=null;t:for(;;){for(var r;z!==a||e!==0&&z.nodeType!==3||(f=i+e),z!==n||u!==0&&z.nodeType!==3||(c=i+u),z.nodeType===3&&(i+=z.nodeValue.length),(r=z.firstChild)!==null;)h=z,z=r;for(;;){if(z===l)break t;if(h===a&&++y===e&&(f=i),h===n&&++g===u&&(c=i),(r=z.nextSibling)!==null)break;z=h,h=z.parentNode}z=r}a=f===-1||c===-1?null:{start:f,end:c}}else a=null}a=a||{start:0,end:0}}else a=null;for($f={focusedElem:l,selectionRange:a},Bn=!1,Hl=t;Hl!==null;)if(t=Hl,l=t.child,(t.subtreeFlags&1028)!==0&&l!==null)l.return=t,Hl=l;else for(;Hl!==null;){switch(t=Hl,n=t.alternate,l=t.flags,t.tag){case 0:if((l&4)!==0&&(l=t.updateQueue,l=l!==null?l.events:null,l!==null))for(a=0;a<l.length;a++)e=l[a],e.ref.impl=e.nextImpl;break;case 11:case 15:break;case 1:if((l&1024)!==0&&n!==null){l=void 0,a=t,e=n.memoizedProps,n=n.memoizedState,u=a.stateNode;try{var _=Qa(a.type,e);l=u.getSnapshotBeforeUpdate(_,n),u.__reactInternalSnapshotBeforeUpdate=l}catch(j){il(a,a.return,j)}}break;case 3:if((l&1024)!==0){if(l=t.stateNode.containerInfo,a=l.nodeType,a===9)If(l);else if(a===1)switch(l.nodeName){case"HEAD":case"HTML":case"BODY":If(l);break;default:l.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((l&1024)!==0)throw Error(m(163))}if(l=t.sibling,l!==null){l.return=t.return,Hl=l;break}Hl=t.return}}function Is(l,t,a){var u=a.flags;switch(a.tag){case 0:case 11:case 15:wt(l,a),u&4&&ie(5,a);break;case 1:if(wt(l,a),u&4)if(l=a.stateNode,t===null)try{l.componentDidMount()}catch(i){il(a,a.return,i)}else{var e=Qa(a.type,t.memoizedProps);t=t.memoizedState;try{l.componentDidUpdate(e,t,l.__reactInternalSnapshotBeforeUpdate)}catch(i){il(a,a.return,i)}}u&64&&Js(a),u&512&&fe(a,a.return);break;case 3:if(wt(l,a),u&64&&(l=a.updateQueue,l!==null)){if(t=null,a.child!==null)switch(a.child.tag){case 27:case 5:t=a.child.stateNode;break;case 1:t=a.child.stateNode}try{q0(l,t)}catch(i){il(a,a.return,i)}}break;case 27:t===null&&u&4&&ks(a);case 26:case 5:wt(l,a),t===null&&u&4&&Ws(a),u&512&&fe(a,a.return);break;case 12:wt(l,a);break;case 31:wt(l,a),u&4&&to(l,a);break;case 13:wt(l,a),u&4&&ao(l,a),u&64&&(l=a.memoizedState,l!==null&&(l=l.dehydrated,l!==null&&(a=vv.bind(null,a),Rv(l,a))));break;case 22:if(u=a.memoizedState!==null||Kt,!u){t=t!==null&&t.memoizedState!==null||_l,e=Kt;var n=_l;Kt=u,(_l=t)&&!n?Wt(l,a,(a.subtreeFlags&8772)!==0):wt(l,a),Kt=e,_l=n}break;case 30:break;default:wt(l,a)}}function Ps(l){var t=l.alternate;t!==null&&(l.alternate=null,Ps(t)),l.child=null,l.deletions=null,l.sibling=null,l.tag===5&&(t=l.stateNode,t!==null&&ai(t)),l.stateNode=null,l.return=null,l.dependencies=null,l.memoizedProps=null,l.memoizedState=null,l.pendingProps=null,l.stateNode=null,l.updateQueue=null}var hl=null,Il=!1;function Jt(l,t,a){for(a=a.child;a!==null;)lo(l,t,a),a=a.sibling}function lo(l,t,a){if(et&&typeof et.onCommitFiberUnmount=="function")try{et.onCommitFiberUnmount(Hu,a)}catch{}switch(a.tag){case 26:_l||Ht(a,t),Jt(l,t,a),a.memoizedState?a.memoizedState.count--:a.stateNode&&(a=a.stateNode,a.parentNode.removeChild(a));break;case 27:_l||Ht(a,t);var u=hl,e=Il;ga(a.type)&&(hl=a.stateNode,Il=!1),Jt(l,t,a),re(a.stateNode),hl=u,Il=e;break;case 5:_l||Ht(a,t);case 6:if(u=hl,e=Il,hl=null,Jt(l,t,a),hl=u,Il=e,hl!==null)if(Il)try{(hl.nodeType===9?hl.body:hl.nodeName==="HTML"?hl.ownerDocument.body:hl).removeChild(a.stateNode)}catch(n){il(a,t,n)}else try{hl.removeChild(a.stateNode)}catch(n){il(a,t,n)}break;case 18:hl!==null&&(Il?(l=hl,wo(l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l,a.stateNode),Du(l)):wo(hl,a.stateNode));break;case 4:u=hl,e=Il,hl=a.stateNode.containerInfo,Il=!0,Jt(l,t,a),hl=u,Il=e;break;case 0:case 11:case 14:case 15:oa(2,a,t),_l||oa(4,a,t),Jt(l,t,a);break;case 1:_l||(Ht(a,t),u=a.stateNode,typeof u.componentWillUnmount=="function"&&ws(a,t,u)),Jt(l,t,a);break;case 21:Jt(l,t,a);break;case 22:_l=(u=_l)||a.memoizedState!==null,Jt(l,t,a),_l=u;break;default:Jt(l,t,a)}}function to(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null))){l=l.dehydrated;try{Du(l)}catch(a){il(t,t.return,a)}}}function ao(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null&&(l=l.dehydrated,l!==null))))try{Du(l)}catch(a){il(t,t.return,a)}}function nv(l){switch(l.tag){case 31:case 13:case 19:var t=l.stateNode;return t===null&&(t=l.stateNode=new Fs),t;case 22:return l=l.stateNode,t=l._retryCache,t===null&&(t=l._retryCache=new Fs),t;default:throw Error(m(435,l.tag))}}function gn(l,t){var a=nv(l);t.forEach(function(u){if(!a.has(u)){a.add(u);var e=yv.bind(null,l,u);u.then(e,e)}})}function Pl(l,t){var a=t.deletions;if(a!==null)for(var u=0;u<a.length;u++){var e=a[u],n=l,i=t,f=i;l:for(;f!==null;){switch(f.tag){case 27:if(ga(f.type)){hl=f.stateNode,Il=!1;break l}break;case 5:hl=f.stateNode,Il=!1;break l;case 3:case 4:hl=f.stateNode.containerInfo,Il=!0;break l}f=f.return}if(hl===null)throw Error(m(160));lo(n,i,e),hl=null,Il=!1,n=e.alternate,n!==null&&(n.return=null),e.return=null}if(t.subtreeFlags&13886)for(t=t.child;t!==null;)uo(t,l),t=t.sibling}var Ot=null;function uo(l,t){var a=l.alternate,u=l.flags;switch(l.tag){case 0:case 11:case 14:case 15:Pl(t,l),lt(l),u&4&&(oa(3,l,l.return),ie(3,l),oa(5,l,l.return));break;case 1:Pl(t,l),lt(l),u&512&&(_l||a===null||Ht(a,a.return)),u&64&&Kt&&(l=l.updateQueue,l!==null&&(u=l.callbacks,u!==null&&(a=l.shared.hiddenCallbacks,l.shared.hiddenCallbacks=a===null?u:a.concat(u))));break;case 26:var e=Ot;if(Pl(t,l),lt(l),u&512&&(_l||a===null||Ht(a,a.return)),u&4){var n=a!==null?a.memoizedState:null;if(u=l.memoizedState,a===null)if(u===null)if(l.stateNode===null){l:{u=l.type,a=l.memoizedProps,e=e.ownerDocument||e;t:switch(u){case"title":n=e.getElementsByTagName("title")[0],(!n||n[Cu]||n[Rl]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=e.createElement(u),e.head.insertBefore(n,e.querySelector("head > title"))),Bl(n,u,a),n[Rl]=l,Ul(n),u=n;break l;case"link":var i=ed("link","href",e).get(u+(a.href||""));if(i){for(var f=0;f<i.length;f++)if(n=i[f],n.getAttribute("href")===(a.href==null||a.href===""?null:a.href)&&n.getAttribute("rel")===(a.rel==null?null:a.rel)&&n.getAttribute("title")===(a.title==null?null:a.title)&&n.getAttribute("crossorigin")===(a.crossOrigin==null?null:a.crossOrigin)){i.splice(f,1);break t}}n=e.createElement(u),Bl(n,u,a),e.head.appendChild(n);break;case"meta":if(i=ed("meta","content",e).get(u+(a.content||""))){for(f=0;f<i.length;f++)if(n=i[f],n.getAttribute("content")===(a.content==null?null:""+a.content)&&n.getAttribute("name")===(a.name==null?null:a.name)&&n.getAttribute("property")===(a.property==null?null:a.property)&&n.getAttribute("http-equiv")===(a.httpEquiv==null?null:a.httpEquiv)&&n.getAttribute("charset")===(a.charSet==null?null:a.charSet)){i.splice(f,1);break t}}n=e.createElement(u),Bl(n,u,a),e.head.appendChild(n);break;default:throw Error(m(468,u))}n[Rl]=l,Ul(n),u=n}l.stateNode=u}else nd(e,l.type,l.stateNode);else l.stateNode=ud(e,u,l.memoizedProps);else n!==u?(n===null?a.stateNode!==null&&(a=a.stateNode,a.parentNode.removeChild(a)):n.count--,u===null?nd(e,l.type,l.stateNode):ud(e,u,l.memoizedProps)):u===null&&l.stateNode!==null&&Af(l,l.memoizedProps,a.memoizedProps)}break;case 27:Pl(t,l),lt(l),u&512&&(_l||a===null||Ht(a,a.return)),a!==null&&u&4&&Af(l,l.memoizedProps,a.memoizedProps);break;case 5:if(Pl(t,l),lt(l),u&512&&(_l||a===null||Ht(a,a.return)),l.flags&32){e=l.stateNode;try{Fa(e,"")}catch(_){il(l,l.return,_)}}u&4&&l.stateNode!=null&&(e=l.memoizedProps,Af(l,e,a!==null?a.memoizedProps:e)),u&1024&&(Mf=!0);break;case 6:if(Pl(t,l),lt(l),u&4){if(l.stateNode===null)throw Error(m(162));u=l.memoizedProps,a=l.stateNode;try{a.nodeValue=u}catch(_){il(l,l.return,_)}}break;case 3:if(Rn=null,e=Ot,Ot=Hn(t.containerInfo),Pl(t,l),Ot=e,lt(l),u&4&&a!==null&&a.memoizedState.isDehydrated)try{Du(t.containerInfo)}catch(_){il(l,l.return,_)}Mf&&(Mf=!1,eo(l));break;case 4:u=Ot,Ot=Hn(l.stateNode.containerInfo),Pl(t,l),lt(l),Ot=u;break;case 12:Pl(t,l),lt(l);break;case 31:Pl(t,l),lt(l),u&4&&(u=l.updateQueue,u!==null&&(l.updateQueue=null,gn(l,u)));break;case 13:Pl(t,l),lt(l),l.child.flags&8192&&l.memoizedState!==null!=(a!==null&&a.memoizedState!==null)&&(bn=ut()),u&4&&(u=l.updateQueue,u!==null&&(l.updateQueue=null,gn(l,u)));break;case 22:e=l.memoizedState!==null;var c=a!==null&&a.memoizedState!==null,y=Kt,g=_l;if(Kt=y||e,_l=g||c,Pl(t,l),_l=g,Kt=y,lt(l),u&8192)l:for(t=l.stateNode,t._visibility=e?t._visibility&-2:t._visibility|1,e&&(a===null||c||Kt||_l||Xa(l)),a=null,t=l;;){if(t.tag===5||t.tag===26){if(a===null){c=a=t;try{if(n=c.stateNode,e)i=n.style,typeof i.setProperty=="function"?i.setProperty("display","none","important"):i.display="none";else{f=c.stateNode;var z=c.memoizedProps.style,h=z!=null&&z.hasOwnProperty("display")?z.display:null;f.style.display=h==null||typeof h=="boolean"?"":(""+h).trim()}}catch(_){il(c,c.return,_)}}}else if(t.tag===6){if(a===null){c=t;try{c.stateNode.nodeValue=e?"":c.memoizedProps}catch(_){il(c,c.return,_)}}}else if(t.tag===18){if(a===null){c=t;try{var r=c.stateNode;e?Wo(r,!0):Wo(c.stateNode,!1)}catch(_){il(c,c.return,_)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===l)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break l;for(;t.sibling===null;){if(t.return===null||t.return===l)break l;a===t&&(a=null),t=t.return}a===t&&(a=null),t.sibling.return=t.return,t=t.sibling}u&4&&(u=l.updateQueue,u!==null&&(a=u.retryQueue,a!==null&&(u.retryQueue=null,gn(l,a))));break;case 19:Pl(t,l),lt(l),u&4&&(u=l.updateQueue,u!==null&&(l.updateQueue=null,gn(l,u)));break;case 30:break;case 21:break;default:Pl(t,l),lt(l)}}function lt(l){var t=l.flags;if(t&2){try{for(var a,u=l.return;u!==null;){if($s(u)){a=u;break}u=u.return}if(a==null)throw Error(m(160));switch(a.tag){case 27:var e=a.stateNode,n=Of(l);rn(l,n,e);break;case 5:var i=a.stateNode;a.flags&32&&(Fa(i,""),a.flags&=-33);var f=Of(l);rn(l,f,i);break;case 3:case 4:var c=a.stateNode.containerInfo,y=Of(l);_f(l,y,c);break;default:throw Error(m(161))}}catch(g){il(l,l.return,g)}l.flags&=-3}t&4096&&(l.flags&=-4097)}function eo(l){if(l.subtreeFlags&1024)for(l=l.child;l!==null;){var t=l;eo(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),l=l.sibling}}function wt(l,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)Is(l,t.alternate,t),t=t.sibling}function Xa(l){for(l=l.child;l!==null;){var t=l;switch(t.tag){case 0:case 11:case 14:case 15:oa(4,t,t.return),Xa(t);break;case 1:Ht(t,t.return);var a=t.stateNode;typeof a.componentWillUnmount=="function"&&ws(t,t.return,a),Xa(t);break;case 27:re(t.stateNode);case 26:case 5:Ht(t,t.return),Xa(t);break;case 22:t.memoizedState===null&&Xa(t);break;case 30:Xa(t);break;default:Xa(t)}l=l.sibling}}function Wt(l,t,a){for(a=a&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var u=t.alternate,e=l,n=t,i=n.flags;switch(n.tag){case 0:case 11:case 15:Wt(e,n,a),ie(4,n);break;case 1:if(Wt(e,n,a),u=n,e=u.stateNode,typeof e.componentDidMount=="function")try{e.componentDidMount()}catch(y){il(u,u.return,y)}if(u=n,e=u.updateQueue,e!==null){var f=u.stateNode;try{var c=e.shared.hiddenCallbacks;if(c!==null)for(e.shared.hiddenCallbacks=null,e=0;e<c.length;e++)j0(c[e],f)}catch(y){il(u,u.return,y)}}a&&i&64&&Js(n),fe(n,n.return);break;case 27:ks(n);case 26:case 5:Wt(e,n,a),a&&u===null&&i&4&&Ws(n),fe(n,n.return);break;case 12:Wt(e,n,a);break;case 31:Wt(e,n,a),a&&i&4&&to(e,n);break;case 13:Wt(e,n,a),a&&i&4&&ao(e,n);break;case 22:n.memoizedState===null&&Wt(e,n,a),fe(n,n.return);break;case 30:break;default:Wt(e,n,a)}t=t.sibling}}function Df(l,t){var a=null;l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),l=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(l=t.memoizedState.cachePool.pool),l!==a&&(l!=null&&l.refCount++,a!=null&&wu(a))}function xf(l,t){l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&wu(l))}function _t(l,t,a,u){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)no(l,t,a,u),t=t.sibling}function no(l,t,a,u){var e=t.flags;switch(t.tag){case 0:case 11:case 15:_t(l,t,a,u),e&2048&&ie(9,t);break;case 1:_t(l,t,a,u);break;case 3:_t(l,t,a,u),e&2048&&(l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&wu(l)));break;case 12:if(e&2048){_t(l,t,a,u),l=t.stateNode;try{var n=t.memoizedProps,i=n.id,f=n.onPostCommit;typeof f=="function"&&f(i,t.alternate===null?"mount":"update",l.passiveEffectDuration,-0)}catch(c){il(t,t.return,c)}}else _t(l,t,a,u);break;case 31:_t(l,t,a,u);break;case 13:_t(l,t,a,u);break;case 23:break;case 22:n=t.stateNode,i=t.alternate,t.memoizedState!==null?n._visibility&2?_t(l,t,a,u):ce(l,t):n._visibility&2?_t(l,t,a,u):(n._visibility|=2,gu(l,t,a,u,(t.subtreeFlags&10256)!==0||!1)),e&2048&&Df(i,t);break;case 24:_t(l,t,a,u),e&2048&&xf(t.alternate,t);break;default:_t(l,t,a,u)}}function gu(l,t,a,u,e){for(e=e&&((t.subtreeFlags&10256)!==0||!1),t=t.child;t!==null;){var n=l,i=t,f=a,c=u,y=i.flags;switch(i.tag){case 0:case 11:case 15:gu(n,i,f,c,e),ie(8,i);break;case 23:break;case 22:var g=i.stateNode;i.memoizedState!==null?g._visibility&2?gu(n,i,f,c,e):ce(n,i):(g._visibility|=2,gu(n,i,f,c,e)),e&&y&2048&&Df(i.alternate,i);break;case 24:gu(n,i,f,c,e),e&&y&2048&&xf(i.alternate,i);break;default:gu(n,i,f,c,e)}t=t.sibling}}function ce(l,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var a=l,u=t,e=u.flags;switch(u.tag){case 22:ce(a,u),e&2048&&Df(u.alternate,u);break;case 24:ce(a,u),e&2048&&xf(u.alternate,u);break;default:ce(a,u)}t=t.sibling}}var se=8192;function Su(l,t,a){if(l.subtreeFlags&se)for(l=l.child;l!==null;)io(l,t,a),l=l.sibling}function io(l,t,a){switch(l.tag){case 26:Su(l,t,a),l.flags&se&&l.memoizedState!==null&&Kv(a,Ot,l.memoizedState,l.memoizedProps);break;case 5:Su(l,t,a);break;case 3:case 4:var u=Ot;Ot=Hn(l.stateNode.containerInfo),Su(l,t,a),Ot=u;break;case 22:l.memoizedState===null&&(u=l.alternate,u!==null&&u.memoizedState!==null?(u=se,se=16777216,Su(l,t,a),se=u):Su(l,t,a));break;default:Su(l,t,a)}}function fo(l){var t=l.alternate;if(t!==null&&(l=t.child,l!==null)){t.child=null;do t=l.sibling,l.sibling=null,l=t;while(l!==null)}}function oe(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var u=t[a];Hl=u,so(u,l)}fo(l)}if(l.subtreeFlags&10256)for(l=l.child;l!==null;)co(l),l=l.sibling}function co(l){switch(l.tag){case 0:case 11:case 15:oe(l),l.flags&2048&&oa(9,l,l.return);break;case 3:oe(l);break;case 12:oe(l);break;case 22:var t=l.stateNode;l.memoizedState!==null&&t._visibility&2&&(l.return===null||l.return.tag!==13)?(t._visibility&=-3,Sn(l)):oe(l);break;default:oe(l)}}function Sn(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var u=t[a];Hl=u,so(u,l)}fo(l)}for(l=l.child;l!==null;){switch(t=l,t.tag){case 0:case 11:case 15:oa(8,t,t.return),Sn(t);break;case 22:a=t.stateNode,a._visibility&2&&(a._visibility&=-3,Sn(t));break;default:Sn(t)}l=l.sibling}}function so(l,t){for(;Hl!==null;){var a=Hl;switch(a.tag){case 0:case 11:case 15:oa(8,a,t);break;case 23:case 22:if(a.memoizedState!==null&&a.memoizedState.cachePool!==null){var u=a.memoizedState.cachePool.pool;u!=null&&u.refCount++}break;case 24:wu(a.memoizedState.cache)}if(u=a.child,u!==null)u.return=a,Hl=u;else l:for(a=l;Hl!==null;){u=Hl;var e=u.sibling,n=u.return;if(Ps(u),u===a){Hl=null;break l}if(e!==null){e.return=n,Hl=e;break l}Hl=n}}}var iv={getCacheForType:function(l){var t=jl(El),a=t.data.get(l);return a===void 0&&(a=l(),t.data.set(l,a)),a},cacheSignal:function(){return jl(El).controller.signal}},fv=typeof WeakMap=="function"?WeakMap:Map,ul=0,ml=null,w=null,$=0,nl=0,ot=null,da=!1,bu=!1,Uf=!1,$t=0,bl=0,ma=0,Za=0,Hf=0,dt=0,pu=0,de=null,tt=null,Nf=!1,bn=0,oo=0,pn=1/0,zn=null,va=null,Ml=0,ya=null,zu=null,kt=0,Rf=0,Cf=null,mo=null,me=0,jf=null;function mt(){return(ul&2)!==0&&$!==0?$&-$:S.T!==null?Xf():Mc()}function vo(){if(dt===0)if(($&536870912)===0||F){var l=De;De<<=1,(De&3932160)===0&&(De=262144),dt=l}else dt=536870912;return l=ct.current,l!==null&&(l.flags|=32),dt}function at(l,t,a){(l===ml&&(nl===2||nl===9)||l.cancelPendingCommit!==null)&&(Tu(l,0),ha(l,$,dt,!1)),Ru(l,a),((ul&2)===0||l!==ml)&&(l===ml&&((ul&2)===0&&(Za|=a),bl===4&&ha(l,$,dt,!1)),Nt(l))}function yo(l,t,a){if((ul&6)!==0)throw Error(m(327));var u=!a&&(t&127)===0&&(t&l.expiredLanes)===0||Nu(l,t),e=u?ov(l,t):Bf(l,t,!0),n=u;do{if(e===0){bu&&!u&&ha(l,t,0,!1);break}else{if(a=l.current.alternate,n&&!cv(a)){e=Bf(l,t,!1),n=!1;continue}if(e===2){if(n=t,l.errorRecoveryDisabledLanes&n)var i=0;else i=l.pendingLanes&-536870913,i=i!==0?i:i&536870912?536870912:0;if(i!==0){t=i;l:{var f=l;e=de;var c=f.current.memoizedState.isDehydrated;if(c&&(Tu(f,i).flags|=256),i=Bf(f,i,!1),i!==2){if(Uf&&!c){f.errorRecoveryDisabledLanes|=n,Za|=n,e=4;break l}n=tt,tt=e,n!==null&&(tt===null?tt=n:tt.push.apply(tt,n))}e=i}if(n=!1,e!==2)continue}}if(e===1){Tu(l,0),ha(l,t,0,!0);break}l:{switch(u=l,n=e,n){case 0:case 1:throw Error(m(345));case 4:if((t&4194048)!==t)break;case 6:ha(u,t,dt,!da);break l;case 2:tt=null;break;case 3:case 5:break;default:throw Error(m(329))}if((t&62914560)===t&&(e=bn+300-ut(),10<e)){if(ha(u,t,dt,!da),Ue(u,0,!0)!==0)break l;kt=t,u.timeoutHandle=Ko(ho.bind(null,u,a,tt,zn,Nf,t,dt,Za,pu,da,n,"Throttled",-0,0),e);break l}ho(u,a,tt,zn,Nf,t,dt,Za,pu,da,n,null,-0,0)}}break}while(!0);Nt(l)}function ho(l,t,a,u,e,n,i,f,c,y,g,z,h,r){if(l.timeoutHandle=-1,z=t.subtreeFlags,z&8192||(z&16785408)===16785408){z={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:jt},io(t,n,z);var _=(n&62914560)===n?bn-ut():(n&4194048)===n?oo-ut():0;if(_=Jv(z,_),_!==null){kt=n,l.cancelPendingCommit=_(Eo.bind(null,l,t,n,a,u,e,i,f,c,g,z,null,h,r)),ha(l,n,i,!y);return}}Eo(l,t,n,a,u,e,i,f,c)}function cv(l){for(var t=l;;){var a=t.tag;if((a===0||a===11||a===15)&&t.flags&16384&&(a=t.updateQueue,a!==null&&(a=a.stores,a!==null)))for(var u=0;u<a.length;u++){var e=a[u],n=e.getSnapshot;e=e.value;try{if(!it(n(),e))return!1}catch{return!1}}if(a=t.child,t.subtreeFlags&16384&&a!==null)a.return=t,t=a;else{if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function ha(l,t,a,u){t&=~Hf,t&=~Za,l.suspendedLanes|=t,l.pingedLanes&=~t,u&&(l.warmLanes|=t),u=l.expirationTimes;for(var e=t;0<e;){var n=31-nt(e),i=1<<n;u[n]=-1,e&=~i}a!==0&&Ac(l,a,t)}function Tn(){return(ul&6)===0?(ve(0),!1):!0}function qf(){if(w!==null){if(nl===0)var l=w.return;else l=w,Gt=Ra=null,Fi(l),mu=null,$u=0,l=w;for(;l!==null;)Ks(l.alternate,l),l=l.return;w=null}}function Tu(l,t){var a=l.timeoutHandle;a!==-1&&(l.timeoutHandle=-1,Dv(a)),a=l.cancelPendingCommit,a!==null&&(l.cancelPendingCommit=null,a()),kt=0,qf(),ml=l,w=a=Bt(l.current,null),$=t,nl=0,ot=null,da=!1,bu=Nu(l,t),Uf=!1,pu=dt=Hf=Za=ma=bl=0,tt=de=null,Nf=!1,(t&8)!==0&&(t|=t&32);var u=l.entangledLanes;if(u!==0)for(l=l.entanglements,u&=t;0<u;){var e=31-nt(u),n=1<<e;t|=l[e],u&=~n}return $t=t,Ze(),a}function ro(l,t){X=null,S.H=ue,t===du||t===ke?(t=H0(),nl=3):t===Gi?(t=H0(),nl=4):nl=t===yf?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,ot=t,w===null&&(bl=1,dn(l,rt(t,l.current)))}function go(){var l=ct.current;return l===null?!0:($&4194048)===$?pt===null:($&62914560)===$||($&536870912)!==0?l===pt:!1}function So(){var l=S.H;return S.H=ue,l===null?ue:l}function bo(){var l=S.A;return S.A=iv,l}function En(){bl=4,da||($&4194048)!==$&&ct.current!==null||(bu=!0),(ma&134217727)===0&&(Za&134217727)===0||ml===null||ha(ml,$,dt,!1)}function Bf(l,t,a){var u=ul;ul|=2;var e=So(),n=bo();(ml!==l||$!==t)&&(zn=null,Tu(l,t)),t=!1;var i=bl;l:do try{if(nl!==0&&w!==null){var f=w,c=ot;switch(nl){case 8:qf(),i=6;break l;case 3:case 2:case 9:case 6:ct.current===null&&(t=!0);var y=nl;if(nl=0,ot=null,Eu(l,f,c,y),a&&bu){i=0;break l}break;default:y=nl,nl=0,ot=null,Eu(l,f,c,y)}}sv(),i=bl;break}catch(g){ro(l,g)}while(!0);return t&&l.shellSuspendCounter++,Gt=Ra=null,ul=u,S.H=e,S.A=n,w===null&&(ml=null,$=0,Ze()),i}function sv(){for(;w!==null;)po(w)}function ov(l,t){var a=ul;ul|=2;var u=So(),e=bo();ml!==l||$!==t?(zn=null,pn=ut()+500,Tu(l,t)):bu=Nu(l,t);l:do try{if(nl!==0&&w!==null){t=w;var n=ot;t:switch(nl){case 1:nl=0,ot=null,Eu(l,t,n,1);break;case 2:case 9:if(x0(n)){nl=0,ot=null,zo(t);break}t=function(){nl!==2&&nl!==9||ml!==l||(nl=7),Nt(l)},n.then(t,t);break l;case 3:nl=7;break l;case 4:nl=5;break l;case 7:x0(n)?(nl=0,ot=null,zo(t)):(nl=0,ot=null,Eu(l,t,n,7));break;case 5:var i=null;switch(w.tag){case 26:i=w.memoizedState;case 5:case 27:var f=w;if(i?id(i):f.stateNode.complete){nl=0,ot=null;var c=f.sibling;if(c!==null)w=c;else{var y=f.return;y!==null?(w=y,An(y)):w=null}break t}}nl=0,ot=null,Eu(l,t,n,5);break;case 6:nl=0,ot=null,Eu(l,t,n,6);break;case 8:qf(),bl=6;break l;default:throw Error(m(462))}}dv();break}catch(g){ro(l,g)}while(!0);return Gt=Ra=null,S.H=u,S.A=e,ul=a,w!==null?0:(ml=null,$=0,Ze(),bl)}function dv(){for(;w!==null&&!Cd();)po(w)}function po(l){var t=Vs(l.alternate,l,$t);l.memoizedProps=l.pendingProps,t===null?An(l):w=t}function zo(l){var t=l,a=t.alternate;switch(t.tag){case 15:case 0:t=Bs(a,t,t.pendingProps,t.type,void 0,$);break;case 11:t=Bs(a,t,t.pendingProps,t.type.render,t.ref,$);break;case 5:Fi(t);default:Ks(a,t),t=w=S0(t,$t),t=Vs(a,t,$t)}l.memoizedProps=l.pendingProps,t===null?An(l):w=t}function Eu(l,t,a,u){Gt=Ra=null,Fi(t),mu=null,$u=0;var e=t.return;try{if(Pm(l,e,t,a,$)){bl=1,dn(l,rt(a,l.current)),w=null;return}}catch(n){if(e!==null)throw w=e,n;bl=1,dn(l,rt(a,l.current)),w=null;return}t.flags&32768?(F||u===1?l=!0:bu||($&536870912)!==0?l=!1:(da=l=!0,(u===2||u===9||u===3||u===6)&&(u=ct.current,u!==null&&u.tag===13&&(u.flags|=16384))),To(t,l)):An(t)}function An(l){var t=l;do{if((t.flags&32768)!==0){To(t,da);return}l=t.return;var a=av(t.alternate,t,$t);if(a!==null){w=a;return}if(t=t.sibling,t!==null){w=t;return}w=t=l}while(t!==null);bl===0&&(bl=5)}function To(l,t){do{var a=uv(l.alternate,l);if(a!==null){a.flags&=32767,w=a;return}if(a=l.return,a!==null&&(a.flags|=32768,a.subtreeFlags=0,a.deletions=null),!t&&(l=l.sibling,l!==null)){w=l;return}w=l=a}while(l!==null);bl=6,w=null}function Eo(l,t,a,u,e,n,i,f,c){l.cancelPendingCommit=null;do On();while(Ml!==0);if((ul&6)!==0)throw Error(m(327));if(t!==null){if(t===l.current)throw Error(m(177));if(n=t.lanes|t.childLanes,n|=Ai,Ld(l,a,n,i,f,c),l===ml&&(w=ml=null,$=0),zu=t,ya=l,kt=a,Rf=n,Cf=e,mo=u,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(l.callbackNode=null,l.callbackPriority=0,hv(_e,function(){return Do(),null})):(l.callbackNode=null,l.callbackPriority=0),u=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||u){u=S.T,S.T=null,e=A.p,A.p=2,i=ul,ul|=4;try{ev(l,t,a)}finally{ul=i,A.p=e,S.T=u}}Ml=1,Ao(),Oo(),_o()}}function Ao(){if(Ml===1){Ml=0;var l=ya,t=zu,a=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||a){a=S.T,S.T=null;var u=A.p;A.p=2;var e=ul;ul|=4;try{uo(t,l);var n=$f,i=s0(l.containerInfo),f=n.focusedElem,c=n.selectionRange;if(i!==f&&f&&f.ownerDocument&&c0(f.ownerDocument.documentElement,f)){if(c!==null&&bi(f)){var y=c.start,g=c.end;if(g===void 0&&(g=y),"selectionStart"in f)f.selectionStart=y,f.selectionEnd=Math.min(g,f.value.length);else{var z=f.ownerDocument||document,h=z&&z.defaultView||window;if(h.getSelection){var r=h.getSelection(),_=f.textContent.length,j=Math.min(c.start,_),ol=c.end===void 0?j:Math.min(c.end,_);!r.extend&&j>ol&&(i=ol,ol=j,j=i);var d=f0(f,j),s=f0(f,ol);if(d&&s&&(r.rangeCount!==1||r.anchorNode!==d.node||r.anchorOffset!==d.offset||r.focusNode!==s.node||r.focusOffset!==s.offset)){var v=z.createRange();v.setStart(d.node,d.offset),r.removeAllRanges(),j>ol?(r.addRange(v),r.extend(s.node,s.offset)):(v.setEnd(s.node,s.offset),r.addRange(v))}}}}for(z=[],r=f;r=r.parentNode;)r.nodeType===1&&z.push({element:r,left:r.scrollLeft,top:r.scrollTop});for(typeof f.focus=="function"&&f.focus(),f=0;f<z.length;f++){var b=z[f];b.element.scrollLeft=b.left,b.element.scrollTop=b.top}}Bn=!!Wf,$f=Wf=null}finally{ul=e,A.p=u,S.T=a}}l.current=t,Ml=2}}function Oo(){if(Ml===2){Ml=0;var l=ya,t=zu,a=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||a){a=S.T,S.T=null;var u=A.p;A.p=2;var e=ul;ul|=4;try{Is(l,t.alternate,t)}finally{ul=e,A.p=u,S.T=a}}Ml=3}}function _o(){if(Ml===4||Ml===3){Ml=0,jd();var l=ya,t=zu,a=kt,u=mo;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?Ml=5:(Ml=0,zu=ya=null,Mo(l,l.pendingLanes));var e=l.pendingLanes;if(e===0&&(va=null),li(a),t=t.stateNode,et&&typeof et.onCommitFiberRoot=="function")try{et.onCommitFiberRoot(Hu,t,void 0,(t.current.flags&128)===128)}catch{}if(u!==null){t=S.T,e=A.p,A.p=2,S.T=null;try{for(var n=l.onRecoverableError,i=0;i<u.length;i++){var f=u[i];n(f.value,{componentStack:f.stack})}}finally{S.T=t,A.p=e}}(kt&3)!==0&&On(),Nt(l),e=l.pendingLanes,(a&261930)!==0&&(e&42)!==0?l===jf?me++:(me=0,jf=l):me=0,ve(0)}}function Mo(l,t){(l.pooledCacheLanes&=t)===0&&(t=l.pooledCache,t!=null&&(l.pooledCache=null,wu(t)))}function On(){return Ao(),Oo(),_o(),Do()}function Do(){if(Ml!==5)return!1;var l=ya,t=Rf;Rf=0;var a=li(kt),u=S.T,e=A.p;try{A.p=32>a?32:a,S.T=null,a=Cf,Cf=null;var n=ya,i=kt;if(Ml=0,zu=ya=null,kt=0,(ul&6)!==0)throw Error(m(331));var f=ul;if(ul|=4,co(n.current),no(n,n.current,i,a),ul=f,ve(0,!1),et&&typeof et.onPostCommitFiberRoot=="function")try{et.onPostCommitFiberRoot(Hu,n)}catch{}return!0}finally{A.p=e,S.T=u,Mo(l,t)}}function xo(l,t,a){t=rt(a,t),t=vf(l.stateNode,t,2),l=fa(l,t,2),l!==null&&(Ru(l,2),Nt(l))}function il(l,t,a){if(l.tag===3)xo(l,l,a);else for(;t!==null;){if(t.tag===3){xo(t,l,a);break}else if(t.tag===1){var u=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof u.componentDidCatch=="function"&&(va===null||!va.has(u))){l=rt(a,l),a=xs(2),u=fa(t,a,2),u!==null&&(Us(a,u,t,l),Ru(u,2),Nt(u));break}}t=t.return}}function Yf(l,t,a){var u=l.pingCache;if(u===null){u=l.pingCache=new fv;var e=new Set;u.set(t,e)}else e=u.get(t),e===void 0&&(e=new Set,u.set(t,e));e.has(a)||(Uf=!0,e.add(a),l=mv.bind(null,l,t,a),t.then(l,l))}function mv(l,t,a){var u=l.pingCache;u!==null&&u.delete(t),l.pingedLanes|=l.suspendedLanes&a,l.warmLanes&=~a,ml===l&&($&a)===a&&(bl===4||bl===3&&($&62914560)===$&&300>ut()-bn?(ul&2)===0&&Tu(l,0):Hf|=a,pu===$&&(pu=0)),Nt(l)}function Uo(l,t){t===0&&(t=Ec()),l=Ua(l,t),l!==null&&(Ru(l,t),Nt(l))}function vv(l){var t=l.memoizedState,a=0;t!==null&&(a=t.retryLane),Uo(l,a)}function yv(l,t){var a=0;switch(l.tag){case 31:case 13:var u=l.stateNode,e=l.memoizedState;e!==null&&(a=e.retryLane);break;case 19:u=l.stateNode;break;case 22:u=l.stateNode._retryCache;break;default:throw Error(m(314))}u!==null&&u.delete(t),Uo(l,a)}function hv(l,t){return kn(l,t)}var _n=null,Au=null,Gf=!1,Mn=!1,Qf=!1,ra=0;function Nt(l){l!==Au&&l.next===null&&(Au===null?_n=Au=l:Au=Au.next=l),Mn=!0,Gf||(Gf=!0,gv())}function ve(l,t){if(!Qf&&Mn){Qf=!0;do for(var a=!1,u=_n;u!==null;){if(l!==0){var e=u.pendingLanes;if(e===0)var n=0;else{var i=u.suspendedLanes,f=u.pingedLanes;n=(1<<31-nt(42|l)+1)-1,n&=e&~(i&~f),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(a=!0,Co(u,n))}else n=$,n=Ue(u,u===ml?n:0,u.cancelPendingCommit!==null||u.timeoutHandle!==-1),(n&3)===0||Nu(u,n)||(a=!0,Co(u,n));u=u.next}while(a);Qf=!1}}function rv(){Ho()}function Ho(){Mn=Gf=!1;var l=0;ra!==0&&Mv()&&(l=ra);for(var t=ut(),a=null,u=_n;u!==null;){var e=u.next,n=No(u,t);n===0?(u.next=null,a===null?_n=e:a.next=e,e===null&&(Au=a)):(a=u,(l!==0||(n&3)!==0)&&(Mn=!0)),u=e}Ml!==0&&Ml!==5||ve(l),ra!==0&&(ra=0)}function No(l,t){for(var a=l.suspendedLanes,u=l.pingedLanes,e=l.expirationTimes,n=l.pendingLanes&-62914561;0<n;){var i=31-nt(n),f=1<<i,c=e[i];c===-1?((f&a)===0||(f&u)!==0)&&(e[i]=Vd(f,t)):c<=t&&(l.expiredLanes|=f),n&=~f}if(t=ml,a=$,a=Ue(l,l===t?a:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),u=l.callbackNode,a===0||l===t&&(nl===2||nl===9)||l.cancelPendingCommit!==null)return u!==null&&u!==null&&Fn(u),l.callbackNode=null,l.callbackPriority=0;if((a&3)===0||Nu(l,a)){if(t=a&-a,t===l.callbackPriority)return t;switch(u!==null&&Fn(u),li(a)){case 2:case 8:a=zc;break;case 32:a=_e;break;case 268435456:a=Tc;break;default:a=_e}return u=Ro.bind(null,l),a=kn(a,u),l.callbackPriority=t,l.callbackNode=a,t}return u!==null&&u!==null&&Fn(u),l.callbackPriority=2,l.callbackNode=null,2}function Ro(l,t){if(Ml!==0&&Ml!==5)return l.callbackNode=null,l.callbackPriority=0,null;var a=l.callbackNode;if(On()&&l.callbackNode!==a)return null;var u=$;return u=Ue(l,l===ml?u:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),u===0?null:(yo(l,u,t),No(l,ut()),l.callbackNode!=null&&l.callbackNode===a?Ro.bind(null,l):null)}function Co(l,t){if(On())return null;yo(l,t,!0)}function gv(){xv(function(){(ul&6)!==0?kn(pc,rv):Ho()})}function Xf(){if(ra===0){var l=su;l===0&&(l=Me,Me<<=1,(Me&261888)===0&&(Me=256)),ra=l}return ra}function jo(l){return l==null||typeof l=="symbol"||typeof l=="boolean"?null:typeof l=="function"?l:Ce(""+l)}function qo(l,t){var a=t.ownerDocument.createElement("input");return a.name=t.name,a.value=t.value,l.id&&a.setAttribute("form",l.id),t.parentNode.insertBefore(a,t),l=new FormData(l),a.parentNode.removeChild(a),l}function Sv(l,t,a,u,e){if(t==="submit"&&a&&a.stateNode===e){var n=jo((e[kl]||null).action),i=u.submitter;i&&(t=(t=i[kl]||null)?jo(t.formAction):i.getAttribute("formAction"),t!==null&&(n=t,i=null));var f=new Ye("action","action",null,u,e);l.push({event:f,listeners:[{instance:null,listener:function(){if(u.defaultPrevented){if(ra!==0){var c=i?qo(e,i):new FormData(e);ff(a,{pending:!0,data:c,method:e.method,action:n},null,c)}}else typeof n=="function"&&(f.preventDefault(),c=i?qo(e,i):new FormData(e),ff(a,{pending:!0,data:c,method:e.method,action:n},n,c))},currentTarget:e}]})}}for(var Zf=0;Zf<Ei.length;Zf++){var Vf=Ei[Zf],bv=Vf.toLowerCase(),pv=Vf[0].toUpperCase()+Vf.slice(1);At(bv,"on"+pv)}At(m0,"onAnimationEnd"),At(v0,"onAnimationIteration"),At(y0,"onAnimationStart"),At("dblclick","onDoubleClick"),At("focusin","onFocus"),At("focusout","onBlur"),At(qm,"onTransitionRun"),At(Bm,"onTransitionStart"),At(Ym,"onTransitionCancel"),At(h0,"onTransitionEnd"),$a("onMouseEnter",["mouseout","mouseover"]),$a("onMouseLeave",["mouseout","mouseover"]),$a("onPointerEnter",["pointerout","pointerover"]),$a("onPointerLeave",["pointerout","pointerover"]),_a("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),_a("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),_a("onBeforeInput",["compositionend","keypress","textInput","paste"]),_a("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),_a("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),_a("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var ye="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),zv=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(ye));function Bo(l,t){t=(t&4)!==0;for(var a=0;a<l.length;a++){var u=l[a],e=u.event;u=u.listeners;l:{var n=void 0;if(t)for(var i=u.length-1;0<=i;i--){var f=u[i],c=f.instance,y=f.currentTarget;if(f=f.listener,c!==n&&e.isPropagationStopped())break l;n=f,e.currentTarget=y;try{n(e)}catch(g){Xe(g)}e.currentTarget=null,n=c}else for(i=0;i<u.length;i++){if(f=u[i],c=f.instance,y=f.currentTarget,f=f.listener,c!==n&&e.isPropagationStopped())break l;n=f,e.currentTarget=y;try{n(e)}catch(g){Xe(g)}e.currentTarget=null,n=c}}}}function W(l,t){var a=t[ti];a===void 0&&(a=t[ti]=new Set);var u=l+"__bubble";a.has(u)||(Yo(t,l,2,!1),a.add(u))}function Lf(l,t,a){var u=0;t&&(u|=4),Yo(a,l,u,t)}var Dn="_reactListening"+Math.random().toString(36).slice(2);function Kf(l){if(!l[Dn]){l[Dn]=!0,Uc.forEach(function(a){a!=="selectionchange"&&(zv.has(a)||Lf(a,!1,l),Lf(a,!0,l))});var t=l.nodeType===9?l:l.ownerDocument;t===null||t[Dn]||(t[Dn]=!0,Lf("selectionchange",!1,t))}}function Yo(l,t,a,u){switch(vd(t)){case 2:var e=$v;break;case 8:e=kv;break;default:e=ic}a=e.bind(null,t,a,l),e=void 0,!oi||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(e=!0),u?e!==void 0?l.addEventListener(t,a,{capture:!0,passive:e}):l.addEventListener(t,a,!0):e!==void 0?l.addEventListener(t,a,{passive:e}):l.addEventListener(t,a,!1)}function Jf(l,t,a,u,e){var n=u;if((t&1)===0&&(t&2)===0&&u!==null)l:for(;;){if(u===null)return;var i=u.tag;if(i===3||i===4){var f=u.stateNode.containerInfo;if(f===e)break;if(i===4)for(i=u.return;i!==null;){var c=i.tag;if((c===3||c===4)&&i.stateNode.containerInfo===e)return;i=i.return}for(;f!==null;){if(i=Ja(f),i===null)return;if(c=i.tag,c===5||c===6||c===26||c===27){u=n=i;continue l}f=f.parentNode}}u=u.return}Zc(function(){var y=n,g=ci(a),z=[];l:{var h=r0.get(l);if(h!==void 0){var r=Ye,_=l;switch(l){case"keypress":if(qe(a)===0)break l;case"keydown":case"keyup":r=ym;break;case"focusin":_="focus",r=yi;break;case"focusout":_="blur",r=yi;break;case"beforeblur":case"afterblur":r=yi;break;case"click":if(a.button===2)break l;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":r=Kc;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":r=am;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":r=gm;break;case m0:case v0:case y0:r=nm;break;case h0:r=bm;break;case"scroll":case"scrollend":r=lm;break;case"wheel":r=zm;break;case"copy":case"cut":case"paste":r=fm;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":r=wc;break;case"toggle":case"beforetoggle":r=Em}var j=(t&4)!==0,ol=!j&&(l==="scroll"||l==="scrollend"),d=j?h!==null?h+"Capture":null:h;j=[];for(var s=y,v;s!==null;){var b=s;if(v=b.stateNode,b=b.tag,b!==5&&b!==26&&b!==27||v===null||d===null||(b=qu(s,d),b!=null&&j.push(he(s,b,v))),ol)break;s=s.return}0<j.length&&(h=new r(h,_,null,a,g),z.push({event:h,listeners:j}))}}if((t&7)===0){l:{if(h=l==="mouseover"||l==="pointerover",r=l==="mouseout"||l==="pointerout",h&&a!==fi&&(_=a.relatedTarget||a.fromElement)&&(Ja(_)||_[Ka]))break l;if((r||h)&&(h=g.window===g?g:(h=g.ownerDocument)?h.defaultView||h.parentWindow:window,r?(_=a.relatedTarget||a.toElement,r=y,_=_?Ja(_):null,_!==null&&(ol=Y(_),j=_.tag,_!==ol||j!==5&&j!==27&&j!==6)&&(_=null)):(r=null,_=y),r!==_)){if(j=Kc,b="onMouseLeave",d="onMouseEnter",s="mouse",(l==="pointerout"||l==="pointerover")&&(j=wc,b="onPointerLeave",d="onPointerEnter",s="pointer"),ol=r==null?h:ju(r),v=_==null?h:ju(_),h=new j(b,s+"leave",r,a,g),h.target=ol,h.relatedTarget=v,b=null,Ja(g)===y&&(j=new j(d,s+"enter",_,a,g),j.target=v,j.relatedTarget=ol,b=j),ol=b,r&&_)t:{for(j=Tv,d=r,s=_,v=0,b=d;b;b=j(b))v++;b=0;for(var R=s;R;R=j(R))b++;for(;0<v-b;)d=j(d),v--;for(;0<b-v;)s=j(s),b--;for(;v--;){if(d===s||s!==null&&d===s.alternate){j=d;break t}d=j(d),s=j(s)}j=null}else j=null;r!==null&&Go(z,h,r,j,!1),_!==null&&ol!==null&&Go(z,ol,_,j,!0)}}l:{if(h=y?ju(y):window,r=h.nodeName&&h.nodeName.toLowerCase(),r==="select"||r==="input"&&h.type==="file")var ll=t0;else if(Pc(h))if(a0)ll=Rm;else{ll=Hm;var x=Um}else r=h.nodeName,!r||r.toLowerCase()!=="input"||h.type!=="checkbox"&&h.type!=="radio"?y&&ii(y.elementType)&&(ll=t0):ll=Nm;if(ll&&(ll=ll(l,y))){l0(z,ll,a,g);break l}x&&x(l,h,y),l==="focusout"&&y&&h.type==="number"&&y.memoizedProps.value!=null&&ni(h,"number",h.value)}switch(x=y?ju(y):window,l){case"focusin":(Pc(x)||x.contentEditable==="true")&&(tu=x,pi=y,Lu=null);break;case"focusout":Lu=pi=tu=null;break;case"mousedown":zi=!0;break;case"contextmenu":case"mouseup":case"dragend":zi=!1,o0(z,a,g);break;case"selectionchange":if(jm)break;case"keydown":case"keyup":o0(z,a,g)}var Z;if(ri)l:{switch(l){case"compositionstart":var k="onCompositionStart";break l;case"compositionend":k="onCompositionEnd";break l;case"compositionupdate":k="onCompositionUpdate";break l}k=void 0}else lu?Fc(l,a)&&(k="onCompositionEnd"):l==="keydown"&&a.keyCode===229&&(k="onCompositionStart");k&&(Wc&&a.locale!=="ko"&&(lu||k!=="onCompositionStart"?k==="onCompositionEnd"&&lu&&(Z=Vc()):(la=g,di="value"in la?la.value:la.textContent,lu=!0)),x=xn(y,k),0<x.length&&(k=new Jc(k,l,null,a,g),z.push({event:k,listeners:x}),Z?k.data=Z:(Z=Ic(a),Z!==null&&(k.data=Z)))),(Z=Om?_m(l,a):Mm(l,a))&&(k=xn(y,"onBeforeInput"),0<k.length&&(x=new Jc("onBeforeInput","beforeinput",null,a,g),z.push({event:x,listeners:k}),x.data=Z)),Sv(z,l,y,a,g)}Bo(z,t)})}function he(l,t,a){return{instance:l,listener:t,currentTarget:a}}function xn(l,t){for(var a=t+"Capture",u=[];l!==null;){var e=l,n=e.stateNode;if(e=e.tag,e!==5&&e!==26&&e!==27||n===null||(e=qu(l,a),e!=null&&u.unshift(he(l,e,n)),e=qu(l,t),e!=null&&u.push(he(l,e,n))),l.tag===3)return u;l=l.return}return[]}function Tv(l){if(l===null)return null;do l=l.return;while(l&&l.tag!==5&&l.tag!==27);return l||null}function Go(l,t,a,u,e){for(var n=t._reactName,i=[];a!==null&&a!==u;){var f=a,c=f.alternate,y=f.stateNode;if(f=f.tag,c!==null&&c===u)break;f!==5&&f!==26&&f!==27||y===null||(c=y,e?(y=qu(a,n),y!=null&&i.unshift(he(a,y,c))):e||(y=qu(a,n),y!=null&&i.push(he(a,y,c)))),a=a.return}i.length!==0&&l.push({event:t,listeners:i})}var Ev=/\r\n?/g,Av=/\u0000|\uFFFD/g;function Qo(l){return(typeof l=="string"?l:""+l).replace(Ev,`
+`).replace(Av,"")}function Xo(l,t){return t=Qo(t),Qo(l)===t}function sl(l,t,a,u,e,n){switch(a){case"children":typeof u=="string"?t==="body"||t==="textarea"&&u===""||Fa(l,u):(typeof u=="number"||typeof u=="bigint")&&t!=="body"&&Fa(l,""+u);break;case"className":Ne(l,"class",u);break;case"tabIndex":Ne(l,"tabindex",u);break;case"dir":case"role":case"viewBox":case"width":case"height":Ne(l,a,u);break;case"style":Qc(l,u,n);break;case"data":if(t!=="object"){Ne(l,"data",u);break}case"src":case"href":if(u===""&&(t!=="a"||a!=="href")){l.removeAttribute(a);break}if(u==null||typeof u=="function"||typeof u=="symbol"||typeof u=="boolean"){l.removeAttribute(a);break}u=Ce(""+u),l.setAttribute(a,u);break;case"action":case"formAction":if(typeof u=="function"){l.setAttribute(a,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(a==="formAction"?(t!=="input"&&sl(l,t,"name",e.name,e,null),sl(l,t,"formEncType",e.formEncType,e,null),sl(l,t,"formMethod",e.formMethod,e,null),sl(l,t,"formTarget",e.formTarget,e,null)):(sl(l,t,"encType",e.encType,e,null),sl(l,t,"method",e.method,e,null),sl(l,t,"target",e.target,e,null)));if(u==null||typeof u=="symbol"||typeof u=="boolean"){l.removeAttribute(a);break}u=Ce(""+u),l.setAttribute(a,u);break;case"onClick":u!=null&&(l.onclick=jt);break;case"onScroll":u!=null&&W("scroll",l);break;case"onScrollEnd":u!=null&&W("scrollend",l);break;case"dangerouslySetInnerHTML":if(u!=null){if(typeof u!="object"||!("__html"in u))throw Error(m(61));if(a=u.__html,a!=null){if(e.children!=null)throw Error(m(60));l.innerHTML=a}}break;case"multiple":l.multiple=u&&typeof u!="function"&&typeof u!="symbol";break;case"muted":l.muted=u&&typeof u!="function"&&typeof u!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(u==null||typeof u=="function"||typeof u=="boolean"||typeof u=="symbol"){l.removeAttribute("xlink:href");break}a=Ce(""+u),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",a);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":u!=null&&typeof u!="function"&&typeof u!="symbol"?l.setAttribute(a,""+u):l.removeAttribute(a);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":u&&typeof u!="function"&&typeof u!="symbol"?l.setAttribute(a,""):l.removeAttribute(a);break;case"capture":case"download":u===!0?l.setAttribute(a,""):u!==!1&&u!=null&&typeof u!="function"&&typeof u!="symbol"?l.setAttribute(a,u):l.removeAttribute(a);break;case"cols":case"rows":case"size":case"span":u!=null&&typeof u!="function"&&typeof u!="symbol"&&!isNaN(u)&&1<=u?l.setAttribute(a,u):l.removeAttribute(a);break;case"rowSpan":case"start":u==null||typeof u=="function"||typeof u=="symbol"||isNaN(u)?l.removeAttribute(a):l.setAttribute(a,u);break;case"popover":W("beforetoggle",l),W("toggle",l),He(l,"popover",u);break;case"xlinkActuate":Ct(l,"http://www.w3.org/1999/xlink","xlink:actuate",u);break;case"xlinkArcrole":Ct(l,"http://www.w3.org/1999/xlink","xlink:arcrole",u);break;case"xlinkRole":Ct(l,"http://www.w3.org/1999/xlink","xlink:role",u);break;case"xlinkShow":Ct(l,"http://www.w3.org/1999/xlink","xlink:show",u);break;case"xlinkTitle":Ct(l,"http://www.w3.org/1999/xlink","xlink:title",u);break;case"xlinkType":Ct(l,"http://www.w3.org/1999/xlink","xlink:type",u);break;case"xmlBase":Ct(l,"http://www.w3.org/XML/1998/namespace","xml:base",u);break;case"xmlLang":Ct(l,"http://www.w3.org/XML/1998/namespace","xml:lang",u);break;case"xmlSpace":Ct(l,"http://www.w3.org/XML/1998/namespace","xml:space",u);break;case"is":He(l,"is",u);break;case"innerText":case"textContent":break;default:(!(2<a.length)||a[0]!=="o"&&a[0]!=="O"||a[1]!=="n"&&a[1]!=="N")&&(a=Id.get(a)||a,He(l,a,u))}}function wf(l,t,a,u,e,n){switch(a){case"style":Qc(l,u,n);break;case"dangerouslySetInnerHTML":if(u!=null){if(typeof u!="object"||!("__html"in u))throw Error(m(61));if(a=u.__html,a!=null){if(e.children!=null)throw Error(m(60));l.innerHTML=a}}break;case"children":typeof u=="string"?Fa(l,u):(typeof u=="number"||typeof u=="bigint")&&Fa(l,""+u);break;case"onScroll":u!=null&&W("scroll",l);break;case"onScrollEnd":u!=null&&W("scrollend",l);break;case"onClick":u!=null&&(l.onclick=jt);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Hc.hasOwnProperty(a))l:{if(a[0]==="o"&&a[1]==="n"&&(e=a.endsWith("Capture"),t=a.slice(2,e?a.length-7:void 0),n=l[kl]||null,n=n!=null?n[a]:null,typeof n=="function"&&l.removeEventListener(t,n,e),typeof u=="function")){typeof n!="function"&&n!==null&&(a in l?l[a]=null:l.hasAttribute(a)&&l.removeAttribute(a)),l.addEventListener(t,u,e);break l}a in l?l[a]=u:u===!0?l.setAttribute(a,""):He(l,a,u)}}}function Bl(l,t,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":W("error",l),W("load",l);var u=!1,e=!1,n;for(n in a)if(a.hasOwnProperty(n)){var i=a[n];if(i!=null)switch(n){case"src":u=!0;break;case"srcSet":e=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(m(137,t));default:sl(l,t,n,i,a,null)}}e&&sl(l,t,"srcSet",a.srcSet,a,null),u&&sl(l,t,"src",a.src,a,null);return;case"input":W("invalid",l);var f=n=i=e=null,c=null,y=null;for(u in a)if(a.hasOwnProperty(u)){var g=a[u];if(g!=null)switch(u){case"name":e=g;break;case"type":i=g;break;case"checked":c=g;break;case"defaultChecked":y=g;break;case"value":n=g;break;case"defaultValue":f=g;break;case"children":case"dangerouslySetInnerHTML":if(g!=null)throw Error(m(137,t));break;default:sl(l,t,u,g,a,null)}}qc(l,n,f,c,y,i,e,!1);return;case"select":W("invalid",l),u=i=n=null;for(e in a)if(a.hasOwnProperty(e)&&(f=a[e],f!=null))switch(e){case"value":n=f;break;case"defaultValue":i=f;break;case"multiple":u=f;default:sl(l,t,e,f,a,null)}t=n,a=i,l.multiple=!!u,t!=null?ka(l,!!u,t,!1):a!=null&&ka(l,!!u,a,!0);return;case"textarea":W("invalid",l),n=e=u=null;for(i in a)if(a.hasOwnProperty(i)&&(f=a[i],f!=null))switch(i){case"value":u=f;break;case"defaultValue":e=f;break;case"children":n=f;break;case"dangerouslySetInnerHTML":if(f!=null)throw Error(m(91));break;default:sl(l,t,i,f,a,null)}Yc(l,u,e,n);return;case"option":for(c in a)a.hasOwnProperty(c)&&(u=a[c],u!=null)&&(c==="selected"?l.selected=u&&typeof u!="function"&&typeof u!="symbol":sl(l,t,c,u,a,null));return;case"dialog":W("beforetoggle",l),W("toggle",l),W("cancel",l),W("close",l);break;case"iframe":case"object":W("load",l);break;case"video":case"audio":for(u=0;u<ye.length;u++)W(ye[u],l);break;case"image":W("error",l),W("load",l);break;case"details":W("toggle",l);break;case"embed":case"source":case"link":W("error",l),W("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(y in a)if(a.hasOwnProperty(y)&&(u=a[y],u!=null))switch(y){case"children":case"dangerouslySetInnerHTML":throw Error(m(137,t));default:sl(l,t,y,u,a,null)}return;default:if(ii(t)){for(g in a)a.hasOwnProperty(g)&&(u=a[g],u!==void 0&&wf(l,t,g,u,a,void 0));return}}for(f in a)a.hasOwnProperty(f)&&(u=a[f],u!=null&&sl(l,t,f,u,a,null))}function Ov(l,t,a,u){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var e=null,n=null,i=null,f=null,c=null,y=null,g=null;for(r in a){var z=a[r];if(a.hasOwnProperty(r)&&z!=null)switch(r){case"checked":break;case"value":break;case"defaultValue":c=z;default:u.hasOwnProperty(r)||sl(l,t,r,null,u,z)}}for(var h in u){var r=u[h];if(z=a[h],u.hasOwnProperty(h)&&(r!=null||z!=null))switch(h){case"type":n=r;break;case"name":e=r;break;case"checked":y=r;break;case"defaultChecked":g=r;break;case"value":i=r;break;case"defaultValue":f=r;break;case"children":case"dangerouslySetInnerHTML":if(r!=null)throw Error(m(137,t));break;default:r!==z&&sl(l,t,h,r,u,z)}}ei(l,i,f,c,y,g,n,e);return;case"select":r=i=f=h=null;for(n in a)if(c=a[n],a.hasOwnProperty(n)&&c!=null)switch(n){case"value":break;case"multiple":r=c;default:u.hasOwnProperty(n)||sl(l,t,n,null,u,c)}for(e in u)if(n=u[e],c=a[e],u.hasOwnProperty(e)&&(n!=null||c!=null))switch(e){case"value":h=n;break;case"defaultValue":f=n;break;case"multiple":i=n;default:n!==c&&sl(l,t,e,n,u,c)}t=f,a=i,u=r,h!=null?ka(l,!!a,h,!1):!!u!=!!a&&(t!=null?ka(l,!!a,t,!0):ka(l,!!a,a?[]:"",!1));return;case"textarea":r=h=null;for(f in a)if(e=a[f],a.hasOwnProperty(f)&&e!=null&&!u.hasOwnProperty(f))switch(f){case"value":break;case"children":break;default:sl(l,t,f,null,u,e)}for(i in u)if(e=u[i],n=a[i],u.hasOwnProperty(i)&&(e!=null||n!=null))switch(i){case"value":h=e;break;case"defaultValue":r=e;break;case"children":break;case"dangerouslySetInnerHTML":if(e!=null)throw Error(m(91));break;default:e!==n&&sl(l,t,i,e,u,n)}Bc(l,h,r);return;case"option":for(var _ in a)h=a[_],a.hasOwnProperty(_)&&h!=null&&!u.hasOwnProperty(_)&&(_==="selected"?l.selected=!1:sl(l,t,_,null,u,h));for(c in u)h=u[c],r=a[c],u.hasOwnProperty(c)&&h!==r&&(h!=null||r!=null)&&(c==="selected"?l.selected=h&&typeof h!="function"&&typeof h!="symbol":sl(l,t,c,h,u,r));return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var j in a)h=a[j],a.hasOwnProperty(j)&&h!=null&&!u.hasOwnProperty(j)&&sl(l,t,j,null,u,h);for(y in u)if(h=u[y],r=a[y],u.hasOwnProperty(y)&&h!==r&&(h!=null||r!=null))switch(y){case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(m(137,t));break;default:sl(l,t,y,h,u,r)}return;default:if(ii(t)){for(var ol in a)h=a[ol],a.hasOwnProperty(ol)&&h!==void 0&&!u.hasOwnProperty(ol)&&wf(l,t,ol,void 0,u,h);for(g in u)h=u[g],r=a[g],!u.hasOwnProperty(g)||h===r||h===void 0&&r===void 0||wf(l,t,g,h,u,r);return}}for(var d in a)h=a[d],a.hasOwnProperty(d)&&h!=null&&!u.hasOwnProperty(d)&&sl(l,t,d,null,u,h);for(z in u)h=u[z],r=a[z],!u.hasOwnProperty(z)||h===r||h==null&&r==null||sl(l,t,z,h,u,r)}function Zo(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function _v(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,a=performance.getEntriesByType("resource"),u=0;u<a.length;u++){var e=a[u],n=e.transferSize,i=e.initiatorType,f=e.duration;if(n&&f&&Zo(i)){for(i=0,f=e.responseEnd,u+=1;u<a.length;u++){var c=a[u],y=c.startTime;if(y>f)break;var g=c.transferSize,z=c.initiatorType;g&&Zo(z)&&(c=c.responseEnd,i+=g*(c<f?1:(f-y)/(c-y)))}if(--u,t+=8*(n+i)/(e.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var Wf=null,$f=null;function Un(l){return l.nodeType===9?l:l.ownerDocument}function Vo(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Lo(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function kf(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Ff=null;function Mv(){var l=window.event;return l&&l.type==="popstate"?l===Ff?!1:(Ff=l,!0):(Ff=null,!1)}var Ko=typeof setTimeout=="function"?setTimeout:void 0,Dv=typeof clearTimeout=="function"?clearTimeout:void 0,Jo=typeof Promise=="function"?Promise:void 0,xv=typeof queueMicrotask=="function"?queueMicrotask:typeof Jo<"u"?function(l){return Jo.resolve(null).then(l).catch(Uv)}:Ko;function Uv(l){setTimeout(function(){throw l})}function ga(l){return l==="head"}function wo(l,t){var a=t,u=0;do{var e=a.nextSibling;if(l.removeChild(a),e&&e.nodeType===8)if(a=e.data,a==="/$"||a==="/&"){if(u===0){l.removeChild(e),Du(t);return}u--}else if(a==="$"||a==="$?"||a==="$~"||a==="$!"||a==="&")u++;else if(a==="html")re(l.ownerDocument.documentElement);else if(a==="head"){a=l.ownerDocument.head,re(a);for(var n=a.firstChild;n;){var i=n.nextSibling,f=n.nodeName;n[Cu]||f==="SCRIPT"||f==="STYLE"||f==="LINK"&&n.rel.toLowerCase()==="stylesheet"||a.removeChild(n),n=i}}else a==="body"&&re(l.ownerDocument.body);a=e}while(a);Du(t)}function Wo(l,t){var a=l;l=0;do{var u=a.nextSibling;if(a.nodeType===1?t?(a._stashedDisplay=a.style.display,a.style.display="none"):(a.style.display=a._stashedDisplay||"",a.getAttribute("style")===""&&a.removeAttribute("style")):a.nodeType===3&&(t?(a._stashedText=a.nodeValue,a.nodeValue=""):a.nodeValue=a._stashedText||""),u&&u.nodeType===8)if(a=u.data,a==="/$"){if(l===0)break;l--}else a!=="$"&&a!=="$?"&&a!=="$~"&&a!=="$!"||l++;a=u}while(a)}function If(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var a=t;switch(t=t.nextSibling,a.nodeName){case"HTML":case"HEAD":case"BODY":If(a),ai(a);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(a.rel.toLowerCase()==="stylesheet")continue}l.removeChild(a)}}function Hv(l,t,a,u){for(;l.nodeType===1;){var e=a;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!u&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(u){if(!l[Cu])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==e.rel||l.getAttribute("href")!==(e.href==null||e.href===""?null:e.href)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin)||l.getAttribute("title")!==(e.title==null?null:e.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(e.src==null?null:e.src)||l.getAttribute("type")!==(e.type==null?null:e.type)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=e.name==null?null:""+e.name;if(e.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=zt(l.nextSibling),l===null)break}return null}function Nv(l,t,a){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!a||(l=zt(l.nextSibling),l===null))return null;return l}function $o(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=zt(l.nextSibling),l===null))return null;return l}function Pf(l){return l.data==="$?"||l.data==="$~"}function lc(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function Rv(l,t){var a=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||a.readyState!=="loading")t();else{var u=function(){t(),a.removeEventListener("DOMContentLoaded",u)};a.addEventListener("DOMContentLoaded",u),l._reactRetry=u}}function zt(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var tc=null;function ko(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var a=l.data;if(a==="/$"||a==="/&"){if(t===0)return zt(l.nextSibling);t--}else a!=="$"&&a!=="$!"&&a!=="$?"&&a!=="$~"&&a!=="&"||t++}l=l.nextSibling}return null}function Fo(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var a=l.data;if(a==="$"||a==="$!"||a==="$?"||a==="$~"||a==="&"){if(t===0)return l;t--}else a!=="/$"&&a!=="/&"||t++}l=l.previousSibling}return null}function Io(l,t,a){switch(t=Un(a),l){case"html":if(l=t.documentElement,!l)throw Error(m(452));return l;case"head":if(l=t.head,!l)throw Error(m(453));return l;case"body":if(l=t.body,!l)throw Error(m(454));return l;default:throw Error(m(451))}}function re(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);ai(l)}var Tt=new Map,Po=new Set;function Hn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var Ft=A.d;A.d={f:Cv,r:jv,D:qv,C:Bv,L:Yv,m:Gv,X:Xv,S:Qv,M:Zv};function Cv(){var l=Ft.f(),t=Tn();return l||t}function jv(l){var t=wa(l);t!==null&&t.tag===5&&t.type==="form"?hs(t):Ft.r(l)}var Ou=typeof document>"u"?null:document;function ld(l,t,a){var u=Ou;if(u&&typeof t=="string"&&t){var e=yt(t);e='link[rel="'+l+'"][href="'+e+'"]',typeof a=="string"&&(e+='[crossorigin="'+a+'"]'),Po.has(e)||(Po.add(e),l={rel:l,crossOrigin:a,href:t},u.querySelector(e)===null&&(t=u.createElement("link"),Bl(t,"link",l),Ul(t),u.head.appendChild(t)))}}function qv(l){Ft.D(l),ld("dns-prefetch",l,null)}function Bv(l,t){Ft.C(l,t),ld("preconnect",l,t)}function Yv(l,t,a){Ft.L(l,t,a);var u=Ou;if(u&&l&&t){var e='link[rel="preload"][as="'+yt(t)+'"]';t==="image"&&a&&a.imageSrcSet?(e+='[imagesrcset="'+yt(a.imageSrcSet)+'"]',typeof a.imageSizes=="string"&&(e+='[imagesizes="'+yt(a.imageSizes)+'"]')):e+='[href="'+yt(l)+'"]';var n=e;switch(t){case"style":n=_u(l);break;case"script":n=Mu(l)}Tt.has(n)||(l=U({rel:"preload",href:t==="image"&&a&&a.imageSrcSet?void 0:l,as:t},a),Tt.set(n,l),u.querySelector(e)!==null||t==="style"&&u.querySelector(ge(n))||t==="script"&&u.querySelector(Se(n))||(t=u.createElement("link"),Bl(t,"link",l),Ul(t),u.head.appendChild(t)))}}function Gv(l,t){Ft.m(l,t);var a=Ou;if(a&&l){var u=t&&typeof t.as=="string"?t.as:"script",e='link[rel="modulepreload"][as="'+yt(u)+'"][href="'+yt(l)+'"]',n=e;switch(u){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=Mu(l)}if(!Tt.has(n)&&(l=U({rel:"modulepreload",href:l},t),Tt.set(n,l),a.querySelector(e)===null)){switch(u){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(a.querySelector(Se(n)))return}u=a.createElement("link"),Bl(u,"link",l),Ul(u),a.head.appendChild(u)}}}function Qv(l,t,a){Ft.S(l,t,a);var u=Ou;if(u&&l){var e=Wa(u).hoistableStyles,n=_u(l);t=t||"default";var i=e.get(n);if(!i){var f={loading:0,preload:null};if(i=u.querySelector(ge(n)))f.loading=5;else{l=U({rel:"stylesheet",href:l,"data-precedence":t},a),(a=Tt.get(n))&&ac(l,a);var c=i=u.createElement("link");Ul(c),Bl(c,"link",l),c._p=new Promise(function(y,g){c.onload=y,c.onerror=g}),c.addEventListener("load",function(){f.loading|=1}),c.addEventListener("error",function(){f.loading|=2}),f.loading|=4,Nn(i,t,u)}i={type:"stylesheet",instance:i,count:1,state:f},e.set(n,i)}}}function Xv(l,t){Ft.X(l,t);var a=Ou;if(a&&l){var u=Wa(a).hoistableScripts,e=Mu(l),n=u.get(e);n||(n=a.querySelector(Se(e)),n||(l=U({src:l,async:!0},t),(t=Tt.get(e))&&uc(l,t),n=a.createElement("script"),Ul(n),Bl(n,"link",l),a.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},u.set(e,n))}}function Zv(l,t){Ft.M(l,t);var a=Ou;if(a&&l){var u=Wa(a).hoistableScripts,e=Mu(l),n=u.get(e);n||(n=a.querySelector(Se(e)),n||(l=U({src:l,async:!0,type:"module"},t),(t=Tt.get(e))&&uc(l,t),n=a.createElement("script"),Ul(n),Bl(n,"link",l),a.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},u.set(e,n))}}function td(l,t,a,u){var e=(e=J.current)?Hn(e):null;if(!e)throw Error(m(446));switch(l){case"meta":case"title":return null;case"style":return typeof a.precedence=="string"&&typeof a.href=="string"?(t=_u(a.href),a=Wa(e).hoistableStyles,u=a.get(t),u||(u={type:"style",instance:null,count:0,state:null},a.set(t,u)),u):{type:"void",instance:null,count:0,state:null};case"link":if(a.rel==="stylesheet"&&typeof a.href=="string"&&typeof a.precedence=="string"){l=_u(a.href);var n=Wa(e).hoistableStyles,i=n.get(l);if(i||(e=e.ownerDocument||e,i={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,i),(n=e.querySelector(ge(l)))&&!n._p&&(i.instance=n,i.state.loading=5),Tt.has(l)||(a={rel:"preload",as:"style",href:a.href,crossOrigin:a.crossOrigin,integrity:a.integrity,media:a.media,hrefLang:a.hrefLang,referrerPolicy:a.referrerPolicy},Tt.set(l,a),n||Vv(e,l,a,i.state))),t&&u===null)throw Error(m(528,""));return i}if(t&&u!==null)throw Error(m(529,""));return null;case"script":return t=a.async,a=a.src,typeof a=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=Mu(a),a=Wa(e).hoistableScripts,u=a.get(t),u||(u={type:"script",instance:null,count:0,state:null},a.set(t,u)),u):{type:"void",instance:null,count:0,state:null};default:throw Error(m(444,l))}}function _u(l){return'href="'+yt(l)+'"'}function ge(l){return'link[rel="stylesheet"]['+l+"]"}function ad(l){return U({},l,{"data-precedence":l.precedence,precedence:null})}function Vv(l,t,a,u){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?u.loading=1:(t=l.createElement("link"),u.preload=t,t.addEventListener("load",function(){return u.loading|=1}),t.addEventListener("error",function(){return u.loading|=2}),Bl(t,"link",a),Ul(t),l.head.appendChild(t))}function Mu(l){return'[src="'+yt(l)+'"]'}function Se(l){return"script[async]"+l}function ud(l,t,a){if(t.count++,t.instance===null)switch(t.type){case"style":var u=l.querySelector('style[data-href~="'+yt(a.href)+'"]');if(u)return t.instance=u,Ul(u),u;var e=U({},a,{"data-href":a.href,"data-precedence":a.precedence,href:null,precedence:null});return u=(l.ownerDocument||l).createElement("style"),Ul(u),Bl(u,"style",e),Nn(u,a.precedence,l),t.instance=u;case"stylesheet":e=_u(a.href);var n=l.querySelector(ge(e));if(n)return t.state.loading|=4,t.instance=n,Ul(n),n;u=ad(a),(e=Tt.get(e))&&ac(u,e),n=(l.ownerDocument||l).createElement("link"),Ul(n);var i=n;return i._p=new Promise(function(f,c){i.onload=f,i.onerror=c}),Bl(n,"link",u),t.state.loading|=4,Nn(n,a.precedence,l),t.instance=n;case"script":return n=Mu(a.src),(e=l.querySelector(Se(n)))?(t.instance=e,Ul(e),e):(u=a,(e=Tt.get(n))&&(u=U({},a),uc(u,e)),l=l.ownerDocument||l,e=l.createElement("script"),Ul(e),Bl(e,"link",u),l.head.appendChild(e),t.instance=e);case"void":return null;default:throw Error(m(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(u=t.instance,t.state.loading|=4,Nn(u,a.precedence,l));return t.instance}function Nn(l,t,a){for(var u=a.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),e=u.length?u[u.length-1]:null,n=e,i=0;i<u.length;i++){var f=u[i];if(f.dataset.precedence===t)n=f;else if(n!==e)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=a.nodeType===9?a.head:a,t.insertBefore(l,t.firstChild))}function ac(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function uc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var Rn=null;function ed(l,t,a){if(Rn===null){var u=new Map,e=Rn=new Map;e.set(a,u)}else e=Rn,u=e.get(a),u||(u=new Map,e.set(a,u));if(u.has(l))return u;for(u.set(l,null),a=a.getElementsByTagName(l),e=0;e<a.length;e++){var n=a[e];if(!(n[Cu]||n[Rl]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var i=n.getAttribute(t)||"";i=l+i;var f=u.get(i);f?f.push(n):u.set(i,[n])}}return u}function nd(l,t,a){l=l.ownerDocument||l,l.head.insertBefore(a,t==="title"?l.querySelector("head > title"):null)}function Lv(l,t,a){if(a===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;return t.rel==="stylesheet"?(l=t.disabled,typeof t.precedence=="string"&&l==null):!0;case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function id(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function Kv(l,t,a,u){if(a.type==="stylesheet"&&(typeof u.media!="string"||matchMedia(u.media).matches!==!1)&&(a.state.loading&4)===0){if(a.instance===null){var e=_u(u.href),n=t.querySelector(ge(e));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=Cn.bind(l),t.then(l,l)),a.state.loading|=4,a.instance=n,Ul(n);return}n=t.ownerDocument||t,u=ad(u),(e=Tt.get(e))&&ac(u,e),n=n.createElement("link"),Ul(n);var i=n;i._p=new Promise(function(f,c){i.onload=f,i.onerror=c}),Bl(n,"link",u),a.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(a,t),(t=a.state.preload)&&(a.state.loading&3)===0&&(l.count++,a=Cn.bind(l),t.addEventListener("load",a),t.addEventListener("error",a))}}var ec=0;function Jv(l,t){return l.stylesheets&&l.count===0&&qn(l,l.stylesheets),0<l.count||0<l.imgCount?function(a){var u=setTimeout(function(){if(l.stylesheets&&qn(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&ec===0&&(ec=62500*_v());var e=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&qn(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>ec?50:800)+t);return l.unsuspend=a,function(){l.unsuspend=null,clearTimeout(u),clearTimeout(e)}}:null}function Cn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)qn(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var jn=null;function qn(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,jn=new Map,t.forEach(wv,l),jn=null,Cn.call(l))}function wv(l,t){if(!(t.state.loading&4)){var a=jn.get(l);if(a)var u=a.get(null);else{a=new Map,jn.set(l,a);for(var e=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<e.length;n++){var i=e[n];(i.nodeName==="LINK"||i.getAttribute("media")!=="not all")&&(a.set(i.dataset.precedence,i),u=i)}u&&a.set(null,u)}e=t.instance,i=e.getAttribute("data-precedence"),n=a.get(i)||u,n===u&&a.set(null,e),a.set(i,e),this.count++,u=Cn.bind(this),e.addEventListener("load",u),e.addEventListener("error",u),n?n.parentNode.insertBefore(e,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(e,l.firstChild)),t.state.loading|=4}}var be={$$typeof:K,Provider:null,Consumer:null,_currentValue:B,_currentValue2:B,_threadCount:0};function Wv(l,t,a,u,e,n,i,f,c){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=In(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=In(0),this.hiddenUpdates=In(null),this.identifierPrefix=u,this.onUncaughtError=e,this.onCaughtError=n,this.onRecoverableError=i,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=c,this.incompleteTransitions=new Map}function fd(l,t,a,u,e,n,i,f,c,y,g,z){return l=new Wv(l,t,a,i,c,y,g,z,f),t=1,n===!0&&(t|=24),n=ft(3,null,null,t),l.current=n,n.stateNode=l,t=qi(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:u,isDehydrated:a,cache:t},Qi(n),l}function cd(l){return l?(l=eu,l):eu}function sd(l,t,a,u,e,n){e=cd(e),u.context===null?u.context=e:u.pendingContext=e,u=ia(t),u.payload={element:a},n=n===void 0?null:n,n!==null&&(u.callback=n),a=fa(l,u,t),a!==null&&(at(a,l,t),Fu(a,l,t))}function od(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var a=l.retryLane;l.retryLane=a!==0&&a<t?a:t}}function nc(l,t){od(l,t),(l=l.alternate)&&od(l,t)}function dd(l){if(l.tag===13||l.tag===31){var t=Ua(l,67108864);t!==null&&at(t,l,67108864),nc(l,67108864)}}function md(l){if(l.tag===13||l.tag===31){var t=mt();t=Pn(t);var a=Ua(l,t);a!==null&&at(a,l,t),nc(l,t)}}var Bn=!0;function $v(l,t,a,u){var e=S.T;S.T=null;var n=A.p;try{A.p=2,ic(l,t,a,u)}finally{A.p=n,S.T=e}}function kv(l,t,a,u){var e=S.T;S.T=null;var n=A.p;try{A.p=8,ic(l,t,a,u)}finally{A.p=n,S.T=e}}function ic(l,t,a,u){if(Bn){var e=fc(u);if(e===null)Jf(l,t,u,Yn,a),yd(l,u);else if(Iv(e,l,t,a,u))u.stopPropagation();else if(yd(l,u),t&4&&-1<Fv.indexOf(l)){for(;e!==null;){var n=wa(e);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var i=Oa(n.pendingLanes);if(i!==0){var f=n;for(f.pendingLanes|=2,f.entangledLanes|=2;i;){var c=1<<31-nt(i);f.entanglements[1]|=c,i&=~c}Nt(n),(ul&6)===0&&(pn=ut()+500,ve(0))}}break;case 31:case 13:f=Ua(n,2),f!==null&&at(f,n,2),Tn(),nc(n,2)}if(n=fc(u),n===null&&Jf(l,t,u,Yn,a),n===e)break;e=n}e!==null&&u.stopPropagation()}else Jf(l,t,u,null,a)}}function fc(l){return l=ci(l),cc(l)}var Yn=null;function cc(l){if(Yn=null,l=Ja(l),l!==null){var t=Y(l);if(t===null)l=null;else{var a=t.tag;if(a===13){if(l=al(t),l!==null)return l;l=null}else if(a===31){if(l=rl(t),l!==null)return l;l=null}else if(a===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return Yn=l,null}function vd(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(qd()){case pc:return 2;case zc:return 8;case _e:case Bd:return 32;case Tc:return 268435456;default:return 32}default:return 32}}var sc=!1,Sa=null,ba=null,pa=null,pe=new Map,ze=new Map,za=[],Fv="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function yd(l,t){switch(l){case"focusin":case"focusout":Sa=null;break;case"dragenter":case"dragleave":ba=null;break;case"mouseover":case"mouseout":pa=null;break;case"pointerover":case"pointerout":pe.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":ze.delete(t.pointerId)}}function Te(l,t,a,u,e,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:a,eventSystemFlags:u,nativeEvent:n,targetContainers:[e]},t!==null&&(t=wa(t),t!==null&&dd(t)),l):(l.eventSystemFlags|=u,t=l.targetContainers,e!==null&&t.indexOf(e)===-1&&t.push(e),l)}function Iv(l,t,a,u,e){switch(t){case"focusin":return Sa=Te(Sa,l,t,a,u,e),!0;case"dragenter":return ba=Te(ba,l,t,a,u,e),!0;case"mouseover":return pa=Te(pa,l,t,a,u,e),!0;case"pointerover":var n=e.pointerId;return pe.set(n,Te(pe.get(n)||null,l,t,a,u,e)),!0;case"gotpointercapture":return n=e.pointerId,ze.set(n,Te(ze.get(n)||null,l,t,a,u,e)),!0}return!1}function hd(l){var t=Ja(l.target);if(t!==null){var a=Y(t);if(a!==null){if(t=a.tag,t===13){if(t=al(a),t!==null){l.blockedOn=t,Dc(l.priority,function(){md(a)});return}}else if(t===31){if(t=rl(a),t!==null){l.blockedOn=t,Dc(l.priority,function(){md(a)});return}}else if(t===3&&a.stateNode.current.memoizedState.isDehydrated){l.blockedOn=a.tag===3?a.stateNode.containerInfo:null;return}}}l.blockedOn=null}function Gn(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var a=fc(l.nativeEvent);if(a===null){a=l.nativeEvent;var u=new a.constructor(a.type,a);fi=u,a.target.dispatchEvent(u),fi=null}else return t=wa(a),t!==null&&dd(t),l.blockedOn=a,!1;t.shift()}return!0}function rd(l,t,a){Gn(l)&&a.delete(t)}function Pv(){sc=!1,Sa!==null&&Gn(Sa)&&(Sa=null),ba!==null&&Gn(ba)&&(ba=null),pa!==null&&Gn(pa)&&(pa=null),pe.forEach(rd),ze.forEach(rd)}function Qn(l,t){l.blockedOn===t&&(l.blockedOn=null,sc||(sc=!0,p.unstable_scheduleCallback(p.unstable_NormalPriority,Pv)))}var Xn=null;function gd(l){Xn!==l&&(Xn=l,p.unstable_scheduleCallback(p.unstable_NormalPriority,function(){Xn===l&&(Xn=null);for(var t=0;t<l.length;t+=3){var a=l[t],u=l[t+1],e=l[t+2];if(typeof u!="function"){if(cc(u||a)===null)continue;break}var n=wa(a);n!==null&&(l.splice(t,3),t-=3,ff(n,{pending:!0,data:e,method:a.method,action:u},u,e))}}))}function Du(l){function t(c){return Qn(c,l)}Sa!==null&&Qn(Sa,l),ba!==null&&Qn(ba,l),pa!==null&&Qn(pa,l),pe.forEach(t),ze.forEach(t);for(var a=0;a<za.length;a++){var u=za[a];u.blockedOn===l&&(u.blockedOn=null)}for(;0<za.length&&(a=za[0],a.blockedOn===null);)hd(a),a.blockedOn===null&&za.shift();if(a=(l.ownerDocument||l).$$reactFormReplay,a!=null)for(u=0;u<a.length;u+=3){var e=a[u],n=a[u+1],i=e[kl]||null;if(typeof n=="function")i||gd(a);else if(i){var f=null;if(n&&n.hasAttribute("formAction")){if(e=n,i=n[kl]||null)f=i.formAction;else if(cc(e)!==null)continue}else f=i.action;typeof f=="function"?a[u+1]=f:(a.splice(u,3),u-=3),gd(a)}}}function Sd(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(i){return e=i})},focusReset:"manual",scroll:"manual"})}function t(){e!==null&&(e(),e=null),u||setTimeout(a,20)}function a(){if(!u&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var u=!1,e=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(a,100),function(){u=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),e!==null&&(e(),e=null)}}}function oc(l){this._internalRoot=l}Zn.prototype.render=oc.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(m(409));var a=t.current,u=mt();sd(a,u,l,t,null,null)},Zn.prototype.unmount=oc.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;sd(l.current,2,null,l,null,null),Tn(),t[Ka]=null}};function Zn(l){this._internalRoot=l}Zn.prototype.unstable_scheduleHydration=function(l){if(l){var t=Mc();l={blockedOn:null,target:l,priority:t};for(var a=0;a<za.length&&t!==0&&t<za[a].priority;a++);za.splice(a,0,l),a===0&&hd(l)}};var bd=q.version;if(bd!=="19.2.4")throw Error(m(527,bd,"19.2.4"));A.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(m(188)):(l=Object.keys(l).join(","),Error(m(268,l)));return l=E(t),l=l!==null?V(l):null,l=l===null?null:l.stateNode,l};var ly={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:S,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Vn=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Vn.isDisabled&&Vn.supportsFiber)try{Hu=Vn.inject(ly),et=Vn}catch{}}return Ae.createRoot=function(l,t){if(!H(l))throw Error(m(299));var a=!1,u="",e=Os,n=_s,i=Ms;return t!=null&&(t.unstable_strictMode===!0&&(a=!0),t.identifierPrefix!==void 0&&(u=t.identifierPrefix),t.onUncaughtError!==void 0&&(e=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(i=t.onRecoverableError)),t=fd(l,1,!1,null,null,a,u,null,e,n,i,Sd),l[Ka]=t.current,Kf(l),new oc(t)},Ae.hydrateRoot=function(l,t,a){if(!H(l))throw Error(m(299));var u=!1,e="",n=Os,i=_s,f=Ms,c=null;return a!=null&&(a.unstable_strictMode===!0&&(u=!0),a.identifierPrefix!==void 0&&(e=a.identifierPrefix),a.onUncaughtError!==void 0&&(n=a.onUncaughtError),a.onCaughtError!==void 0&&(i=a.onCaughtError),a.onRecoverableError!==void 0&&(f=a.onRecoverableError),a.formState!==void 0&&(c=a.formState)),t=fd(l,1,!0,t,a??null,u,e,c,n,i,f,Sd),t.context=cd(null),a=t.current,u=mt(),u=Pn(u),e=ia(u),e.callback=null,fa(a,e,u),a=u,t.current.lanes=a,Ru(t,a),Nt(t),l[Ka]=t.current,Kf(l),new Zn(t)},Ae.version="19.2.4",Ae}var xd;function oy(){if(xd)return vc.exports;xd=1;function p(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(p)}catch(q){console.error(q)}}return p(),vc.exports=sy(),vc.exports}var dy=oy();
+(() => {
+const React = Dl;
+const __m = {};
+// Showroom.jsx
+{
+const { useState, useEffect, useRef, useMemo, useCallback } = Dl;
+const YELLOW = "#FFD700";
+const DARK = "#111";
+const WHITE = "#fff";
+const MAGENTA = "#FF00FF";
+const CYAN = "#00FFFF";
+const CONTACT = {
+  phone: "011 855220",
+  locations: [
+    "Via Stradella 82 - Torino",
+    "Via Cecchi 62 - Torino",
+    "Via Tunisi 50 - Torino"
+  ]
+};
+const VIDEO_EXTS = /\.(mp4|webm|ogg)$/i;
+function isVideo(src) {
+  return VIDEO_EXTS.test(src ?? "");
+}
+function formatKm(km) {
+  if (!km)
+    return "";
+  const num = parseInt(String(km).replace(/\D/g, ""), 10);
+  if (isNaN(num))
+    return String(km);
+  return num === 0 ? "0 km" : `${num.toLocaleString("it-IT")} km`;
+}
+function buildSlides(cars, promos) {
+  const slides = [];
+  let carCount = 0;
+  for (const car of cars) {
+    slides.push({ type: "car", data: car });
+    carCount++;
+    if (carCount % 4 === 0 && promos && promos.length > 0) {
+      const promoIndex = Math.floor(carCount / 4 - 1) % promos.length;
+      slides.push({ type: "promo", data: promos[promoIndex] });
+    }
+  }
+  return slides;
+}
+function useSlideshow(slides, duration) {
+  const [index, setIndex] = useState(0);
+  const [progress, setProgress] = useState(0);
+  const startRef = useRef(Date.now());
+  const currentSlide = slides[index] ?? null;
+  const paused = currentSlide?.type === "promo" && isVideo(currentSlide.data ?? "");
+  useEffect(() => {
+    if (index >= slides.length)
+      setIndex(0);
+  }, [index, slides.length]);
+  const forceAdvance = useCallback(() => {
+    setProgress(0);
+    setIndex((i) => (i + 1) % slides.length);
+  }, [slides.length]);
+  useEffect(() => {
+    if (!slides || slides.length === 0)
+      return;
+    startRef.current = Date.now();
+    setProgress(0);
+    if (paused)
+      return;
+    const advance = setInterval(() => {
+      setIndex((i) => (i + 1) % slides.length);
+    }, duration);
+    const tick = setInterval(() => {
+      const elapsed = Date.now() - startRef.current;
+      setProgress(Math.min(elapsed / duration * 100, 100));
+    }, 50);
+    return () => {
+      clearInterval(advance);
+      clearInterval(tick);
+    };
+  }, [index, slides, duration, paused]);
+  return { index, progress, forceAdvance, isVideoSlide: paused };
+}
+function CarSlide({ car }) {
+  const [imgError, setImgError] = useState(false);
+  const [qrError, setQrError] = useState(false);
+  const hasImage = car.immagine && !imgError;
+  const tags = [
+    car.anno ? { label: car.anno } : null,
+    car.km !== void 0 && car.km !== "" ? { label: formatKm(car.km) } : null,
+    car.alimentazione ? { label: car.alimentazione } : null,
+    car.cambio ? { label: car.cambio.charAt(0).toUpperCase() + car.cambio.slice(1) } : null
+  ].filter(Boolean);
+  const tipoLabel = { km0: "KM ZERO", usato: "USATO", outlet: "OUTLET" }[car.tipo] ?? car.tipo?.toUpperCase() ?? "";
+  const qrUrl = car.link ? `https://api.qrserver.com/v1/create-qr-code/?size=150x150&data=${encodeURIComponent(car.link)}` : null;
+  return /* @__PURE__ */ React.createElement("div", { style: s.slideOuter }, /* @__PURE__ */ React.createElement("div", { style: s.card }, /* @__PURE__ */ React.createElement("div", { style: s.imageCol }, hasImage ? /* @__PURE__ */ React.createElement(
+    "img",
+    {
+      src: car.immagine,
+      alt: car.titolo,
+      onError: () => setImgError(true),
+      style: s.carImage
+    }
+  ) : /* @__PURE__ */ React.createElement("div", { style: s.noPhoto }, /* @__PURE__ */ React.createElement("span", { style: s.noPhotoText }, "FOTO NON DISPONIBILE"))), /* @__PURE__ */ React.createElement("div", { style: s.infoCol }, /* @__PURE__ */ React.createElement("div", { style: s.infoTop }, tipoLabel && /* @__PURE__ */ React.createElement("div", { style: s.tipoBadge }, tipoLabel), /* @__PURE__ */ React.createElement("h1", { style: s.title }, car.titolo ? car.titolo.toUpperCase() : ""), tags.length > 0 && /* @__PURE__ */ React.createElement("div", { style: s.tagsRow }, tags.map((t, i) => /* @__PURE__ */ React.createElement("span", { key: i, style: s.tag }, t.label))), car.prezzo && /* @__PURE__ */ React.createElement("div", { style: s.priceBox }, /* @__PURE__ */ React.createElement("span", { style: s.priceText }, car.prezzo))), qrUrl && !qrError && /* @__PURE__ */ React.createElement("div", { style: s.qrBlock }, /* @__PURE__ */ React.createElement(
+    "img",
+    {
+      src: qrUrl,
+      alt: "QR code",
+      style: s.qrImg,
+      onError: () => setQrError(true)
+    }
+  ), /* @__PURE__ */ React.createElement("span", { style: s.qrLabel }, "Scansiona per i dettagli")))));
+}
+function PromoSlide({ src, onEnded, nextCars }) {
+  const [err, setErr] = useState(false);
+  if (isVideo(src)) {
+    return /* @__PURE__ */ React.createElement(
+      VideoPromoSlide,
+      {
+        src,
+        onEnded,
+        cars: nextCars ?? []
+      }
+    );
+  }
+  return /* @__PURE__ */ React.createElement("div", { style: s.promoWrapper }, err ? /* @__PURE__ */ React.createElement("p", { style: { color: DARK, fontFamily: "'Rubik Mono One'", fontSize: "2rem" } }, "PROMO") : /* @__PURE__ */ React.createElement("img", { src, alt: "Promo", style: s.promoImg, onError: () => setErr(true) }));
+}
+function MiniCarCard({ car }) {
+  const [imgErr, setImgErr] = useState(false);
+  return /* @__PURE__ */ React.createElement("div", { style: {
+    flex: 1,
+    minHeight: 0,
+    display: "flex",
+    overflow: "hidden",
+    background: WHITE,
+    border: `3px solid ${DARK}`,
+    boxShadow: `3px 3px 0 ${CYAN}`
+  } }, /* @__PURE__ */ React.createElement("div", { style: {
+    width: "38%",
+    flexShrink: 0,
+    background: "#f0f0f0",
+    overflow: "hidden"
+  } }, car.immagine && !imgErr && /* @__PURE__ */ React.createElement(
+    "img",
+    {
+      src: car.immagine,
+      alt: car.titolo,
+      onError: () => setImgErr(true),
+      style: { width: "100%", height: "100%", objectFit: "cover", display: "block" }
+    }
+  )), /* @__PURE__ */ React.createElement("div", { style: {
+    flex: 1,
+    padding: "6px 8px",
+    display: "flex",
+    flexDirection: "column",
+    justifyContent: "center",
+    gap: "4px",
+    overflow: "hidden",
+    minWidth: 0
+  } }, /* @__PURE__ */ React.createElement("div", { style: {
+    fontFamily: "'Rubik Mono One', sans-serif",
+    fontSize: "clamp(0.55rem, 1.2vmin, 0.9rem)",
+    color: DARK,
+    overflow: "hidden",
+    textOverflow: "ellipsis",
+    whiteSpace: "nowrap"
+  } }, car.titolo), car.prezzo && /* @__PURE__ */ React.createElement("div", { style: {
+    fontFamily: "'Rubik Mono One', sans-serif",
+    fontSize: "clamp(0.6rem, 1.3vmin, 1rem)",
+    color: YELLOW,
+    background: DARK,
+    display: "inline-block",
+    padding: "2px 6px",
+    alignSelf: "flex-start"
+  } }, car.prezzo)));
+}
+function VideoPromoSlide({ src, onEnded, cars }) {
+  return /* @__PURE__ */ React.createElement("div", { style: {
+    width: "100%",
+    height: "100%",
+    display: "flex",
+    flexDirection: "row",
+    gap: "clamp(6px, 1vw, 14px)"
+  } }, /* @__PURE__ */ React.createElement("div", { style: {
+    flex: 2,
+    position: "relative",
+    overflow: "hidden",
+    background: DARK
+  } }, /* @__PURE__ */ React.createElement(
+    "video",
+    {
+      src,
+      autoPlay: true,
+      muted: true,
+      playsInline: true,
+      loop: true,
+      "aria-hidden": "true",
+      style: {
+        position: "absolute",
+        inset: 0,
+        width: "100%",
+        height: "100%",
+        objectFit: "cover",
+        filter: "blur(24px)",
+        transform: "scale(1.1)",
+        opacity: 0.85
+      }
+    }
+  ), /* @__PURE__ */ React.createElement(
+    "video",
+    {
+      src,
+      autoPlay: true,
+      muted: true,
+      playsInline: true,
+      onEnded,
+      onError: onEnded,
+      style: {
+        position: "absolute",
+        left: "50%",
+        top: "50%",
+        transform: "translate(-50%, -50%)",
+        height: "100%",
+        width: "auto",
+        maxWidth: "100%"
+      }
+    }
+  )), cars && cars.length > 0 && /* @__PURE__ */ React.createElement("div", { style: {
+    flex: 1,
+    display: "flex",
+    flexDirection: "column",
+    gap: "clamp(4px, 0.6vw, 8px)",
+    minWidth: 0
+  } }, cars.map((car, i) => /* @__PURE__ */ React.createElement(MiniCarCard, { key: car.link ?? i, car }))));
+}
+async function fetchWithRetry(url, maxAttempts = 5, baseDelay = 2e3) {
+  for (let attempt = 1; attempt <= maxAttempts; attempt++) {
+    try {
+      const r = await fetch(url);
+      if (!r.ok)
+        throw new Error(`HTTP ${r.status}`);
+      return await r.json();
+    } catch (err) {
+      if (attempt === maxAttempts)
+        throw err;
+      await new Promise((res) => setTimeout(res, baseDelay * attempt));
+    }
+  }
+}
+function unescapePointer(part) {
+  return part.replace(/~1/g, "/").replace(/~0/g, "~");
+}
+function applyFeedPatch(doc, ops) {
+  const out = { ...doc };
+  for (const op of ops) {
+    const [link, field] = op.path.split("/").slice(1).map(unescapePointer);
+    if (field === void 0) {
+      if (op.op === "remove")
+        delete out[link];
+      else
+        out[link] = op.value;
+    } else if (out[link]) {
+      const car = { ...out[link] };
+      if (op.op === "remove")
+        delete car[field];
+      else
+        car[field] = op.value;
+      out[link] = car;
+    }
+  }
+  return out;
+}
+function patchPlaylistSlides(slides, ops) {
+  const doc = {};
+  for (const sl of slides)
+    if (sl.type === "car")
+      doc[sl.data.link] = sl.data;
+  const patched = applyFeedPatch(doc, ops);
+  return slides.filter((sl) => sl.type !== "car" || patched[sl.data.link]).map((sl) => sl.type === "car" ? { ...sl, data: patched[sl.data.link] } : sl);
+}
+function Showroom() {
+  const [cars, setCars] = useState([]);
+  const [settings, setSettings] = useState(null);
+  const [playlist, setPlaylist] = useState(null);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState(null);
+  useEffect(() => {
+    fetchWithRetry("./playlist.json", 1).then((playlistData) => setPlaylist(playlistData)).catch(
+      () => Promise.all([
+        fetchWithRetry("./stock.json"),
+        fetchWithRetry("./settings.json")
+      ]).then(([stockData, settingsData]) => {
+        setCars(stockData);
+        setSettings(settingsData);
+      })
+    ).then(() => setLoading(false)).catch((err) => {
+      setError(String(err));
+      setLoading(false);
+    });
+  }, []);
+  const hasPlaylist = playlist !== null;
+  const feedRef = useRef(null);
+  useEffect(() => {
+    const watched = hasPlaylist ? ["./playlist.json"] : ["./stock.json", "./settings.json"];
+    const etags = {};
+    const check = async () => {
+      for (const file of watched) {
+        try {
+          const res = await fetch(file, { method: "HEAD", cache: "no-store" });
+          const current = res.headers.get("etag") || res.headers.get("last-modified");
+          if (!(file in etags)) {
+            etags[file] = current;
+            continue;
+          }
+          if (!current || current === etags[file])
+            continue;
+          if (!hasPlaylist) {
+            window.location.reload();
+            return;
+          }
+          const next = await fetchWithRetry(file, 2);
+          etags[file] = current;
+          feedRef.current = next.feed_versione ?? null;
+          setPlaylist(next);
+        } catch {
+        }
+      }
+    };
+    check();
+    const id = setInterval(check, 5 * 60 * 1e3);
+    return () => clearInterval(id);
+  }, [hasPlaylist]);
+  const feedVersion = playlist?.feed_versione ?? null;
+  useEffect(() => {
+    if (feedVersion === null)
+      return;
+    feedRef.current = feedVersion;
+    const check = async () => {
+      try {
+        const res = await fetch("./feed/manifest.json", { cache: "no-store" });
+        if (!res.ok)
+          return;
+        const manifest = await res.json();
+        const from = feedRef.current;
+        if (from === null || manifest.versione <= from)
+          return;
+        if (from < manifest.delta_da) {
+          window.location.reload();
+          return;
+        }
+        const deltas = [];
+        for (let v = from + 1; v <= manifest.versione; v++) {
+          deltas.push(await fetchWithRetry(`./feed/delta-${v}.json`, 2));
+        }
+        if (feedRef.current !== from)
+          return;
+        feedRef.current = manifest.versione;
+        setPlaylist((pl) => ({
+          ...pl,
+          slides: deltas.reduce(
+            (sl, d) => patchPlaylistSlides(sl, d.patch),
+            pl.slides ?? []
+          )
+        }));
+      } catch {
+      }
+    };
+    const id = setInterval(check, 5 * 60 * 1e3);
+    return () => clearInterval(id);
+  }, [feedVersion]);
+  const config = playlist ?? settings;
+  const rawDuration = config ? (config.durata_slide || 0) * 1e3 : 6e3;
+  const duration = Math.max(rawDuration, 2e3);
+  const promo = useMemo(() => settings?.promo ?? [], [settings]);
+  const slides = useMemo(() => {
+    if (playlist)
+      return playlist.slides ?? [];
+    if (cars.length === 0)
+      return [];
+    const shuffled = [...cars];
+    for (let i = shuffled.length - 1; i > 0; i--) {
+      const j = Math.floor(Math.random() * (i + 1));
+      [shuffled[i], shuffled[j]] = [shuffled[j], shuffled[i]];
+    }
+    return buildSlides(shuffled, promo);
+  }, [playlist, cars, promo]);
+  const { index, progress, forceAdvance, isVideoSlide } = useSlideshow(
+    loading || error || slides.length === 0 ? [] : slides,
+    duration
+  );
+  const currentSlide = slides[index] || null;
+  const nextCars = useMemo(() => {
+    if (!slides || slides.length === 0)
+      return [];
+    return slides.slice(index + 1).concat(slides.slice(0, index)).filter((s2) => s2.type === "car").slice(0, 3).map((s2) => s2.data);
+  }, [slides, index]);
+  let slideContent;
+  if (loading) {
+    slideContent = /* @__PURE__ */ React.createElement("div", { style: s.centerMsg }, "Caricamento...");
+  } else if (error) {
+    slideContent = /* @__PURE__ */ React.createElement("div", { style: s.centerMsg }, /* @__PURE__ */ React.createElement("span", { style: { color: "#900" } }, "Errore caricamento dati"), /* @__PURE__ */ React.createElement("br", null), /* @__PURE__ */ React.createElement("span", { style: { fontSize: "0.85rem", opacity: 0.6 } }, error));
+  } else if (slides.length === 0) {
+    slideContent = /* @__PURE__ */ React.createElement("div", { style: s.centerMsg }, "Nessun annuncio");
+  } else if (currentSlide) {
+    if (currentSlide.type === "promo") {
+      slideContent = /* @__PURE__ */ React.createElement(
+        PromoSlide,
+        {
+          src: currentSlide.data,
+          onEnded: isVideoSlide ? forceAdvance : void 0,
+          nextCars: isVideoSlide ? nextCars : void 0
+        }
+      );
+    } else {
+      slideContent = /* @__PURE__ */ React.createElement(CarSlide, { key: index, car: currentSlide.data });
+    }
+  }
+  return /* @__PURE__ */ React.createElement("div", { style: s.root }, /* @__PURE__ */ React.createElement("div", { style: s.bgGrid }), /* @__PURE__ */ React.createElement("div", { style: s.topBar }, /* @__PURE__ */ React.createElement("div", { style: s.brandBadge }, "PREZZO CHIARO \u2014 ROTOLO AUTOMOBILI")), /* @__PURE__ */ React.createElement("div", { style: s.slideArea }, slideContent), /* @__PURE__ */ React.createElement("div", { style: s.progressTrack }, /* @__PURE__ */ React.createElement("div", { style: { ...s.progressFill, width: `${progress}%` } })), /* @__PURE__ */ React.createElement("div", { style: s.bottomBar }, /* @__PURE__ */ React.createElement("div", { style: s.phoneNumber }, CONTACT.phone), /* @__PURE__ */ React.createElement("div", { style: s.locationsList }, CONTACT.locations.map((loc, i) => /* @__PURE__ */ React.createElement("span", { key: i, style: s.locationItem }, loc))), /* @__PURE__ */ React.createElement("div", { style: s.torinoBadge }, "TORINO")));
+}
+const s = {
+  // Root — sfondo GIALLO
+  root: {
+    width: "100vw",
+    height: "100vh",
+    display: "flex",
+    flexDirection: "column",
+    overflow: "hidden",
+    background: YELLOW,
+    color: DARK,
+    position: "relative"
+  },
+  // Griglia anni '80
+  bgGrid: {
+    position: "fixed",
+    top: 0,
+    left: 0,
+    width: "100%",
+    height: "100%",
+    backgroundImage: "linear-gradient(rgba(0,0,0,0.05) 1px, transparent 1px), linear-gradient(90deg, rgba(0,0,0,0.05) 1px, transparent 1px)",
+    backgroundSize: "40px 40px",
+    pointerEvents: "none",
+    zIndex: 0
+  },
+  // Barra superiore — altezza vh, non px fissi
+  topBar: {
+    height: "8vh",
+    minHeight: "52px",
+    maxHeight: "80px",
+    background: DARK,
+    display: "flex",
+    alignItems: "center",
+    justifyContent: "center",
+    padding: "0 2vw",
+    flexShrink: 0,
+    borderBottom: `clamp(3px, 0.5vh, 6px) solid ${MAGENTA}`,
+    position: "relative",
+    zIndex: 2
+  },
+  brandBadge: {
+    display: "inline-block",
+    backgroundColor: YELLOW,
+    color: DARK,
+    fontFamily: "'Rubik Mono One', sans-serif",
+    fontSize: "clamp(0.85rem, 2.2vh, 1.6rem)",
+    padding: "clamp(4px,0.6vh,8px) clamp(14px,2vw,30px)",
+    transform: "rotate(-0.5deg)",
+    boxShadow: `clamp(4px,0.7vw,8px) clamp(4px,0.7vw,8px) 0 ${MAGENTA}`,
+    letterSpacing: "0.02em",
+    whiteSpace: "nowrap"
+  },
+  // Area slide — padding ridotto per dare più spazio alla card
+  slideArea: {
+    flex: 1,
+    display: "flex",
+    alignItems: "center",
+    justifyContent: "center",
+    padding: "clamp(6px, 1vmin, 14px)",
+    overflow: "hidden",
+    position: "relative",
+    zIndex: 1,
+    minHeight: 0
+  },
+  slideOuter: {
+    width: "100%",
+    height: "100%",
+    display: "flex",
+    alignItems: "center",
+    justifyContent: "center"
+  },
+  // Card — ombra ridotta per non essere clippata, padding e maxHeight responsive
+  card: {
+    width: "96%",
+    maxWidth: "1400px",
+    height: "96%",
+    // altezza fissa al 96% invece di maxHeight per evitare overflow
+    backgroundColor: WHITE,
+    border: `clamp(5px, 0.6vw, 10px) solid ${DARK}`,
+    boxShadow: `clamp(8px,1.2vmin,18px) clamp(8px,1.2vmin,18px) 0 ${CYAN}`,
+    display: "flex",
+    flexDirection: "row",
+    padding: "clamp(10px, 1.4vw, 22px)",
+    overflow: "hidden",
+    animation: "slideIn 0.5s ease-out",
+    boxSizing: "border-box"
+  },
+  // Colonna immagine
+  imageCol: {
+    flex: "1.2",
+    display: "flex",
+    alignItems: "center",
+    justifyContent: "center",
+    marginRight: "clamp(10px, 1.4vw, 22px)",
+    overflow: "hidden",
+    background: "#f4f4f4",
+    border: `clamp(2px, 0.3vw, 4px) solid ${DARK}`,
+    minHeight: 0,
+    minWidth: 0
+  },
+  carImage: {
+    width: "100%",
+    height: "100%",
+    objectFit: "cover",
+    display: "block"
+  },
+  noPhoto: {
+    display: "flex",
+    alignItems: "center",
+    justifyContent: "center",
+    width: "100%",
+    height: "100%"
+  },
+  noPhotoText: {
+    fontFamily: "'Rubik Mono One', sans-serif",
+    fontSize: "clamp(0.6rem, 1.5vmin, 1.1rem)",
+    color: "#bbb",
+    letterSpacing: "0.1em"
+  },
+  // Colonna info — space-between tra infoTop e qrBlock, padding per i terzi
+  infoCol: {
+    flex: "1",
+    display: "flex",
+    flexDirection: "column",
+    justifyContent: "space-between",
+    paddingTop: "clamp(1.5rem, 18vh, 7rem)",
+    // ~1/3 dall'alto
+    paddingBottom: "clamp(1rem, 10vh, 4rem)",
+    // ~1/3 dal basso
+    overflow: "hidden",
+    minWidth: 0,
+    minHeight: 0
+  },
+  // Gruppo scritte: badge + titolo + tags + prezzo
+  infoTop: {
+    display: "flex",
+    flexDirection: "column",
+    gap: "clamp(5px, 1vh, 14px)"
+  },
+  // Badge tipo
+  tipoBadge: {
+    backgroundColor: MAGENTA,
+    color: WHITE,
+    display: "inline-block",
+    padding: "clamp(3px,0.5vh,7px) clamp(8px,1vw,16px)",
+    fontFamily: "'Rubik Mono One', sans-serif",
+    fontSize: "clamp(0.75rem, 1.8vh, 1.24rem)",
+    alignSelf: "flex-start",
+    transform: "rotate(1.5deg)",
+    boxShadow: `3px 3px 0 ${DARK}`,
+    letterSpacing: "0.04em",
+    flexShrink: 0
+  },
+  // Titolo — vmin per mantenere proporzioni su 16:9
+  title: {
+    fontFamily: "'Rubik Mono One', sans-serif",
+    fontSize: "clamp(1rem, 2.6vmin, 2.5rem)",
+    color: DARK,
+    lineHeight: 1.1,
+    letterSpacing: "0.01em",
+    wordBreak: "break-word",
+    overflow: "hidden",
+    flexShrink: 0
+  },
+  // Tag row
+  tagsRow: {
+    display: "flex",
+    flexWrap: "wrap",
+    gap: "clamp(4px, 0.6vw, 10px)",
+    borderLeft: `clamp(4px, 0.5vw, 8px) solid ${YELLOW}`,
+    paddingLeft: "clamp(8px, 1vw, 16px)",
+    flexShrink: 0
+  },
+  tag: {
+    fontFamily: "'Outfit', sans-serif",
+    fontWeight: 700,
+    fontSize: "clamp(0.75rem, 1.4vh, 1.1rem)",
+    color: "#444",
+    letterSpacing: "0.04em",
+    textTransform: "uppercase"
+  },
+  // Prezzo
+  priceBox: {
+    backgroundColor: DARK,
+    color: YELLOW,
+    padding: "clamp(7px,1vh,14px) clamp(14px,2vw,28px)",
+    display: "inline-block",
+    alignSelf: "flex-start",
+    boxShadow: `clamp(5px,0.7vw,10px) clamp(5px,0.7vw,10px) 0 ${MAGENTA}`,
+    flexShrink: 0
+  },
+  priceText: {
+    fontFamily: "'Rubik Mono One', sans-serif",
+    fontSize: "clamp(1.4rem, 3.6vmin, 3.4rem)",
+    letterSpacing: "0.02em"
+  },
+  // QR — dimensione CSS responsive, immagine server 150px
+  qrBlock: {
+    display: "flex",
+    flexDirection: "column",
+    alignItems: "center",
+    gap: "clamp(3px, 0.5vh, 7px)",
+    flexShrink: 0
+  },
+  qrImg: {
+    border: `clamp(2px, 0.3vw, 4px) solid ${DARK}`,
+    display: "block",
+    width: "clamp(80px, 13vh, 145px)",
+    height: "clamp(80px, 13vh, 145px)"
+  },
+  qrLabel: {
+    fontFamily: "'Outfit', sans-serif",
+    fontSize: "clamp(0.55rem, 1vh, 0.75rem)",
+    color: "#666",
+    letterSpacing: "0.04em"
+  },
+  // Barra progresso
+  progressTrack: {
+    height: "clamp(4px, 0.6vh, 8px)",
+    background: "rgba(0,0,0,0.15)",
+    flexShrink: 0,
+    position: "relative",
+    zIndex: 2
+  },
+  progressFill: {
+    height: "100%",
+    background: MAGENTA,
+    transition: "width 50ms linear"
+  },
+  // Barra inferiore — altezza vh
+  bottomBar: {
+    height: "6.5vh",
+    minHeight: "44px",
+    maxHeight: "68px",
+    background: DARK,
+    borderTop: `clamp(3px, 0.5vh, 6px) solid ${CYAN}`,
+    display: "flex",
+    alignItems: "center",
+    justifyContent: "space-around",
+    padding: "0 2vw",
+    flexShrink: 0,
+    position: "relative",
+    zIndex: 2,
+    gap: "1vw"
+  },
+  phoneNumber: {
+    fontFamily: "'Rubik Mono One', sans-serif",
+    fontSize: "clamp(1.1rem, 2.4vh, 1.8rem)",
+    color: CYAN,
+    letterSpacing: "0.05em",
+    whiteSpace: "nowrap"
+  },
+  locationsList: {
+    display: "flex",
+    gap: "clamp(10px, 2vw, 28px)",
+    alignItems: "center"
+  },
+  locationItem: {
+    fontFamily: "'Outfit', sans-serif",
+    fontWeight: 700,
+    fontSize: "clamp(0.75rem, 1.55vh, 1.1rem)",
+    color: WHITE,
+    letterSpacing: "0.03em",
+    whiteSpace: "nowrap"
+  },
+  torinoBadge: {
+    fontFamily: "'Rubik Mono One', sans-serif",
+    fontSize: "clamp(0.75rem, 1.55vh, 1.1rem)",
+    color: YELLOW,
+    border: `2px solid ${YELLOW}`,
+    padding: "clamp(2px,0.3vh,4px) clamp(8px,1vw,14px)",
+    whiteSpace: "nowrap"
+  },
+  // Slide promo
+  promoWrapper: {
+    width: "100%",
+    height: "100%",
+    display: "flex",
+    alignItems: "center",
+    justifyContent: "center",
+    padding: "clamp(8px, 1.5vmin, 20px)"
+  },
+  promoImg: {
+    maxWidth: "100%",
+    maxHeight: "100%",
+    objectFit: "contain",
+    border: `clamp(4px, 0.5vw, 8px) solid ${DARK}`,
+    boxShadow: `clamp(8px,1.2vmin,20px) clamp(8px,1.2vmin,20px) 0 ${MAGENTA}`
+  },
+  // Stato caricamento / errore
+  centerMsg: {
+    width: "100%",
+    height: "100%",
+    display: "flex",
+    flexDirection: "column",
+    alignItems: "center",
+    justifyContent: "center",
+    fontFamily: "'Rubik Mono One', sans-serif",
+    fontSize: "clamp(1rem, 2.5vh, 1.6rem)",
+    color: DARK,
+    letterSpacing: "0.05em",
+    textAlign: "center",
+    padding: "2vmin"
+  }
+};
+
+__m.Showroom = Showroom;
+}
+// App.jsx
+{
+const Showroom = __m.Showroom;
+function App() {
+  return /* @__PURE__ */ React.createElement(Showroom, null);
+}
+
+__m.App = App;
+}
+// main.jsx
+{
+const { StrictMode } = Dl;
+const { createRoot } = dy;
+
+const App = __m.App;
+createRoot(document.getElementById("root")).render(
+  /* @__PURE__ */ React.createElement(StrictMode, null, /* @__PURE__ */ React.createElement(App, null))
+);
+
+}
+})();
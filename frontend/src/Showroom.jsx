@@ -62,6 +62,11 @@ function useSlideshow(slides, duration) {
   const currentSlide = slides[index] ?? null;
   const paused = currentSlide?.type === "promo" && isVideo(currentSlide.data ?? "");
 
+  // Playlist ripubblicata più corta: riparti dalla prima slide
+  useEffect(() => {
+    if (index >= slides.length) setIndex(0);
+  }, [index, slides.length]);
+
   const forceAdvance = useCallback(() => {
     setProgress(0);
     setIndex(i => (i + 1) % slides.length);
@@ -366,6 +371,43 @@ async function fetchWithRetry(url, maxAttempts = 5, baseDelay = 2000) {
   }
 }
 
+// ---------------------------------------------------------------------------
+// Feed versionato — delta JSON Patch sul documento { link: auto }
+// ---------------------------------------------------------------------------
+
+function unescapePointer(part) {
+  return part.replace(/~1/g, "/").replace(/~0/g, "~");
+}
+
+function applyFeedPatch(doc, ops) {
+  const out = { ...doc };
+  for (const op of ops) {
+    const [link, field] = op.path.split("/").slice(1).map(unescapePointer);
+    if (field === undefined) {
+      if (op.op === "remove") delete out[link];
+      else out[link] = op.value;
+    } else if (out[link]) {
+      const car = { ...out[link] };
+      if (op.op === "remove") delete car[field];
+      else car[field] = op.value;
+      out[link] = car;
+    }
+  }
+  return out;
+}
+
+// Auto rimosse escono dalla rotazione, quelle modificate si aggiornano sul
+// posto. Le auto nuove NON vengono accodate: ordine, promo e filtro
+// immagine_ko li decide build_playlist, quindi arrivano con la prossima playlist
+function patchPlaylistSlides(slides, ops) {
+  const doc = {};
+  for (const sl of slides) if (sl.type === "car") doc[sl.data.link] = sl.data;
+  const patched = applyFeedPatch(doc, ops);
+  return slides
+    .filter(sl => sl.type !== "car" || patched[sl.data.link])
+    .map(sl => (sl.type === "car" ? { ...sl, data: patched[sl.data.link] } : sl));
+}
+
 // ---------------------------------------------------------------------------
 // Showroom principale
 // ---------------------------------------------------------------------------
@@ -373,44 +415,101 @@ async function fetchWithRetry(url, maxAttempts = 5, baseDelay = 2000) {
 export default function Showroom() {
   const [cars, setCars]       = useState([]);
   const [settings, setSettings] = useState(null);
+  const [playlist, setPlaylist] = useState(null);
   const [loading, setLoading] = useState(true);
   const [error, setError]     = useState(null);
 
   useEffect(() => {
-    Promise.all([
-      fetchWithRetry("./stock.json"),
-      fetchWithRetry("./settings.json"),
-    ])
-      .then(([stockData, settingsData]) => {
-        setCars(stockData);
-        setSettings(settingsData);
-        setLoading(false);
-      })
+    // Playlist precalcolata dal CMS (publish.py); se manca, stock + settings completi
+    fetchWithRetry("./playlist.json", 1)
+      .then((playlistData) => setPlaylist(playlistData))
+      .catch(() =>
+        Promise.all([
+          fetchWithRetry("./stock.json"),
+          fetchWithRetry("./settings.json"),
+        ]).then(([stockData, settingsData]) => {
+          setCars(stockData);
+          setSettings(settingsData);
+        })
+      )
+      .then(() => setLoading(false))
       .catch((err) => {
         setError(String(err));
         setLoading(false);
       });
   }, []);
 
-  // Auto-reload quando il listino cambia (entro 5 minuti dal push CMS)
+  // Aggiornamento quando listino o impostazioni cambiano (entro 5 minuti dal
+  // push CMS): playlist.json viene riscaricata, senza playlist si ricarica la
+  // pagina. Resta attivo anche con il feed: la playlist ripubblicata porta
+  // ordine, promo e auto nuove, che i delta non gestiscono.
+  const hasPlaylist = playlist !== null;
+  const feedRef = useRef(null);
   useEffect(() => {
-    let etag = null;
+    const watched = hasPlaylist ? ["./playlist.json"] : ["./stock.json", "./settings.json"];
+    const etags = {};
+    const check = async () => {
+      for (const file of watched) {
+        try {
+          const res = await fetch(file, { method: "HEAD", cache: "no-store" });
+          const current = res.headers.get("etag") || res.headers.get("last-modified");
+          if (!(file in etags)) { etags[file] = current; continue; }
+          if (!current || current === etags[file]) continue;
+          if (!hasPlaylist) { window.location.reload(); return; }
+          const next = await fetchWithRetry(file, 2);
+          etags[file] = current;
+          feedRef.current = next.feed_versione ?? null;
+          setPlaylist(next);
+        } catch { /* rete assente, riprova al prossimo tick */ }
+      }
+    };
+    check();
+    const id = setInterval(check, 5 * 60 * 1000);
+    return () => clearInterval(id);
+  }, [hasPlaylist]);
+
+  const feedVersion = playlist?.feed_versione ?? null;
+
+  // Feed versionato: scarica solo i delta dalla versione della playlist.
+  // Troppo indietro (delta già rimossi dal CMS) → ricarica la pagina.
+  useEffect(() => {
+    if (feedVersion === null) return;
+    feedRef.current = feedVersion;
     const check = async () => {
       try {
-        const res = await fetch("./stock.json", { method: "HEAD", cache: "no-store" });
-        const current = res.headers.get("etag") || res.headers.get("last-modified");
-        if (etag === null) { etag = current; return; }
-        if (current && current !== etag) window.location.reload();
+        const res = await fetch("./feed/manifest.json", { cache: "no-store" });
+        if (!res.ok) return;
+        const manifest = await res.json();
+        const from = feedRef.current;
+        if (from === null || manifest.versione <= from) return;
+        if (from < manifest.delta_da) { window.location.reload(); return; }
+        const deltas = [];
+        for (let v = from + 1; v <= manifest.versione; v++) {
+          deltas.push(await fetchWithRetry(`./feed/delta-${v}.json`, 2));
+        }
+        // Nel frattempo è arrivata una playlist nuova: i delta non valgono più
+        if (feedRef.current !== from) return;
+        feedRef.current = manifest.versione;
+        setPlaylist(pl => ({
+          ...pl,
+          slides: deltas.reduce(
+            (sl, d) => patchPlaylistSlides(sl, d.patch),
+            pl.slides ?? []
+          ),
+        }));
       } catch { /* rete assente, riprova al prossimo tick */ }
     };
     const id = setInterval(check, 5 * 60 * 1000);
     return () => clearInterval(id);
-  }, []);
+  }, [feedVersion]);
 
-  const rawDuration = settings ? (settings.durata_slide || 0) * 1000 : 6000;
+  const config      = playlist ?? settings;
+  const rawDuration = config ? (config.durata_slide || 0) * 1000 : 6000;
   const duration    = Math.max(rawDuration, 2000);
   const promo       = useMemo(() => settings?.promo ?? [], [settings]);
   const slides      = useMemo(() => {
+    // La playlist arriva già ordinata, troncata e con le promo intercalate
+    if (playlist) return playlist.slides ?? [];
     if (cars.length === 0) return [];
     // Shuffle Fisher-Yates — ordine casuale ad ogni caricamento pagina
     const shuffled = [...cars];
@@ -419,7 +518,7 @@ export default function Showroom() {
       [shuffled[i], shuffled[j]] = [shuffled[j], shuffled[i]];
     }
     return buildSlides(shuffled, promo);
-  }, [cars, promo]);
+  }, [playlist, cars, promo]);
 
   const { index, progress, forceAdvance, isVideoSlide } = useSlideshow(
     loading || error || slides.length === 0 ? [] : slides,